@@ -1,10 +1,201 @@
+# engine/entities/entity.py
+"""
+Entidad base (jugador o NPC).
+
+La entidad usa __slots__ para no llevar un __dict__ por instancia, y los
+contenedores que casi siempre están vacíos (skills, magia, inventario,
+quests, familia, equipo...) no se crean hasta el primer acceso. Hasta que
+algo se equipa, todas las entidades comparten la misma distribución de
+equipo vacía (EMPTY_EQUIPMENT).
+
+Las necesidades y vitales (hambre, sed, salud, mana...) y el estado pueden
+vivir en un NeedsStore (engine/systems/needs.py); mientras la entidad esté
+en uno, esos atributos son una vista de su fila.
+"""
+
+from types import MappingProxyType
+
+from engine.systems.needs import NEED_FIELDS
+
+# Ranuras de equipo, en orden
+EQUIPMENT_SLOTS = (
+    "main",
+    "offhand",
+    "head",
+    "neck",
+    #Superior
+    #Brazo izquierdo
+    "left_shoulder",
+    "left_arm",
+    "left_hand",
+    "left_thumb",
+    "left_index",
+    "left_middle",
+    "left_ring",
+    "left_pinky",
+
+    #Brazo derecho
+    "right_shoulder",
+    "right_arm",
+    "right_hand",
+    "right_thumb",
+    "right_index",
+    "right_middle",
+    "right_ring",
+    "right_pinky",
+
+    #Torso
+    "chest",
+    "abdomen",
+    "waist",
+
+    #Inferior
+    #Pierna izquierda
+    "left_leg",
+    "left_ankle",
+    "left_foot",
+
+    #Pierna derecha
+    "right_leg",
+    "right_ankle",
+    "right_foot",
+)
+
+# Equipo vacío compartido por todas las entidades sin nada equipado
+EMPTY_EQUIPMENT = MappingProxyType(dict.fromkeys(EQUIPMENT_SLOTS))
+
+
+class _LazyContainer:
+    """
+    Atributo contenedor (dict o list) que se crea vacío en el primer acceso.
+    Se guarda en una ranura privada que vale None mientras no existe.
+    """
+
+    __slots__ = ("slot", "factory")
+
+    def __init__(self, slot, factory):
+        self.slot = slot
+        self.factory = factory
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        value = getattr(obj, self.slot)
+        if value is None:
+            value = self.factory()
+            setattr(obj, self.slot, value)
+        return value
+
+    def __set__(self, obj, value):
+        setattr(obj, self.slot, value)
+
+
+def _empty_equipment():
+    return dict(EMPTY_EQUIPMENT)
+
+
+class _NeedField:
+    """
+    Atributo numérico que vive en la entidad o, si está en un NeedsStore,
+    en la fila del almacén.
+    """
+
+    __slots__ = ("name", "slot")
+
+    def __init__(self, name):
+        self.name = name
+        self.slot = "_" + name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        needs = obj._needs
+        if needs is None:
+            return getattr(obj, self.slot)
+        return needs.get(self.name, obj._needs_row)
+
+    def __set__(self, obj, value):
+        needs = obj._needs
+        if needs is None:
+            setattr(obj, self.slot, value)
+        else:
+            needs.set(self.name, obj._needs_row, value)
+
+
+class _StateField:
+    """Estado de la entidad (en la entidad o en su fila del NeedsStore)."""
+
+    __slots__ = ()
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        needs = obj._needs
+        if needs is None:
+            return obj._state
+        return needs.get_state(obj._needs_row)
+
+    def __set__(self, obj, value):
+        needs = obj._needs
+        if needs is None:
+            obj._state = value
+        else:
+            needs.set_state(obj._needs_row, value)
+
+
 class Entity:
     """
     Clase base para representar cualquier entidad del juego (jugador o NPC).
     Contiene stats, habilidades, inventario, estado de salud y otros atributos.
     """
+
+    __slots__ = (
+        # Información básica
+        "name", "race", "stats",
+        # Habilidades y rasgos (contenedores creados en el primer acceso)
+        "_skills", "_holded_skills_experience", "_abilities", "_magic", "_magic_domain",
+        "_holded_magic_experience", "_magic_heat", "_max_magic_heat",
+        # Atributos mundanos
+        "age", "_hunger", "_thirst", "_tiredness", "weight", "height",
+        "inventory_weight_limit", "inventory_weight", "reputation", "_state", "_family",
+        # Inventario y quests
+        "_inventory", "_equipped", "_quests",
+        # Combate y supervivencia
+        "level", "experience", "experience_modifier", "_max_health", "_current_health",
+        "_max_mana", "_current_mana", "_stamina",
+        # NeedsStore al que pertenece la entidad (o None) y su fila
+        "_needs", "_needs_row",
+        "__weakref__",
+    )
+
+    # Necesidades y vitales (vista de la fila si la entidad está en un NeedsStore)
+    hunger = _NeedField("hunger")
+    thirst = _NeedField("thirst")
+    tiredness = _NeedField("tiredness")
+    magic_heat = _NeedField("magic_heat")
+    max_magic_heat = _NeedField("max_magic_heat")
+    stamina = _NeedField("stamina")
+    current_health = _NeedField("current_health")
+    max_health = _NeedField("max_health")
+    current_mana = _NeedField("current_mana")
+    max_mana = _NeedField("max_mana")
+    state = _StateField()
+
+    skills = _LazyContainer("_skills", dict)                                      # Skills y niveles
+    holded_skills_experience = _LazyContainer("_holded_skills_experience", dict)  # Experiencia de habilidades acumulada
+    abilities = _LazyContainer("_abilities", dict)                                # Habilidades activables
+    magic = _LazyContainer("_magic", dict)                                        # Habilidades mágicas
+    magic_domain = _LazyContainer("_magic_domain", dict)                          # Dominios mágicos del personaje
+    holded_magic_experience = _LazyContainer("_holded_magic_experience", dict)    # Experiencia mágica acumulada
+    family = _LazyContainer("_family", list)         # Lista de miembros de la familia (para interacciones y relaciones)
+    inventory = _LazyContainer("_inventory", list)   # Objetos que posee la entidad
+    equipped = _LazyContainer("_equipped", _empty_equipment)  # Objetos equipados (armas, armaduras, accesorios)
+    quests = _LazyContainer("_quests", dict)         # Quests activas
     
     def __init__(self, name, new_stats, height):
+        self._needs = None
+        self._needs_row = None
+
         # Información básica
         self.name = name
         self.race = {}          # Puede ser híbrido: {"orc":50, "human":50}
@@ -12,15 +203,15 @@ class Entity:
         
 
         # Habilidades y rasgos
-        self.skills = {}          # Skills y niveles
-        self.holded_skills_experience = {}  # Experiencia de habilidades acumulada
-        self.abilities = {}       # Habilidades activables
-        self.magic = {}           # Habilidades mágicas
-        self.magic_domain = {}    # Dominios mágicos del personaje
+        self._skills = None
+        self._holded_skills_experience = None
+        self._abilities = None
+        self._magic = None
+        self._magic_domain = None
         self.magic_heat = 0       # Define cuantas veces puedes usar hechizos antes de sobrecalentar 
                                   # tus capacidades magicas e inivir las mismas
         self.max_magic_heat = 100   # Calor mágico máximo permitido
-        self.holded_magic_experience = {}  # Experiencia mágica acumulada
+        self._holded_magic_experience = None
 
         
         #Atributos Mundanos
@@ -34,55 +225,13 @@ class Entity:
         self.inventory_weight = 0  # Límite de peso del inventario en kilogramos
         self.reputation = 0        # Reputación de la entidad
         self.state = "conscious"  # "conscious", "knocked_out", "Sleep", "poisoned", "dead" and so on
-        self.family = []           # Lista de miembros de la familia (para interacciones y relaciones)
+        self._family = None
     
 
-        # Inventario y quests
-        self.inventory = []       # Objetos que posee la entidad
-        self.equipped = {
-            "main": None,
-            "offhand": None,
-            "head": None,
-            "neck": None,
-            #Superior
-            #Brazo izquierdo
-            "left_shoulder": None,
-            "left_arm": None,
-            "left_hand": None,
-            "left_thumb": None,
-            "left_index": None,
-            "left_middle": None,
-            "left_ring": None,
-            "left_pinky": None,
-
-            #Brazo derecho
-            "right_shoulder": None,
-            "right_arm": None,
-            "right_hand": None,
-            "right_thumb": None,
-            "right_index": None,
-            "right_middle": None,
-            "right_ring": None,
-            "right_pinky": None,
-
-            #Torso
-            "chest": None,
-            "abdomen": None,
-            "waist": None,
-
-            #Inferior
-            #Pierna izquierda
-            "left_leg": None,
-            "left_ankle": None,
-            "left_foot": None,
-
-            #Pierna derecha
-            "right_leg": None,
-            "right_ankle": None,
-            "right_foot": None,
-
-        }        # Objetos equipados (armas, armaduras, accesorios)
-        self.quests = {}          # Quests activas
+        # Inventario y quests (el equipo vacío es EMPTY_EQUIPMENT, compartido)
+        self._inventory = None
+        self._equipped = None
+        self._quests = None
         
         # Atributos de combate y supervivencia
         self.level = 1
@@ -97,6 +246,86 @@ class Entity:
 
     
 
+    # ------------------------------
+    # NeedsStore
+    # ------------------------------
+
+    def _attach_needs(self, store, row):
+        """La entidad pasa a ser una vista de la fila `row` de `store`."""
+        self._needs = store
+        self._needs_row = row
+
+    def _detach_needs(self):
+        """Copia los valores de la fila a la entidad y deja de ser una vista."""
+        if self._needs is None:
+            return
+        values = {name: getattr(self, name) for name in NEED_FIELDS}
+        state = self.state
+        self._needs = None
+        self._needs_row = None
+        for name, value in values.items():
+            setattr(self, name, value)
+        self.state = state
+
+    def __getstate__(self):
+        """Estado para copy/pickle: una copia independiente de cualquier NeedsStore."""
+        state = {}
+        for cls in type(self).__mro__:
+            for slot in cls.__dict__.get("__slots__", ()):
+                if slot != "__weakref__" and hasattr(self, slot):
+                    state[slot] = getattr(self, slot)
+        if self._needs is not None:
+            for name in NEED_FIELDS:
+                state["_" + name] = getattr(self, name)
+            state["_state"] = self.state
+            state["_needs"] = None
+            state["_needs_row"] = None
+        return None, state
+
+    # ------------------------------
+    # Métodos de equipo
+    # ------------------------------
+
+    def get_equipped(self, slot):
+        """
+        Objeto equipado en una ranura (None si está vacía), sin crear el
+        diccionario de equipo de la entidad.
+        """
+        equipment = self._equipped if self._equipped is not None else EMPTY_EQUIPMENT
+        return equipment[slot]
+
+    def equip(self, slot, item):
+        """
+        Equipa un objeto en una ranura.
+
+        Args:
+            slot: Ranura (ver EQUIPMENT_SLOTS)
+            item: Objeto a equipar
+
+        Returns:
+            Objeto que ocupaba la ranura (o None)
+        """
+        if slot not in EMPTY_EQUIPMENT:
+            raise ValueError(f"Ranura de equipo desconocida: {slot}")
+        previous = self.equipped[slot]
+        self.equipped[slot] = item
+        return previous
+
+    def unequip(self, slot):
+        """
+        Vacía una ranura de equipo.
+
+        Returns:
+            Objeto que ocupaba la ranura (o None)
+        """
+        if slot not in EMPTY_EQUIPMENT:
+            raise ValueError(f"Ranura de equipo desconocida: {slot}")
+        if self._equipped is None:
+            return None
+        previous = self._equipped[slot]
+        self._equipped[slot] = None
+        return previous
+
     # ------------------------------
     # Métodos de combate y habilidades
     # ------------------------------
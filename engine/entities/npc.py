@@ -1,12 +1,72 @@
 # engine/entities/npc.py
-import json
 import random
-from pathlib import Path
 from engine.entities.entity import Entity
+from engine.entities.trait_graph import TraitGraph
+from engine.systems.decisions import DECISION_BETRAY, DECISION_COMBAT, decide_one
+from engine.utils.data_registry import get_registry
 from engine.utils.name_generator import NameGenerator
+from engine.utils.rng_streams import STREAM_NPC, py_stream
 
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
-DATA = BASE_DIR / "data"
+# Valores base de comportamiento según profesión
+PROFESSION_VALUES = {
+    "warrior": {"aggressiveness": 75, "honesty": 65, "loyalty": 70, "caution": 30},
+    "rogue": {"aggressiveness": 50, "honesty": 30, "loyalty": 40, "caution": 65},
+    "mage": {"aggressiveness": 40, "honesty": 60, "loyalty": 55, "caution": 70},
+    "paladin": {"aggressiveness": 60, "honesty": 85, "loyalty": 90, "caution": 40},
+    "cleric": {"aggressiveness": 35, "honesty": 80, "loyalty": 85, "caution": 55},
+    "archer": {"aggressiveness": 55, "honesty": 70, "loyalty": 60, "caution": 70},
+    "merchant": {"aggressiveness": 25, "honesty": 50, "loyalty": 45, "caution": 60},
+    "assassin": {"aggressiveness": 70, "honesty": 20, "loyalty": 30, "caution": 75},
+    "bard": {"aggressiveness": 40, "honesty": 55, "loyalty": 50, "caution": 45},
+    "ranger": {"aggressiveness": 60, "honesty": 75, "loyalty": 65, "caution": 60},
+    "monk": {"aggressiveness": 50, "honesty": 85, "loyalty": 80, "caution": 50},
+    "warlock": {"aggressiveness": 65, "honesty": 35, "loyalty": 25, "caution": 55},
+}
+
+DEFAULT_NPC_VALUES = {
+    "aggressiveness": 50,
+    "honesty": 50,
+    "loyalty": 50,
+    "caution": 50
+}
+
+# Modificadores de los valores por rasgo (a intensidad 100)
+TRAIT_VALUE_MODIFIERS = {
+    "aggressive": {"aggressiveness": 20},
+    "timid": {"aggressiveness": -20, "caution": 15},
+    "brave": {"caution": -10, "aggressiveness": 10},
+    "cowardly": {"caution": 20, "aggressiveness": -15},
+    "honest": {"honesty": 25},
+    "cunning": {"honesty": -20},
+    "manipulative": {"honesty": -25},
+    "loyal": {"loyalty": 25},
+    "treacherous": {"loyalty": -30},
+    "cautious": {"caution": 15},
+    "reckless": {"caution": -20},
+    "impulsive": {"caution": -10, "aggressiveness": 5},
+    "ruthless": {"aggressiveness": 15, "honesty": -10},
+    "compassionate": {"aggressiveness": -10, "honesty": 10},
+}
+
+# Grafo de rasgos compilado (ver get_trait_graph)
+_trait_graph = None
+
+
+def get_trait_graph():
+    """
+    Grafo de rasgos compilado a partir del registro (se recompila si el
+    registro volvió a cargar los rasgos).
+    
+    Returns:
+        TraitGraph
+    """
+    global _trait_graph
+    traits = get_registry().traits
+    graph = _trait_graph
+    if graph is None or graph.source is not traits:
+        graph = TraitGraph(traits, TRAIT_VALUE_MODIFIERS, tuple(DEFAULT_NPC_VALUES))
+        _trait_graph = graph
+    return graph
 
 
 class NPC(Entity):
@@ -17,7 +77,13 @@ class NPC(Entity):
     Los rasgos de personalidad se asignan según la profesión y sus sinergia.
     """
 
-    def __init__(self, name=None, profession_name=None, race_name="human", height=None, auto_generate_name=True):
+    __slots__ = (
+        "profession", "profession_display", "profession_description",
+        "profession_title", "profession_category", "personality", "npc_values",
+    )
+
+    def __init__(self, name=None, profession_name=None, race_name="human", height=None, auto_generate_name=True,
+                 rng=None):
         """
         Inicializa un NPC basado en una profesión.
         
@@ -27,49 +93,38 @@ class NPC(Entity):
             race_name: Nombre de la raza (default: "human")
             height: Altura (opcional, se genera aleatoriamente si no se proporciona)
             auto_generate_name: Si True, genera un nombre automático si no se proporciona (default: True)
+            rng: Flujo aleatorio (random.Random) para nombre, stats, altura y
+                 personalidad; si es None se usa el módulo global `random`
         """
-        # Cargar datos
-        with open(DATA / "professions.json", encoding="utf-8") as f:
-            professions = json.load(f)
-        
-        with open(DATA / "races.json", encoding="utf-8") as f:
-            races = json.load(f)
-        
-        with open(DATA / "stats.json", encoding="utf-8") as f:
-            stats_data = json.load(f)
+        if rng is None:
+            rng = random
         
-        with open(DATA / "personality_traits.json", encoding="utf-8") as f:
-            personality_data = json.load(f)
+        # Datos compartidos (cargados una vez por proceso)
+        registry = get_registry()
         
         # Validar profession_name
         if not profession_name:
             raise ValueError("profession_name es requerido")
         
         # Encontrar profesión
-        profession = next(
-            (p for p in professions if p["profession_name"] == profession_name),
-            None
-        )
+        profession = registry.professions_by_name.get(profession_name)
         if not profession:
             raise ValueError(f"Profesión '{profession_name}' no encontrada")
         
         # Encontrar raza
-        race = next(
-            (r for r in races if r["race_name"] == race_name),
-            None
-        )
+        race = registry.races_by_name.get(race_name)
         if not race:
             raise ValueError(f"Raza '{race_name}' no encontrada")
         
         # Generar nombre automáticamente si no se proporciona
         if name is None and auto_generate_name:
             name_gen = NameGenerator()
-            name = name_gen.generate_name(race=race_name)
+            name = name_gen.generate_name(race=race_name, rng=rng)
         elif name is None:
             raise ValueError("name es requerido cuando auto_generate_name=False")
         
         # Generar stats dentro de los rangos de la profesión
-        stats = self._generate_profession_stats(profession, stats_data)
+        stats = self._generate_profession_stats(profession, registry.stats, rng)
         
         # Aplicar modificadores de raza
         for mod in race.get("modifiers", []):
@@ -87,7 +142,7 @@ class NPC(Entity):
             max_h = int(race.get("max_height", 200))
             if min_h > max_h:
                 min_h, max_h = max_h, min_h
-            height = random.randint(min_h, max_h)
+            height = rng.randint(min_h, max_h)
         
         # Inicializar Entity con los stats generados
         super().__init__(
@@ -96,30 +151,119 @@ class NPC(Entity):
             height=height
         )
         
-        # Asignar raza
-        self.race = {race.get("race_name"): 100}
-        
-        # Asignar profesión
-        self.profession = profession_name
-        self.profession_display = profession.get("display", profession_name)
-        self.profession_description = profession.get("description", "")
-        self.profession_title = profession.get("title", f"el {self.profession_display}")
-        self.profession_category = profession.get("category", "combat")
+        # Asignar raza y profesión
+        self._assign_profession(profession_name, profession, race)
         
         # Generar personalidad
         self.personality = self._generate_personality(
             profession.get("personality_traits", []),
-            personality_data
+            rng
         )
         
         # Generar valores únicos de NPC (para comportamiento emergente)
         self.npc_values = self._generate_npc_values(
             profession_name,
-            self.personality,
-            personality_data
+            self.personality
         )
     
-    def _generate_profession_stats(self, profession, stats_data):
+    def _assign_profession(self, profession_name, profession, race):
+        """
+        Asigna raza y datos de profesión (nombre, título, categoría...).
+        
+        Args:
+            profession_name: Nombre de la profesión
+            profession: Diccionario de profesión
+            race: Diccionario de raza
+        """
+        self.race = {race.get("race_name"): 100}
+        self.profession = profession_name
+        self.profession_display = profession.get("display", profession_name)
+        self.profession_description = profession.get("description", "")
+        self.profession_title = profession.get("title", f"el {self.profession_display}")
+        self.profession_category = profession.get("category", "combat")
+    
+    @classmethod
+    def from_generated(cls, name, profession_name, race_name, stats, height, personality, npc_values):
+        """
+        Construye un NPC con valores ya generados (sin volver a tirar dados).
+        Lo usa NPCPopulation para materializar NPCs creados en lote.
+        
+        Args:
+            name: Nombre del NPC
+            profession_name: Nombre de la profesión
+            race_name: Nombre de la raza
+            stats: Diccionario de stats (con modificadores de raza aplicados)
+            height: Altura en centímetros
+            personality: Diccionario {trait_id: intensidad}
+            npc_values: Diccionario de valores de comportamiento
+        
+        Returns:
+            NPC
+        """
+        registry = get_registry()
+        npc = cls.__new__(cls)
+        Entity.__init__(npc, name=name, new_stats=stats, height=height)
+        npc._assign_profession(
+            profession_name,
+            registry.professions_by_name[profession_name],
+            registry.races_by_name[race_name]
+        )
+        npc.personality = personality
+        npc.npc_values = npc_values
+        return npc
+    
+    @classmethod
+    def from_seed(cls, root_seed, npc_id, profession_name, race_name="human", name=None):
+        """
+        Crea (o recrea) un NPC a partir de la semilla raíz y su id.
+        El mismo (root_seed, npc_id, profesión, raza) da siempre el mismo NPC,
+        sin importar el orden ni el hilo en que se genere.
+        
+        Args:
+            root_seed: Semilla raíz (p. ej. la del mundo)
+            npc_id: Identificador del NPC (entero o texto)
+            profession_name: Nombre de la profesión
+            race_name: Nombre de la raza
+            name: Nombre fijo (si es None se genera con el mismo flujo)
+        
+        Returns:
+            NPC
+        """
+        return cls(
+            name=name,
+            profession_name=profession_name,
+            race_name=race_name,
+            rng=py_stream(root_seed, STREAM_NPC, npc_id)
+        )
+    
+    @classmethod
+    def batch_create(cls, profession_mix, race_mix="human", count=1, seed=None, columnar=False):
+        """
+        Crea muchos NPCs de una vez con tiradas vectorizadas (NumPy).
+        Las distribuciones de stats, altura, rasgos y valores son las mismas
+        que al crear los NPCs uno a uno.
+        
+        Args:
+            profession_mix: Profesión, lista de profesiones (mismo peso) o
+                            diccionario {profesión: peso}
+            race_mix: Igual que profession_mix, para las razas
+            count: Número de NPCs
+            seed: Semilla (misma semilla -> misma población) o un
+                  numpy.random.Generator (ej: np_stream(world_seed, STREAM_NPC_BATCH, lote))
+            columnar: Si True, retorna un NPCPopulation (arrays por columna)
+                      en lugar de objetos NPC
+        
+        Returns:
+            NPCPopulation si columnar, si no lista de NPC
+        """
+        from engine.entities.npc_batch import generate_population
+        
+        population = generate_population(profession_mix, race_mix, count, seed)
+        if columnar:
+            return population
+        return population.to_npcs(cls)
+    
+    def _generate_profession_stats(self, profession, stats_data, rng=random):
         """
         Genera stats basados en los rangos definidos por la profesión.
         Los stats se generan aleatoriamente dentro del rango [min, max].
@@ -127,6 +271,7 @@ class NPC(Entity):
         Args:
             profession: Diccionario de profesión
             stats_data: Lista de datos de stats disponibles
+            rng: Flujo aleatorio
         
         Returns:
             Diccionario de stats generados
@@ -143,87 +288,28 @@ class NPC(Entity):
                 stat_range = stat_ranges[stat_name]
                 min_val = stat_range.get("min", 10)
                 max_val = stat_range.get("max", 18)
-                stats[stat_name] = random.randint(min_val, max_val)
+                stats[stat_name] = rng.randint(min_val, max_val)
             else:
                 # Stat no definido en profesión, usar valor por defecto
                 stats[stat_name] = 10
         
         return stats
     
-    def _generate_personality(self, profession_traits, personality_data):
+    def _generate_personality(self, profession_traits, rng=random):
         """
         Asigna rasgos de personalidad basados en la profesión.
         Permite contradicciones leves (10% de probabilidad) para más variedad y realismo.
         
         Args:
             profession_traits: Lista de trait IDs recomendados para la profesión
-            personality_data: Diccionario con todos los rasgos disponibles
+            rng: Flujo aleatorio
         
         Returns:
             Diccionario de personalidad con intensidades
         """
-        traits_dict = {t["id"]: t for t in personality_data["traits"]}
-        
-        selected_traits = {}
-        
-        def _would_create_contradiction(trait_id, current_traits):
-            """
-            Verifica si un rasgo entraría en conflicto con los actuales.
-            Retorna True si habría conflicto, False si es seguro añadirlo.
-            """
-            if trait_id not in traits_dict:
-                return False
-            
-            trait = traits_dict[trait_id]
-            conflicts = trait.get("conflicts", [])
-            
-            for conflict_id in conflicts:
-                if conflict_id in current_traits:
-                    return True
-            return False
-        
-        # Agregar rasgos base de la profesión
-        for trait_id in profession_traits:
-            if trait_id in traits_dict:
-                trait = traits_dict[trait_id]
-                # Generar intensidad aleatoria dentro del rango permitido
-                intensity_range = trait.get("intensity", {})
-                min_intensity = intensity_range.get("min", 0)
-                max_intensity = intensity_range.get("max", 100)
-                intensity = random.randint(min_intensity, max_intensity)
-                selected_traits[trait_id] = intensity
-        
-        # Intentar agregar rasgos sinérgicos (30% de probabilidad por sinergía)
-        # Pero permitir algunas contradicciones leves (10% de probabilidad)
-        added_synergies = set()
-        for trait_id in list(selected_traits.keys()):
-            if trait_id in traits_dict:
-                trait = traits_dict[trait_id]
-                synergies = trait.get("synergies", [])
-                
-                for synergy_id in synergies:
-                    if (synergy_id not in selected_traits and 
-                        synergy_id not in added_synergies and 
-                        random.random() < 0.3):  # 30% de probabilidad
-                        
-                        if synergy_id in traits_dict:
-                            synergy_trait = traits_dict[synergy_id]
-                            
-                            # Verificar conflictos pero permitir 10% de probabilidad
-                            if _would_create_contradiction(synergy_id, selected_traits):
-                                if random.random() > 0.10:  # Solo 10% de contradicciones
-                                    continue
-                            
-                            intensity_range = synergy_trait.get("intensity", {})
-                            min_intensity = intensity_range.get("min", 0)
-                            max_intensity = intensity_range.get("max", 100)
-                            intensity = random.randint(min_intensity, max_intensity)
-                            selected_traits[synergy_id] = intensity
-                            added_synergies.add(synergy_id)
-        
-        return selected_traits
+        return get_trait_graph().roll_personality(profession_traits, rng)
     
-    def _generate_npc_values(self, profession_name, personality, personality_data):
+    def _generate_npc_values(self, profession_name, personality):
         """
         Genera valores únicos del NPC que afectan su comportamiento.
         Estos valores se derivan de la profesión y personalidad.
@@ -231,68 +317,12 @@ class NPC(Entity):
         Args:
             profession_name: Nombre de la profesión
             personality: Diccionario de personalidad del NPC
-            personality_data: Datos de personalidad
         
         Returns:
             Diccionario con valores únicos del NPC
         """
-        traits_dict = {t["id"]: t for t in personality_data["traits"]}
-        
-        # Valores base según profesión
-        profession_values = {
-            "warrior": {"aggressiveness": 75, "honesty": 65, "loyalty": 70, "caution": 30},
-            "rogue": {"aggressiveness": 50, "honesty": 30, "loyalty": 40, "caution": 65},
-            "mage": {"aggressiveness": 40, "honesty": 60, "loyalty": 55, "caution": 70},
-            "paladin": {"aggressiveness": 60, "honesty": 85, "loyalty": 90, "caution": 40},
-            "cleric": {"aggressiveness": 35, "honesty": 80, "loyalty": 85, "caution": 55},
-            "archer": {"aggressiveness": 55, "honesty": 70, "loyalty": 60, "caution": 70},
-            "merchant": {"aggressiveness": 25, "honesty": 50, "loyalty": 45, "caution": 60},
-            "assassin": {"aggressiveness": 70, "honesty": 20, "loyalty": 30, "caution": 75},
-            "bard": {"aggressiveness": 40, "honesty": 55, "loyalty": 50, "caution": 45},
-            "ranger": {"aggressiveness": 60, "honesty": 75, "loyalty": 65, "caution": 60},
-            "monk": {"aggressiveness": 50, "honesty": 85, "loyalty": 80, "caution": 50},
-            "warlock": {"aggressiveness": 65, "honesty": 35, "loyalty": 25, "caution": 55},
-        }
-        
-        values = profession_values.get(profession_name, {
-            "aggressiveness": 50,
-            "honesty": 50,
-            "loyalty": 50,
-            "caution": 50
-        }).copy()
-        
-        # Modificar según rasgos de personalidad
-        trait_modifiers = {
-            "aggressive": {"aggressiveness": 20},
-            "timid": {"aggressiveness": -20, "caution": 15},
-            "brave": {"caution": -10, "aggressiveness": 10},
-            "cowardly": {"caution": 20, "aggressiveness": -15},
-            "honest": {"honesty": 25},
-            "cunning": {"honesty": -20},
-            "manipulative": {"honesty": -25},
-            "loyal": {"loyalty": 25},
-            "treacherous": {"loyalty": -30},
-            "cautious": {"caution": 15},
-            "reckless": {"caution": -20},
-            "impulsive": {"caution": -10, "aggressiveness": 5},
-            "ruthless": {"aggressiveness": 15, "honesty": -10},
-            "compassionate": {"aggressiveness": -10, "honesty": 10},
-        }
-        
-        for trait_id, intensity in personality.items():
-            if trait_id in trait_modifiers:
-                modifiers = trait_modifiers[trait_id]
-                # Aplicar modificadores escalados por intensidad (0-100)
-                scale = intensity / 100.0
-                for value_name, modifier in modifiers.items():
-                    if value_name in values:
-                        values[value_name] += int(modifier * scale)
-        
-        # Asegurar que todos los valores estén en rango [0-100]
-        for key in values:
-            values[key] = max(0, min(100, values[key]))
-        
-        return values
+        base_values = PROFESSION_VALUES.get(profession_name, DEFAULT_NPC_VALUES)
+        return get_trait_graph().npc_values(base_values, personality)
     
     def add_personality_trait(self, trait_name, trait_intensity):
         """
@@ -311,10 +341,7 @@ class NPC(Entity):
         Returns:
             String con descripción de personalidad
         """
-        with open(DATA / "personality_traits.json", encoding="utf-8") as f:
-            personality_data = json.load(f)
-        
-        traits_dict = {t["id"]: t for t in personality_data["traits"]}
+        traits_dict = get_registry().traits_by_id
         
         summary = []
         for trait_id, intensity in sorted(
@@ -345,39 +372,40 @@ class NPC(Entity):
         
         return " | ".join(summary)
     
-    def would_initiate_combat(self):
+    def would_initiate_combat(self, rng=random):
         """
         Determina probabilísticamente si el NPC iniciaría un combate.
         Basado en aggressiveness, bravery y caution.
         
+        Args:
+            rng: Flujo aleatorio (módulo `random` por defecto)
+        
         Returns:
             True si el NPC debería iniciar combate, False en caso contrario
         """
-        aggressiveness = self.npc_values.get("aggressiveness", 50)
-        caution = self.npc_values.get("caution", 50)
-        
-        # Probabilidad = (aggressiveness - caution) / 100
-        combat_probability = (aggressiveness - caution) / 100.0
-        combat_probability = max(0.0, min(1.0, combat_probability))
-        
-        return random.random() < combat_probability
+        # Probabilidad = (aggressiveness - caution) / 100 (ver engine/systems/decisions.py)
+        return decide_one(DECISION_COMBAT, self._decision_values(), rng)
     
-    def would_betray(self):
+    def would_betray(self, rng=random):
         """
         Determina probabilísticamente si el NPC traicionaría.
         Basado en loyalty, honesty y cunning.
         
+        Args:
+            rng: Flujo aleatorio (módulo `random` por defecto)
+        
         Returns:
             True si el NPC debería traicionar, False en caso contrario
         """
-        loyalty = self.npc_values.get("loyalty", 50)
-        honesty = self.npc_values.get("honesty", 50)
-        
-        # Probabilidad de traición = (100 - loyalty) / 100
-        betrayal_probability = (100 - loyalty) / 100.0
-        betrayal_probability = max(0.0, min(1.0, betrayal_probability))
-        
-        return random.random() < betrayal_probability
+        # Probabilidad de traición = (100 - loyalty) / 100 (ver engine/systems/decisions.py)
+        return decide_one(DECISION_BETRAY, self._decision_values(), rng)
+    
+    def _decision_values(self):
+        """npc_values con 50 para los valores que falten."""
+        values = self.npc_values
+        if len(values) < len(DEFAULT_NPC_VALUES):
+            values = {**DEFAULT_NPC_VALUES, **values}
+        return values
     
     def __repr__(self):
         """Representación en string del NPC."""
@@ -0,0 +1,260 @@
+# engine/entities/npc_batch.py
+"""
+Creación de NPCs en lote.
+
+En lugar de tirar los dados NPC por NPC, las tiradas de un grupo (misma
+profesión o misma raza) se hacen de una vez con NumPy:
+- stats: un array por stat dentro del rango de la profesión,
+- modificadores de raza y altura: por grupo de raza,
+- personalidad: rasgos base de la profesión y, para cada candidato a
+  sinergia (en el mismo orden que NPC._generate_personality), una tirada
+  para todo el grupo, con la misma comprobación de contradicciones
+  (TraitGraph.roll_personality_batch),
+- valores de comportamiento: la matriz de modificadores del grafo de
+  rasgos (TraitGraph.npc_values_batch).
+
+Las probabilidades son las mismas que al crear los NPCs uno a uno; solo
+cambia la fuente de aleatoriedad (un numpy.random.Generator con semilla).
+
+El resultado es un NPCPopulation (arrays por columna); to_npc() / to_npcs()
+lo convierten en objetos NPC cuando hacen falta.
+"""
+
+import numpy as np
+
+from engine.entities.npc import DEFAULT_NPC_VALUES, PROFESSION_VALUES, get_trait_graph
+from engine.entities.trait_graph import NO_TRAIT
+from engine.utils.data_registry import get_registry
+from engine.utils.name_generator import NameGenerator
+
+VALUE_NAMES = tuple(DEFAULT_NPC_VALUES)
+
+
+class NPCPopulation:
+    """Población de NPCs guardada por columnas (un array por atributo)."""
+
+    def __init__(self, names, professions, profession_ids, races, race_ids,
+                 stat_names, stats, heights, trait_ids, personality, npc_values):
+        """
+        Args:
+            names: Lista de nombres
+            professions: Tupla de nombres de profesión (indexada por profession_ids)
+            profession_ids: Array (n,) con el índice de profesión de cada NPC
+            races: Tupla de nombres de raza (indexada por race_ids)
+            race_ids: Array (n,) con el índice de raza de cada NPC
+            stat_names: Tupla de nombres de stats (columnas de stats)
+            stats: Array (n, len(stat_names))
+            heights: Array (n,) de alturas en centímetros
+            trait_ids: Tupla de ids de rasgos (columnas de personality)
+            personality: Array (n, len(trait_ids)) de intensidades; NO_TRAIT si falta
+            npc_values: Array (n, len(VALUE_NAMES)) de valores de comportamiento
+        """
+        self.names = names
+        self.professions = professions
+        self.profession_ids = profession_ids
+        self.races = races
+        self.race_ids = race_ids
+        self.stat_names = stat_names
+        self.stats = stats
+        self.heights = heights
+        self.trait_ids = trait_ids
+        self.personality = personality
+        self.value_names = VALUE_NAMES
+        self.npc_values = npc_values
+
+    def __len__(self):
+        return len(self.names)
+
+    def profession_of(self, index):
+        """Nombre de la profesión de un NPC."""
+        return self.professions[self.profession_ids[index]]
+
+    def race_of(self, index):
+        """Nombre de la raza de un NPC."""
+        return self.races[self.race_ids[index]]
+
+    def stats_of(self, index):
+        """Diccionario de stats de un NPC."""
+        return dict(zip(self.stat_names, self.stats[index].tolist()))
+
+    def personality_of(self, index):
+        """Diccionario {trait_id: intensidad} de un NPC."""
+        row = self.personality[index]
+        return {self.trait_ids[t]: int(row[t]) for t in np.flatnonzero(row != NO_TRAIT)}
+
+    def values_of(self, index):
+        """Diccionario de valores de comportamiento de un NPC."""
+        return dict(zip(self.value_names, self.npc_values[index].tolist()))
+
+    def to_npc(self, index, npc_class=None):
+        """
+        Materializa un NPC de la población.
+
+        Args:
+            index: Posición del NPC
+            npc_class: Clase a construir (NPC por defecto)
+
+        Returns:
+            Objeto NPC con los mismos valores
+        """
+        return _npc_class(npc_class).from_generated(
+            self.names[index],
+            self.profession_of(index),
+            self.race_of(index),
+            self.stats_of(index),
+            int(self.heights[index]),
+            self.personality_of(index),
+            self.values_of(index),
+        )
+
+    def to_npcs(self, npc_class=None):
+        """
+        Lista con todos los NPCs materializados.
+        Convierte cada columna a listas de Python una sola vez en lugar de
+        indexar los arrays NPC por NPC.
+        """
+        npc_class = _npc_class(npc_class)
+
+        personalities = [{} for _ in range(len(self))]
+        rows, columns = np.nonzero(self.personality != NO_TRAIT)
+        intensities = self.personality[rows, columns].tolist()
+        for row, column, intensity in zip(rows.tolist(), columns.tolist(), intensities):
+            personalities[row][self.trait_ids[column]] = intensity
+
+        npcs = []
+        for name, profession_id, race_id, stats, height, personality, values in zip(
+                self.names, self.profession_ids.tolist(), self.race_ids.tolist(),
+                self.stats.tolist(), self.heights.tolist(), personalities,
+                self.npc_values.tolist()):
+            npcs.append(npc_class.from_generated(
+                name,
+                self.professions[profession_id],
+                self.races[race_id],
+                dict(zip(self.stat_names, stats)),
+                height,
+                personality,
+                dict(zip(self.value_names, values)),
+            ))
+        return npcs
+
+
+def _npc_class(npc_class):
+    """Clase NPC por defecto (importada aquí: npc.py importa este módulo al crear lotes)."""
+    if npc_class is None:
+        from engine.entities.npc import NPC
+        npc_class = NPC
+    return npc_class
+
+
+def _normalize_mix(mix, known, label):
+    """
+    Convierte una mezcla en (nombres, probabilidades).
+
+    Args:
+        mix: Nombre, lista de nombres o diccionario {nombre: peso}
+        known: Diccionario de nombres válidos
+        label: "Profesión" o "Raza" (para el mensaje de error)
+
+    Raises:
+        ValueError: si la mezcla está vacía, tiene pesos inválidos o nombres desconocidos
+    """
+    if isinstance(mix, str):
+        mix = {mix: 1.0}
+    elif not hasattr(mix, "items"):
+        mix = {name: 1.0 for name in mix}
+    if not mix:
+        raise ValueError(f"{label}: la mezcla está vacía")
+
+    names = tuple(mix)
+    for name in names:
+        if name not in known:
+            raise ValueError(f"{label} '{name}' no encontrada")
+    weights = np.array([mix[name] for name in names], dtype=np.float64)
+    if (weights < 0).any() or weights.sum() <= 0:
+        raise ValueError(f"{label}: pesos inválidos {dict(mix)}")
+    return names, weights / weights.sum()
+
+
+def _roll_range(rng, spec, size, default_min, default_max):
+    """Enteros uniformes en [min, max] de un dict {"min", "max"}."""
+    return rng.integers(spec.get("min", default_min), spec.get("max", default_max) + 1, size=size)
+
+
+def generate_population(profession_mix, race_mix="human", count=1, seed=None):
+    """
+    Genera una población de NPCs por columnas.
+
+    Args:
+        profession_mix: Profesión, lista de profesiones o {profesión: peso}
+        race_mix: Raza, lista de razas o {raza: peso}
+        count: Número de NPCs
+        seed: Semilla del generador (None = aleatoria) o un
+              numpy.random.Generator ya creado (ej: rng_streams.np_stream)
+
+    Returns:
+        NPCPopulation
+
+    Raises:
+        ValueError: si alguna profesión o raza no existe
+    """
+    registry = get_registry()
+    professions, profession_weights = _normalize_mix(profession_mix, registry.professions_by_name, "Profesión")
+    races, race_weights = _normalize_mix(race_mix, registry.races_by_name, "Raza")
+    rng = np.random.default_rng(seed)
+
+    profession_ids = rng.choice(len(professions), size=count, p=profession_weights).astype(np.int16)
+    race_ids = rng.choice(len(races), size=count, p=race_weights).astype(np.int16)
+
+    stat_names = registry.stat_names
+    stat_column = {name: i for i, name in enumerate(stat_names)}
+    graph = get_trait_graph()
+    trait_ids = graph.trait_ids
+
+    stats = np.full((count, len(stat_names)), 10, dtype=np.int16)
+    personality = np.full((count, len(trait_ids)), NO_TRAIT, dtype=np.int8)
+    npc_values = np.zeros((count, len(VALUE_NAMES)), dtype=np.int8)
+    heights = np.zeros(count, dtype=np.int16)
+
+    # Tiradas por profesión: stats, personalidad y valores
+    for index, profession_name in enumerate(professions):
+        rows = np.flatnonzero(profession_ids == index)
+        if not len(rows):
+            continue
+        profession = registry.professions_by_name[profession_name]
+        for stat_name, stat_range in profession.get("stat_ranges", {}).items():
+            if stat_name in stat_column:
+                stats[rows, stat_column[stat_name]] = _roll_range(rng, stat_range, len(rows), 10, 18)
+        group_personality = graph.roll_personality_batch(
+            profession.get("personality_traits", []), rng, len(rows)
+        )
+        personality[rows] = group_personality
+        npc_values[rows] = graph.npc_values_batch(
+            PROFESSION_VALUES.get(profession_name, DEFAULT_NPC_VALUES), group_personality
+        )
+
+    # Tiradas por raza: modificadores, altura y nombres
+    names = [None] * count
+    name_generator = NameGenerator()
+    for index, race_name in enumerate(races):
+        rows = np.flatnonzero(race_ids == index)
+        if not len(rows):
+            continue
+        race = registry.races_by_name[race_name]
+        for mod in race.get("modifiers", []):
+            stat_name = mod.get("stat_name")
+            if stat_name in stat_column:
+                stats[rows, stat_column[stat_name]] += int(mod.get("modifier", 0))
+
+        min_h = int(race.get("min_height", 150))
+        max_h = int(race.get("max_height", 200))
+        if min_h > max_h:
+            min_h, max_h = max_h, min_h
+        heights[rows] = rng.integers(min_h, max_h + 1, size=len(rows))
+
+        for row, name in zip(rows.tolist(), name_generator.generate_names(race_name, len(rows), rng)):
+            names[row] = name
+
+    return NPCPopulation(
+        names, professions, profession_ids, races, race_ids,
+        stat_names, stats, heights, trait_ids, personality, npc_values,
+    )
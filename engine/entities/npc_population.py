@@ -0,0 +1,375 @@
+# engine/entities/npc_population.py
+"""
+Población virtual de NPCs generada bajo demanda.
+
+Cada NPC se identifica por (semilla del mundo, asentamiento, índice) y no
+existe en memoria hasta que se consulta: get() lo regenera de forma
+determinista (profesión, raza, nombre, stats, altura, personalidad y
+npc_values salen del flujo py_stream(semilla, "npc", asentamiento, índice))
+y lo guarda en un LRU con un número máximo de NPCs cargados.
+
+De cada NPC solo se conserva lo que el juego cambió: al salir del LRU (o
+al exportar con to_dict) se compara con el NPC recién generado y se
+guardan únicamente los campos distintos (deltas). La próxima vez que se
+consulte se regenera y se le aplican. Así la memoria y el guardado
+dependen de con cuántos NPCs interactuó el jugador y no del tamaño de la
+población.
+
+Uso:
+    population = VirtualPopulation(world_seed)
+    population.add_settlement("riverside", 5000, {"farmer": 6, "blacksmith": 1})
+    npc = population.get("riverside", 1234)
+    npc.take_damage(10)   # se guarda como delta al salir del LRU
+"""
+
+import copy
+from collections import OrderedDict
+
+from engine.entities.npc import NPC
+from engine.entities.npc_batch import _normalize_mix
+from engine.utils.data_registry import get_registry
+from engine.utils.rng_streams import STREAM_NPC, py_stream
+
+DEFAULT_MAX_LOADED = 256
+
+# Campos que se comparan para obtener los deltas de un NPC
+PERSISTED_FIELDS = (
+    "name", "age", "height", "weight", "reputation", "level", "experience", "state",
+    "hunger", "thirst", "tiredness", "magic_heat", "stamina",
+    "current_health", "max_health", "current_mana", "max_mana", "inventory_weight",
+    "stats", "personality", "npc_values",
+    "skills", "magic", "inventory", "quests", "equipped",
+)
+
+# Contenedores que Entity crea en el primer acceso: se leen de su ranura
+# para no crearlos al comparar (vacío y sin crear cuentan igual)
+LAZY_SLOTS = {
+    "skills": "_skills",
+    "magic": "_magic",
+    "inventory": "_inventory",
+    "quests": "_quests",
+    "equipped": "_equipped",
+}
+
+
+def _read_field(npc, field):
+    """Valor comparable de un campo (None para contenedores vacíos sin crear)."""
+    slot = LAZY_SLOTS.get(field)
+    if slot is None:
+        return getattr(npc, field)
+    return getattr(npc, slot) or None
+
+
+def capture(npc):
+    """
+    Copia de los campos persistentes de un NPC.
+
+    Args:
+        npc: NPC (o Entity)
+
+    Returns:
+        Diccionario {campo: valor} independiente del NPC
+    """
+    return {field: copy.deepcopy(_read_field(npc, field)) for field in PERSISTED_FIELDS}
+
+
+def diff(baseline, npc):
+    """
+    Campos de un NPC que cambiaron respecto a su captura original.
+
+    Args:
+        baseline: Resultado de capture() al generar el NPC
+        npc: NPC actual
+
+    Returns:
+        Diccionario {campo: valor actual} (vacío si no cambió nada)
+    """
+    changes = {}
+    for field in PERSISTED_FIELDS:
+        value = _read_field(npc, field)
+        if value != baseline[field]:
+            changes[field] = copy.deepcopy(value)
+    return changes
+
+
+def apply_delta(npc, delta):
+    """Aplica a un NPC los campos guardados en un delta."""
+    for field, value in delta.items():
+        setattr(npc, field, copy.deepcopy(value))
+
+
+class Settlement:
+    """Descripción de la población de un asentamiento (sin NPCs)."""
+
+    __slots__ = ("settlement_id", "size", "profession_mix", "race_mix", "professions",
+                 "profession_weights", "races", "race_weights")
+
+    def __init__(self, settlement_id, size, profession_mix, race_mix="human"):
+        """
+        Args:
+            settlement_id: Identificador (entero o texto) del asentamiento
+            size: Número de NPCs
+            profession_mix: Profesión, lista de profesiones o {profesión: peso}
+            race_mix: Raza, lista de razas o {raza: peso}
+
+        Raises:
+            ValueError: si el tamaño es negativo o alguna profesión o raza no existe
+        """
+        if size < 0:
+            raise ValueError(f"Tamaño de asentamiento inválido: {size}")
+        registry = get_registry()
+        self.settlement_id = settlement_id
+        self.size = size
+        self.profession_mix = profession_mix
+        self.race_mix = race_mix
+        professions, profession_weights = _normalize_mix(profession_mix, registry.professions_by_name, "Profesión")
+        races, race_weights = _normalize_mix(race_mix, registry.races_by_name, "Raza")
+        self.professions = professions
+        self.profession_weights = profession_weights.tolist()
+        self.races = races
+        self.race_weights = race_weights.tolist()
+
+    def to_dict(self):
+        """Descripción serializable (las mezclas tal como se dieron)."""
+        return {
+            "id": self.settlement_id,
+            "size": self.size,
+            "professions": _mix_to_json(self.profession_mix),
+            "races": _mix_to_json(self.race_mix),
+        }
+
+
+def _mix_to_json(mix):
+    """Mezcla en un formato que sobrevive a JSON (texto, lista o dict)."""
+    if isinstance(mix, str):
+        return mix
+    if hasattr(mix, "items"):
+        return dict(mix)
+    return list(mix)
+
+
+class VirtualPopulation:
+    """NPCs de todos los asentamientos, regenerados bajo demanda."""
+
+    def __init__(self, world_seed, max_loaded=DEFAULT_MAX_LOADED):
+        """
+        Args:
+            world_seed: Semilla raíz del mundo
+            max_loaded: NPCs que se mantienen construidos en memoria
+        """
+        self.world_seed = world_seed
+        self.max_loaded = max_loaded
+        self.settlements = {}
+
+        # (asentamiento, índice) -> (NPC, captura original), del menos al más usado
+        self._loaded = OrderedDict()
+        # (asentamiento, índice) -> {campo: valor} de NPCs fuera del LRU
+        self._deltas = {}
+
+        self.generated = 0
+        self.hits = 0
+        self.evicted = 0
+
+    # ------------------------------
+    # Asentamientos
+    # ------------------------------
+
+    def add_settlement(self, settlement_id, size, profession_mix, race_mix="human"):
+        """
+        Registra (o redimensiona) un asentamiento.
+
+        Args:
+            settlement_id: Identificador (entero o texto)
+            size: Número de NPCs
+            profession_mix: Profesión, lista de profesiones o {profesión: peso}
+            race_mix: Raza, lista de razas o {raza: peso}
+
+        Returns:
+            Settlement
+        """
+        settlement = Settlement(settlement_id, size, profession_mix, race_mix)
+        self.settlements[settlement_id] = settlement
+        return settlement
+
+    def __len__(self):
+        """Número total de NPCs (virtuales) de todos los asentamientos."""
+        return sum(settlement.size for settlement in self.settlements.values())
+
+    def __contains__(self, key):
+        settlement_id, index = key
+        settlement = self.settlements.get(settlement_id)
+        return settlement is not None and 0 <= index < settlement.size
+
+    @property
+    def loaded(self):
+        """Número de NPCs construidos en memoria."""
+        return len(self._loaded)
+
+    def is_loaded(self, settlement_id, index):
+        """True si el NPC está construido en memoria."""
+        return (settlement_id, index) in self._loaded
+
+    # ------------------------------
+    # NPCs
+    # ------------------------------
+
+    def _settlement(self, settlement_id, index):
+        settlement = self.settlements.get(settlement_id)
+        if settlement is None:
+            raise KeyError(f"Asentamiento desconocido: {settlement_id!r}")
+        if not 0 <= index < settlement.size:
+            raise IndexError(f"NPC fuera del asentamiento {settlement_id!r}: {index}")
+        return settlement
+
+    def _roll_profile(self, settlement, rng):
+        """Profesión y raza (primeras tiradas del flujo del NPC)."""
+        profession = rng.choices(settlement.professions, settlement.profession_weights)[0]
+        race = rng.choices(settlement.races, settlement.race_weights)[0]
+        return profession, race
+
+    def profile(self, settlement_id, index):
+        """
+        Profesión y raza de un NPC sin construirlo.
+
+        Returns:
+            Tupla (profession_name, race_name)
+        """
+        settlement = self._settlement(settlement_id, index)
+        return self._roll_profile(settlement, py_stream(self.world_seed, STREAM_NPC, settlement_id, index))
+
+    def generate(self, settlement_id, index):
+        """
+        Construye el NPC original (sin deltas y sin pasar por el LRU).
+
+        Returns:
+            NPC
+        """
+        settlement = self._settlement(settlement_id, index)
+        rng = py_stream(self.world_seed, STREAM_NPC, settlement_id, index)
+        profession, race = self._roll_profile(settlement, rng)
+        self.generated += 1
+        return NPC(profession_name=profession, race_name=race, rng=rng)
+
+    def get(self, settlement_id, index):
+        """
+        Retorna un NPC, generándolo (con sus deltas) si no está en memoria.
+
+        Args:
+            settlement_id: Asentamiento
+            index: Índice del NPC dentro del asentamiento
+
+        Returns:
+            NPC (el mismo objeto mientras siga en el LRU)
+        """
+        key = (settlement_id, index)
+        entry = self._loaded.get(key)
+        if entry is not None:
+            self._loaded.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        npc = self.generate(settlement_id, index)
+        baseline = capture(npc)
+        delta = self._deltas.pop(key, None)
+        if delta:
+            apply_delta(npc, delta)
+
+        self._loaded[key] = (npc, baseline)
+        while len(self._loaded) > self.max_loaded:
+            self._evict(*self._loaded.popitem(last=False))
+        return npc
+
+    def _evict(self, key, entry):
+        """Guarda los deltas de un NPC que sale de memoria."""
+        npc, baseline = entry
+        # Sale de la simulación de necesidades junto con la memoria
+        needs = getattr(npc, "_needs", None)
+        if needs is not None:
+            needs.remove(npc)
+        delta = diff(baseline, npc)
+        if delta:
+            self._deltas[key] = delta
+        self.evicted += 1
+
+    def unload(self, settlement_id, index):
+        """Saca un NPC de memoria (conservando sus deltas)."""
+        key = (settlement_id, index)
+        entry = self._loaded.pop(key, None)
+        if entry is not None:
+            self._evict(key, entry)
+
+    def reset(self, settlement_id, index):
+        """Descarta los cambios de un NPC: vuelve a su versión generada."""
+        key = (settlement_id, index)
+        self._loaded.pop(key, None)
+        self._deltas.pop(key, None)
+
+    def delta(self, settlement_id, index):
+        """Cambios actuales de un NPC respecto al generado ({} si ninguno)."""
+        key = (settlement_id, index)
+        entry = self._loaded.get(key)
+        if entry is not None:
+            return diff(entry[1], entry[0])
+        return copy.deepcopy(self._deltas.get(key, {}))
+
+    def deltas(self):
+        """
+        Todos los deltas, incluidos los de NPCs cargados.
+
+        Returns:
+            Diccionario {(asentamiento, índice): {campo: valor}}
+        """
+        result = {key: copy.deepcopy(delta) for key, delta in self._deltas.items()}
+        for key, (npc, baseline) in self._loaded.items():
+            delta = diff(baseline, npc)
+            if delta:
+                result[key] = delta
+        return result
+
+    def clear(self):
+        """Saca de memoria todos los NPCs (conservando sus deltas)."""
+        while self._loaded:
+            self._evict(*self._loaded.popitem(last=False))
+
+    # ------------------------------
+    # Persistencia
+    # ------------------------------
+
+    def to_dict(self):
+        """
+        Estado serializable a JSON: asentamientos y deltas (nada más).
+
+        Returns:
+            Diccionario {"settlements": [...]}, con los deltas de cada
+            asentamiento por índice
+        """
+        deltas = self.deltas()
+        settlements = []
+        for settlement_id, settlement in self.settlements.items():
+            data = settlement.to_dict()
+            data["deltas"] = {
+                str(index): delta for (owner, index), delta in deltas.items() if owner == settlement_id
+            }
+            settlements.append(data)
+        return {"settlements": settlements}
+
+    @classmethod
+    def from_dict(cls, world_seed, data, max_loaded=DEFAULT_MAX_LOADED):
+        """
+        Reconstruye una población guardada con to_dict.
+
+        Args:
+            world_seed: Semilla del mundo (la misma con la que se guardó)
+            data: Diccionario de to_dict (o vacío)
+            max_loaded: NPCs que se mantienen construidos en memoria
+
+        Returns:
+            VirtualPopulation
+        """
+        population = cls(world_seed, max_loaded)
+        for item in (data or {}).get("settlements", []):
+            settlement_id = item["id"]
+            population.add_settlement(settlement_id, item["size"], item["professions"], item["races"])
+            for index, delta in item.get("deltas", {}).items():
+                population._deltas[(settlement_id, int(index))] = delta
+        return population
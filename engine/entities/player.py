@@ -2,6 +2,7 @@ import os
 import json
 from InquirerPy import inquirer
 from engine.entities.entity import Entity
+from engine.utils.data_registry import get_registry
 from pathlib import Path
 import random
 import datetime
@@ -10,17 +11,16 @@ import uuid
 # Obtener la ruta base del proyecto
 # === RUTAS PORTABLES ===
 BASE_DIR = Path(__file__).resolve().parent.parent.parent  # -> raíz del proyecto (E:\jogo)
-DATA_DIR = BASE_DIR / "data"
 
-RACES_PATH = DATA_DIR / "races.json"
-STATS_PATH = DATA_DIR / "stats.json"
+def create_player(rng=None):
+    # Flujo aleatorio propio (altura); inyectable para reproducir la creación
+    if rng is None:
+        rng = random.Random()
 
-def create_player():
-    # Cargar archivos JSON
-    with open(RACES_PATH, "r", encoding="utf-8") as f:
-        races_data = json.load(f)
-    with open(STATS_PATH, "r", encoding="utf-8") as f:
-        stats_data = json.load(f)
+    # Datos compartidos (cargados una vez por proceso)
+    registry = get_registry()
+    races_data = registry.races
+    stats_data = registry.stats
 
     # 1️⃣ Selección del nombre del jugador
     player_name = inquirer.text(
@@ -35,7 +35,7 @@ def create_player():
         choices=race_options
     ).execute()
 
-    selected_race = next((r for r in races_data if r["display"] == choice_race), None)
+    selected_race = registry.races_by_display.get(choice_race)
     if not selected_race:
         print("❌ Error: raza no encontrada.")
         return None
@@ -90,7 +90,7 @@ def create_player():
     player_entity = Entity(name=player_name, new_stats=stats, height=0)
     player_entity.race = {selected_race["race_name"]: 100}
     player_entity.age = age
-    player_entity.height = random.randint(int(selected_race["min_height"]), int(selected_race["max_height"]))
+    player_entity.height = rng.randint(int(selected_race["min_height"]), int(selected_race["max_height"]))
 
     print("\n✅ Jugador creado con éxito.")
     print(f"👉 Nombre: {player_entity.name}")
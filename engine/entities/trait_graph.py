@@ -0,0 +1,270 @@
+# engine/entities/trait_graph.py
+"""
+Grafo de rasgos de personalidad compilado.
+
+personality_traits.json describe cada rasgo por id con sus conflictos,
+sinergias y rango de intensidad. TraitGraph lo compila una sola vez a:
+
+- ids enteros (posición del rasgo en el archivo),
+- máscaras de bits de conflictos y sinergias (un entero de Python por
+  rasgo para el camino escalar; palabras uint64 para el camino en lote),
+- rangos de intensidad como arrays,
+- una matriz de modificadores (rasgo x valor de comportamiento) a partir
+  de TRAIT_VALUE_MODIFIERS.
+
+Generar una personalidad pasa a ser recorrer listas de enteros y comparar
+máscaras, sin buscar en diccionarios ni recorrer listas de conflictos; los
+valores de comportamiento salen de la matriz. Los métodos *_batch hacen lo
+mismo para muchos NPCs de la misma profesión con un numpy.random.Generator.
+
+Las tiradas se consumen en el mismo orden que antes de compilar el grafo,
+así que la misma semilla da la misma personalidad.
+"""
+
+import numpy as np
+
+# Probabilidad de añadir cada rasgo sinérgico y de aceptar uno que contradiga
+SYNERGY_CHANCE = 0.3
+CONTRADICTION_CHANCE = 0.10
+
+# Intensidad guardada para los rasgos que el NPC no tiene
+NO_TRAIT = -1
+
+# Rasgos por palabra de las máscaras en lote
+WORD_BITS = 64
+
+
+class TraitGraph:
+    """Rasgos de personalidad con ids enteros, máscaras y matriz de modificadores."""
+
+    def __init__(self, traits, value_modifiers, value_names):
+        """
+        Compila el grafo.
+
+        Args:
+            traits: Lista de rasgos (como en personality_traits.json)
+            value_modifiers: {trait_id: {valor: modificador a intensidad 100}}
+            value_names: Nombres de los valores de comportamiento (columnas)
+        """
+        self.source = traits
+        self.trait_ids = tuple(trait["id"] for trait in traits)
+        self.index = {trait_id: i for i, trait_id in enumerate(self.trait_ids)}
+        self.value_names = tuple(value_names)
+        count = len(self.trait_ids)
+
+        ranges = []
+        for trait in traits:
+            intensity = trait.get("intensity", {})
+            ranges.append((intensity.get("min", 0), intensity.get("max", 100)))
+        self.ranges = tuple(ranges)
+        self.min_intensity = np.array([low for low, _ in ranges], dtype=np.int16)
+        self.max_intensity = np.array([high for _, high in ranges], dtype=np.int16)
+
+        # Sinergias en su orden original; -1 para ids desconocidos (el camino
+        # escalar tira el dado igualmente, como el código original)
+        self.synergies = tuple(
+            tuple(self.index.get(synergy_id, -1) for synergy_id in trait.get("synergies", []))
+            for trait in traits
+        )
+        self.conflict_masks = tuple(self._mask(trait.get("conflicts", [])) for trait in traits)
+        self.synergy_masks = tuple(self._mask(trait.get("synergies", [])) for trait in traits)
+
+        words = max(1, -(-count // WORD_BITS))
+        self.conflict_words = np.zeros((count, words), dtype=np.uint64)
+        for i, mask in enumerate(self.conflict_masks):
+            self.conflict_words[i] = self._words(mask, words)
+
+        self.modifier_matrix = np.zeros((count, len(self.value_names)), dtype=np.float64)
+        value_column = {name: i for i, name in enumerate(self.value_names)}
+        for trait_id, modifiers in value_modifiers.items():
+            row = self.index.get(trait_id)
+            if row is None:
+                continue
+            for value_name, modifier in modifiers.items():
+                if value_name in value_column:
+                    self.modifier_matrix[row, value_column[value_name]] = modifier
+        self.modifier_traits = np.flatnonzero(self.modifier_matrix.any(axis=1))
+        # Modificadores como (columna, modificador) por trait_id; incluye los
+        # rasgos sin fila en la matriz (no están en los datos pero pueden
+        # añadirse a mano a una personalidad)
+        self.modifier_rows = {
+            trait_id: tuple(
+                (value_column[value_name], float(modifier))
+                for value_name, modifier in modifiers.items() if value_name in value_column and modifier
+            )
+            for trait_id, modifiers in value_modifiers.items()
+        }
+
+        self._plans = {}
+
+    def __len__(self):
+        return len(self.trait_ids)
+
+    def _mask(self, trait_ids):
+        """Máscara de bits de una lista de ids (ignora los desconocidos)."""
+        mask = 0
+        for trait_id in trait_ids:
+            i = self.index.get(trait_id)
+            if i is not None:
+                mask |= 1 << i
+        return mask
+
+    @staticmethod
+    def _words(mask, words):
+        """Máscara de Python partida en palabras uint64."""
+        return [(mask >> (WORD_BITS * w)) & 0xFFFFFFFFFFFFFFFF for w in range(words)]
+
+    def plan(self, profession_traits):
+        """
+        Rasgos base de una profesión como ids enteros (se calcula una vez).
+
+        Args:
+            profession_traits: Lista de trait IDs de la profesión
+
+        Returns:
+            Tupla (tiradas base en orden, rasgos base sin repetir)
+        """
+        key = tuple(profession_traits)
+        plan = self._plans.get(key)
+        if plan is None:
+            rolls = tuple(self.index[trait_id] for trait_id in key if trait_id in self.index)
+            plan = (rolls, tuple(dict.fromkeys(rolls)))
+            self._plans[key] = plan
+        return plan
+
+    # ------------------------------
+    # Un NPC
+    # ------------------------------
+
+    def roll_personality(self, profession_traits, rng):
+        """
+        Personalidad de un NPC: rasgos base con intensidad aleatoria y, por
+        cada sinergia, SYNERGY_CHANCE de añadirla (solo CONTRADICTION_CHANCE
+        si choca con un rasgo ya elegido).
+
+        Args:
+            profession_traits: Lista de trait IDs de la profesión
+            rng: random.Random (o el módulo random)
+
+        Returns:
+            Diccionario {trait_id: intensidad}
+        """
+        rolls, base = self.plan(profession_traits)
+        ranges = self.ranges
+        intensities = {}
+        for i in rolls:
+            low, high = ranges[i]
+            intensities[i] = rng.randint(low, high)
+        selected = 0
+        for i in base:
+            selected |= 1 << i
+
+        for i in base:
+            for synergy in self.synergies[i]:
+                if synergy >= 0 and selected >> synergy & 1:
+                    continue
+                if rng.random() >= SYNERGY_CHANCE or synergy < 0:
+                    continue
+                if self.conflict_masks[synergy] & selected and rng.random() > CONTRADICTION_CHANCE:
+                    continue
+                low, high = ranges[synergy]
+                intensities[synergy] = rng.randint(low, high)
+                selected |= 1 << synergy
+
+        trait_ids = self.trait_ids
+        return {trait_ids[i]: intensity for i, intensity in intensities.items()}
+
+    def npc_values(self, base_values, personality):
+        """
+        Valores de comportamiento: los de la profesión más los modificadores
+        de cada rasgo escalados por su intensidad, en [0, 100].
+
+        Args:
+            base_values: Diccionario {valor: base} (claves en value_names)
+            personality: Diccionario {trait_id: intensidad}
+
+        Returns:
+            Diccionario {valor: entero}
+        """
+        values = [base_values[name] for name in self.value_names]
+        modifier_row = self.modifier_rows.get
+        for trait_id, intensity in personality.items():
+            row = modifier_row(trait_id)
+            if row is None:
+                continue
+            scale = intensity / 100.0
+            for column, modifier in row:
+                values[column] += int(modifier * scale)
+        return {
+            name: 0 if value < 0 else 100 if value > 100 else value
+            for name, value in zip(self.value_names, values)
+        }
+
+    # ------------------------------
+    # En lote
+    # ------------------------------
+
+    def roll_intensities(self, rng, trait, size):
+        """Intensidades uniformes de un rasgo para `size` NPCs."""
+        return rng.integers(self.min_intensity[trait], int(self.max_intensity[trait]) + 1, size=size)
+
+    def roll_personality_batch(self, profession_traits, rng, size):
+        """
+        Personalidad de `size` NPCs de la misma profesión (mismas
+        probabilidades que roll_personality; conflictos con máscaras uint64).
+
+        Args:
+            profession_traits: Lista de trait IDs de la profesión
+            rng: numpy.random.Generator
+            size: Número de NPCs
+
+        Returns:
+            Array (size, len(self)) int8 de intensidades (NO_TRAIT si falta)
+        """
+        rolls, base = self.plan(profession_traits)
+        personality = np.full((size, len(self)), NO_TRAIT, dtype=np.int8)
+        selected = np.zeros((size, self.conflict_words.shape[1]), dtype=np.uint64)
+
+        for i in rolls:
+            personality[:, i] = self.roll_intensities(rng, i, size)
+            selected[:, i // WORD_BITS] |= np.uint64(1 << (i % WORD_BITS))
+
+        for i in base:
+            for synergy in self.synergies[i]:
+                if synergy < 0 or synergy in base:
+                    continue
+                word, bit = divmod(synergy, WORD_BITS)
+                bit = np.uint64(1 << bit)
+                candidates = ((selected[:, word] & bit) == 0) & (rng.random(size) < SYNERGY_CHANCE)
+                conflict = (selected & self.conflict_words[synergy]).any(axis=1)
+                allowed = ~conflict | (rng.random(size) <= CONTRADICTION_CHANCE)
+
+                added = candidates & allowed
+                intensity = self.roll_intensities(rng, synergy, size)
+                personality[added, synergy] = intensity[added]
+                selected[added, word] |= bit
+
+        return personality
+
+    def npc_values_batch(self, base_values, personality):
+        """
+        Valores de comportamiento de muchos NPCs (como npc_values).
+
+        Args:
+            base_values: Diccionario {valor: base} común al grupo
+            personality: Array (n, len(self)) de roll_personality_batch
+
+        Returns:
+            Array (n, len(value_names)) int8 en [0, 100]
+        """
+        base = np.array([base_values[name] for name in self.value_names], dtype=np.int64)
+        values = np.tile(base, (len(personality), 1))
+        for trait in self.modifier_traits:
+            intensity = personality[:, trait]
+            present = intensity != NO_TRAIT
+            if not present.any():
+                continue
+            scale = intensity[present] / 100.0
+            # int() trunca hacia cero, igual que en npc_values
+            values[present] += np.trunc(np.outer(scale, self.modifier_matrix[trait])).astype(np.int64)
+        return np.clip(values, 0, 100).astype(np.int8)
@@ -0,0 +1,198 @@
+# engine/systems/decisions.py
+"""
+Decisiones de comportamiento de NPCs (atacar, traicionar...) en lote.
+
+Cada decisión tiene una fórmula que convierte los valores de
+comportamiento (npc_values: aggressiveness, honesty, loyalty, caution) en
+una probabilidad. La misma fórmula sirve para un NPC (valores escalares)
+y para muchos (columnas de NumPy), así que NPC.would_initiate_combat y
+would_initiate_combat(población, rng) dan el mismo resultado con el mismo
+flujo aleatorio: una tirada uniforme por NPC, en orden.
+
+Las fórmulas se pueden reemplazar con set_formula (p. ej. para un modo de
+juego más agresivo); la probabilidad se recorta a [0, 1] después de
+aplicarlas, así que no necesitan hacerlo.
+
+Uso:
+    rng = np_stream(world_seed, "encounter", encounter_id)
+    attackers = would_initiate_combat(population, rng)   # máscara booleana
+"""
+
+import numpy as np
+
+DECISION_COMBAT = "combat"
+DECISION_BETRAY = "betray"
+
+# Valor que se asume para un npc_value que falta (igual que NPC.npc_values.get)
+DEFAULT_VALUE = 50
+
+
+def combat_probability(values):
+    """Probabilidad de iniciar combate: (aggressiveness - caution) / 100."""
+    return (values["aggressiveness"] - values["caution"]) / 100.0
+
+
+def betrayal_probability(values):
+    """Probabilidad de traicionar: (100 - loyalty) / 100."""
+    return (100 - values["loyalty"]) / 100.0
+
+
+# Decisión -> fórmula(valores) -> probabilidad (escalar o array)
+FORMULAS = {
+    DECISION_COMBAT: combat_probability,
+    DECISION_BETRAY: betrayal_probability,
+}
+
+
+def get_formula(decision):
+    """Fórmula de una decisión (KeyError si no existe)."""
+    formula = FORMULAS.get(decision)
+    if formula is None:
+        raise KeyError(f"Decisión desconocida: {decision!r}")
+    return formula
+
+
+def set_formula(decision, formula):
+    """
+    Registra o reemplaza la fórmula de una decisión.
+
+    Args:
+        decision: Nombre de la decisión (ej: DECISION_COMBAT)
+        formula: Función (valores) -> probabilidad; recibe un mapping
+                 {valor: número} o {valor: array} y debe funcionar con ambos
+
+    Returns:
+        Fórmula anterior (o None)
+    """
+    previous = FORMULAS.get(decision)
+    FORMULAS[decision] = formula
+    return previous
+
+
+# ------------------------------
+# Un NPC
+# ------------------------------
+
+def probability(decision, values):
+    """
+    Probabilidad (en [0, 1]) de una decisión para un NPC.
+
+    Args:
+        decision: Nombre de la decisión
+        values: Diccionario npc_values del NPC
+
+    Returns:
+        float
+    """
+    return max(0.0, min(1.0, float(get_formula(decision)(values))))
+
+
+def decide_one(decision, values, rng):
+    """
+    Tira la decisión para un NPC.
+
+    Args:
+        decision: Nombre de la decisión
+        values: Diccionario npc_values del NPC
+        rng: Flujo aleatorio con random() (random, random.Random o
+             numpy.random.Generator)
+
+    Returns:
+        bool
+    """
+    return bool(rng.random() < probability(decision, values))
+
+
+# ------------------------------
+# En lote
+# ------------------------------
+
+def value_columns(source, value_names=None):
+    """
+    Columnas float64 de npc_values de muchos NPCs.
+
+    Args:
+        source: NPCPopulation, array (n, len(value_names)), diccionario
+                {valor: array} o lista de NPCs
+        value_names: Nombres de las columnas si source es un array 2D
+
+    Returns:
+        Diccionario {valor: array (n,)}
+
+    Raises:
+        ValueError: si source es un array y no se indican value_names
+    """
+    if hasattr(source, "npc_values") and hasattr(source, "value_names"):
+        value_names, source = source.value_names, source.npc_values
+    if isinstance(source, np.ndarray):
+        if value_names is None:
+            raise ValueError("value_names es requerido para un array de npc_values")
+        return {name: source[:, i].astype(np.float64) for i, name in enumerate(value_names)}
+    if hasattr(source, "items"):
+        return {name: np.asarray(column, dtype=np.float64) for name, column in source.items()}
+
+    npcs = list(source)
+    names = set()
+    for npc in npcs:
+        names.update(npc.npc_values)
+    return {
+        name: np.array([npc.npc_values.get(name, DEFAULT_VALUE) for npc in npcs], dtype=np.float64)
+        for name in names
+    }
+
+
+class _Defaults(dict):
+    """Columnas con DEFAULT_VALUE para los valores que faltan."""
+
+    __slots__ = ("size",)
+
+    def __init__(self, columns):
+        super().__init__(columns)
+        self.size = len(next(iter(columns.values()))) if columns else 0
+
+    def __missing__(self, name):
+        return np.full(self.size, DEFAULT_VALUE, dtype=np.float64)
+
+
+def probabilities(decision, source, value_names=None):
+    """
+    Probabilidades (en [0, 1]) de una decisión para muchos NPCs.
+
+    Returns:
+        Array float64 (n,)
+    """
+    columns = _Defaults(value_columns(source, value_names))
+    chances = np.asarray(get_formula(decision)(columns), dtype=np.float64)
+    # Una fórmula constante también da una probabilidad por NPC
+    return np.clip(np.broadcast_to(chances, (columns.size,)), 0.0, 1.0)
+
+
+def decide(decision, source, rng=None, value_names=None):
+    """
+    Tira una decisión para muchos NPCs a la vez.
+
+    Args:
+        decision: Nombre de la decisión
+        source: NPCs (ver value_columns)
+        rng: numpy.random.Generator (uno nuevo si es None); consume una
+             tirada por NPC, en el mismo orden que decide_one en un bucle
+        value_names: Nombres de las columnas si source es un array 2D
+
+    Returns:
+        Máscara booleana (n,)
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    chances = probabilities(decision, source, value_names)
+    return rng.random(chances.shape) < chances
+
+
+def would_initiate_combat(source, rng=None, value_names=None):
+    """Máscara de los NPCs que inician combate (ver decide)."""
+    return decide(DECISION_COMBAT, source, rng, value_names)
+
+
+def would_betray(source, rng=None, value_names=None):
+    """Máscara de los NPCs que traicionan (ver decide)."""
+    return decide(DECISION_BETRAY, source, rng, value_names)
+
@@ -0,0 +1,242 @@
+# engine/systems/needs.py
+"""
+Simulación vectorizada de las necesidades de muchas entidades.
+
+NeedsStore guarda hambre, sed, cansancio, calor mágico, stamina, salud y
+mana de todas sus entidades en arrays de NumPy (una fila por entidad) y
+las actualiza juntas con tick(dt):
+
+- decaimiento de hambre, sed, cansancio y calor mágico (y recuperación de
+  stamina si se configura) con su tasa por entidad,
+- recorte a los mismos rangos que Entity (0-100; calor mágico hasta
+  max_magic_heat),
+- daño por inanición / deshidratación cuando hambre o sed llegan a 0,
+- cambios de estado con la regla de Entity.take_damage: "knocked_out" con
+  salud <= 0 y "dead" con salud <= -max_health // 2.
+
+Una entidad añadida al almacén pasa a ser una vista de su fila: leer o
+escribir entity.hunger (o usar alter_hunger, take_damage...) lee o escribe
+el array. Al quitarla, los valores vuelven a la propia entidad.
+
+Las tasas están en unidades por unidad de tiempo; dt usa la misma unidad
+(igual que time_passed en Entity.update_needs).
+"""
+
+import numpy as np
+
+# Campos numéricos guardados por fila (mismos nombres que en Entity)
+NEED_FIELDS = (
+    "hunger", "thirst", "tiredness", "magic_heat", "max_magic_heat", "stamina",
+    "current_health", "max_health", "current_mana", "max_mana",
+)
+
+# Tasas por fila
+RATE_FIELDS = ("hunger_rate", "thirst_rate", "tiredness_rate", "magic_heat_rate", "stamina_rate")
+
+DEFAULT_RATES = {
+    "hunger_rate": 1.0,       # Puntos de hambre perdidos por unidad de tiempo
+    "thirst_rate": 1.5,       # Puntos de sed perdidos por unidad de tiempo
+    "tiredness_rate": 0.5,    # Puntos de cansancio perdidos por unidad de tiempo
+    "magic_heat_rate": 5.0,   # Calor mágico disipado por unidad de tiempo
+    "stamina_rate": 0.0,      # Stamina recuperada por unidad de tiempo
+}
+
+# Salud perdida por unidad de tiempo por cada necesidad agotada (hambre, sed)
+STARVATION_DAMAGE = 1.0
+
+NEED_MAX = 100
+
+# Estados con código fijo; el resto se registra al usarse
+STATE_CONSCIOUS = 0
+STATE_KNOCKED_OUT = 1
+STATE_DEAD = 2
+BASE_STATES = ("conscious", "knocked_out", "dead")
+
+
+class NeedsStore:
+    """Necesidades de muchas entidades en arrays de NumPy."""
+
+    def __init__(self, capacity=256, starvation_damage=STARVATION_DAMAGE):
+        """
+        Args:
+            capacity: Filas reservadas al inicio (crece al doble cuando se llena)
+            starvation_damage: Salud perdida por unidad de tiempo por cada
+                               necesidad (hambre o sed) en 0
+        """
+        self.starvation_damage = starvation_damage
+        self.size = 0
+        self.entities = []
+        self.columns = {
+            name: np.zeros(capacity, dtype=np.float64) for name in NEED_FIELDS + RATE_FIELDS
+        }
+        self.states = np.zeros(capacity, dtype=np.int16)
+        self.state_names = list(BASE_STATES)
+        self._state_codes = {name: code for code, name in enumerate(BASE_STATES)}
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, entity):
+        return getattr(entity, "_needs", None) is self
+
+    # ------------------------------
+    # Filas
+    # ------------------------------
+
+    def _grow(self, needed):
+        capacity = len(self.states)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name, column in self.columns.items():
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            self.columns[name] = grown
+        grown = np.zeros(capacity, dtype=self.states.dtype)
+        grown[:self.size] = self.states[:self.size]
+        self.states = grown
+
+    def add(self, entity, **rates):
+        """
+        Añade una entidad: copia sus valores a una fila y la convierte en
+        vista de esa fila.
+
+        Args:
+            entity: Entity que no esté en otro almacén
+            **rates: Tasas de la entidad (ver DEFAULT_RATES)
+
+        Returns:
+            Fila asignada
+        """
+        if getattr(entity, "_needs", None) is not None:
+            raise ValueError(f"{entity.name} ya está en un NeedsStore")
+        unknown = set(rates) - set(RATE_FIELDS)
+        if unknown:
+            raise ValueError(f"Tasas desconocidas: {sorted(unknown)}")
+
+        row = self.size
+        self._grow(row + 1)
+        for name in NEED_FIELDS:
+            self.columns[name][row] = getattr(entity, name)
+        for name in RATE_FIELDS:
+            self.columns[name][row] = rates.get(name, DEFAULT_RATES[name])
+        self.states[row] = self.state_code(entity.state)
+
+        self.size += 1
+        self.entities.append(entity)
+        entity._attach_needs(self, row)
+        return row
+
+    def add_many(self, entities, **rates):
+        """Añade varias entidades con las mismas tasas."""
+        for entity in entities:
+            self.add(entity, **rates)
+
+    def remove(self, entity):
+        """
+        Quita una entidad: sus valores vuelven a la entidad y la última
+        fila ocupa su lugar.
+        """
+        if entity not in self:
+            raise ValueError(f"{entity.name} no está en este NeedsStore")
+        row = entity._needs_row
+        entity._detach_needs()
+
+        last = self.size - 1
+        if row != last:
+            for column in self.columns.values():
+                column[row] = column[last]
+            self.states[row] = self.states[last]
+            moved = self.entities[last]
+            self.entities[row] = moved
+            moved._needs_row = row
+        self.entities.pop()
+        self.size -= 1
+
+    def get(self, name, row):
+        """Valor de un campo de una fila (float de Python)."""
+        return float(self.columns[name][row])
+
+    def set(self, name, row, value):
+        """Escribe un campo de una fila."""
+        self.columns[name][row] = value
+
+    def column(self, name):
+        """Vista del campo `name` para las filas ocupadas."""
+        return self.columns[name][:self.size]
+
+    # ------------------------------
+    # Estados
+    # ------------------------------
+
+    def state_code(self, name):
+        """Código de un estado (lo registra si es nuevo)."""
+        code = self._state_codes.get(name)
+        if code is None:
+            code = len(self.state_names)
+            self.state_names.append(name)
+            self._state_codes[name] = code
+        return code
+
+    def get_state(self, row):
+        """Nombre del estado de una fila."""
+        return self.state_names[self.states[row]]
+
+    def set_state(self, row, name):
+        """Cambia el estado de una fila."""
+        self.states[row] = self.state_code(name)
+
+    def state_counts(self):
+        """Diccionario {estado: número de entidades}."""
+        counts = np.bincount(self.states[:self.size], minlength=len(self.state_names))
+        return {name: int(counts[code]) for code, name in enumerate(self.state_names) if counts[code]}
+
+    # ------------------------------
+    # Simulación
+    # ------------------------------
+
+    def tick(self, dt):
+        """
+        Avanza la simulación `dt` unidades de tiempo para todas las filas.
+
+        Las entidades muertas no cambian.
+
+        Args:
+            dt: Tiempo transcurrido
+
+        Returns:
+            Array con las filas que cambiaron de estado en este tick
+        """
+        n = self.size
+        if n == 0:
+            return np.zeros(0, dtype=np.int64)
+        c = {name: column[:n] for name, column in self.columns.items()}
+        states = self.states[:n]
+        alive = states != STATE_DEAD
+
+        for need in ("hunger", "thirst", "tiredness"):
+            decayed = np.clip(c[need] - c[need + "_rate"] * dt, 0, NEED_MAX)
+            np.copyto(c[need], decayed, where=alive)
+
+        heat = np.clip(c["magic_heat"] - c["magic_heat_rate"] * dt, 0, c["max_magic_heat"])
+        np.copyto(c["magic_heat"], heat, where=alive)
+
+        # Igual que alter_stamina: solo se recorta al cambiar
+        regenerating = alive & (c["stamina_rate"] != 0)
+        stamina = np.clip(c["stamina"] + c["stamina_rate"] * dt, 0, NEED_MAX)
+        np.copyto(c["stamina"], stamina, where=regenerating)
+
+        # Inanición y deshidratación
+        depleted = (c["hunger"] <= 0).astype(np.float64) + (c["thirst"] <= 0)
+        damage = depleted * (self.starvation_damage * dt)
+        c["current_health"] -= np.where(alive, damage, 0.0)
+
+        # Mismas reglas que Entity.take_damage
+        down = alive & (c["current_health"] <= 0) & (damage > 0)
+        dead = down & (c["current_health"] <= np.floor_divide(-c["max_health"], 2))
+        knocked_out = down & ~dead & (states != STATE_KNOCKED_OUT)
+        changed = np.flatnonzero(dead | knocked_out)
+        states[dead] = STATE_DEAD
+        states[knocked_out] = STATE_KNOCKED_OUT
+        return changed
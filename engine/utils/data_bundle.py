@@ -0,0 +1,262 @@
+# engine/utils/data_bundle.py
+"""
+Paquete precompilado de los datos del juego (data/*.json).
+
+Todos los JSON se validan, se indexan y se guardan juntos en un único
+archivo marshal (data/__pycache__/data_bundle.marshal). Al arrancar se
+lee ese archivo de una vez en lugar de abrir y parsear cada JSON.
+
+El paquete guarda el hash SHA-256 del contenido de los JSON y el tamaño
+y mtime de cada uno:
+- si tamaños y mtimes coinciden, se usa directamente;
+- si no, se recalcula el hash; si el contenido no cambió solo se
+  actualizan las marcas, y si cambió se recompila.
+
+Un paquete de otra versión de Python (marshal no es portable), de otra
+versión de este formato o corrupto se recompila igual.
+
+Compilación manual (informa del tiempo de carga antes y después):
+
+    python -m engine.utils.data_bundle
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+DATA = BASE_DIR / "data"
+
+BUNDLE_VERSION = 1
+BUNDLE_FILENAME = "data_bundle.marshal"
+
+# Índices precalculados: nombre -> (archivo, clave contenedora o None, campo)
+INDEXES = {
+    "professions_by_name": ("professions", None, "profession_name"),
+    "races_by_name": ("races", None, "race_name"),
+    "races_by_display": ("races", None, "display"),
+    "stats_by_name": ("stats", None, "stat_name"),
+    "traits_by_id": ("personality_traits", "traits", "id"),
+    "skills_by_name": ("skills", None, "skill_name"),
+}
+
+
+class DataBundleError(ValueError):
+    """Un JSON de data/ no es válido o no se puede indexar."""
+
+
+def default_bundle_path(data_dir=DATA):
+    """Ruta del paquete para un directorio de datos."""
+    return Path(data_dir) / "__pycache__" / BUNDLE_FILENAME
+
+
+def source_files(data_dir=DATA):
+    """JSON de origen, ordenados por nombre."""
+    return sorted(Path(data_dir).glob("*.json"))
+
+
+def source_stamps(paths):
+    """{nombre: [tamaño, mtime_ns]} de los JSON de origen."""
+    stamps = {}
+    for path in paths:
+        stat = path.stat()
+        stamps[path.stem] = [stat.st_size, stat.st_mtime_ns]
+    return stamps
+
+
+def content_hash(paths):
+    """SHA-256 (hex) de los nombres y el contenido de los JSON."""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.name.encode("utf-8") + b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _items(files, file_name, container):
+    """Lista indexable de un archivo, o None si el archivo no existe."""
+    data = files.get(file_name)
+    if data is None:
+        return None
+    if container is not None:
+        if not isinstance(data, dict) or container not in data:
+            raise DataBundleError(f"{file_name}.json: falta la clave '{container}'")
+        data = data[container]
+    if not isinstance(data, list):
+        raise DataBundleError(f"{file_name}.json: se esperaba una lista")
+    return data
+
+
+def build_indexes(files):
+    """
+    Valida las listas indexadas y calcula sus índices.
+
+    Args:
+        files: {nombre de archivo: datos JSON}
+
+    Returns:
+        {nombre del índice: {valor del campo: posición en la lista}}
+
+    Raises:
+        DataBundleError: si falta el campo o hay valores repetidos
+    """
+    indexes = {}
+    for index_name, (file_name, container, field) in INDEXES.items():
+        items = _items(files, file_name, container)
+        if items is None:
+            continue
+        positions = {}
+        for position, item in enumerate(items):
+            if not isinstance(item, dict) or field not in item:
+                raise DataBundleError(
+                    f"{file_name}.json: el elemento {position} no tiene '{field}'"
+                )
+            key = item[field]
+            if key in positions:
+                raise DataBundleError(f"{file_name}.json: '{field}' repetido: {key!r}")
+            positions[key] = position
+        indexes[index_name] = positions
+    return indexes
+
+
+def build_bundle(data_dir=DATA):
+    """
+    Lee, valida e indexa todos los JSON de un directorio.
+
+    Args:
+        data_dir: Directorio de datos
+
+    Returns:
+        Diccionario del paquete (listo para marshal)
+
+    Raises:
+        DataBundleError: si algún JSON no es válido
+    """
+    paths = source_files(data_dir)
+    files = {}
+    for path in paths:
+        try:
+            files[path.stem] = json.loads(path.read_bytes().decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise DataBundleError(f"{path.name}: {e}") from e
+
+    return {
+        "version": BUNDLE_VERSION,
+        "python": sys.implementation.cache_tag,
+        "hash": content_hash(paths),
+        "sources": source_stamps(paths),
+        "files": files,
+        "indexes": build_indexes(files),
+    }
+
+
+def write_bundle(bundle, bundle_path):
+    """Escribe el paquete de forma atómica (temporal + os.replace)."""
+    bundle_path = Path(bundle_path)
+    bundle_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=bundle_path.parent, prefix=bundle_path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(marshal.dumps(bundle))
+        os.replace(tmp_path, bundle_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def read_bundle(bundle_path):
+    """
+    Lee un paquete en una sola lectura.
+
+    Returns:
+        Diccionario del paquete, o None si no existe, está corrupto o es
+        de otra versión
+    """
+    try:
+        with open(bundle_path, "rb") as f:
+            bundle = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if (not isinstance(bundle, dict)
+            or bundle.get("version") != BUNDLE_VERSION
+            or bundle.get("python") != sys.implementation.cache_tag):
+        return None
+    return bundle
+
+
+def load_bundle(data_dir=DATA, bundle_path=None):
+    """
+    Paquete actualizado de un directorio de datos, recompilándolo si algún
+    JSON cambió.
+
+    Si el paquete no se puede escribir (directorio de solo lectura) se usa
+    el recién compilado en memoria.
+
+    Args:
+        data_dir: Directorio de datos
+        bundle_path: Ruta del paquete (por defecto data/__pycache__/...)
+
+    Returns:
+        Diccionario del paquete
+    """
+    if bundle_path is None:
+        bundle_path = default_bundle_path(data_dir)
+    paths = source_files(data_dir)
+    stamps = source_stamps(paths)
+
+    bundle = read_bundle(bundle_path)
+    if bundle is not None:
+        if bundle["sources"] == stamps:
+            return bundle
+        if bundle["hash"] == content_hash(paths):
+            # Mismo contenido (p. ej. tras un checkout): solo cambian las marcas
+            bundle["sources"] = stamps
+            _try_write(bundle, bundle_path)
+            return bundle
+
+    bundle = build_bundle(data_dir)
+    _try_write(bundle, bundle_path)
+    return bundle
+
+
+def _try_write(bundle, bundle_path):
+    try:
+        write_bundle(bundle, bundle_path)
+    except OSError as e:
+        print(f"[WARN] No se pudo escribir el paquete de datos {bundle_path}: {e}")
+
+
+def main():
+    """Compila el paquete y compara el tiempo de carga con los JSON."""
+    bundle_path = default_bundle_path()
+    paths = source_files()
+
+    start = time.perf_counter()
+    for path in paths:
+        json.loads(path.read_bytes().decode("utf-8"))
+    json_ms = (time.perf_counter() - start) * 1000
+
+    bundle = build_bundle()
+    write_bundle(bundle, bundle_path)
+
+    start = time.perf_counter()
+    load_bundle()
+    bundle_ms = (time.perf_counter() - start) * 1000
+
+    print(f"Paquete: {bundle_path} ({bundle_path.stat().st_size} bytes, "
+          f"{len(bundle['files'])} archivos, {len(bundle['indexes'])} índices)")
+    print(f"  JSON:    {json_ms:6.2f} ms")
+    print(f"  Paquete: {bundle_ms:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
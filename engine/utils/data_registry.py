@@ -0,0 +1,258 @@
+# engine/utils/data_registry.py
+"""
+Registro central de los datos del juego (data/*.json).
+
+Cada archivo se lee una sola vez por proceso y se guarda congelado: los
+dicts pasan a MappingProxyType y las listas a tuplas, así que los datos
+pueden compartirse entre NPCs, pantallas y generadores sin que nadie los
+modifique por accidente. Sobre ellos se construyen, también una sola vez,
+los índices que antes se recorrían con next(...) en cada consulta:
+
+- profesiones por profession_name
+- razas por race_name (y por display)
+- rasgos de personalidad por id
+- stats por stat_name
+
+Por defecto los datos salen del paquete precompilado (ver data_bundle),
+que se lee de una vez y se recompila solo si algún JSON cambió.
+
+Uso:
+    registry = get_registry()
+    warrior = registry.professions_by_name["warrior"]
+"""
+
+import json
+import threading
+from pathlib import Path
+from types import MappingProxyType
+
+from engine.utils.data_bundle import DATA, load_bundle
+
+
+def freeze(value):
+    """
+    Copia inmutable de un valor JSON.
+
+    Args:
+        value: Valor cargado con json (dict, list o escalar)
+
+    Returns:
+        MappingProxyType para dicts, tuplas para listas, el propio valor
+        para escalares
+    """
+    kind = type(value)
+    if kind is dict:
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if kind is list:
+        return tuple([freeze(item) for item in value])
+    return value
+
+
+def thaw(value):
+    """
+    Copia mutable (dicts y listas normales) de un valor congelado.
+    Útil para guardarlo con json o modificarlo.
+    """
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+
+class DataRegistry:
+    """Datos del juego cargados una vez e indexados."""
+
+    def __init__(self, data_dir=DATA, use_bundle=True):
+        """
+        Args:
+            data_dir: Directorio con los JSON (data/ por defecto)
+            use_bundle: Cargar desde el paquete precompilado; si es False se
+                        parsea cada JSON por separado
+        """
+        self.data_dir = Path(data_dir)
+        self.use_bundle = use_bundle
+        self._lock = threading.RLock()
+        self._bundle = None
+        self._files = {}
+        self._indexes = {}
+
+        # Archivos leídos de disco (para medir y para los tests)
+        self.loads = 0
+
+    # ------------------------------
+    # Archivos
+    # ------------------------------
+
+    def bundle(self):
+        """Paquete precompilado (se lee, o recompila, en la primera llamada)."""
+        if self._bundle is None:
+            with self._lock:
+                if self._bundle is None:
+                    self._bundle = load_bundle(self.data_dir)
+        return self._bundle
+
+    def preload(self):
+        """Lee el paquete al arrancar para que las pantallas no esperen."""
+        if self.use_bundle:
+            self.bundle()
+
+    def _read(self, name):
+        """Datos JSON (mutables) de un archivo."""
+        if self.use_bundle:
+            files = self.bundle()["files"]
+            if name not in files:
+                raise FileNotFoundError(self.data_dir / f"{name}.json")
+            return files[name]
+        with open(self.data_dir / f"{name}.json", encoding="utf-8") as f:
+            return json.load(f)
+
+    def load(self, name):
+        """
+        Contenido congelado de data/<name>.json, leído solo la primera vez.
+
+        Args:
+            name: Nombre del archivo sin extensión (ej: "professions")
+
+        Returns:
+            Datos congelados (tupla o MappingProxyType)
+        """
+        data = self._files.get(name)
+        if data is not None:
+            return data
+
+        with self._lock:
+            if name not in self._files:
+                self._files[name] = freeze(self._read(name))
+                self.loads += 1
+            return self._files[name]
+
+    def _index(self, name, source, key):
+        """
+        Índice {item[key]: item} sobre una lista de datos, construido una vez.
+
+        Args:
+            name: Nombre del índice en la caché
+            source: Lista congelada a indexar
+            key: Campo que identifica cada elemento
+        """
+        index = self._indexes.get(name)
+        if index is not None:
+            return index
+
+        with self._lock:
+            if name not in self._indexes:
+                positions = self.bundle()["indexes"].get(name) if self.use_bundle else None
+                if positions is not None:
+                    index = {value: source[position] for value, position in positions.items()}
+                else:
+                    index = {item[key]: item for item in source}
+                self._indexes[name] = MappingProxyType(index)
+            return self._indexes[name]
+
+    def clear(self):
+        """Olvida los datos cargados; se releerán en la próxima consulta."""
+        with self._lock:
+            self._bundle = None
+            self._files.clear()
+            self._indexes.clear()
+
+    # ------------------------------
+    # Profesiones
+    # ------------------------------
+
+    @property
+    def professions(self):
+        """Tupla de profesiones en el orden del archivo."""
+        return self.load("professions")
+
+    @property
+    def professions_by_name(self):
+        """Profesiones por profession_name."""
+        return self._index("professions_by_name", self.professions, "profession_name")
+
+    # ------------------------------
+    # Razas
+    # ------------------------------
+
+    @property
+    def races(self):
+        """Tupla de razas en el orden del archivo."""
+        return self.load("races")
+
+    @property
+    def races_by_name(self):
+        """Razas por race_name."""
+        return self._index("races_by_name", self.races, "race_name")
+
+    @property
+    def races_by_display(self):
+        """Razas por nombre visible (display)."""
+        return self._index("races_by_display", self.races, "display")
+
+    # ------------------------------
+    # Stats
+    # ------------------------------
+
+    @property
+    def stats(self):
+        """Tupla de stats en el orden del archivo."""
+        return self.load("stats")
+
+    @property
+    def stats_by_name(self):
+        """Stats por stat_name."""
+        return self._index("stats_by_name", self.stats, "stat_name")
+
+    @property
+    def stat_names(self):
+        """Nombres de los stats, en orden."""
+        return tuple(self.stats_by_name)
+
+    # ------------------------------
+    # Personalidad y eventos
+    # ------------------------------
+
+    @property
+    def traits(self):
+        """Tupla de rasgos de personalidad."""
+        return self.load("personality_traits")["traits"]
+
+    @property
+    def traits_by_id(self):
+        """Rasgos de personalidad por id."""
+        return self._index("traits_by_id", self.traits, "id")
+
+    @property
+    def skills(self):
+        """Tupla de habilidades."""
+        return self.load("skills")
+
+    @property
+    def skills_by_name(self):
+        """Habilidades por skill_name."""
+        return self._index("skills_by_name", self.skills, "skill_name")
+
+    @property
+    def childhood_events(self):
+        """Eventos de infancia por categoría de edad."""
+        return self.load("childhood_events")
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry():
+    """
+    Registro compartido del proceso (se crea en la primera llamada).
+
+    Returns:
+        DataRegistry sobre data/
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = DataRegistry()
+    return _registry
@@ -5,11 +5,10 @@ Utiliza sílabas y reglas fonéticas específicas por raza.
 """
 
 import random
-import json
-from pathlib import Path
 
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
-DATA = BASE_DIR / "data"
+import numpy as np
+
+from engine.utils.data_registry import get_registry
 
 # Definición de sílabas por raza (estructura fonética)
 RACE_SYLLABLES = {
@@ -95,20 +94,22 @@ class NameGenerator:
         """Inicializa el generador de nombres."""
         self.syllables = RACE_SYLLABLES
     
-    def generate_name(self, race="human", gender=None, seed=None):
+    def generate_name(self, race="human", gender=None, seed=None, rng=None):
         """
         Genera un nombre fonético para un NPC.
         
         Args:
             race: Raza del NPC (human, elf, dwarf, orc, halfling, tiefling)
             gender: Género (no afecta el nombre, solo para futura expansión)
-            seed: Semilla para reproducibilidad
+            seed: Semilla para reproducibilidad (crea un flujo propio; no
+                  altera el estado global de `random`)
+            rng: Flujo aleatorio (random.Random); tiene prioridad sobre seed
         
         Returns:
             Nombre generado
         """
-        if seed is not None:
-            random.seed(seed)
+        if rng is None:
+            rng = random.Random(seed) if seed is not None else random
         
         # Validar raza
         if race not in self.syllables:
@@ -119,22 +120,22 @@ class NameGenerator:
         max_syllables = rules.get("max_syllables", 3)
         
         # Decidir número de sílabas
-        num_syllables = random.randint(2, max_syllables)
+        num_syllables = rng.randint(2, max_syllables)
         
         # Construir nombre
         name_parts = []
         
         # Prefijo (siempre)
-        prefix = random.choice(syllable_set["prefixes"])
+        prefix = rng.choice(syllable_set["prefixes"])
         name_parts.append(prefix)
         
         # Medios (según número de sílabas)
         for i in range(num_syllables - 2):
-            middle = random.choice(syllable_set["middles"])
+            middle = rng.choice(syllable_set["middles"])
             name_parts.append(middle)
         
         # Sufijo (siempre)
-        suffix = random.choice(syllable_set["suffixes"])
+        suffix = rng.choice(syllable_set["suffixes"])
         name_parts.append(suffix)
         
         # Combinar partes
@@ -149,6 +150,59 @@ class NameGenerator:
         
         return name
     
+    def generate_names(self, race="human", count=1, rng=None):
+        """
+        Genera muchos nombres de una vez con un generador de NumPy.
+        Sigue las mismas reglas que generate_name, pero las sílabas se
+        eligen en bloque y no toca el estado global de `random`.
+
+        Args:
+            race: Raza de los NPCs
+            count: Cantidad de nombres
+            rng: numpy.random.Generator (uno nuevo si es None)
+
+        Returns:
+            Lista de nombres (pueden repetirse)
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+        if race not in self.syllables:
+            race = "human"
+
+        syllable_set = self.syllables[race]
+        rules = syllable_set.get("rules", {})
+        max_syllables = rules.get("max_syllables", 3)
+
+        num_syllables = rng.integers(2, max_syllables + 1, size=count)
+        prefixes = syllable_set["prefixes"]
+        middles = syllable_set["middles"]
+        suffixes = syllable_set["suffixes"]
+        prefix_ids = rng.integers(0, len(prefixes), size=count)
+        middle_ids = rng.integers(0, len(middles), size=(count, max(max_syllables - 2, 0)))
+        suffix_ids = rng.integers(0, len(suffixes), size=count)
+
+        # Las combinaciones posibles son pocas: se codifica cada nombre como
+        # un entero y solo se construye una vez cada combinación distinta
+        slots = np.arange(middle_ids.shape[1])
+        used = slots[None, :] < (num_syllables - 2)[:, None]
+        codes = prefix_ids.astype(np.int64)
+        for slot in slots:
+            codes = codes * (len(middles) + 1) + np.where(used[:, slot], middle_ids[:, slot] + 1, 0)
+        codes = codes * len(suffixes) + suffix_ids
+        _, first, inverse = np.unique(codes, return_index=True, return_inverse=True)
+
+        avoid_doubles = rules.get("avoid_double_consonants", True)
+        unique_names = []
+        for i in first.tolist():
+            parts = [prefixes[prefix_ids[i]]]
+            parts.extend(middles[m] for m in middle_ids[i, :num_syllables[i] - 2])
+            parts.append(suffixes[suffix_ids[i]])
+            name = "".join(parts)
+            if avoid_doubles:
+                name = self._remove_double_consonants(name)
+            unique_names.append(name.capitalize())
+        return [unique_names[i] for i in inverse.ravel().tolist()]
+
     def _remove_double_consonants(self, name):
         """Elimina consonantes duplicadas consecutivas."""
         vowels = set("aeiouAEIOU")
@@ -201,13 +255,7 @@ class NameGenerator:
         Returns:
             Título formateado (ej: "el Sastre", "la Sastre")
         """
-        with open(DATA / "professions.json", encoding="utf-8") as f:
-            professions = json.load(f)
-        
-        profession = next(
-            (p for p in professions if p["profession_name"] == profession_name),
-            None
-        )
+        profession = get_registry().professions_by_name.get(profession_name)
         
         if not profession:
             return f"el {profession_name.capitalize()}"
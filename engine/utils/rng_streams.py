@@ -0,0 +1,69 @@
+# engine/utils/rng_streams.py
+"""
+Flujos aleatorios independientes derivados de (semilla raíz, claves).
+
+Cada generador (nombres, stats, personalidad, eventos de infancia...)
+recibe su propio random.Random o numpy.random.Generator en lugar de usar
+el módulo global `random`. La semilla de cada flujo se obtiene con BLAKE2b
+de la semilla raíz y de claves como el id de la entidad y el propósito, así
+que:
+- no depende del orden de generación, ni de hilos o procesos,
+- cualquier NPC se reproduce con su semilla raíz y su id,
+- dos flujos con claves distintas no comparten estado.
+
+El terreno ya usa un generador sin estado por celda (ver hash_rng).
+
+Uso:
+    rng = py_stream(world_seed, "npc", npc_id)
+    npc = NPC(profession_name="warrior", rng=rng)
+"""
+
+import hashlib
+import random
+import struct
+
+import numpy as np
+
+# Propósitos habituales
+STREAM_NPC = "npc"
+STREAM_NPC_BATCH = "npc_batch"
+STREAM_CHILDHOOD = "childhood"
+STREAM_CHARACTER = "character"
+
+
+def _encode_key(key):
+    """Bytes de una clave (entero o texto) sin ambigüedad entre tipos."""
+    if isinstance(key, bool) or not isinstance(key, (int, str)):
+        raise TypeError(f"Clave de flujo no soportada: {key!r} (usa int o str)")
+    if isinstance(key, int):
+        data = b"i" + str(key).encode("ascii")
+    else:
+        data = b"s" + key.encode("utf-8")
+    return struct.pack("<I", len(data)) + data
+
+
+def derive_seed(root_seed, *keys):
+    """
+    Semilla de 64 bits para un flujo.
+
+    Args:
+        root_seed: Semilla raíz (entero o texto)
+        *keys: Claves del flujo (ids, propósitos...)
+
+    Returns:
+        Entero en [0, 2**64)
+    """
+    digest = hashlib.blake2b(digest_size=8, person=b"liberty-rng")
+    for key in (root_seed,) + keys:
+        digest.update(_encode_key(key))
+    return int.from_bytes(digest.digest(), "little")
+
+
+def py_stream(root_seed, *keys):
+    """random.Random propio para (root_seed, *keys)."""
+    return random.Random(derive_seed(root_seed, *keys))
+
+
+def np_stream(root_seed, *keys):
+    """numpy.random.Generator propio para (root_seed, *keys)."""
+    return np.random.default_rng(derive_seed(root_seed, *keys))
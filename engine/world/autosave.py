@@ -0,0 +1,212 @@
+# engine/world/autosave.py
+"""
+Guardado atómico y autoguardado en segundo plano.
+
+write_atomic escribe un archivo sin dejarlo nunca a medias: los datos van a
+un archivo temporal en el mismo directorio, se hace fsync y después se
+renombra sobre el destino (os.replace es atómico). Antes del rename la
+versión anterior se conserva como copia de seguridad rotativa
+(save.json.1, save.json.2, ...).
+
+AutoSaver usa eso para el autoguardado de World: solo guarda si el mundo
+está marcado como modificado, serializa la instantánea en el hilo
+principal (rápido y consistente) y hace la escritura en un hilo aparte
+para no provocar tirones en el frame. Cuando la escritura termina, el
+diario de la sesión que cubre la instantánea se compacta en ese mismo hilo.
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+DEFAULT_BACKUPS = 3
+
+
+def backup_path(path, number):
+    """Ruta de la copia de seguridad número `number` (1 = la más reciente)."""
+    path = Path(path)
+    return path.with_name(f"{path.name}.{number}")
+
+
+def rotate_backups(path, backups=DEFAULT_BACKUPS):
+    """
+    Desplaza las copias de seguridad y guarda la versión actual como .1.
+
+    La versión actual se enlaza (o copia) en lugar de moverse, así que el
+    archivo original sigue existiendo hasta que lo reemplace el nuevo.
+
+    Args:
+        path: Archivo a respaldar
+        backups: Número de copias a conservar (0 = ninguna)
+    """
+    path = Path(path)
+    if backups <= 0 or not path.exists():
+        return
+
+    for number in range(backups - 1, 0, -1):
+        older = backup_path(path, number)
+        if older.exists():
+            os.replace(older, backup_path(path, number + 1))
+
+    newest = backup_path(path, 1)
+    if newest.exists():
+        newest.unlink()
+    try:
+        os.link(path, newest)
+    except OSError:
+        # Sistemas de archivos sin enlaces duros
+        shutil.copy2(path, newest)
+
+
+def _fsync_directory(directory):
+    """Persiste el rename en el directorio (solo POSIX)."""
+    if os.name != "posix":
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_atomic(path, payload, backups=DEFAULT_BACKUPS):
+    """
+    Escribe payload en path de forma atómica, con copias rotativas.
+
+    Args:
+        path: Archivo destino
+        payload: Bytes a escribir
+        backups: Número de copias de seguridad a conservar
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        rotate_backups(path, backups)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    _fsync_directory(path.parent)
+
+
+class AutoSaver:
+    """Autoguardado asíncrono de un World con seguimiento de cambios."""
+
+    def __init__(self, world, backups=DEFAULT_BACKUPS):
+        """
+        Inicializa el autoguardado.
+
+        Args:
+            world: World a guardar (usa dirty, take_snapshot,
+                   encode_save_data, write_snapshot y snapshot_saved)
+            backups: Copias de seguridad rotativas del guardado
+        """
+        self.world = world
+        self.backups = backups
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autosave")
+        self._future = None
+
+        # Estadísticas
+        self.saves = 0
+        self.skipped = 0
+        self.failures = 0
+        self.last_serialize_ms = 0.0
+        self.last_write_ms = 0.0
+        self.max_write_ms = 0.0
+        self.last_error = None
+
+    @property
+    def busy(self):
+        """True si hay una escritura en curso."""
+        return self._future is not None and not self._future.done()
+
+    def request_save(self, force=False):
+        """
+        Lanza un guardado si el mundo cambió desde el último.
+
+        La instantánea se toma aquí (hilo principal); la escritura se hace
+        en el hilo de autoguardado. Si ya hay una escritura en curso no se
+        encola otra: el mundo sigue marcado y se guardará en la siguiente.
+
+        Args:
+            force: Guardar aunque no haya cambios
+
+        Returns:
+            True si se encoló una escritura
+        """
+        if (not force and not self.world.dirty) or self.busy:
+            self.skipped += 1
+            return False
+
+        start = time.perf_counter()
+        save_data = self.world.take_snapshot()
+        payload = self.world.encode_save_data(save_data)
+        self.last_serialize_ms = (time.perf_counter() - start) * 1000
+
+        # Los cambios posteriores vuelven a marcar el mundo
+        self.world.dirty = False
+        self._future = self._executor.submit(self._write, payload, save_data)
+        return True
+
+    def _write(self, payload, save_data):
+        """Escritura en el hilo de autoguardado."""
+        start = time.perf_counter()
+        try:
+            self.world.write_snapshot(save_data, payload, self.backups)
+            self.world.snapshot_saved(save_data)
+        except (OSError, sqlite3.Error) as e:
+            self.failures += 1
+            self.last_error = e
+            self.world.dirty = True  # Reintentar en el próximo autoguardado
+            print(f"Autosave failed: {e}")
+            return False
+
+        self.last_write_ms = (time.perf_counter() - start) * 1000
+        self.max_write_ms = max(self.max_write_ms, self.last_write_ms)
+        self.saves += 1
+        return True
+
+    def flush(self):
+        """Espera a que termine la escritura en curso (al salir de la partida)."""
+        if self._future is not None:
+            self._future.result()
+
+    def shutdown(self):
+        """Termina la escritura pendiente y detiene el hilo."""
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    def stats(self):
+        """
+        Retorna las estadísticas de autoguardado.
+
+        Returns:
+            Diccionario con saves, skipped, failures y latencias en ms
+        """
+        return {
+            "saves": self.saves,
+            "skipped": self.skipped,
+            "failures": self.failures,
+            "last_serialize_ms": self.last_serialize_ms,
+            "last_write_ms": self.last_write_ms,
+            "max_write_ms": self.max_write_ms,
+        }
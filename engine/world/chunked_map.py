@@ -0,0 +1,233 @@
+# engine/world/chunked_map.py
+"""
+Mapa mundial generado bajo demanda por chunks.
+
+En lugar de generar el mapa completo al crear el mundo, ChunkedWorldMap
+divide el mundo en bloques de chunk_size x chunk_size celdas y genera cada
+uno (con MapGenerator.generate_world_chunk) la primera vez que se consulta
+una de sus celdas. Los chunks se guardan en un LRU con un número máximo de
+entradas, así que el tiempo de arranque y la memoria dependen de lo que
+haya visto el jugador y no del tamaño del mundo.
+
+Con un store (RegionCache) los chunks generados se guardan también en
+disco y, al volver a cargar la partida, se mapean con memmap en lugar de
+volver a generarse.
+
+Expone la misma interfaz de lectura que TerrainGrid que usan World y la
+interfaz: shape, terrain_at, indexado [y, x] (MapTile) y cortes
+[y0:y1, x0:x1] (TerrainGrid con copia de los datos).
+"""
+
+from collections import OrderedDict
+
+from engine.world.map_generator import TerrainGrid
+
+DEFAULT_CHUNK_SIZE = 64
+DEFAULT_MAX_CHUNKS = 256  # ~9 MB con chunks de 64x64
+
+
+class ChunkedWorldMap:
+    """Mapa mundial de width x height celdas generado por chunks."""
+
+    def __init__(self, generator, width, height, chunk_size=DEFAULT_CHUNK_SIZE,
+                 max_chunks=DEFAULT_MAX_CHUNKS, store=None):
+        """
+        Inicializa el mapa (no genera nada todavía).
+
+        Args:
+            generator: MapGenerator que produce los chunks
+            width: Ancho del mundo en celdas
+            height: Alto del mundo en celdas
+            chunk_size: Lado de cada chunk en celdas
+            max_chunks: Chunks que se mantienen en memoria
+            store: Caché en disco de chunks (RegionCache de la semilla y del
+                   tamaño de este mundo) o None
+        """
+        self.generator = generator
+        self.width = width
+        self.height = height
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self.origin_x = 0
+        self.origin_y = 0
+        self.store = store
+
+        self._chunks = OrderedDict()  # (chunk_x, chunk_y) -> TerrainGrid
+        self.generated = 0
+        self.loaded = 0
+        self.evicted = 0
+
+    @property
+    def shape(self):
+        """Forma (alto, ancho) del mundo completo."""
+        return (self.height, self.width)
+
+    def __len__(self):
+        return self.height
+
+    @property
+    def loaded_chunks(self):
+        """Número de chunks en memoria."""
+        return len(self._chunks)
+
+    @property
+    def nbytes(self):
+        """Memoria ocupada por los chunks cargados."""
+        return sum(chunk.nbytes for chunk in self._chunks.values())
+
+    # ------------------------------
+    # Chunks
+    # ------------------------------
+
+    def chunk(self, chunk_x, chunk_y):
+        """
+        Retorna un chunk, generándolo si no está en memoria.
+
+        Args:
+            chunk_x: Índice X del chunk
+            chunk_y: Índice Y del chunk
+
+        Returns:
+            TerrainGrid del chunk (los del borde pueden ser más pequeños)
+        """
+        key = (chunk_x, chunk_y)
+        grid = self._chunks.get(key)
+        if grid is not None:
+            self._chunks.move_to_end(key)
+            return grid
+
+        origin_x = chunk_x * self.chunk_size
+        origin_y = chunk_y * self.chunk_size
+        if not (0 <= origin_x < self.width and 0 <= origin_y < self.height):
+            raise IndexError(f"Chunk fuera del mundo: {key}")
+
+        width = min(self.chunk_size, self.width - origin_x)
+        height = min(self.chunk_size, self.height - origin_y)
+        grid = self.store.get(chunk_x, chunk_y, width, height) if self.store is not None else None
+        if grid is not None:
+            self.loaded += 1
+        else:
+            grid = self.generator.generate_world_chunk(
+                origin_x, origin_y, width, height, self.width, self.height
+            )
+            self.generated += 1
+            self._save_chunk(chunk_x, chunk_y, grid)
+
+        self._chunks[key] = grid
+        while len(self._chunks) > self.max_chunks:
+            self._chunks.popitem(last=False)
+            self.evicted += 1
+        return grid
+
+    def _save_chunk(self, chunk_x, chunk_y, grid):
+        """Guarda un chunk recién generado en el store (si hay)."""
+        if self.store is None:
+            return
+        try:
+            self.store.put(chunk_x, chunk_y, grid)
+        except OSError as e:
+            print(f"Error caching world chunk {(chunk_x, chunk_y)}: {e}")
+
+    def is_loaded(self, chunk_x, chunk_y):
+        """True si el chunk ya está en memoria."""
+        return (chunk_x, chunk_y) in self._chunks
+
+    def _locate(self, x, y):
+        """Chunk y coordenadas locales de la celda (x, y)."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"Celda fuera del mundo: ({x}, {y})")
+        chunk = self.chunk(x // self.chunk_size, y // self.chunk_size)
+        return chunk, x % self.chunk_size, y % self.chunk_size
+
+    # ------------------------------
+    # Acceso compatible con TerrainGrid
+    # ------------------------------
+
+    def terrain_at(self, x, y):
+        """Retorna el Terrain de la celda (x, y)."""
+        chunk, local_x, local_y = self._locate(x, y)
+        return chunk.terrain_at(local_x, local_y)
+
+    def tile(self, x, y):
+        """Crea el MapTile de la celda (x, y)."""
+        chunk, local_x, local_y = self._locate(x, y)
+        return chunk.tile(local_x, local_y)
+
+    def __getitem__(self, key):
+        """
+        Indexado estilo NumPy: [y, x] retorna un MapTile y
+        [y0:y1, x0:x1] un TerrainGrid con la ventana pedida.
+        """
+        if not (isinstance(key, tuple) and len(key) == 2):
+            raise TypeError("ChunkedWorldMap se indexa con [y, x]")
+
+        row, col = key
+        if isinstance(row, slice) or isinstance(col, slice):
+            rows = row if isinstance(row, slice) else slice(row, row + 1)
+            cols = col if isinstance(col, slice) else slice(col, col + 1)
+            return self.window(rows, cols)
+
+        if row < 0:
+            row += self.height
+        if col < 0:
+            col += self.width
+        return self.tile(col, row)
+
+    def window(self, rows, cols):
+        """
+        Copia un rectángulo del mundo en un TerrainGrid.
+
+        Args:
+            rows: slice de filas
+            cols: slice de columnas
+
+        Returns:
+            TerrainGrid con origin_x/origin_y en coordenadas del mundo
+        """
+        y0, y1, y_step = rows.indices(self.height)
+        x0, x1, x_step = cols.indices(self.width)
+        if y_step != 1 or x_step != 1:
+            raise ValueError("ChunkedWorldMap solo admite cortes con paso 1")
+        y1 = max(y0, y1)
+        x1 = max(x0, x1)
+
+        result = TerrainGrid.empty(y1 - y0, x1 - x0, x0, y0)
+        for chunk_y in chunk_range(y0, y1, self.chunk_size):
+            for chunk_x in chunk_range(x0, x1, self.chunk_size):
+                chunk = self.chunk(chunk_x, chunk_y)
+                # Intersección del chunk con la ventana, en coordenadas del mundo
+                top = max(y0, chunk.origin_y)
+                bottom = min(y1, chunk.origin_y + chunk.shape[0])
+                left = max(x0, chunk.origin_x)
+                right = min(x1, chunk.origin_x + chunk.shape[1])
+
+                src = (slice(top - chunk.origin_y, bottom - chunk.origin_y),
+                       slice(left - chunk.origin_x, right - chunk.origin_x))
+                dst = (slice(top - y0, bottom - y0), slice(left - x0, right - x0))
+                result.heights[dst] = chunk.heights[src]
+                result.temperatures[dst] = chunk.temperatures[src]
+                result.terrain_codes[dst] = chunk.terrain_codes[src]
+        return result
+
+    def colors(self):
+        """
+        Imagen RGB del mundo completo. Genera todos los chunks: pensado
+        para mundos pequeños o herramientas de depuración.
+        """
+        return self[:, :].colors()
+
+    def clear(self):
+        """Descarta todos los chunks cargados."""
+        self._chunks.clear()
+
+
+def chunk_range(start, end, chunk_size):
+    """
+    Índices de chunk que cubren [start, end).
+
+    Returns:
+        range de índices de chunk
+    """
+    if end <= start:
+        return range(0)
+    return range(start // chunk_size, (end - 1) // chunk_size + 1)
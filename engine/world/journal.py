@@ -0,0 +1,278 @@
+# engine/world/journal.py
+"""
+Diario (journal) de sesión: registros pequeños que se añaden al final de
+un archivo entre guardados completos.
+
+Cada cambio del estado (movimiento, cambio de datos del jugador, evento
+de una entidad) se escribe como un registro binario:
+
+    seq (uint64) | tipo (uint8) | longitud (uint32) | crc32 (uint32) | datos
+
+Los movimientos son dos int32; el resto, JSON compacto. Cada escritura es
+un único append secuencial que se pasa al sistema operativo en el acto,
+así que si el juego se cierra de golpe solo se pierde, como mucho, el
+registro que se estaba escribiendo.
+
+El diario se divide en segmentos journal/<primer seq>.log. Al tomar una
+instantánea (save.json / save.bin) World apunta el último seq incluido y
+rota el segmento; cuando la instantánea ya está en disco, los segmentos
+que cubre se borran (compactación). Al cargar se aplica la instantánea y
+después los registros con seq posterior.
+
+Un registro final incompleto o con CRC incorrecto (escritura cortada) se
+descarta junto con lo que venga detrás.
+"""
+
+import json
+import os
+import struct
+import threading
+import zlib
+from pathlib import Path
+
+# seq, tipo, longitud, crc32
+RECORD_HEADER = struct.Struct("<QBII")
+MOVE_PAYLOAD = struct.Struct("<ii")
+
+SEGMENT_SUFFIX = ".log"
+
+# Tipos de registro
+RECORD_MOVE = 1
+RECORD_PLAYER = 2
+RECORD_EVENT = 3
+
+
+def encode_record(seq, kind, payload):
+    """Bytes de un registro (cabecera + datos)."""
+    return RECORD_HEADER.pack(seq, kind, len(payload), zlib.crc32(payload)) + payload
+
+
+def encode_move(x, y):
+    """Datos de un registro RECORD_MOVE."""
+    return MOVE_PAYLOAD.pack(x, y)
+
+
+def encode_json(value):
+    """Datos de un registro RECORD_PLAYER o RECORD_EVENT."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def decode_payload(kind, payload):
+    """
+    Decodifica los datos de un registro.
+
+    Returns:
+        (x, y) para movimientos; el valor JSON para el resto
+    """
+    if kind == RECORD_MOVE:
+        return MOVE_PAYLOAD.unpack(payload)
+    return json.loads(payload.decode("utf-8"))
+
+
+def read_segment(path):
+    """
+    Lee los registros válidos de un segmento.
+
+    Args:
+        path: Archivo del segmento
+
+    Returns:
+        (lista de (seq, tipo, datos decodificados), bytes válidos)
+    """
+    records = []
+    valid = 0
+    with open(path, "rb") as f:
+        data = f.read()
+
+    while valid + RECORD_HEADER.size <= len(data):
+        seq, kind, length, crc = RECORD_HEADER.unpack_from(data, valid)
+        start = valid + RECORD_HEADER.size
+        payload = data[start:start + length]
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            break  # Escritura cortada: el resto no es fiable
+        try:
+            records.append((seq, kind, decode_payload(kind, payload)))
+        except (ValueError, struct.error):
+            break
+        valid = start + length
+    return records, valid
+
+
+class Journal:
+    """Diario de una sesión en segmentos append-only."""
+
+    def __init__(self, directory, sync=False):
+        """
+        Abre el diario de una sesión (sin crear nada hasta el primer registro).
+
+        Busca el último seq escrito en los segmentos existentes y recorta el
+        final del último si quedó a medias.
+
+        Args:
+            directory: Directorio de los segmentos (saves/games/<sesión>/journal)
+            sync: Hacer fsync tras cada registro (más seguro ante cortes de
+                  luz, más lento); sin él cada registro se entrega al SO
+        """
+        self.directory = Path(directory)
+        self.sync = sync
+        self._lock = threading.Lock()
+        self._file = None
+        self._segment_start = None
+
+        # Registros añadidos desde la última rotación
+        self.pending = 0
+        self.last_seq = 0
+        self._recover()
+
+    # ------------------------------
+    # Segmentos
+    # ------------------------------
+
+    def segments(self):
+        """Segmentos existentes como lista de (primer seq, ruta), en orden."""
+        if not self.directory.exists():
+            return []
+        segments = []
+        for path in self.directory.iterdir():
+            if path.suffix == SEGMENT_SUFFIX and path.stem.isdigit():
+                segments.append((int(path.stem), path))
+        return sorted(segments)
+
+    def _segment_path(self, first_seq):
+        return self.directory / f"{first_seq:012d}{SEGMENT_SUFFIX}"
+
+    def _recover(self):
+        """Calcula last_seq y recorta un registro final incompleto."""
+        segments = self.segments()
+        if not segments:
+            return
+
+        first_seq, path = segments[-1]
+        records, valid = read_segment(path)
+        if valid < path.stat().st_size:
+            with open(path, "r+b") as f:
+                f.truncate(valid)
+        self.last_seq = records[-1][0] if records else first_seq - 1
+        # Los segmentos anteriores terminan antes de que empiece el último
+        self.last_seq = max(self.last_seq, first_seq - 1)
+
+    # ------------------------------
+    # Escritura
+    # ------------------------------
+
+    def append(self, kind, payload):
+        """
+        Añade un registro al segmento activo.
+
+        Args:
+            kind: Tipo de registro (RECORD_*)
+            payload: Datos ya codificados
+
+        Returns:
+            seq asignado al registro
+        """
+        with self._lock:
+            seq = self.last_seq + 1
+            if self._file is None:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                self._segment_start = seq
+                self._file = open(self._segment_path(seq), "ab")
+
+            self._file.write(encode_record(seq, kind, payload))
+            self._file.flush()
+            if self.sync:
+                os.fsync(self._file.fileno())
+            self.last_seq = seq
+            self.pending += 1
+            return seq
+
+    def advance_to(self, seq):
+        """
+        Garantiza que los próximos registros tengan seq mayor que `seq`
+        (el de la instantánea cargada, aunque sus segmentos ya se borraran).
+        """
+        with self._lock:
+            self.last_seq = max(self.last_seq, seq)
+
+    def record_move(self, x, y):
+        """Registra la nueva posición del jugador."""
+        return self.append(RECORD_MOVE, encode_move(x, y))
+
+    def record_player(self, changes):
+        """Registra cambios en los datos del jugador (dict parcial)."""
+        return self.append(RECORD_PLAYER, encode_json(changes))
+
+    def record_event(self, event):
+        """Registra un evento de entidad (dict con al menos "type")."""
+        return self.append(RECORD_EVENT, encode_json(event))
+
+    def rotate(self):
+        """
+        Cierra el segmento activo; el siguiente registro abre uno nuevo.
+        Se llama al tomar una instantánea.
+
+        Returns:
+            Último seq incluido en la instantánea
+        """
+        with self._lock:
+            self._close_file()
+            self.pending = 0
+            return self.last_seq
+
+    def compact(self, snapshot_seq):
+        """
+        Borra los segmentos que ya están cubiertos por una instantánea
+        guardada (todos sus registros tienen seq <= snapshot_seq).
+
+        Args:
+            snapshot_seq: Último seq incluido en la instantánea escrita
+
+        Returns:
+            Número de segmentos borrados
+        """
+        with self._lock:
+            segments = self.segments()
+            removed = 0
+            for index, (first_seq, path) in enumerate(segments):
+                if first_seq == self._segment_start and self._file is not None:
+                    break  # Segmento activo
+                next_start = segments[index + 1][0] if index + 1 < len(segments) else self.last_seq + 1
+                if next_start - 1 > snapshot_seq:
+                    break
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError:
+                    break
+            return removed
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._segment_start = None
+
+    def close(self):
+        """Cierra el segmento activo."""
+        with self._lock:
+            self._close_file()
+
+    # ------------------------------
+    # Lectura
+    # ------------------------------
+
+    def records_after(self, snapshot_seq):
+        """
+        Registros posteriores a una instantánea, en orden.
+
+        Args:
+            snapshot_seq: Último seq incluido en la instantánea cargada
+
+        Returns:
+            Lista de (seq, tipo, datos decodificados)
+        """
+        records = []
+        for _, path in self.segments():
+            segment_records, _ = read_segment(path)
+            records.extend(r for r in segment_records if r[0] > snapshot_seq)
+        return records
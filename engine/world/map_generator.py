@@ -17,6 +17,24 @@ import numpy as np
 from dataclasses import dataclass
 from enum import Enum
 
+from engine.world.noise import VectorizedPerlin
+from engine.world.tiling import (
+    DEFAULT_TILE_SIZE,
+    local_region_task,
+    plan_tiles,
+    resolve_workers,
+    run_tasks,
+    world_tile_task,
+)
+from engine.utils.hash_rng import (
+    hash_uniform,
+    PURPOSE_WORLD_ARENA,
+    PURPOSE_LOCAL_ARENA,
+    PURPOSE_LOCAL_GRASS,
+    PURPOSE_LOCAL_FOREST,
+    PURPOSE_LOCAL_WATER,
+)
+
 
 class Terrain(Enum):
     """Tipos de terreno según altura."""
@@ -203,8 +221,218 @@ class MapTile:
         return chars.get(self.terrain, "?")
 
 
+# Códigos compactos (uint8) de terreno: índice dentro de TERRAIN_BY_CODE
+TERRAIN_BY_CODE = tuple(Terrain)
+TERRAIN_CODE = {terrain: code for code, terrain in enumerate(TERRAIN_BY_CODE)}
+
+# Umbrales de MapTile.get_temperature_category (índice = posición en Temperature)
+TEMPERATURE_THRESHOLDS = (-0.5, -0.1, 0.2, 0.5, 0.8)
+TEMPERATURE_BY_BUCKET = tuple(Temperature)
+
+
+def build_terrain_palette():
+    """
+    Precalcula la tabla de colores indexada por (código de terreno, categoría de temperatura).
+
+    Cada entrada se obtiene de MapTile.get_color con una temperatura
+    representativa de la categoría, así que la tabla sigue siempre las
+    mismas reglas que TerrainColor.
+
+    Returns:
+        Array uint8 de forma (len(TERRAIN_BY_CODE), len(Temperature), 3)
+    """
+    # Una temperatura dentro de cada categoría
+    representative = (-0.75, -0.3, 0.05, 0.35, 0.65, 0.9)
+    palette = np.zeros((len(TERRAIN_BY_CODE), len(TEMPERATURE_BY_BUCKET), 3), dtype=np.uint8)
+    for code, terrain in enumerate(TERRAIN_BY_CODE):
+        for bucket, temperature in enumerate(representative):
+            palette[code, bucket] = MapTile(0, 0, 0.0, terrain, temperature).get_color()
+    palette.setflags(write=False)
+    return palette
+
+
+TERRAIN_PALETTE = build_terrain_palette()
+
+
+class TerrainGrid:
+    """
+    Mapa como estructura de arrays contiguos.
+
+    Guarda alturas y temperaturas en float32 y el terreno como códigos uint8
+    (ver TERRAIN_BY_CODE). Indexar con dos enteros devuelve un MapTile creado
+    al vuelo, así que el código que trabaja tile a tile sigue funcionando,
+    mientras que las operaciones masivas usan directamente los arrays.
+    """
+
+    def __init__(self, heights, temperatures, terrain_codes, origin_x=0, origin_y=0):
+        """
+        Inicializa la rejilla.
+
+        Args:
+            heights: Array 2D de alturas (-1.0 a 1.0)
+            temperatures: Array 2D de temperaturas (-1.0 a 1.0)
+            terrain_codes: Array 2D de códigos de terreno
+            origin_x: Coordenada X global de la columna 0
+            origin_y: Coordenada Y global de la fila 0
+        """
+        self.heights = np.ascontiguousarray(heights, dtype=np.float32)
+        self.temperatures = np.ascontiguousarray(temperatures, dtype=np.float32)
+        self.terrain_codes = np.ascontiguousarray(terrain_codes, dtype=np.uint8)
+        self.origin_x = origin_x
+        self.origin_y = origin_y
+
+        if not (self.heights.shape == self.temperatures.shape == self.terrain_codes.shape):
+            raise ValueError("heights, temperatures y terrain_codes deben tener la misma forma")
+
+    @classmethod
+    def from_arrays(cls, heights, temperatures, terrain_codes, origin_x=0, origin_y=0):
+        """
+        Crea una rejilla sobre arrays existentes sin copiarlos (cortes,
+        arrays mapeados desde disco). Los arrays deben ser ya contiguos y
+        del dtype correcto.
+        """
+        grid = cls.__new__(cls)
+        grid.heights = heights
+        grid.temperatures = temperatures
+        grid.terrain_codes = terrain_codes
+        grid.origin_x = origin_x
+        grid.origin_y = origin_y
+        return grid
+
+    @classmethod
+    def empty(cls, height, width, origin_x=0, origin_y=0):
+        """Crea una rejilla sin inicializar de height x width celdas."""
+        return cls(
+            np.zeros((height, width), dtype=np.float32),
+            np.zeros((height, width), dtype=np.float32),
+            np.zeros((height, width), dtype=np.uint8),
+            origin_x,
+            origin_y,
+        )
+
+    @classmethod
+    def from_tiles(cls, tiles):
+        """
+        Convierte un array 2D de MapTile (formato antiguo) en TerrainGrid.
+
+        Args:
+            tiles: Array 2D (dtype=object) de MapTile
+
+        Returns:
+            TerrainGrid equivalente
+        """
+        height, width = tiles.shape
+        grid = cls.empty(height, width, tiles[0, 0].x, tiles[0, 0].y)
+        for y in range(height):
+            for x in range(width):
+                tile = tiles[y, x]
+                grid.heights[y, x] = tile.height
+                grid.temperatures[y, x] = tile.temperature
+                grid.terrain_codes[y, x] = TERRAIN_CODE[tile.terrain]
+        return grid
+
+    @property
+    def shape(self):
+        """Forma (alto, ancho) de la rejilla."""
+        return self.terrain_codes.shape
+
+    @property
+    def nbytes(self):
+        """Memoria ocupada por los arrays de datos."""
+        return self.heights.nbytes + self.temperatures.nbytes + self.terrain_codes.nbytes
+
+    def __len__(self):
+        return self.shape[0]
+
+    def terrain_at(self, x, y):
+        """Retorna el Terrain de la celda (x, y) sin crear un MapTile."""
+        return TERRAIN_BY_CODE[self.terrain_codes[y, x]]
+
+    def tile(self, x, y):
+        """Retorna una vista MapTile de la celda (x, y) (coordenadas de la rejilla)."""
+        return MapTile(
+            self.origin_x + x,
+            self.origin_y + y,
+            float(self.heights[y, x]),
+            TERRAIN_BY_CODE[self.terrain_codes[y, x]],
+            float(self.temperatures[y, x]),
+        )
+
+    def __getitem__(self, key):
+        """
+        grid[y, x] retorna un MapTile; grid[y0:y1, x0:x1] retorna una sub-rejilla
+        que comparte memoria con la original.
+        """
+        if not isinstance(key, tuple) or len(key) != 2:
+            raise TypeError("TerrainGrid se indexa como grid[y, x]")
+
+        key_y, key_x = key
+        height, width = self.shape
+        if isinstance(key_y, slice) or isinstance(key_x, slice):
+            rows = key_y if isinstance(key_y, slice) else slice(key_y, key_y + 1)
+            cols = key_x if isinstance(key_x, slice) else slice(key_x, key_x + 1)
+            row_start, _, row_step = rows.indices(height)
+            col_start, _, col_step = cols.indices(width)
+            if row_step != 1 or col_step != 1:
+                raise ValueError("TerrainGrid solo admite cortes contiguos")
+            return TerrainGrid.from_arrays(
+                self.heights[rows, cols],
+                self.temperatures[rows, cols],
+                self.terrain_codes[rows, cols],
+                self.origin_x + col_start,
+                self.origin_y + row_start,
+            )
+
+        y = int(key_y)
+        x = int(key_x)
+        if y < 0:
+            y += height
+        if x < 0:
+            x += width
+        if not (0 <= y < height and 0 <= x < width):
+            raise IndexError(f"Celda ({x}, {y}) fuera de la rejilla {width}x{height}")
+        return self.tile(x, y)
+
+    def __setitem__(self, key, tile):
+        """Permite asignar un MapTile a una celda: grid[y, x] = tile."""
+        y, x = key
+        self.heights[y, x] = tile.height
+        self.temperatures[y, x] = tile.temperature
+        self.terrain_codes[y, x] = TERRAIN_CODE[tile.terrain]
+
+    @property
+    def flat(self):
+        """Itera todas las celdas como MapTile, por filas."""
+        height, width = self.shape
+        for y in range(height):
+            for x in range(width):
+                yield self.tile(x, y)
+
+    def temperature_categories(self):
+        """
+        Categoría de temperatura de cada celda como índice dentro de Temperature.
+
+        Returns:
+            Array uint8 con los mismos umbrales que MapTile.get_temperature_category
+        """
+        return np.digitize(self.temperatures, TEMPERATURE_THRESHOLDS).astype(np.uint8)
+
+    def colors(self):
+        """
+        Imagen RGB de la rejilla con una sola consulta a TERRAIN_PALETTE.
+
+        Returns:
+            Array uint8 de forma (alto, ancho, 3)
+        """
+        return TERRAIN_PALETTE[self.terrain_codes, self.temperature_categories()]
+
+
 class MapGenerator:
     """Generador de mapas usando Perlin Noise con más tierra y montañas."""
+
+    # Versión del algoritmo de generación. Incrementar cuando cambie el
+    # resultado para una misma semilla (invalida las regiones cacheadas en disco).
+    VERSION = 2
     
     def __init__(self, seed=42, world_size=128):
         """
@@ -239,6 +467,12 @@ class MapGenerator:
         
         # Capa adicional para montañas - alta frecuencia
         self.mountain_noise = PerlinNoise(octaves=5, seed=self.seed + 3000)
+        
+        # Backends vectorizados (mismas semillas que las capas anteriores)
+        self.world_field = VectorizedPerlin.from_perlin(self.world_noise)
+        self.local_field = VectorizedPerlin.from_perlin(self.local_noise)
+        self.temperature_field = VectorizedPerlin.from_perlin(self.temperature_noise)
+        self.mountain_field = VectorizedPerlin.from_perlin(self.mountain_noise)
     
     def get_terrain_type(self, height, mountain_factor=0.0, is_local=False):
         """
@@ -305,11 +539,205 @@ class MapGenerator:
                 return True
         
         return False
-    
-    def generate_world_map(self, width=None, height=None):
+
+    def classify_terrain(self, heights, mountain_factors, is_local=False):
+        """
+        Versión vectorizada de get_terrain_type.
+
+        Args:
+            heights: Array de alturas normalizadas (-1.0 a 1.0)
+            mountain_factors: Array de influencia de montañas (misma forma)
+            is_local: True si es mapa local, False si es mundial
+
+        Returns:
+            Array uint8 con el código de terreno (ver TERRAIN_BY_CODE) de cada celda
+        """
+        heights = np.asarray(heights)
+        mountain_factors = np.asarray(mountain_factors)
+
+        conditions = [
+            heights < -0.55,
+            heights < -0.25,
+            heights < -0.05,
+            heights < 0.15,
+            heights < 0.35,
+            (heights < 0.55) & (mountain_factors > 0.3),
+            heights < 0.55,
+            heights < 0.75,
+        ]
+        choices = [
+            TERRAIN_CODE[Terrain.DEEP_OCEAN],
+            TERRAIN_CODE[Terrain.OCEAN],
+            TERRAIN_CODE[Terrain.SHALLOW_WATER],
+            TERRAIN_CODE[Terrain.SAND],
+            TERRAIN_CODE[Terrain.GRASS],
+            TERRAIN_CODE[Terrain.MOUNTAINS],
+            TERRAIN_CODE[Terrain.FOREST],
+            TERRAIN_CODE[Terrain.MOUNTAINS],
+        ]
+        if is_local:
+            conditions.insert(0, heights < -0.85)
+            choices.insert(0, TERRAIN_CODE[Terrain.DEEP_CHASM])
+
+        codes = np.select(conditions, choices, default=TERRAIN_CODE[Terrain.SNOW_PEAKS])
+        return codes.astype(np.uint8)
+
+    def generate_world_fields(self, width=None, height=None, origin_x=0, origin_y=0,
+                              world_width=None, world_height=None):
+        """
+        Calcula en una sola pasada vectorizada los campos del mapa mundial.
+
+        Usa las mismas semillas, escalas (80/40/100) y reglas que
+        generate_world_map_reference, pero sobre arrays completos. Puede
+        calcular solo una ventana del mundo (un chunk): el resultado es el
+        mismo que el del recorte correspondiente del mapa completo.
+
+        Args:
+            width: Ancho de la ventana en celdas
+            height: Alto de la ventana en celdas
+            origin_x: Columna del mundo donde empieza la ventana
+            origin_y: Fila del mundo donde empieza la ventana
+            world_width: Ancho total del mundo (por defecto, el de la ventana)
+            world_height: Alto total del mundo (por defecto, el de la ventana)
+
+        Returns:
+            Diccionario con arrays (height, width): "height", "mountain",
+            "temperature" y "terrain" (códigos de TERRAIN_BY_CODE)
+        """
+        if width is None:
+            width = self.world_size
+        if height is None:
+            height = self.world_size
+        if world_width is None:
+            world_width = origin_x + width
+        if world_height is None:
+            world_height = origin_y + height
+
+        # Escalas para el ruido (idénticas a la versión por celda)
+        world_scale = 80
+        mountain_scale = 40
+        temp_scale = 100
+
+        xs = origin_x + np.arange(width)
+        ys = origin_y + np.arange(height)
+
+        # === RUIDO DE ALTURA PRINCIPAL ===
+        height_val = self.world_field.grid(xs / world_scale, ys / world_scale)
+        height_val = np.clip(height_val, -1.0, 1.0)
+
+        # === CAPA DE MONTAÑAS ADICIONAL ===
+        mountain_val = self.mountain_field.grid(xs / mountain_scale, ys / mountain_scale)
+        mountain_influence = np.maximum(0.0, mountain_val * 0.5)
+
+        height_val = height_val * 0.7 + 0.3
+        height_val = height_val + mountain_influence * 0.3
+
+        # === RUIDO DE TEMPERATURA ===
+        temp_val = self.temperature_field.grid(xs / temp_scale, ys / temp_scale)
+        temp_val = np.clip(temp_val, -1.0, 1.0)
+
+        # === FORZAR BORDES DE AGUA ===
+        grid_x = xs[np.newaxis, :]
+        grid_y = ys[:, np.newaxis]
+        border_distance = np.minimum(
+            np.minimum(grid_x, grid_y),
+            np.minimum(world_width - 1 - grid_x, world_height - 1 - grid_y),
+        )
+        border_threshold = 5
+        water_influence = np.where(
+            border_distance < border_threshold,
+            (border_threshold - border_distance) / border_threshold,
+            0.0,
+        )
+        height_val = np.where(
+            border_distance < border_threshold,
+            height_val * (1.0 - water_influence) - 0.5 * water_influence,
+            height_val,
+        )
+        height_val = np.clip(height_val, -1.0, 1.0)
+
+        terrain = self.classify_terrain(height_val, mountain_influence, is_local=False)
+
+        # Arenas de combate: una tirada por celda con el RNG de hash, que solo
+        # depende de (semilla, x, y) y no del orden de generación
+        rolls = hash_uniform(self.seed, grid_x, grid_y, PURPOSE_WORLD_ARENA)
+        arena = (terrain == TERRAIN_CODE[Terrain.SAND]) & (temp_val > 0.3) & (rolls < 0.05)
+        terrain[arena] = TERRAIN_CODE[Terrain.ARENA]
+
+        return {
+            "height": height_val,
+            "mountain": mountain_influence,
+            "temperature": temp_val,
+            "terrain": terrain,
+        }
+
+    def generate_world_map(self, width=None, height=None, workers=1, tile_size=DEFAULT_TILE_SIZE):
         """
         Genera el mapa mundial con más tierra, montañas y bordes de agua.
-        
+
+        Los campos se calculan de forma vectorizada con generate_world_fields;
+        generate_world_map_reference conserva la implementación celda a celda.
+        Con varios workers el mapa se reparte en tiles que se generan en
+        procesos separados (ver engine/world/tiling.py); el resultado es
+        idéntico al de un solo proceso.
+
+        Args:
+            width: Ancho del mapa en celdas (1km cada una)
+            height: Alto del mapa en celdas (1km cada una)
+            workers: Número de procesos (1 = en este proceso, None = todos los núcleos)
+            tile_size: Lado de cada tile al repartir entre procesos
+
+        Returns:
+            TerrainGrid con el mapa mundial
+        """
+        width = width or self.world_size
+        height = height or self.world_size
+        tiles = plan_tiles(width, height, tile_size)
+        if resolve_workers(workers) == 1 or len(tiles) == 1:
+            fields = self.generate_world_fields(width, height)
+            return TerrainGrid(fields["height"], fields["temperature"], fields["terrain"])
+
+        tasks = [
+            (self.seed, self.world_size, x, y, w, h, width, height)
+            for x, y, w, h in tiles
+        ]
+        world_map = TerrainGrid.empty(height, width)
+        for tile in run_tasks(world_tile_task, tasks, workers):
+            tile_height, tile_width = tile.shape
+            area = (slice(tile.origin_y, tile.origin_y + tile_height),
+                    slice(tile.origin_x, tile.origin_x + tile_width))
+            world_map.heights[area] = tile.heights
+            world_map.temperatures[area] = tile.temperatures
+            world_map.terrain_codes[area] = tile.terrain_codes
+        return world_map
+
+    def generate_world_chunk(self, origin_x, origin_y, width, height, world_width=None, world_height=None):
+        """
+        Genera solo un rectángulo del mapa mundial (ver ChunkedWorldMap).
+
+        Args:
+            origin_x: Columna del mundo donde empieza el chunk
+            origin_y: Fila del mundo donde empieza el chunk
+            width: Ancho del chunk en celdas
+            height: Alto del chunk en celdas
+            world_width: Ancho total del mundo (por defecto world_size)
+            world_height: Alto total del mundo (por defecto world_size)
+
+        Returns:
+            TerrainGrid del chunk con origin_x/origin_y en coordenadas del mundo
+        """
+        fields = self.generate_world_fields(
+            width, height, origin_x, origin_y,
+            world_width or self.world_size, world_height or self.world_size,
+        )
+        return TerrainGrid(
+            fields["height"], fields["temperature"], fields["terrain"], origin_x, origin_y
+        )
+
+    def generate_world_map_reference(self, width=None, height=None):
+        """
+        Genera el mapa mundial celda a celda con PerlinNoise (implementación de referencia).
+
         Args:
             width: Ancho del mapa en celdas (1km cada una)
             height: Alto del mapa en celdas (1km cada una)
@@ -368,9 +796,7 @@ class MapGenerator:
                 terrain = self.get_terrain_type(height_val, mountain_factor=mountain_influence, is_local=False)
                 
                 # Posibilidad de arena en lugar de Sand
-                import random as rnd
-                rnd.seed(self.seed + x * 1000 + y)
-                rand_factor = rnd.random()
+                rand_factor = hash_uniform(self.seed, x, y, PURPOSE_WORLD_ARENA)
                 
                 if self.should_have_arena(terrain, temp_val, rand_factor):
                     terrain = Terrain.ARENA
@@ -380,10 +806,138 @@ class MapGenerator:
         
         return world_map
     
+    def generate_local_fields(self, world_x, world_y, local_width=64, local_height=64):
+        """
+        Calcula en bloque los campos de una región local.
+
+        Usa los backends vectorizados y el RNG de hash (sin estado global),
+        así que puede ejecutarse en hilos de fondo (ver RegionPrefetcher).
+
+        Args:
+            world_x: Coordenada X en el mapa mundial
+            world_y: Coordenada Y en el mapa mundial
+            local_width: Ancho del mapa local en celdas
+            local_height: Alto del mapa local en celdas
+
+        Returns:
+            Diccionario con arrays (local_height, local_width): "height",
+            "temperature" y "terrain" (códigos de TERRAIN_BY_CODE)
+        """
+        # Escalas para el ruido local (idénticas a la versión por celda)
+        local_scale = 8
+        mountain_local_scale = 5
+        temp_local_scale = 15
+
+        # Offset global basado en posición mundial
+        xs = world_x * 200 + np.arange(local_width)
+        ys = world_y * 200 + np.arange(local_height)
+
+        # === ALTURA LOCAL ===
+        height_val = np.clip(self.local_field.grid(xs / local_scale, ys / local_scale), -1.0, 1.0)
+
+        # === DETALLES DE MONTAÑA ===
+        mountain_val = self.mountain_field.grid(xs / mountain_local_scale, ys / mountain_local_scale)
+        mountain_influence = np.maximum(0.0, mountain_val * 0.4)
+        height_val = height_val * 0.6 + mountain_influence * 0.4
+
+        # === TEMPERATURA LOCAL ===
+        temp_val = np.clip(self.temperature_field.grid(xs / temp_local_scale, ys / temp_local_scale), -1.0, 1.0)
+
+        terrain = self.classify_terrain(height_val, mountain_influence, is_local=True)
+
+        # Arenas y variaciones por bioma: tiradas del RNG de hash sobre las
+        # coordenadas locales globales de cada celda, un flujo por decisión
+        cell_x = (world_x * local_width + np.arange(local_width))[np.newaxis, :]
+        cell_y = (world_y * local_height + np.arange(local_height))[:, np.newaxis]
+        sand = TERRAIN_CODE[Terrain.SAND]
+        grass = TERRAIN_CODE[Terrain.GRASS]
+        forest = TERRAIN_CODE[Terrain.FOREST]
+
+        variations = [
+            # (candidatas, propósito, probabilidad, nuevo terreno)
+            ((terrain == sand) & (temp_val > 0.3), PURPOSE_LOCAL_ARENA, 0.05, TERRAIN_CODE[Terrain.ARENA]),
+            ((terrain == grass) & (height_val > 0.25), PURPOSE_LOCAL_GRASS, 0.15, forest),
+            ((terrain == forest) & (height_val > 0.35), PURPOSE_LOCAL_FOREST, 0.1, grass),
+            ((terrain == TERRAIN_CODE[Terrain.SHALLOW_WATER]) & (height_val > -0.15), PURPOSE_LOCAL_WATER, 0.08, sand),
+        ]
+        # Las máscaras se calculan antes de modificar terrain: cada celda
+        # recibe como mucho una variación, como en la versión por celda
+        changes = [
+            (candidates & (hash_uniform(self.seed, cell_x, cell_y, purpose) < chance), new_terrain)
+            for candidates, purpose, chance, new_terrain in variations
+        ]
+        for mask, new_terrain in changes:
+            terrain[mask] = new_terrain
+
+        return {
+            "height": height_val,
+            "temperature": temp_val,
+            "terrain": terrain,
+        }
+
+    def generate_local_maps(self, positions, local_width=64, local_height=64, workers=1):
+        """
+        Genera un lote de regiones locales, opcionalmente en varios procesos.
+
+        Args:
+            positions: Lista de (world_x, world_y) como en generate_local_map
+            local_width: Ancho de cada región en celdas
+            local_height: Alto de cada región en celdas
+            workers: Número de procesos (1 = en este proceso, None = todos los núcleos)
+
+        Returns:
+            Lista de TerrainGrid en el orden de positions
+        """
+        positions = list(positions)
+        if resolve_workers(workers) == 1 or len(positions) <= 1:
+            return [
+                self.generate_local_map(world_x, world_y, local_width, local_height)
+                for world_x, world_y in positions
+            ]
+
+        tasks = [
+            (self.seed, self.world_size, world_x, world_y, local_width, local_height)
+            for world_x, world_y in positions
+        ]
+        return run_tasks(local_region_task, tasks, workers)
+
     def generate_local_map(self, world_x, world_y, local_width=64, local_height=64):
         """
         Genera el mapa local para una región del mundo con MUCHO MÁS DETALLE.
         Cada celda del mapa mundial expande a local_width x local_height celdas locales.
+
+        Características:
+        - Más detalle que el mapa mundial
+        - Características más pequeñas visibles
+        - Vegetación y detalles varían por bioma
+        - Grietas, lagos pequeños, colinas menores
+
+        Args:
+            world_x: Coordenada X en el mapa mundial
+            world_y: Coordenada Y en el mapa mundial
+            local_width: Ancho del mapa local en celdas (5m cada una) - aumentado a 64
+            local_height: Alto del mapa local en celdas (5m cada una) - aumentado a 64
+
+        Returns:
+            TerrainGrid con el mapa local (coordenadas globales en origin_x/origin_y)
+        """
+        fields = self.generate_local_fields(world_x, world_y, local_width, local_height)
+        return TerrainGrid(
+            fields["height"],
+            fields["temperature"],
+            fields["terrain"],
+            origin_x=world_x * local_width,
+            origin_y=world_y * local_height,
+        )
+
+    def generate_local_map_reference(self, world_x, world_y, local_width=64, local_height=64):
+        """
+        Versión celda a celda de generate_local_map (referencia para tests).
+        Usa PerlinNoise, que siembra el módulo random global, así que no es
+        segura en hilos.
+
+        Genera el mapa local para una región del mundo con MUCHO MÁS DETALLE.
+        Cada celda del mapa mundial expande a local_width x local_height celdas locales.
         
         Características:
         - Más detalle que el mapa mundial
@@ -398,9 +952,16 @@ class MapGenerator:
             local_height: Alto del mapa local en celdas (5m cada una) - aumentado a 64
         
         Returns:
-            Array 2D de MapTile
+            TerrainGrid con el mapa local (coordenadas globales en origin_x/origin_y)
         """
-        local_map = np.empty((local_height, local_width), dtype=object)
+        local_map = TerrainGrid.empty(
+            local_height, local_width,
+            origin_x=world_x * local_width,
+            origin_y=world_y * local_height,
+        )
+        heights = local_map.heights
+        temperatures = local_map.temperatures
+        terrain_codes = local_map.terrain_codes
         
         # Escalas para el ruido local - MÁS DETALLE
         local_scale = 8          # Más pequeño = más variación (antes era 15)
@@ -411,9 +972,9 @@ class MapGenerator:
         global_offset_x = world_x * 200  # Aumentado para consistencia
         global_offset_y = world_y * 200
         
-        # Base de seed determinística
-        import random as rnd
-        base_seed = self.seed + world_x * 10000 + world_y * 100
+        # Coordenadas locales globales de la región (para el RNG de hash)
+        cell_origin_x = local_map.origin_x
+        cell_origin_y = local_map.origin_y
         
         for y in range(local_height):
             for x in range(local_width):
@@ -443,8 +1004,9 @@ class MapGenerator:
                 terrain = self.get_terrain_type(height_val, mountain_factor=mountain_influence, is_local=True)
                 
                 # === ARENAS DE COMBATE (raras pero posibles localmente) ===
-                rnd.seed(base_seed + x * 100 + y)
-                rand_factor = rnd.random()
+                cell_x = cell_origin_x + x
+                cell_y = cell_origin_y + y
+                rand_factor = hash_uniform(self.seed, cell_x, cell_y, PURPOSE_LOCAL_ARENA)
                 
                 if self.should_have_arena(terrain, temp_val, rand_factor):
                     terrain = Terrain.ARENA
@@ -453,32 +1015,25 @@ class MapGenerator:
                 # Añadir más diversidad visual dentro de un bioma
                 if terrain == Terrain.GRASS:
                     # Algunos tiles de hierba pueden ser más altos (pequeñas colinas)
-                    rnd.seed(base_seed + x * 50 + y * 50)
-                    if rnd.random() < 0.15 and height_val > 0.25:
+                    if hash_uniform(self.seed, cell_x, cell_y, PURPOSE_LOCAL_GRASS) < 0.15 and height_val > 0.25:
                         # Pequeña colina
                         terrain = Terrain.FOREST
                 
                 elif terrain == Terrain.FOREST:
                     # Algunos bosques pueden tener claros o ser más densos
-                    rnd.seed(base_seed + x * 75 + y * 75)
-                    if rnd.random() < 0.1 and height_val > 0.35:
+                    if hash_uniform(self.seed, cell_x, cell_y, PURPOSE_LOCAL_FOREST) < 0.1 and height_val > 0.35:
                         # Claro en el bosque
                         terrain = Terrain.GRASS
                 
                 elif terrain == Terrain.SHALLOW_WATER:
                     # Pequeños lagos pueden tener islas de hierba
-                    rnd.seed(base_seed + x * 80 + y * 80)
-                    if rnd.random() < 0.08 and height_val > -0.15:
+                    if hash_uniform(self.seed, cell_x, cell_y, PURPOSE_LOCAL_WATER) < 0.08 and height_val > -0.15:
                         terrain = Terrain.SAND
                 
-                # Crear celda local con coordenadas globales
-                local_map[y, x] = MapTile(
-                    world_x * local_width + x,
-                    world_y * local_height + y,
-                    height_val,
-                    terrain,
-                    temp_val
-                )
+                # Guardar celda local (coordenadas globales vía origin_x/origin_y)
+                heights[y, x] = height_val
+                temperatures[y, x] = temp_val
+                terrain_codes[y, x] = TERRAIN_CODE[terrain]
         
         return local_map
     
@@ -487,7 +1042,7 @@ class MapGenerator:
         Visualiza el mapa mundial como ASCII art.
         
         Args:
-            world_map: Array 2D de MapTile
+            world_map: TerrainGrid (o array 2D de MapTile)
             show_coordinates: Si True, muestra coordenadas
         
         Returns:
@@ -520,7 +1075,7 @@ class MapGenerator:
         Visualiza el mapa local como ASCII art.
         
         Args:
-            local_map: Array 2D de MapTile
+            local_map: TerrainGrid (o array 2D de MapTile)
             show_coordinates: Si True, muestra coordenadas
             show_heights: Si True, muestra valores de altura
         
@@ -601,31 +1156,34 @@ class MapGenerator:
         Calcula estadísticas del mapa.
         
         Args:
-            world_map: Array 2D de MapTile
+            world_map: TerrainGrid (o array 2D de MapTile)
         
         Returns:
             Diccionario con estadísticas
         """
+        if not isinstance(world_map, TerrainGrid):
+            world_map = TerrainGrid.from_tiles(world_map)
+        
         height, width = world_map.shape
         total = height * width
         
-        terrain_counts = {}
-        height_values = []
-        temp_values = []
-        temp_category_counts = {}
+        # Conteos directamente sobre los arrays
+        code_counts = np.bincount(world_map.terrain_codes.ravel(), minlength=len(TERRAIN_BY_CODE))
+        terrain_counts = {
+            TERRAIN_BY_CODE[code].name: int(count)
+            for code, count in enumerate(code_counts)
+            if count
+        }
         
-        for y in range(height):
-            for x in range(width):
-                tile = world_map[y, x]
-                terrain_name = tile.terrain.name
-                terrain_counts[terrain_name] = terrain_counts.get(terrain_name, 0) + 1
-                height_values.append(tile.height)
-                temp_values.append(tile.temperature)
-                
-                # Contar categorías de temperatura
-                temp_cat = tile.get_temperature_category()
-                temp_name = temp_cat.value
-                temp_category_counts[temp_name] = temp_category_counts.get(temp_name, 0) + 1
+        category_counts = np.bincount(
+            world_map.temperature_categories().ravel(),
+            minlength=len(TEMPERATURE_BY_BUCKET),
+        )
+        temp_category_counts = {
+            TEMPERATURE_BY_BUCKET[index].value: int(count)
+            for index, count in enumerate(category_counts)
+            if count
+        }
         
         # Calcular porcentajes
         terrain_percentages = {
@@ -638,6 +1196,9 @@ class MapGenerator:
             for name, count in temp_category_counts.items()
         }
         
+        height_values = world_map.heights.astype(np.float64)
+        temp_values = world_map.temperatures.astype(np.float64)
+        
         return {
             "total_tiles": total,
             "terrain_counts": terrain_counts,
@@ -0,0 +1,161 @@
+# engine/world/noise.py
+"""
+Ruido de gradiente vectorizado con NumPy.
+
+Reproduce exactamente el algoritmo de la librería ``perlin_noise`` (mismas
+semillas, mismos vectores de gradiente y misma interpolación), pero evalúa
+una rejilla completa de coordenadas en una sola llamada en lugar de celda
+por celda.
+
+Notas sobre ``perlin_noise``:
+- ``octaves`` no suma capas: solo multiplica la frecuencia de las coordenadas.
+- El gradiente del punto de red (ix, iy) se obtiene sembrando ``random`` con
+  ``seed * max(1, |ix + 10 * iy + 1|)`` y tomando dos ``uniform(-1, 1)``.
+"""
+
+import random
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# Gradientes de red guardados por generador (LRU): cubre los bordes que
+# comparten chunks y regiones vecinas sin crecer con todo lo explorado
+GRADIENT_CACHE_SIZE = 16384
+
+
+def fade(values):
+    """Curva de suavizado 6t^5 - 15t^4 + 10t^3 aplicada a un array."""
+    return 6 * values ** 5 - 15 * values ** 4 + 10 * values ** 3
+
+
+class VectorizedPerlin:
+    """Versión vectorizada de ``perlin_noise.PerlinNoise`` para 2D."""
+
+    def __init__(self, octaves=1, seed=1, cache_size=GRADIENT_CACHE_SIZE):
+        """
+        Inicializa el generador.
+
+        Args:
+            octaves: Multiplicador de frecuencia (igual que en PerlinNoise)
+            seed: Semilla ya resuelta (PerlinNoise sustituye 0/None por una aleatoria)
+            cache_size: Máximo de gradientes de red guardados (LRU)
+        """
+        self.octaves = octaves
+        self.seed = seed
+        self.cache_size = cache_size
+        # (ix, iy) -> gradiente, del menos al más recientemente usado
+        self._gradients = OrderedDict()
+        self._rng = random.Random()
+        # seed() + uniform() y el LRU deben ser atómicos si varios hilos
+        # muestrean a la vez
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_perlin(cls, perlin):
+        """Crea un generador compatible con una instancia de PerlinNoise."""
+        return cls(octaves=perlin.octaves, seed=perlin.seed)
+
+    def gradient(self, ix, iy):
+        """
+        Retorna el vector de gradiente del punto de red (ix, iy).
+
+        Usa una instancia propia de ``random.Random`` para no alterar el
+        estado global, con la misma semilla que usaría PerlinNoise.
+        """
+        with self._lock:
+            vec = self._gradient_locked(ix, iy)
+            self._trim_locked()
+        return vec
+
+    def _gradient_locked(self, ix, iy):
+        """gradient() sin tomar el lock ni recortar la caché."""
+        key = (ix, iy)
+        gradients = self._gradients
+        vec = gradients.get(key)
+        if vec is None:
+            coord_hash = max(1, int(abs(ix + 10 * iy + 1)))
+            self._rng.seed(self.seed * coord_hash)
+            vec = (self._rng.uniform(-1, 1), self._rng.uniform(-1, 1))
+            gradients[key] = vec
+        else:
+            gradients.move_to_end(key)
+        return vec
+
+    def _trim_locked(self):
+        """Descarta los gradientes menos usados por encima de cache_size."""
+        gradients = self._gradients
+        for _ in range(len(gradients) - self.cache_size):
+            gradients.popitem(last=False)
+
+    def _gradient_table(self, x_min, x_max, y_min, y_max):
+        """Construye arrays (gx, gy) con los gradientes del rectángulo de red."""
+        width = x_max - x_min + 1
+        height = y_max - y_min + 1
+        gx = np.empty((height, width), dtype=np.float64)
+        gy = np.empty((height, width), dtype=np.float64)
+        with self._lock:
+            for j in range(height):
+                for i in range(width):
+                    gx[j, i], gy[j, i] = self._gradient_locked(x_min + i, y_min + j)
+            # La tabla ya tiene sus gradientes: recortar al final
+            self._trim_locked()
+        return gx, gy
+
+    def sample(self, xs, ys):
+        """
+        Evalúa el ruido en un conjunto de coordenadas.
+
+        Las entradas se combinan por broadcasting, así que pasar una fila de
+        X y una columna de Y produce una rejilla completa. Pensado para
+        rejillas regulares: la tabla de gradientes cubre el rectángulo de red
+        que abarcan las coordenadas.
+
+        Args:
+            xs: Coordenadas X (escalar o array)
+            ys: Coordenadas Y (escalar o array)
+
+        Returns:
+            Array float64 con el valor de ruido en cada punto
+        """
+        x = np.asarray(xs, dtype=np.float64) * self.octaves
+        y = np.asarray(ys, dtype=np.float64) * self.octaves
+        x, y = np.broadcast_arrays(x, y)
+
+        x0 = np.floor(x).astype(np.int64)
+        y0 = np.floor(y).astype(np.int64)
+        if x.size == 0:
+            return np.zeros(x.shape, dtype=np.float64)
+
+        x_min, y_min = int(x0.min()), int(y0.min())
+        gx, gy = self._gradient_table(x_min, int(x0.max()) + 1, y_min, int(y0.max()) + 1)
+        col = x0 - x_min
+        row = y0 - y_min
+
+        # Mismo orden de suma que itertools.product en PerlinNoise
+        total = np.zeros(x.shape, dtype=np.float64)
+        for cx in (0, 1):
+            dx = x - (x0 + cx)
+            weight_x = fade(1 - np.abs(dx))
+            for cy in (0, 1):
+                dy = y - (y0 + cy)
+                weight = weight_x * fade(1 - np.abs(dy))
+                vec_x = gx[row + cy, col + cx]
+                vec_y = gy[row + cy, col + cx]
+                total += weight * (vec_x * dx + vec_y * dy)
+        return total
+
+    def grid(self, x_coords, y_coords):
+        """
+        Evalúa el ruido en la rejilla formada por dos ejes 1D.
+
+        Args:
+            x_coords: Coordenadas X (columnas)
+            y_coords: Coordenadas Y (filas)
+
+        Returns:
+            Array 2D de forma (len(y_coords), len(x_coords))
+        """
+        x_coords = np.asarray(x_coords, dtype=np.float64)
+        y_coords = np.asarray(y_coords, dtype=np.float64)
+        return self.sample(x_coords[np.newaxis, :], y_coords[:, np.newaxis])
@@ -0,0 +1,240 @@
+# engine/world/region_cache.py
+"""
+Caché persistente en disco de regiones locales generadas.
+
+Cada región se guarda en un archivo binario propio dentro de
+saves/games/<sesión>/regions/ con una cabecera fija seguida de los arrays
+de TerrainGrid (alturas float32, temperaturas float32, códigos uint8) sin
+comprimir, de forma que al leerlos se mapean en memoria con np.memmap en
+lugar de copiarlos. El nombre del archivo incluye semilla, versión del
+generador, coordenadas y tamaño de la región; la cabecera repite esos
+datos y se valida al cargar.
+
+El tamaño total del directorio se limita con un presupuesto en bytes:
+al superarlo se borran las regiones usadas hace más tiempo (LRU, usando
+la fecha de modificación del archivo como marca de último uso).
+"""
+
+import os
+import struct
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from engine.world.map_generator import MapGenerator, TerrainGrid
+
+REGION_MAGIC = b"PLRG"
+REGION_FORMAT_VERSION = 1
+REGION_SUFFIX = ".region"
+
+# magic, versión de formato, versión del generador, semilla, región x/y,
+# ancho, alto, origen x/y
+REGION_HEADER = struct.Struct("<4sHHqiiiiii")
+# Los arrays empiezan alineados a 16 bytes
+REGION_DATA_OFFSET = (REGION_HEADER.size + 15) // 16 * 16
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class RegionCache:
+    """Caché LRU de regiones locales en disco, con lectura por memmap."""
+
+    def __init__(self, directory, seed, generator_version=MapGenerator.VERSION,
+                 max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Inicializa la caché.
+
+        Args:
+            directory: Directorio donde se guardan las regiones
+            seed: Semilla del mundo (forma parte de la clave)
+            generator_version: Versión del generador que produjo las regiones
+            max_bytes: Presupuesto máximo de disco en bytes
+        """
+        self.directory = Path(directory)
+        self.seed = seed
+        self.generator_version = generator_version
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+
+        # nombre de archivo -> tamaño, del menos al más recientemente usado
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self._scan()
+
+    # ------------------------------
+    # Índice
+    # ------------------------------
+
+    def _scan(self):
+        """Construye el índice LRU a partir de los archivos existentes."""
+        if not self.directory.exists():
+            return
+
+        files = []
+        for path in self.directory.glob(f"*{REGION_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, path.name, stat.st_size))
+
+        for _, name, size in sorted(files):
+            self._entries[name] = size
+            self._total_bytes += size
+
+    @property
+    def total_bytes(self):
+        """Bytes ocupados en disco por las regiones conocidas."""
+        return self._total_bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        region_x, region_y, width, height = key
+        return self.filename(region_x, region_y, width, height) in self._entries
+
+    def filename(self, region_x, region_y, width, height):
+        """Nombre de archivo de una región para esta semilla y versión."""
+        return (
+            f"s{self.seed}_g{self.generator_version}_"
+            f"{region_x}_{region_y}_{width}x{height}{REGION_SUFFIX}"
+        )
+
+    def _forget(self, name):
+        size = self._entries.pop(name, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    def _remove(self, name):
+        """Borra un archivo de región y lo quita del índice."""
+        try:
+            (self.directory / name).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            # En Windows no se puede borrar un archivo mapeado en memoria
+            return False
+        self._forget(name)
+        return True
+
+    def _evict(self):
+        """Borra las regiones menos usadas hasta cumplir el presupuesto."""
+        for name in list(self._entries):
+            if self._total_bytes <= self.max_bytes or len(self._entries) <= 1:
+                break
+            self._remove(name)
+
+    # ------------------------------
+    # Lectura / escritura
+    # ------------------------------
+
+    def get(self, region_x, region_y, width, height):
+        """
+        Carga una región de disco.
+
+        Args:
+            region_x: Coordenada X de la región
+            region_y: Coordenada Y de la región
+            width: Ancho de la región en celdas
+            height: Alto de la región en celdas
+
+        Returns:
+            TerrainGrid de solo lectura respaldado por memmap, o None si no
+            está en caché o el archivo no es válido
+        """
+        name = self.filename(region_x, region_y, width, height)
+        path = self.directory / name
+        if name not in self._entries:
+            self.misses += 1
+            return None
+
+        try:
+            grid = self._read(path, region_x, region_y, width, height)
+        except (OSError, ValueError):
+            grid = None
+
+        if grid is None:
+            # Archivo dañado o de otra versión: descartarlo
+            self._remove(name)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(name)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return grid
+
+    def _read(self, path, region_x, region_y, width, height):
+        """Valida la cabecera y mapea los arrays del archivo."""
+        with open(path, "rb") as f:
+            header = f.read(REGION_HEADER.size)
+        if len(header) != REGION_HEADER.size:
+            return None
+
+        (magic, format_version, generator_version, seed, rx, ry,
+         w, h, origin_x, origin_y) = REGION_HEADER.unpack(header)
+        if (magic != REGION_MAGIC
+                or format_version != REGION_FORMAT_VERSION
+                or generator_version != self.generator_version
+                or seed != self.seed
+                or (rx, ry, w, h) != (region_x, region_y, width, height)):
+            return None
+
+        cells = width * height
+        if path.stat().st_size != REGION_DATA_OFFSET + cells * 9:
+            return None
+
+        shape = (height, width)
+        offset = REGION_DATA_OFFSET
+        heights = np.memmap(path, dtype=np.float32, mode="r", offset=offset, shape=shape)
+        offset += cells * 4
+        temperatures = np.memmap(path, dtype=np.float32, mode="r", offset=offset, shape=shape)
+        offset += cells * 4
+        terrain_codes = np.memmap(path, dtype=np.uint8, mode="r", offset=offset, shape=shape)
+        return TerrainGrid.from_arrays(heights, temperatures, terrain_codes, origin_x, origin_y)
+
+    def put(self, region_x, region_y, grid):
+        """
+        Guarda una región en disco y aplica el presupuesto de bytes.
+
+        La escritura va a un archivo temporal que luego se renombra, para
+        que una interrupción nunca deje una región a medias.
+
+        Args:
+            region_x: Coordenada X de la región
+            region_y: Coordenada Y de la región
+            grid: TerrainGrid de la región
+        """
+        height, width = grid.shape
+        name = self.filename(region_x, region_y, width, height)
+        path = self.directory / name
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        header = REGION_HEADER.pack(
+            REGION_MAGIC, REGION_FORMAT_VERSION, self.generator_version, self.seed,
+            region_x, region_y, width, height, grid.origin_x, grid.origin_y,
+        )
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(header.ljust(REGION_DATA_OFFSET, b"\0"))
+            f.write(np.ascontiguousarray(grid.heights, dtype=np.float32).tobytes())
+            f.write(np.ascontiguousarray(grid.temperatures, dtype=np.float32).tobytes())
+            f.write(np.ascontiguousarray(grid.terrain_codes, dtype=np.uint8).tobytes())
+        os.replace(tmp_path, path)
+
+        self._forget(name)
+        self._entries[name] = path.stat().st_size
+        self._total_bytes += self._entries[name]
+        self._evict()
+
+    def clear(self):
+        """Borra todas las regiones de la caché."""
+        for name in list(self._entries):
+            self._remove(name)
@@ -0,0 +1,205 @@
+# engine/world/region_prefetcher.py
+"""
+Precarga en segundo plano de regiones locales vecinas.
+
+World consulta al prefetcher en cada movimiento del jugador: cuando este se
+acerca al borde de su región, las regiones del otro lado del borde (primero
+las que están en la dirección en la que se mueve) se generan en un pool de
+hilos. Al cruzar el borde, load_local_map recoge la región ya generada en
+lugar de generarla en el hilo principal.
+
+La generación de MapGenerator.generate_local_map no usa el estado global
+de random, así que es segura en hilos. El resto (cachés de World y
+RegionCache) solo se toca desde el hilo principal.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+class RegionPrefetcher:
+    """Genera regiones vecinas en un pool de hilos y lleva estadísticas."""
+
+    def __init__(self, generate, max_workers=2, margin=8, region_size=64):
+        """
+        Inicializa el prefetcher.
+
+        Args:
+            generate: Función (region_x, region_y) -> TerrainGrid
+            max_workers: Hilos del pool de generación
+            margin: Distancia al borde (en tiles) a la que se precarga el vecino
+            region_size: Tamaño de región en tiles del mapa mundial
+        """
+        self.generate = generate
+        self.max_workers = max_workers
+        self.margin = margin
+        self.region_size = region_size
+
+        self._executor = None
+        self._pending = {}  # (region_x, region_y) -> Future
+
+        # Estadísticas
+        self.hits = 0           # Región lista al necesitarla (caché o precarga terminada)
+        self.misses = 0         # Hubo que esperar o generar en el hilo principal
+        self.stall_time = 0.0   # Segundos que el hilo principal estuvo bloqueado
+        self.prefetched = 0     # Regiones enviadas al pool
+        self.failed = 0         # Generaciones con error o canceladas
+
+    # ------------------------------
+    # Planificación
+    # ------------------------------
+
+    def neighbours(self, world_x, world_y, dx=0, dy=0):
+        """
+        Calcula qué regiones vecinas conviene precargar.
+
+        Se incluyen las regiones al otro lado de cada borde a menos de
+        `margin` tiles (y la diagonal si está cerca de dos bordes). Las que
+        quedan en la dirección del movimiento (dx, dy) van primero.
+
+        Args:
+            world_x: Posición X del jugador en el mapa mundial
+            world_y: Posición Y del jugador en el mapa mundial
+            dx: Componente X de la dirección de movimiento
+            dy: Componente Y de la dirección de movimiento
+
+        Returns:
+            Lista de claves (region_x, region_y)
+        """
+        region_x, region_y = world_x // self.region_size, world_y // self.region_size
+        local_x, local_y = world_x % self.region_size, world_y % self.region_size
+
+        steps_x = [0]
+        if local_x < self.margin:
+            steps_x.append(-1)
+        if local_x >= self.region_size - self.margin:
+            steps_x.append(1)
+        steps_y = [0]
+        if local_y < self.margin:
+            steps_y.append(-1)
+        if local_y >= self.region_size - self.margin:
+            steps_y.append(1)
+
+        steps = [(sx, sy) for sx in steps_x for sy in steps_y if (sx, sy) != (0, 0)]
+        # Primero las regiones hacia las que se mueve el jugador
+        steps.sort(key=lambda step: -(step[0] * dx + step[1] * dy))
+        return [(region_x + sx, region_y + sy) for sx, sy in steps]
+
+    def schedule(self, keys):
+        """
+        Envía al pool las regiones indicadas que no estén ya en curso.
+
+        Args:
+            keys: Claves (region_x, region_y) en orden de prioridad
+        """
+        if self.max_workers <= 0:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="region-prefetch"
+            )
+        for key in keys:
+            if key not in self._pending:
+                self._pending[key] = self._executor.submit(self.generate, *key)
+                self.prefetched += 1
+
+    def is_pending(self, key):
+        """True si la región está en cola, generándose o lista para recoger."""
+        return key in self._pending
+
+    # ------------------------------
+    # Recogida de resultados
+    # ------------------------------
+
+    def take(self, key):
+        """
+        Recoge una región del pool.
+
+        Si la generación aún no ha terminado se espera a que termine. Un
+        error del hilo o una cancelación no se propagan: se cuentan en
+        `failed` y la región se trata como no pedida, para que World la
+        busque en disco o la genere en el momento.
+
+        Args:
+            key: Clave (region_x, region_y)
+
+        Returns:
+            (TerrainGrid, listo) o (None, False) si la región no se pidió o
+            falló; listo indica si estaba terminada sin esperar
+        """
+        future = self._pending.pop(key, None)
+        if future is None:
+            return None, False
+        ready = future.done()
+        if self._failed(future, key):
+            return None, False
+        return future.result(), ready
+
+    def _failed(self, future, key):
+        """True (y lo cuenta) si la generación de la región falló o se canceló."""
+        if future.cancelled():
+            self.failed += 1
+            return True
+        error = future.exception()
+        if error is not None:
+            print(f"Error prefetching region {key}: {error}")
+            self.failed += 1
+            return True
+        return False
+
+    def completed(self):
+        """
+        Extrae las regiones cuya generación ya terminó.
+
+        Returns:
+            Lista de (clave, TerrainGrid)
+        """
+        done = [key for key, future in self._pending.items() if future.done()]
+        results = []
+        for key in done:
+            future = self._pending.pop(key)
+            if self._failed(future, key):
+                continue
+            results.append((key, future.result()))
+        return results
+
+    def cancel(self):
+        """Descarta todas las regiones pendientes (p. ej. al cambiar la semilla)."""
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+
+    def shutdown(self):
+        """Cancela lo pendiente y detiene el pool de hilos."""
+        self.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    # ------------------------------
+    # Estadísticas
+    # ------------------------------
+
+    def record_hit(self):
+        """Anota una región que ya estaba disponible."""
+        self.hits += 1
+
+    def record_miss(self, seconds=0.0):
+        """Anota una región que bloqueó al hilo principal durante `seconds`."""
+        self.misses += 1
+        self.stall_time += seconds
+
+    def stats(self):
+        """
+        Retorna las estadísticas de precarga.
+
+        Returns:
+            Diccionario con hits, misses, stall_ms, prefetched, failed y pending
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stall_ms": self.stall_time * 1000,
+            "prefetched": self.prefetched,
+            "failed": self.failed,
+            "pending": len(self._pending),
+        }
@@ -0,0 +1,418 @@
+# engine/world/save_format.py
+"""
+Formato binario compacto de guardado (save.bin) y migraciones de esquema.
+
+Estructura del archivo:
+- Cabecera fija (HEADER) con la versión de esquema y el resumen que usa el
+  menú de carga: semilla, tamaño del mundo, posición, fecha de guardado y
+  las longitudes de los nombres de sesión y jugador (que van a continuación
+  en UTF-8).
+- Tabla de secciones (SECTION): nombre, codificación, desplazamiento,
+  tamaño almacenado, tamaño original y CRC32.
+- Los datos de cada sección: JSON compacto, comprimido con zlib salvo que
+  sea tan pequeño que no compense.
+
+Cada clave de primer nivel del guardado (world, player, session_name...) es
+una sección, así que SaveFile puede leer solo la cabecera (menú de carga) o
+una sección concreta sin descomprimir el resto.
+
+JSON sigue siendo un formato válido de carga y de exportación/depuración:
+load_save detecta el formato por el número mágico y aplica la cadena de
+migraciones hasta SCHEMA_VERSION.
+
+Versiones de esquema:
+1. save.json original (sin schema_version ni world.world_size)
+2. schema_version y world.world_size explícitos
+3. journal_seq: último registro del diario incluido en la instantánea
+4. npcs: asentamientos y deltas de la población virtual de NPCs
+"""
+
+import io
+import json
+import struct
+import time
+import zlib
+from pathlib import Path
+
+MAGIC = b"PLSV"
+SCHEMA_VERSION = 4
+
+# Nombres de archivo por formato
+FORMAT_JSON = "json"
+FORMAT_BINARY = "binary"
+SAVE_FILENAMES = {
+    FORMAT_JSON: "save.json",
+    FORMAT_BINARY: "save.bin",
+}
+
+# magic, esquema, nº secciones, semilla, world_size, x, y, fecha, len(sesión), len(jugador)
+HEADER = struct.Struct("<4sHHqiiidHH")
+# nombre, codificación, desplazamiento, tamaño almacenado, tamaño original, crc32
+SECTION = struct.Struct("<16sBQIII")
+
+CODEC_RAW = 0
+CODEC_ZLIB = 1
+MIN_COMPRESS_BYTES = 64
+
+DEFAULT_WORLD_SIZE = 128
+
+
+class SaveFormatError(ValueError):
+    """Archivo de guardado con formato o esquema no válido."""
+
+
+# ------------------------------
+# Migraciones
+# ------------------------------
+
+def _migrate_1_to_2(save_data):
+    """save.json original -> esquema 2 (world_size explícito)."""
+    world = dict(save_data.get("world", {}))
+    world.setdefault("world_size", DEFAULT_WORLD_SIZE)
+    save_data["world"] = world
+    return save_data
+
+
+def _migrate_2_to_3(save_data):
+    """Esquema 2 -> 3 (guardados anteriores al diario de sesión)."""
+    save_data.setdefault("journal_seq", 0)
+    return save_data
+
+
+def _migrate_3_to_4(save_data):
+    """Esquema 3 -> 4 (guardados anteriores a la población virtual de NPCs)."""
+    save_data.setdefault("npcs", {})
+    return save_data
+
+
+# Versión de origen -> función que produce la versión siguiente
+MIGRATIONS = {
+    1: _migrate_1_to_2,
+    2: _migrate_2_to_3,
+    3: _migrate_3_to_4,
+}
+
+
+def schema_of(save_data):
+    """Versión de esquema de unos datos de guardado (1 si no la indican)."""
+    return int(save_data.get("schema_version", 1))
+
+
+def migrate(save_data):
+    """
+    Lleva los datos de guardado a SCHEMA_VERSION.
+
+    Args:
+        save_data: Diccionario de guardado de cualquier versión conocida
+
+    Returns:
+        Nuevo diccionario en la versión actual
+    """
+    save_data = dict(save_data)
+    version = schema_of(save_data)
+    if version > SCHEMA_VERSION:
+        raise SaveFormatError(f"Esquema de guardado {version} más nuevo que el soportado ({SCHEMA_VERSION})")
+
+    while version < SCHEMA_VERSION:
+        migration = MIGRATIONS.get(version)
+        if migration is None:
+            raise SaveFormatError(f"No hay migración desde el esquema {version}")
+        save_data = migration(save_data)
+        version += 1
+    save_data["schema_version"] = SCHEMA_VERSION
+    return save_data
+
+
+# ------------------------------
+# Escritura
+# ------------------------------
+
+def _summary(save_data):
+    """Campos de la cabecera a partir de los datos de guardado."""
+    world = save_data.get("world") or {}
+    position = world.get("player_position") or {}
+    player = save_data.get("player") or {}
+    return (
+        int(world.get("seed") or 0),
+        int(world.get("world_size") or 0),
+        int(position.get("x", 0)),
+        int(position.get("y", 0)),
+        str(save_data.get("session_name") or ""),
+        str(player.get("name") or ""),
+    )
+
+
+def encode_binary(save_data, saved_at=None):
+    """
+    Serializa los datos de guardado al formato binario.
+
+    Args:
+        save_data: Diccionario de guardado (se migra a la versión actual)
+        saved_at: Fecha de guardado (por defecto, ahora)
+
+    Returns:
+        Bytes del archivo save.bin
+    """
+    save_data = migrate(save_data)
+    seed, world_size, x, y, session_name, player_name = _summary(save_data)
+    session_bytes = session_name.encode("utf-8")
+    player_bytes = player_name.encode("utf-8")
+
+    names = [name for name in save_data if name != "schema_version"]
+    payloads = []
+    for name in names:
+        raw = json.dumps(save_data[name], ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        if len(raw) >= MIN_COMPRESS_BYTES:
+            stored, codec = zlib.compress(raw, 6), CODEC_ZLIB
+        else:
+            stored, codec = raw, CODEC_RAW
+        payloads.append((name, codec, stored, len(raw), zlib.crc32(raw)))
+
+    header = HEADER.pack(
+        MAGIC, SCHEMA_VERSION, len(payloads), seed, world_size, x, y,
+        time.time() if saved_at is None else saved_at,
+        len(session_bytes), len(player_bytes),
+    )
+    offset = HEADER.size + len(session_bytes) + len(player_bytes) + SECTION.size * len(payloads)
+
+    table = []
+    for name, codec, stored, raw_size, crc in payloads:
+        encoded_name = name.encode("utf-8")
+        if len(encoded_name) > 16:
+            raise SaveFormatError(f"Nombre de sección demasiado largo: {name}")
+        table.append(SECTION.pack(encoded_name, codec, offset, len(stored), raw_size, crc))
+        offset += len(stored)
+
+    return b"".join([header, session_bytes, player_bytes, *table, *(p[2] for p in payloads)])
+
+
+def encode_json(save_data):
+    """Serializa los datos de guardado a JSON legible (exportación/depuración)."""
+    return json.dumps(migrate(save_data), indent=4, ensure_ascii=False).encode("utf-8")
+
+
+def serialize(save_data, save_format):
+    """
+    Serializa los datos de guardado en el formato pedido.
+
+    Args:
+        save_data: Diccionario de guardado
+        save_format: FORMAT_JSON o FORMAT_BINARY
+
+    Returns:
+        Bytes del archivo
+    """
+    if save_format == FORMAT_BINARY:
+        return encode_binary(save_data)
+    if save_format == FORMAT_JSON:
+        return encode_json(save_data)
+    raise ValueError(f"Formato de guardado desconocido: {save_format}")
+
+
+def format_for_path(path):
+    """Formato según la extensión del archivo (.bin = binario, resto = JSON)."""
+    return FORMAT_BINARY if Path(path).suffix == ".bin" else FORMAT_JSON
+
+
+# ------------------------------
+# Lectura
+# ------------------------------
+
+class SaveFile:
+    """
+    Lector perezoso de un save.bin.
+
+    Al abrirlo solo se leen la cabecera y la tabla de secciones; cada
+    sección se lee y descomprime la primera vez que se pide.
+    """
+
+    def __init__(self, source):
+        """
+        Lee la cabecera del archivo.
+
+        Args:
+            source: Ruta del save.bin, o sus bytes (p. ej. de SessionStore)
+
+        Raises:
+            SaveFormatError: si no es un guardado binario válido
+        """
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            self.path, self._data = None, bytes(source)
+        else:
+            self.path, self._data = Path(source), None
+        self._cache = {}
+
+        with self._open() as f:
+            header = f.read(HEADER.size)
+            if len(header) < HEADER.size or header[:4] != MAGIC:
+                raise SaveFormatError(f"No es un guardado binario: {self.path or '<bytes>'}")
+            (_, self.schema_version, count, self.seed, self.world_size, x, y,
+             self.saved_at, session_len, player_len) = HEADER.unpack(header)
+            self.position = (x, y)
+
+            names = f.read(session_len + player_len)
+            table = f.read(SECTION.size * count)
+            if len(names) < session_len + player_len or len(table) < SECTION.size * count:
+                raise SaveFormatError(f"Cabecera truncada: {self.path or '<bytes>'}")
+
+        self.session_name = names[:session_len].decode("utf-8")
+        self.player_name = names[session_len:].decode("utf-8")
+
+        # nombre -> (codificación, desplazamiento, tamaño almacenado, tamaño original, crc)
+        self.sections = {}
+        for index in range(count):
+            name, codec, offset, stored, raw_size, crc = SECTION.unpack_from(table, index * SECTION.size)
+            self.sections[name.rstrip(b"\0").decode("utf-8")] = (codec, offset, stored, raw_size, crc)
+
+    def _open(self):
+        """Abre el origen de datos (archivo o bytes en memoria)."""
+        if self._data is not None:
+            return io.BytesIO(self._data)
+        return open(self.path, "rb")
+
+    def summary(self):
+        """
+        Datos de la cabecera para el menú de carga (sin leer secciones).
+
+        Returns:
+            Diccionario con schema_version, session_name, player_name,
+            position, seed, world_size y saved_at
+        """
+        return {
+            "schema_version": self.schema_version,
+            "session_name": self.session_name,
+            "player_name": self.player_name,
+            "position": list(self.position),
+            "seed": self.seed,
+            "world_size": self.world_size,
+            "saved_at": self.saved_at,
+        }
+
+    def section(self, name):
+        """
+        Lee una sección (en el esquema del archivo, sin migrar).
+
+        Args:
+            name: Nombre de la sección (p. ej. "player")
+
+        Returns:
+            Valor de la sección
+
+        Raises:
+            KeyError: si la sección no existe
+            SaveFormatError: si los datos están dañados
+        """
+        if name in self._cache:
+            return self._cache[name]
+
+        codec, offset, stored, raw_size, crc = self.sections[name]
+        with self._open() as f:
+            f.seek(offset)
+            data = f.read(stored)
+        if len(data) < stored:
+            raise SaveFormatError(f"Sección '{name}' truncada")
+
+        if codec == CODEC_ZLIB:
+            try:
+                data = zlib.decompress(data)
+            except zlib.error as e:
+                raise SaveFormatError(f"Sección '{name}' dañada: {e}") from e
+        elif codec != CODEC_RAW:
+            raise SaveFormatError(f"Codificación desconocida en '{name}': {codec}")
+        if len(data) != raw_size or zlib.crc32(data) != crc:
+            raise SaveFormatError(f"Sección '{name}' dañada (CRC)")
+
+        value = json.loads(data.decode("utf-8"))
+        self._cache[name] = value
+        return value
+
+    def load(self):
+        """
+        Lee todas las secciones y las migra a la versión actual.
+
+        Returns:
+            Diccionario de guardado completo
+        """
+        save_data = {name: self.section(name) for name in self.sections}
+        save_data["schema_version"] = self.schema_version
+        return migrate(save_data)
+
+
+def is_binary_save(path):
+    """True si el archivo empieza por el número mágico del formato binario."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def load_save(path):
+    """
+    Carga un guardado en cualquier formato y lo migra a la versión actual.
+
+    Args:
+        path: Ruta de save.bin o save.json
+
+    Returns:
+        Diccionario de guardado
+    """
+    if is_binary_save(path):
+        return SaveFile(path).load()
+    with open(path, "r", encoding="utf-8") as f:
+        return migrate(json.load(f))
+
+
+def decode_save(payload):
+    """
+    Decodifica los bytes de un guardado (binario o JSON) y lo migra.
+
+    Args:
+        payload: Bytes tal como los produce serialize
+
+    Returns:
+        Diccionario de guardado
+    """
+    if payload[:len(MAGIC)] == MAGIC:
+        return SaveFile(payload).load()
+    return migrate(json.loads(bytes(payload).decode("utf-8")))
+
+
+def find_save_file(session_dir):
+    """
+    Archivo de guardado de una sesión. Si hay varios formatos se usa el
+    más reciente.
+
+    Args:
+        session_dir: Directorio de la sesión
+
+    Returns:
+        Path del guardado o None si no hay ninguno
+    """
+    newest, newest_mtime = None, None
+    for filename in SAVE_FILENAMES.values():
+        path = Path(session_dir) / filename
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            continue
+        if newest is None or mtime > newest_mtime:
+            newest, newest_mtime = path, mtime
+    return newest
+
+
+def export_json(source, destination):
+    """
+    Convierte un guardado (binario o JSON de cualquier esquema) a JSON
+    legible, para depurarlo o editarlo a mano.
+
+    Args:
+        source: Guardado de origen
+        destination: Archivo JSON a escribir
+
+    Returns:
+        Path del archivo escrito
+    """
+    destination = Path(destination)
+    destination.write_bytes(encode_json(load_save(source)))
+    return destination
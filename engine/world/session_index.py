@@ -0,0 +1,258 @@
+# engine/world/session_index.py
+"""
+Índice de sesiones guardadas.
+
+Guarda en saves/games/.index/sessions.json los datos que necesita el menú de carga
+(nombre del jugador, posición, semilla, fechas y tamaño) para no tener que
+abrir y parsear el guardado de cada sesión.
+
+World.save_game actualiza la entrada de su sesión. Al leer el índice se
+valida contra el disco sin parsear nada que no haya cambiado:
+- si cambió la fecha de modificación de saves/games se buscan sesiones
+  nuevas o borradas,
+- si el guardado de una sesión tiene otra fecha o tamaño que los
+  registrados, solo esa sesión se vuelve a leer (de un save.bin basta con
+  la cabecera).
+
+El índice vive en un subdirectorio para que escribirlo no cambie la fecha
+de modificación de saves/games.
+"""
+
+import json
+import os
+from pathlib import Path
+
+from engine.world.save_format import SaveFile, find_save_file, is_binary_save, load_save
+
+INDEX_DIRNAME = ".index"
+INDEX_FILENAME = "sessions.json"
+INDEX_VERSION = 1
+
+
+def _stat_key(stat):
+    """Huella de un archivo para detectar cambios (fecha y tamaño)."""
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class SessionIndex:
+    """Índice persistente de las sesiones de un directorio de partidas."""
+
+    def __init__(self, games_dir):
+        """
+        Inicializa el índice (no lee nada hasta que se consulta).
+
+        Args:
+            games_dir: Directorio con una carpeta por sesión
+        """
+        self.games_dir = Path(games_dir)
+        self.path = self.games_dir / INDEX_DIRNAME / INDEX_FILENAME
+        self._entries = None
+        self._dir_mtime = None
+
+    # ------------------------------
+    # Lectura y validación
+    # ------------------------------
+
+    def _read_index(self):
+        """Lee el índice; si no existe o no es válido, empieza vacío."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION:
+                raise ValueError("versión de índice distinta")
+            return data.get("sessions", {}), data.get("dir_mtime")
+        except (OSError, ValueError, AttributeError):
+            return {}, None
+
+    def _dir_mtime_ns(self):
+        try:
+            return self.games_dir.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def load(self):
+        """
+        Carga el índice y lo sincroniza con el disco.
+
+        Returns:
+            Diccionario nombre de sesión -> entrada
+        """
+        entries, dir_mtime = self._read_index()
+        changed = False
+
+        current_dir_mtime = self._dir_mtime_ns()
+        if current_dir_mtime is None:
+            self._entries, self._dir_mtime = {}, None
+            return self._entries
+
+        # Sesiones nuevas o borradas: solo si cambió el directorio
+        if current_dir_mtime != dir_mtime:
+            on_disk = {
+                path.name for path in self.games_dir.iterdir()
+                if path.is_dir() and find_save_file(path) is not None
+            }
+            for name in set(entries) - on_disk:
+                del entries[name]
+                changed = True
+            for name in on_disk - set(entries):
+                entries[name] = None
+            dir_mtime = current_dir_mtime
+            changed = True
+
+        # Sesiones modificadas fuera de save_game
+        for name in list(entries):
+            save_file = find_save_file(self.games_dir / name)
+            try:
+                stat = save_file.stat()
+            except (OSError, AttributeError):
+                del entries[name]
+                changed = True
+                continue
+
+            entry = entries[name]
+            if entry is None or entry.get("stat") != _stat_key(stat):
+                entry = self._entry_from_file(name, save_file, stat, entry)
+                if entry is None:
+                    del entries[name]
+                else:
+                    entries[name] = entry
+                changed = True
+
+        self._entries, self._dir_mtime = entries, dir_mtime
+        if changed:
+            self._write()
+        return self._entries
+
+    def _entry_from_file(self, name, save_file, stat, previous=None):
+        """Construye la entrada de una sesión leyendo su guardado."""
+        try:
+            if is_binary_save(save_file):
+                return self._entry_from_header(name, SaveFile(save_file), stat, previous)
+            save_data = load_save(save_file)
+        except (OSError, ValueError):  # SaveFormatError incluido
+            return None
+        return self._make_entry(name, save_data, stat, previous)
+
+    @staticmethod
+    def _entry_from_header(name, save_file, stat, previous=None):
+        """Entrada a partir de la cabecera de un save.bin (sin leer secciones)."""
+        created = previous.get("created") if previous else None
+        return {
+            "name": name,
+            "player_name": save_file.player_name or "Desconocido",
+            "position": list(save_file.position),
+            "seed": save_file.seed,
+            "world_size": save_file.world_size,
+            "created": created if created is not None else stat.st_mtime,
+            "modified": stat.st_mtime,
+            "size": stat.st_size,
+            "stat": _stat_key(stat),
+        }
+
+    @staticmethod
+    def _make_entry(name, save_data, stat, previous=None):
+        """Extrae de los datos de guardado lo que necesita el menú."""
+        world = save_data.get("world", {})
+        position = world.get("player_position", {})
+        player = save_data.get("player") or {}
+        created = previous.get("created") if previous else None
+        return {
+            "name": name,
+            "player_name": player.get("name", "Desconocido"),
+            "position": [position.get("x", 0), position.get("y", 0)],
+            "seed": world.get("seed"),
+            "world_size": world.get("world_size"),
+            "created": created if created is not None else stat.st_mtime,
+            "modified": stat.st_mtime,
+            "size": stat.st_size,
+            "stat": _stat_key(stat),
+        }
+
+    def _write(self):
+        """Escribe el índice de forma atómica (archivo temporal + rename)."""
+        data = {
+            "version": INDEX_VERSION,
+            "dir_mtime": self._dir_mtime,
+            "sessions": self._entries,
+        }
+        tmp_path = self.path.with_suffix(".tmp")
+        try:
+            if not self.path.parent.exists():
+                # Crear el subdirectorio cambia la fecha de saves/games
+                self.path.parent.mkdir(parents=True)
+                if self._dir_mtime is not None:
+                    data["dir_mtime"] = self._dir_mtime = self._dir_mtime_ns()
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Error writing session index: {e}")
+
+    # ------------------------------
+    # Consultas
+    # ------------------------------
+
+    def entries(self):
+        """
+        Retorna las entradas ordenadas por nombre de sesión.
+
+        Returns:
+            Lista de diccionarios con name, player_name, position, seed,
+            world_size, created, modified y size
+        """
+        if self._entries is None:
+            self.load()
+        return [self._entries[name] for name in sorted(self._entries)]
+
+    def session_names(self):
+        """Retorna los nombres de sesión ordenados."""
+        return [entry["name"] for entry in self.entries()]
+
+    def get(self, session_name):
+        """Retorna la entrada de una sesión o None."""
+        if self._entries is None:
+            self.load()
+        return self._entries.get(session_name)
+
+    # ------------------------------
+    # Actualización
+    # ------------------------------
+
+    def update(self, session_name, save_data):
+        """
+        Registra una sesión recién guardada (llamado por World.save_game).
+
+        Parte del índice tal como está en disco (sin revalidar el resto de
+        sesiones) para no pisar cambios hechos por otra instancia.
+
+        Args:
+            session_name: Nombre de la sesión
+            save_data: Datos que se acaban de escribir en su guardado
+        """
+        save_file = find_save_file(self.games_dir / session_name)
+        if save_file is None:
+            return
+        try:
+            stat = save_file.stat()
+        except OSError:
+            return
+
+        entries, dir_mtime = self._read_index()
+        entries[session_name] = self._make_entry(
+            session_name, save_data, stat, entries.get(session_name)
+        )
+        if dir_mtime is not None:
+            # La carpeta de la sesión pudo crearse ahora mismo
+            dir_mtime = self._dir_mtime_ns()
+        self._entries, self._dir_mtime = entries, dir_mtime
+        self._write()
+
+    def remove(self, session_name):
+        """
+        Quita una sesión del índice (al borrarla). La siguiente carga vuelve
+        a listar el directorio, por si la sesión sigue existiendo en disco.
+        """
+        entries, _ = self._read_index()
+        entries.pop(session_name, None)
+        self._entries, self._dir_mtime = entries, None
+        self._write()
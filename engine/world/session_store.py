@@ -0,0 +1,523 @@
+# engine/world/session_store.py
+"""
+Almacén de sesiones en SQLite (opcional).
+
+Alternativa a las carpetas de saves/games/ para cuando hay muchas
+sesiones (p. ej. las que crean los tests): una sola base de datos con
+
+- sessions: una fila por sesión con los metadatos del menú de carga
+  (jugador, semilla, tamaño, posición, fechas) en columnas indexadas y la
+  instantánea completa como blob (formato de engine/world/save_format.py),
+- blobs: datos binarios por sesión, usados para las cachés de chunks del
+  mapa mundial y de regiones locales (SessionBlobCache), con la fecha de
+  último uso para limitarlas a un presupuesto en bytes (LRU, como
+  RegionCache).
+
+Listar, buscar (más recientes, por jugador, por semilla) y borrar son
+consultas indexadas, sin recorrer directorios. El borrado de una sesión
+y de sus blobs va en una sola transacción; vacuum() recupera el espacio.
+
+Solo usa sqlite3 de la biblioteca estándar. La conexión se comparte
+entre hilos (el autoguardado escribe desde el suyo) protegida por un lock.
+"""
+
+import sqlite3
+import struct
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+
+from engine.world.map_generator import MapGenerator, TerrainGrid
+from engine.world.region_cache import DEFAULT_MAX_BYTES
+from engine.world.save_format import FORMAT_BINARY, decode_save, find_save_file, load_save, serialize
+
+STORE_SCHEMA_VERSION = 2
+
+# Tipos de blob usados por World
+BLOB_WORLD_CHUNK = "world"
+BLOB_REGION = "region"
+
+# Origen x/y del TerrainGrid guardado en un blob, antes de los arrays
+BLOB_GRID_HEADER = struct.Struct("<ii")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    name TEXT PRIMARY KEY,
+    player_name TEXT NOT NULL DEFAULT '',
+    seed INTEGER,
+    world_size INTEGER,
+    pos_x INTEGER NOT NULL DEFAULT 0,
+    pos_y INTEGER NOT NULL DEFAULT 0,
+    schema_version INTEGER NOT NULL,
+    created REAL NOT NULL,
+    modified REAL NOT NULL,
+    save BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_modified ON sessions (modified);
+CREATE INDEX IF NOT EXISTS sessions_player ON sessions (player_name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS sessions_seed ON sessions (seed);
+CREATE TABLE IF NOT EXISTS blobs (
+    session TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    data BLOB NOT NULL,
+    accessed REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (session, kind, key)
+) WITHOUT ROWID;
+"""
+
+# Migraciones de bases de datos anteriores: versión de origen -> sentencias
+_MIGRATIONS = {
+    # v1 -> v2: fecha de último uso de los blobs (los antiguos quedan como
+    # los menos recientes)
+    1: ["ALTER TABLE blobs ADD COLUMN accessed REAL NOT NULL DEFAULT 0"],
+}
+
+# Índice creado tras migrar (la columna no existe en una base v1)
+_BLOB_ACCESS_INDEX = "CREATE INDEX IF NOT EXISTS blobs_accessed ON blobs (session, kind, accessed)"
+
+# Columnas de metadatos (todo menos el blob de la instantánea)
+_ENTRY_COLUMNS = "name, player_name, seed, world_size, pos_x, pos_y, created, modified, length(save)"
+
+
+def _entry(row):
+    """Fila de sessions -> entrada con el formato de SessionIndex."""
+    name, player_name, seed, world_size, pos_x, pos_y, created, modified, size = row
+    return {
+        "name": name,
+        "player_name": player_name or "Desconocido",
+        "position": [pos_x, pos_y],
+        "seed": seed,
+        "world_size": world_size,
+        "created": created,
+        "modified": modified,
+        "size": size,
+    }
+
+
+class SessionStore:
+    """Sesiones, instantáneas y blobs de caché en una base de datos SQLite."""
+
+    def __init__(self, path):
+        """
+        Abre (o crea) la base de datos.
+
+        Args:
+            path: Archivo SQLite, o ":memory:"
+        """
+        self.path = path
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self.transaction() as cursor:
+            # executescript haría COMMIT por su cuenta: sentencia a sentencia
+            for statement in _SCHEMA.split(";"):
+                if statement.strip():
+                    cursor.execute(statement)
+            cursor.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (str(STORE_SCHEMA_VERSION),),
+            )
+            self._migrate(cursor)
+            cursor.execute(_BLOB_ACCESS_INDEX)
+
+    def _migrate(self, cursor):
+        """Lleva una base de datos de una versión anterior a STORE_SCHEMA_VERSION."""
+        version = int(cursor.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()[0])
+        while version < STORE_SCHEMA_VERSION:
+            for statement in _MIGRATIONS[version]:
+                cursor.execute(statement)
+            version += 1
+        cursor.execute("UPDATE meta SET value = ? WHERE key = 'schema_version'", (str(version),))
+
+    def close(self):
+        """Cierra la conexión."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Ejecuta un bloque en una transacción (BEGIN IMMEDIATE ... COMMIT,
+        ROLLBACK si hay una excepción).
+
+        Yields:
+            Cursor de la conexión
+        """
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            else:
+                cursor.execute("COMMIT")
+            finally:
+                cursor.close()
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    # ------------------------------
+    # Sesiones
+    # ------------------------------
+
+    def save_session(self, session_name, save_data, payload=None):
+        """
+        Guarda (o reemplaza) la instantánea de una sesión.
+
+        Args:
+            session_name: Nombre de la sesión
+            save_data: Diccionario de guardado (para las columnas de metadatos)
+            payload: Bytes ya serializados (por defecto, formato binario)
+        """
+        if payload is None:
+            payload = serialize(save_data, FORMAT_BINARY)
+        world = save_data.get("world") or {}
+        position = world.get("player_position") or {}
+        player = save_data.get("player") or {}
+        now = time.time()
+
+        with self.transaction() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO sessions (name, player_name, seed, world_size, pos_x, pos_y,
+                                      schema_version, created, modified, save)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (name) DO UPDATE SET
+                    player_name = excluded.player_name, seed = excluded.seed,
+                    world_size = excluded.world_size, pos_x = excluded.pos_x,
+                    pos_y = excluded.pos_y, schema_version = excluded.schema_version,
+                    modified = excluded.modified, save = excluded.save
+                """,
+                (
+                    session_name, player.get("name") or "", world.get("seed"),
+                    world.get("world_size"), position.get("x", 0), position.get("y", 0),
+                    save_data.get("schema_version", 1), now, now, sqlite3.Binary(payload),
+                ),
+            )
+
+    def load_session(self, session_name):
+        """
+        Carga la instantánea de una sesión (migrada a la versión actual).
+
+        Returns:
+            Diccionario de guardado, o None si la sesión no existe
+        """
+        rows = self._query("SELECT save FROM sessions WHERE name = ?", (session_name,))
+        if not rows:
+            return None
+        return decode_save(rows[0][0])
+
+    def __contains__(self, session_name):
+        return bool(self._query("SELECT 1 FROM sessions WHERE name = ?", (session_name,)))
+
+    def __len__(self):
+        return self._query("SELECT count(*) FROM sessions")[0][0]
+
+    def get(self, session_name):
+        """Retorna la entrada (metadatos) de una sesión o None."""
+        rows = self._query(f"SELECT {_ENTRY_COLUMNS} FROM sessions WHERE name = ?", (session_name,))
+        return _entry(rows[0]) if rows else None
+
+    def entries(self):
+        """
+        Entradas de todas las sesiones ordenadas por nombre, con el mismo
+        formato que SessionIndex.entries (para el menú de carga).
+        """
+        return [_entry(row) for row in self._query(f"SELECT {_ENTRY_COLUMNS} FROM sessions ORDER BY name")]
+
+    def session_names(self):
+        """Nombres de sesión ordenados."""
+        return [row[0] for row in self._query("SELECT name FROM sessions ORDER BY name")]
+
+    def recent(self, limit=10):
+        """Las `limit` sesiones guardadas más recientemente."""
+        rows = self._query(
+            f"SELECT {_ENTRY_COLUMNS} FROM sessions ORDER BY modified DESC, rowid DESC LIMIT ?", (limit,)
+        )
+        return [_entry(row) for row in rows]
+
+    def by_player(self, player_name):
+        """Sesiones de un jugador (sin distinguir mayúsculas)."""
+        rows = self._query(
+            f"SELECT {_ENTRY_COLUMNS} FROM sessions WHERE player_name = ? COLLATE NOCASE "
+            "ORDER BY modified DESC, rowid DESC",
+            (player_name,),
+        )
+        return [_entry(row) for row in rows]
+
+    def by_seed(self, seed):
+        """Sesiones de un mundo con la semilla dada."""
+        rows = self._query(
+            f"SELECT {_ENTRY_COLUMNS} FROM sessions WHERE seed = ? ORDER BY modified DESC, rowid DESC", (seed,)
+        )
+        return [_entry(row) for row in rows]
+
+    def delete(self, session_name):
+        """
+        Borra una sesión y todos sus blobs en una sola transacción.
+
+        Returns:
+            True si la sesión existía
+        """
+        with self.transaction() as cursor:
+            cursor.execute("DELETE FROM blobs WHERE session = ?", (session_name,))
+            cursor.execute("DELETE FROM sessions WHERE name = ?", (session_name,))
+            return cursor.rowcount > 0
+
+    def vacuum(self):
+        """Compacta el archivo de la base de datos tras borrar sesiones."""
+        with self._lock:
+            self._conn.execute("VACUUM")
+
+    def import_directory(self, games_dir):
+        """
+        Importa las sesiones en carpetas (save.json / save.bin) de un
+        directorio de partidas.
+
+        Args:
+            games_dir: Directorio con una carpeta por sesión
+
+        Returns:
+            Número de sesiones importadas
+        """
+        imported = 0
+        games_dir = Path(games_dir)
+        if not games_dir.exists():
+            return 0
+        for session_dir in sorted(games_dir.iterdir()):
+            save_file = find_save_file(session_dir) if session_dir.is_dir() else None
+            if save_file is None:
+                continue
+            try:
+                save_data = load_save(save_file)
+            except (OSError, ValueError) as e:
+                print(f"Skipping session {session_dir.name}: {e}")
+                continue
+            self.save_session(session_dir.name, save_data)
+            imported += 1
+        return imported
+
+    # ------------------------------
+    # Blobs
+    # ------------------------------
+
+    def put_blob(self, session_name, kind, key, data):
+        """Guarda (o reemplaza) un blob de la sesión, marcado como recién usado."""
+        with self.transaction() as cursor:
+            cursor.execute(
+                "INSERT OR REPLACE INTO blobs (session, kind, key, data, accessed) VALUES (?, ?, ?, ?, ?)",
+                (session_name, kind, key, sqlite3.Binary(data), time.time()),
+            )
+
+    def get_blob(self, session_name, kind, key, touch=False):
+        """
+        Retorna los bytes de un blob o None.
+
+        Args:
+            session_name: Nombre de la sesión
+            kind: Tipo de blob
+            key: Clave del blob
+            touch: Actualizar su fecha de último uso (para el LRU)
+        """
+        if not touch:
+            rows = self._query(
+                "SELECT data FROM blobs WHERE session = ? AND kind = ? AND key = ?",
+                (session_name, kind, key),
+            )
+            return bytes(rows[0][0]) if rows else None
+
+        with self.transaction() as cursor:
+            cursor.execute(
+                "UPDATE blobs SET accessed = ? WHERE session = ? AND kind = ? AND key = ?",
+                (time.time(), session_name, kind, key),
+            )
+            if not cursor.rowcount:
+                return None
+            row = cursor.execute(
+                "SELECT data FROM blobs WHERE session = ? AND kind = ? AND key = ?",
+                (session_name, kind, key),
+            ).fetchone()
+            return bytes(row[0])
+
+    def has_blob(self, session_name, kind, key):
+        """True si existe el blob."""
+        return bool(self._query(
+            "SELECT 1 FROM blobs WHERE session = ? AND kind = ? AND key = ?",
+            (session_name, kind, key),
+        ))
+
+    def blob_sizes(self, session_name, kind):
+        """
+        Tamaño de cada blob de un tipo.
+
+        Returns:
+            Lista de (clave, bytes), del menos al más recientemente usado
+        """
+        return self._query(
+            "SELECT key, length(data) FROM blobs WHERE session = ? AND kind = ? ORDER BY accessed, key",
+            (session_name, kind),
+        )
+
+    def delete_blobs(self, session_name, kind=None, keys=None):
+        """
+        Borra los blobs de una sesión (de un tipo o todos) en una transacción.
+
+        Args:
+            session_name: Nombre de la sesión
+            kind: Tipo de blob (None = todos)
+            keys: Claves concretas a borrar (requiere kind; None = todas)
+        """
+        with self.transaction() as cursor:
+            if kind is None:
+                cursor.execute("DELETE FROM blobs WHERE session = ?", (session_name,))
+            elif keys is None:
+                cursor.execute("DELETE FROM blobs WHERE session = ? AND kind = ?", (session_name, kind))
+            else:
+                cursor.executemany(
+                    "DELETE FROM blobs WHERE session = ? AND kind = ? AND key = ?",
+                    [(session_name, kind, key) for key in keys],
+                )
+
+    def blob_cache(self, session_name, kind, seed, generator_version=MapGenerator.VERSION,
+                   max_bytes=DEFAULT_MAX_BYTES):
+        """Caché de TerrainGrid de la sesión con la interfaz de RegionCache."""
+        return SessionBlobCache(self, session_name, kind, seed, generator_version, max_bytes)
+
+
+class SessionBlobCache:
+    """
+    Caché de TerrainGrid guardada como blobs de SessionStore, con la misma
+    interfaz que RegionCache (get, put, in, clear, hits/misses, total_bytes).
+
+    Los arrays se leen con np.frombuffer sobre los bytes del blob, sin
+    copiarlos (solo lectura). Igual que RegionCache, el tamaño total se
+    limita con un presupuesto en bytes: al superarlo se borran los blobs
+    usados hace más tiempo (LRU, según la columna accessed).
+    """
+
+    def __init__(self, store, session_name, kind, seed, generator_version=MapGenerator.VERSION,
+                 max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            store: SessionStore
+            session_name: Sesión dueña de los blobs
+            kind: Tipo de blob (BLOB_WORLD_CHUNK, BLOB_REGION...)
+            seed: Semilla del mundo (forma parte de la clave)
+            generator_version: Versión del generador (forma parte de la clave)
+            max_bytes: Presupuesto máximo de bytes de este tipo de blob
+        """
+        self.store = store
+        self.session_name = session_name
+        self.kind = kind
+        self.seed = seed
+        self.generator_version = generator_version
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        # clave -> tamaño, del menos al más recientemente usado
+        self._entries = OrderedDict(store.blob_sizes(session_name, kind))
+        self._total_bytes = sum(self._entries.values())
+
+    @property
+    def total_bytes(self):
+        """Bytes ocupados por los blobs conocidos."""
+        return self._total_bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _forget(self, key):
+        size = self._entries.pop(key, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    def _evict(self):
+        """Borra los blobs menos usados hasta cumplir el presupuesto."""
+        evicted = []
+        for key in list(self._entries):
+            if self._total_bytes <= self.max_bytes or len(self._entries) <= 1:
+                break
+            self._forget(key)
+            evicted.append(key)
+        if evicted:
+            self.store.delete_blobs(self.session_name, self.kind, evicted)
+
+    def key(self, region_x, region_y, width, height):
+        """Clave del blob (mismo esquema que los nombres de RegionCache)."""
+        return f"s{self.seed}_g{self.generator_version}_{region_x}_{region_y}_{width}x{height}"
+
+    def __contains__(self, key):
+        return self.store.has_blob(self.session_name, self.kind, self.key(*key))
+
+    def get(self, region_x, region_y, width, height):
+        """
+        Carga un TerrainGrid.
+
+        Returns:
+            TerrainGrid de solo lectura, o None si no está o no es válido
+        """
+        key = self.key(region_x, region_y, width, height)
+        data = self.store.get_blob(self.session_name, self.kind, key, touch=True)
+        cells = width * height
+        if data is None or len(data) != BLOB_GRID_HEADER.size + cells * 9:
+            self.misses += 1
+            return None
+
+        origin_x, origin_y = BLOB_GRID_HEADER.unpack_from(data)
+        offset = BLOB_GRID_HEADER.size
+        shape = (height, width)
+        heights = np.frombuffer(data, dtype=np.float32, count=cells, offset=offset).reshape(shape)
+        offset += cells * 4
+        temperatures = np.frombuffer(data, dtype=np.float32, count=cells, offset=offset).reshape(shape)
+        offset += cells * 4
+        terrain_codes = np.frombuffer(data, dtype=np.uint8, count=cells, offset=offset).reshape(shape)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        self.hits += 1
+        return TerrainGrid.from_arrays(heights, temperatures, terrain_codes, origin_x, origin_y)
+
+    def put(self, region_x, region_y, grid):
+        """Guarda un TerrainGrid y aplica el presupuesto de bytes."""
+        height, width = grid.shape
+        data = b"".join([
+            BLOB_GRID_HEADER.pack(grid.origin_x, grid.origin_y),
+            np.ascontiguousarray(grid.heights, dtype=np.float32).tobytes(),
+            np.ascontiguousarray(grid.temperatures, dtype=np.float32).tobytes(),
+            np.ascontiguousarray(grid.terrain_codes, dtype=np.uint8).tobytes(),
+        ])
+        key = self.key(region_x, region_y, width, height)
+        self.store.put_blob(self.session_name, self.kind, key, data)
+
+        self._forget(key)
+        self._entries[key] = len(data)
+        self._total_bytes += len(data)
+        self._evict()
+
+    def clear(self):
+        """Borra todos los blobs de este tipo de la sesión."""
+        self.store.delete_blobs(self.session_name, self.kind)
+        self._entries.clear()
+        self._total_bytes = 0
@@ -0,0 +1,154 @@
+# engine/world/tiling.py
+"""
+Generación de mapas repartida en procesos.
+
+El mapa mundial se divide en tiles rectangulares que se generan por
+separado con MapGenerator.generate_world_chunk y se vuelven a unir. Como
+cada celda solo depende de la semilla, de sus coordenadas absolutas y del
+tamaño total del mundo, el resultado es idéntico bit a bit al de la
+generación en un solo proceso.
+
+Las tareas se ejecutan en un ProcessPoolExecutor; con un solo worker, una
+sola tarea o si no se puede crear el pool, se ejecutan en serie en el
+proceso actual.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+DEFAULT_TILE_SIZE = 256
+
+# Generadores por proceso worker: (semilla, world_size) -> MapGenerator
+_generators = {}
+
+
+def resolve_workers(workers):
+    """
+    Normaliza el número de workers.
+
+    Args:
+        workers: Entero, o None para usar todos los núcleos
+
+    Returns:
+        Número de procesos (al menos 1)
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return max(1, int(workers))
+
+
+def plan_tiles(width, height, tile_size=DEFAULT_TILE_SIZE):
+    """
+    Divide un rectángulo en tiles en orden fila a fila.
+
+    Args:
+        width: Ancho total en celdas
+        height: Alto total en celdas
+        tile_size: Lado máximo de cada tile
+
+    Returns:
+        Lista de (origin_x, origin_y, ancho, alto)
+    """
+    return [
+        (x, y, min(tile_size, width - x), min(tile_size, height - y))
+        for y in range(0, height, tile_size)
+        for x in range(0, width, tile_size)
+    ]
+
+
+def run_tasks(function, tasks, workers=None):
+    """
+    Ejecuta function(task) para cada tarea, en procesos si es posible.
+
+    Args:
+        function: Función de nivel de módulo (debe poder serializarse)
+        tasks: Lista de argumentos, uno por tarea
+        workers: Número de procesos (None = todos los núcleos, 1 = en serie)
+
+    Returns:
+        Lista de resultados en el mismo orden que tasks
+    """
+    tasks = list(tasks)
+    workers = min(resolve_workers(workers), len(tasks))
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(function, tasks))
+        except (OSError, NotImplementedError, BrokenProcessPool) as e:
+            # Entornos sin multiprocessing (o un worker caído): seguir en serie
+            print(f"Parallel generation unavailable, running serially: {e}")
+    return [function(task) for task in tasks]
+
+
+def _generator(seed, world_size):
+    """Retorna (creándolo una vez por proceso) el MapGenerator de la semilla."""
+    from engine.world.map_generator import MapGenerator
+
+    key = (seed, world_size)
+    generator = _generators.get(key)
+    if generator is None:
+        _generators.clear()  # Solo se reutiliza el de la semilla en curso
+        generator = _generators[key] = MapGenerator(seed=seed, world_size=world_size)
+    return generator
+
+
+def world_tile_task(task):
+    """
+    Worker: genera un tile del mapa mundial.
+
+    Args:
+        task: (seed, world_size, origin_x, origin_y, ancho, alto, world_width, world_height)
+
+    Returns:
+        TerrainGrid del tile
+    """
+    seed, world_size, origin_x, origin_y, width, height, world_width, world_height = task
+    return _generator(seed, world_size).generate_world_chunk(
+        origin_x, origin_y, width, height, world_width, world_height
+    )
+
+
+def local_region_task(task):
+    """
+    Worker: genera una región local.
+
+    Args:
+        task: (seed, world_size, world_x, world_y, local_width, local_height)
+
+    Returns:
+        TerrainGrid de la región
+    """
+    seed, world_size, world_x, world_y, local_width, local_height = task
+    return _generator(seed, world_size).generate_local_map(world_x, world_y, local_width, local_height)
+
+
+def world_map_task(task):
+    """
+    Worker: genera un mapa mundial completo (lotes de semillas).
+
+    Args:
+        task: (seed, world_size, width, height)
+
+    Returns:
+        TerrainGrid del mundo
+    """
+    seed, world_size, width, height = task
+    return _generator(seed, world_size).generate_world_map(width, height)
+
+
+def generate_world_maps(seeds, width, height, workers=None):
+    """
+    Genera un mapa mundial por semilla, repartiendo las semillas en procesos.
+
+    Args:
+        seeds: Iterable de semillas
+        width: Ancho de cada mapa
+        height: Alto de cada mapa
+        workers: Número de procesos (None = todos los núcleos, 1 = en serie)
+
+    Returns:
+        Lista de TerrainGrid en el orden de seeds
+    """
+    tasks = [(seed, max(width, height), width, height) for seed in seeds]
+    return run_tasks(world_map_task, tasks, workers)
@@ -4,26 +4,66 @@ Sistema de gestión del mundo del juego.
 Maneja el estado global, posición del jugador, mapa generado y navegación.
 """
 
-import json
+import copy
+import time
 from pathlib import Path
-from engine.world.map_generator import MapGenerator, Terrain
+from engine.entities.npc_population import VirtualPopulation
+from engine.world.autosave import DEFAULT_BACKUPS, write_atomic
+from engine.world.chunked_map import ChunkedWorldMap
+from engine.world.journal import (
+    RECORD_EVENT, RECORD_MOVE, RECORD_PLAYER, Journal, encode_json, encode_move,
+)
+from engine.world.map_generator import TERRAIN_BY_CODE, MapGenerator, Terrain
+from engine.world.region_cache import RegionCache
+from engine.world.region_prefetcher import RegionPrefetcher
+from engine.world.save_format import (
+    FORMAT_BINARY, FORMAT_JSON, SAVE_FILENAMES, SCHEMA_VERSION,
+    find_save_file, format_for_path, is_binary_save, load_save, serialize,
+)
+from engine.world.session_index import SessionIndex
+from engine.world.session_store import BLOB_REGION, BLOB_WORLD_CHUNK
 import numpy as np
 
+# Directorio raíz de las partidas guardadas
+GAMES_DIR = Path(__file__).parent.parent.parent / "saves" / "games"
+
+# Tamaño por defecto del mundo (celdas por lado)
+DEFAULT_WORLD_SIZE = 128
+
+# Registros de diario tras los que conviene tomar una instantánea
+JOURNAL_SNAPSHOT_RECORDS = 1000
+
+# Chunks del mapa mundial que se examinan como máximo al buscar la posición
+# inicial (por debajo del LRU de ChunkedWorldMap)
+SPAWN_SEARCH_CHUNKS = 64
+
 
 class World:
     """Gestor principal del mundo."""
     
-    def __init__(self, seed=42, session_name="default"):
+    def __init__(self, seed=42, session_name="default", use_region_cache=True, prefetch_workers=2,
+                 world_size=DEFAULT_WORLD_SIZE, save_format=FORMAT_JSON, use_journal=True,
+                 session_store=None):
         """
         Inicializa el mundo.
         
         Args:
             seed: Semilla para generación procedural
             session_name: Nombre de la sesión para guardado
+            use_region_cache: Guardar en disco las regiones locales y los chunks
+                              del mapa mundial generados
+            prefetch_workers: Hilos para precargar regiones vecinas (0 = desactivado)
+            world_size: Celdas por lado del mapa mundial (se genera por chunks)
+            save_format: Formato de save_game (FORMAT_JSON o FORMAT_BINARY)
+            use_journal: Registrar los cambios entre guardados en el diario
+                         de la sesión (ver engine/world/journal.py)
+            session_store: SessionStore (SQLite) donde guardar la sesión y sus
+                           cachés en lugar de la carpeta saves/games/<sesión>
         """
         self.seed = seed
         self.session_name = session_name
-        self.generator = MapGenerator(seed=seed, world_size=128)  # Mundo más grande
+        self.world_size = world_size
+        self.generator = MapGenerator(seed=seed, world_size=world_size)
         
         # Posición del jugador en el mapa mundial (será actualizada en generate_world)
         self.player_world_x = 0
@@ -39,64 +79,201 @@ class World:
         self.cached_region_x = None
         self.cached_region_y = None
         
+        # Caché persistente de regiones en saves/games/<sesión>/regions/
+        # y de chunks del mapa mundial en saves/games/<sesión>/world/
+        # (o en blobs de session_store)
+        self.session_store = session_store
+        self.use_region_cache = use_region_cache
+        self.region_cache = None
+        self.world_cache = None
+        
+        # Precarga de regiones vecinas en segundo plano
+        self.prefetcher = None
+        if prefetch_workers > 0:
+            self.prefetcher = RegionPrefetcher(self._generate_region, max_workers=prefetch_workers)
+        
         # Datos del jugador
         self.player_data = None
+        
+        # True si hay cambios sin guardar (lo usa el autoguardado)
+        self.dirty = False
+        
+        # Formato de guardado de la sesión (ver engine/world/save_format.py)
+        self.save_format = save_format
+        
+        # Diario de cambios entre instantáneas; se abre con el primer
+        # guardado o al cargar la sesión
+        self.use_journal = use_journal
+        self.journal = None
+        # Eventos de entidades recuperados del diario al cargar
+        self.replayed_events = []
+        
+        # Población virtual de NPCs (se crea al primer uso); mientras no
+        # se use se conservan tal cual los datos guardados
+        self.npc_population = None
+        self.npc_data = {}
     
-    def generate_world(self, width=128, height=128):
+    def generate_world(self, width=None, height=None):
         """
-        Genera el mapa mundial.
+        Prepara el mapa mundial. Los chunks se generan al consultarlos por
+        primera vez, así que aquí solo se genera la zona donde aparece el jugador.
         
         Args:
-            width: Ancho del mapa
-            height: Alto del mapa
+            width: Ancho del mapa (por defecto world_size)
+            height: Alto del mapa (por defecto world_size)
         
         Returns:
-            Array 2D de MapTile
+            ChunkedWorldMap con el mapa mundial
         """
-        self.world_map = self.generator.generate_world_map(width=width, height=height)
+        width = width or self.world_size
+        height = height or self.world_size
+        self._create_world_map(width, height)
+        self.dirty = True
         
         # Establecer posición inicial del jugador en un lugar caminable
-        # Optimizado: buscar solo en el centro del mapa
+        spawn = self._find_spawn(width, height)
+        # Si no hay terreno caminable cerca del centro, usar posición 0,0
+        self.player_world_x, self.player_world_y = spawn or (0, 0)
+        return self.world_map
+    
+    def _find_spawn(self, width, height):
+        """
+        Busca la celda caminable más cercana al centro del mapa (distancia
+        de Chebyshev; a igual distancia, la primera por filas).
+        
+        Recorre los chunks en anillos alrededor del centro y examina cada
+        uno de una vez sobre sus códigos de terreno. Los chunks que no pueden
+        tener una celda más cercana que la ya encontrada no se generan, y la
+        búsqueda se detiene tras SPAWN_SEARCH_CHUNKS chunks, así que el
+        arranque no genera el mundo entero aunque el centro sea océano.
+        
+        Returns:
+            (x, y) o None si no hay celdas caminables en la zona examinada
+        """
+        world_map = self.world_map
+        size = world_map.chunk_size
         center_x, center_y = width // 2, height // 2
-        search_radius = min(width, height) // 4
-        
-        # Primera pasada: buscar en área cercana al centro
-        for distance in range(0, search_radius):
-            found = False
-            for dy in range(-distance, distance + 1):
-                for dx in range(-distance, distance + 1):
-                    if abs(dx) < distance and abs(dy) < distance:
-                        continue  # Solo buscar en los bordes del cuadrado
-                    
-                    x = center_x + dx
-                    y = center_y + dy
-                    
-                    if 0 <= x < width and 0 <= y < height:
-                        if self.is_terrain_walkable(self.world_map[y, x].terrain):
-                            self.player_world_x = x
-                            self.player_world_y = y
-                            return self.world_map
-        
-        # Fallback: encontrar cualquier tile caminable
-        for y in range(height):
-            for x in range(width):
-                if self.is_terrain_walkable(self.world_map[y, x].terrain):
-                    self.player_world_x = x
-                    self.player_world_y = y
-                    return self.world_map
-        
-        # Si no hay terreno caminable, usar posición 0,0
-        self.player_world_x = 0
-        self.player_world_y = 0
+        center_chunk_x, center_chunk_y = center_x // size, center_y // size
+        chunks_x, chunks_y = -(-width // size), -(-height // size)
+        blocked = [code for code, terrain in enumerate(TERRAIN_BY_CODE)
+                   if not self.is_terrain_walkable(terrain)]
+        
+        best = None  # (distancia, dy, dx)
+        visited = 0
+        ring = 0
+        while visited < SPAWN_SEARCH_CHUNKS:
+            # Todo chunk del anillo está a más de (ring - 1) * size celdas
+            if best is not None and (ring - 1) * size > best[0]:
+                break
+            chunks = []
+            for chunk_y in range(center_chunk_y - ring, center_chunk_y + ring + 1):
+                for chunk_x in range(center_chunk_x - ring, center_chunk_x + ring + 1):
+                    if max(abs(chunk_x - center_chunk_x), abs(chunk_y - center_chunk_y)) != ring:
+                        continue
+                    if 0 <= chunk_x < chunks_x and 0 <= chunk_y < chunks_y:
+                        # Distancia mínima del centro a una celda del chunk
+                        near_x = min(max(center_x, chunk_x * size), chunk_x * size + size - 1)
+                        near_y = min(max(center_y, chunk_y * size), chunk_y * size + size - 1)
+                        nearest = max(abs(near_x - center_x), abs(near_y - center_y))
+                        chunks.append((nearest, chunk_y, chunk_x))
+            if not chunks:
+                break
+            
+            for nearest, chunk_y, chunk_x in sorted(chunks):
+                if visited >= SPAWN_SEARCH_CHUNKS:
+                    break
+                if best is not None and nearest > best[0]:
+                    continue
+                grid = world_map.chunk(chunk_x, chunk_y)
+                rows, cols = np.nonzero(~np.isin(grid.terrain_codes, blocked))
+                visited += 1
+                if len(rows) == 0:
+                    continue
+                dys = rows + chunk_y * size - center_y
+                dxs = cols + chunk_x * size - center_x
+                distances = np.maximum(np.abs(dxs), np.abs(dys))
+                first = np.lexsort((dxs, dys, distances))[0]
+                candidate = (int(distances[first]), int(dys[first]), int(dxs[first]))
+                if best is None or candidate < best:
+                    best = candidate
+            ring += 1
+        
+        if best is None:
+            return None
+        return center_x + best[2], center_y + best[1]
+    
+    def _create_world_map(self, width, height):
+        """Crea el mapa por chunks, enlazado a la caché de chunks de la sesión."""
+        self.world_map = ChunkedWorldMap(
+            self.generator, width, height, store=self.get_world_cache(width, height)
+        )
         return self.world_map
     
+    @property
+    def session_dir(self):
+        """Directorio de la sesión actual."""
+        return GAMES_DIR / self.session_name
+    
+    def get_region_cache(self):
+        """
+        Retorna la caché de regiones en disco de la sesión actual,
+        recreándola si cambió la semilla o la sesión.
+        
+        Returns:
+            RegionCache o None si está desactivada
+        """
+        if not self.use_region_cache:
+            return None
+        
+        if self.session_store is not None:
+            self.region_cache = self._blob_cache(self.region_cache, BLOB_REGION)
+            return self.region_cache
+        
+        directory = self.session_dir / "regions"
+        cache = self.region_cache
+        if cache is None or cache.seed != self.seed or cache.directory != directory:
+            self.region_cache = RegionCache(directory, self.seed)
+        return self.region_cache
+    
+    def get_world_cache(self, width=None, height=None):
+        """
+        Retorna la caché en disco de chunks del mapa mundial, en
+        saves/games/<sesión>/world/<ancho>x<alto>/ (la semilla y la versión
+        del generador forman parte del nombre de cada archivo).
+        
+        Returns:
+            RegionCache o None si está desactivada
+        """
+        if not self.use_region_cache:
+            return None
+        
+        width = width or self.world_size
+        height = height or self.world_size
+        if self.session_store is not None:
+            kind = f"{BLOB_WORLD_CHUNK}_{width}x{height}"
+            self.world_cache = self._blob_cache(self.world_cache, kind)
+            return self.world_cache
+        
+        directory = self.session_dir / "world" / f"{width}x{height}"
+        cache = self.world_cache
+        if cache is None or cache.seed != self.seed or cache.directory != directory:
+            self.world_cache = RegionCache(directory, self.seed)
+        return self.world_cache
+    
+    def _blob_cache(self, cache, kind):
+        """Caché en blobs de session_store, recreada si cambió la semilla o la sesión."""
+        if (cache is None or cache.seed != self.seed or getattr(cache, "kind", None) != kind
+                or cache.session_name != self.session_name):
+            cache = self.session_store.blob_cache(self.session_name, kind, self.seed)
+        return cache
+    
     def load_local_map(self):
         """
         Carga el mapa local para la posición actual del jugador.
         Usa caché para evitar regeneración innecesaria.
         
         Returns:
-            Array 2D de MapTile (mapa local)
+            TerrainGrid (mapa local)
         """
         # Calcular región actual (64x64)
         region_x = self.player_world_x // 64
@@ -105,20 +282,13 @@ class World:
         # Verificar si ya está en caché
         cache_key = (region_x, region_y)
         if cache_key in self.local_map_cache:
-            self.current_local_map = self.local_map_cache[cache_key]
-            self.cached_region_x = region_x
-            self.cached_region_y = region_y
-            return self.current_local_map
-        
-        # Generar y cachear el mapa local
-        local_map = self.generator.generate_local_map(
-            region_x * 64,  # Convertir región a coordenadas mundiales
-            region_y * 64,
-            local_width=64,
-            local_height=64
-        )
+            local_map = self.local_map_cache[cache_key]
+            if self.prefetcher is not None:
+                self.prefetcher.record_hit()
+        else:
+            local_map = self._fetch_region(region_x, region_y)
+            self.local_map_cache[cache_key] = local_map
         
-        self.local_map_cache[cache_key] = local_map
         self.current_local_map = local_map
         self.cached_region_x = region_x
         self.cached_region_y = region_y
@@ -134,8 +304,105 @@ class World:
             for key in keys_to_remove[:len(keys_to_remove) - 5]:  # Mantener al menos 5
                 del self.local_map_cache[key]
         
+        self.prefetch_regions()
         return self.current_local_map
     
+    def _generate_region(self, region_x, region_y):
+        """Genera una región local de 64x64 (se ejecuta también en hilos de precarga)."""
+        return self.generator.generate_local_map(
+            region_x * 64,  # Convertir región a coordenadas mundiales
+            region_y * 64,
+            local_width=64,
+            local_height=64
+        )
+    
+    def _store_region(self, region_x, region_y, local_map):
+        """Guarda una región recién generada en la caché de disco."""
+        region_cache = self.get_region_cache()
+        if region_cache is None:
+            return
+        try:
+            region_cache.put(region_x, region_y, local_map)
+        except OSError as e:
+            print(f"Error caching region {(region_x, region_y)}: {e}")
+    
+    def _fetch_region(self, region_x, region_y):
+        """
+        Obtiene una región que no está en memoria: de la precarga, de la
+        caché de disco o generándola en el momento (en ese orden).
+        
+        Returns:
+            TerrainGrid de la región
+        """
+        start = time.perf_counter()
+        local_map, ready = None, False
+        
+        if self.prefetcher is not None:
+            local_map, ready = self.prefetcher.take((region_x, region_y))
+            if local_map is not None:
+                self._store_region(region_x, region_y, local_map)
+        
+        if local_map is None:
+            region_cache = self.get_region_cache()
+            if region_cache is not None:
+                local_map = region_cache.get(region_x, region_y, 64, 64)
+                ready = local_map is not None
+        
+        if local_map is None:
+            local_map = self._generate_region(region_x, region_y)
+            self._store_region(region_x, region_y, local_map)
+        
+        if self.prefetcher is not None:
+            if ready:
+                self.prefetcher.record_hit()
+            else:
+                self.prefetcher.record_miss(time.perf_counter() - start)
+        return local_map
+    
+    def collect_prefetched_regions(self):
+        """Pasa a las cachés las regiones que la precarga ya terminó."""
+        if self.prefetcher is None:
+            return
+        for (region_x, region_y), local_map in self.prefetcher.completed():
+            if (region_x, region_y) not in self.local_map_cache:
+                self.local_map_cache[(region_x, region_y)] = local_map
+                self._store_region(region_x, region_y, local_map)
+    
+    def prefetch_regions(self, dx=0, dy=0):
+        """
+        Encola la generación de las regiones vecinas a las que se acerca el
+        jugador y que no están ya en memoria ni en disco.
+        
+        Args:
+            dx: Componente X de la dirección de movimiento
+            dy: Componente Y de la dirección de movimiento
+        """
+        if self.prefetcher is None or self.world_map is None:
+            return
+        
+        self.collect_prefetched_regions()
+        height, width = self.world_map.shape
+        region_cache = self.get_region_cache()
+        
+        keys = []
+        for key in self.prefetcher.neighbours(self.player_world_x, self.player_world_y, dx, dy):
+            region_x, region_y = key
+            if not (0 <= region_x * 64 < width and 0 <= region_y * 64 < height):
+                continue
+            if key in self.local_map_cache or self.prefetcher.is_pending(key):
+                continue
+            if region_cache is not None and (region_x, region_y, 64, 64) in region_cache:
+                continue
+            keys.append(key)
+        self.prefetcher.schedule(keys)
+    
+    def close(self):
+        """Detiene los hilos de precarga y cierra el diario."""
+        if self.prefetcher is not None:
+            self.prefetcher.shutdown()
+        if self.journal is not None:
+            self.journal.close()
+    
     def move_player(self, direction):
         """
         Mueve al jugador en una dirección.
@@ -176,13 +443,14 @@ class World:
             return False
         
         # Verificar si el terreno es navegable
-        tile = self.world_map[new_y, new_x]
-        if not self.is_terrain_walkable(tile.terrain):
+        if not self.is_terrain_walkable(self.world_map.terrain_at(new_x, new_y)):
             return False
         
         # Actualizar posición
         self.player_world_x = new_x
         self.player_world_y = new_y
+        self.dirty = True
+        self._journal_append(RECORD_MOVE, encode_move(new_x, new_y))
         
         # OPTIMIZACIÓN: solo recalcular si cambia de región (64x64)
         new_region_x = new_x // 64
@@ -193,6 +461,9 @@ class World:
         if new_region_x != old_region_x or new_region_y != old_region_y:
             # Cambió de región, actualizar mapa local
             self.load_local_map()
+        else:
+            # Precargar las regiones hacia las que se dirige el jugador
+            self.prefetch_regions(dx, dy)
         
         return True
     
@@ -271,95 +542,314 @@ class World:
         
         return nearby
     
-    def save_game(self, save_path=None):
+    def mark_dirty(self):
+        """Marca el mundo como modificado (p. ej. al cambiar player_data)."""
+        self.dirty = True
+    
+    # ------------------------------
+    # Población de NPCs
+    # ------------------------------
+    
+    def get_npc_population(self):
         """
-        Guarda el estado del juego.
+        Retorna la población virtual de NPCs de la partida, creándola (con
+        los asentamientos y deltas guardados) en la primera llamada.
+        
+        Returns:
+            VirtualPopulation de la semilla del mundo
+        """
+        if self.npc_population is None:
+            self.npc_population = VirtualPopulation.from_dict(self.seed, self.npc_data)
+        return self.npc_population
+    
+    # ------------------------------
+    # Diario de sesión
+    # ------------------------------
+    
+    def get_journal(self):
+        """
+        Retorna el diario de la sesión actual, abriéndolo (o reabriéndolo
+        si cambió la sesión).
+        
+        Returns:
+            Journal o None si está desactivado
+        """
+        if not self.use_journal:
+            return None
+        
+        directory = self.session_dir / "journal"
+        if self.journal is None or self.journal.directory != directory:
+            if self.journal is not None:
+                self.journal.close()
+            self.journal = Journal(directory)
+        return self.journal
+    
+    def _journal_append(self, kind, payload):
+        """Añade un registro al diario si está abierto (tras el primer guardado)."""
+        if self.journal is None:
+            return
+        try:
+            self.journal.append(kind, payload)
+        except OSError as e:
+            print(f"Error writing journal: {e}")
+    
+    def update_player_data(self, changes):
+        """
+        Modifica los datos del jugador y registra el cambio en el diario.
         
         Args:
-            save_path: Ruta del archivo de guardado (opcional, usa sesión si no se proporciona)
+            changes: Diccionario con las claves a reemplazar
         """
-        if save_path is None:
-            # Crear ruta automática basada en la sesión
-            session_dir = Path(__file__).parent.parent.parent / "saves" / "games" / self.session_name
-            session_dir.mkdir(parents=True, exist_ok=True)
-            save_path = session_dir / "save.json"
+        if self.player_data is None:
+            self.player_data = {}
+        self.player_data.update(changes)
+        self.dirty = True
+        self._journal_append(RECORD_PLAYER, encode_json(changes))
+    
+    def record_event(self, event):
+        """
+        Registra un evento de entidad en el diario (para sistemas que no
+        guardan su propio estado en la instantánea).
         
-        save_data = {
+        Args:
+            event: Diccionario serializable a JSON con al menos "type"
+        """
+        self.dirty = True
+        self._journal_append(RECORD_EVENT, encode_json(event))
+    
+    def journal_needs_snapshot(self):
+        """
+        True si conviene guardar ya una instantánea: el diario creció lo
+        bastante como para compactarlo, o la partida es nueva y aún no
+        tiene ninguna (el diario empieza a registrar a partir de ella).
+        """
+        if not self.use_journal:
+            return False
+        if self.journal is None:
+            return True
+        return self.journal.pending >= JOURNAL_SNAPSHOT_RECORDS
+    
+    def take_snapshot(self):
+        """
+        Toma una instantánea para guardarla como save de la sesión.
+        
+        Rota el diario: la instantánea incluye todos los registros hasta
+        journal_seq y los siguientes van a un segmento nuevo.
+        
+        player_data se copia: AutoSaver lee la instantánea desde su hilo
+        (índice de sesiones, session_store) mientras el hilo principal
+        sigue modificando el jugador con update_player_data.
+        
+        Returns:
+            Diccionario de build_save_data con journal_seq
+        """
+        journal = self.get_journal()
+        save_data = self.build_save_data()
+        save_data["player"] = copy.deepcopy(save_data["player"])
+        save_data["journal_seq"] = journal.rotate() if journal is not None else 0
+        return save_data
+    
+    def snapshot_saved(self, save_data):
+        """
+        Se llama cuando una instantánea de take_snapshot ya está en disco:
+        actualiza el índice de sesiones y borra el diario que cubre.
+        """
+        self.update_session_index(save_data)
+        if self.journal is not None:
+            try:
+                self.journal.compact(save_data.get("journal_seq", 0))
+            except OSError as e:
+                print(f"Error compacting journal: {e}")
+    
+    def _replay_journal(self, snapshot_seq):
+        """
+        Aplica sobre el estado recién cargado los registros del diario
+        posteriores a la instantánea.
+        
+        Returns:
+            Número de registros aplicados
+        """
+        self.replayed_events = []
+        journal = self.get_journal()
+        if journal is None:
+            return 0
+        
+        journal.advance_to(snapshot_seq)
+        records = journal.records_after(snapshot_seq)
+        for _, kind, value in records:
+            if kind == RECORD_MOVE:
+                self.player_world_x, self.player_world_y = value
+            elif kind == RECORD_PLAYER:
+                if self.player_data is None:
+                    self.player_data = {}
+                self.player_data.update(value)
+            elif kind == RECORD_EVENT:
+                self.replayed_events.append(value)
+        return len(records)
+    
+    def default_save_path(self):
+        """Ruta del guardado de la sesión actual (save.json o save.bin)."""
+        return self.session_dir / SAVE_FILENAMES[self.save_format]
+    
+    def encode_save_data(self, save_data, save_path=None):
+        """
+        Serializa una instantánea para escribirla en disco.
+        
+        Args:
+            save_data: Diccionario de build_save_data
+            save_path: Archivo destino (su extensión decide el formato);
+                       por defecto el formato de la sesión
+        
+        Returns:
+            Bytes a escribir
+        """
+        fmt = self.save_format if save_path is None else format_for_path(save_path)
+        return serialize(save_data, fmt)
+    
+    def build_save_data(self):
+        """
+        Toma una instantánea del estado a guardar.
+        
+        Returns:
+            Diccionario con el contenido del guardado
+        """
+        return {
+            "schema_version": SCHEMA_VERSION,
             "world": {
                 "seed": self.seed,
+                "world_size": self.world_size,
                 "player_position": {
                     "x": self.player_world_x,
                     "y": self.player_world_y,
                 }
             },
             "player": self.player_data if self.player_data else {},
+            "npcs": self.npc_population.to_dict() if self.npc_population is not None else self.npc_data,
             "session_name": self.session_name
         }
+    
+    def update_session_index(self, save_data):
+        """Actualiza la entrada de la sesión en el índice del menú de carga."""
+        if self.session_store is not None:
+            return  # La propia base de datos es el índice
+        SessionIndex(GAMES_DIR).update(self.session_name, save_data)
+    
+    def write_snapshot(self, save_data, payload, backups=DEFAULT_BACKUPS):
+        """
+        Escribe una instantánea ya serializada donde vive la sesión: en
+        session_store o, si no hay, en su archivo de forma atómica.
+        """
+        if self.session_store is not None:
+            self.session_store.save_session(self.session_name, save_data, payload)
+        else:
+            write_atomic(self.default_save_path(), payload, backups)
+    
+    def save_game(self, save_path=None, backups=DEFAULT_BACKUPS):
+        """
+        Guarda el estado del juego de forma síncrona y atómica
+        (ver AutoSaver para el guardado en segundo plano).
         
-        save_file = Path(save_path)
-        save_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(save_file, "w", encoding="utf-8") as f:
-            json.dump(save_data, f, indent=4, ensure_ascii=False)
+        Args:
+            save_path: Ruta del archivo de guardado (opcional, usa sesión si no se proporciona).
+                       Con extensión .bin se usa el formato binario, si no JSON.
+            backups: Copias de seguridad rotativas a conservar
+        """
+        if save_path is None:
+            # Instantánea de la sesión: rota el diario y, ya escrita, lo compacta
+            save_data = self.take_snapshot()
+            self.write_snapshot(save_data, self.encode_save_data(save_data), backups)
+            self.dirty = False
+            self.snapshot_saved(save_data)
+            return
+        
+        # Ruta explícita: exportación, no afecta al diario ni al índice
+        save_data = self.build_save_data()
+        write_atomic(save_path, self.encode_save_data(save_data, save_path), backups)
+        self.dirty = False
     
     def load_game(self, save_path=None):
         """
         Carga el estado del juego.
         
         Args:
-            save_path: Ruta del archivo de guardado (opcional, usa sesión si no se proporciona)
+            save_path: Ruta del archivo de guardado (opcional, usa el más
+                       reciente de la sesión). Acepta JSON o binario y migra
+                       los esquemas antiguos.
         
         Returns:
             True si se cargó correctamente
         """
-        if save_path is None:
+        # El diario solo se aplica al guardado propio de la sesión
+        replay_journal = save_path is None
+        from_store = save_path is None and self.session_store is not None
+        if save_path is None and not from_store:
             # Crear ruta automática basada en la sesión
-            session_dir = Path(__file__).parent.parent.parent / "saves" / "games" / self.session_name
-            save_path = session_dir / "save.json"
+            save_path = find_save_file(self.session_dir) or self.default_save_path()
         
         try:
-            with open(save_path, "r", encoding="utf-8") as f:
-                save_data = json.load(f)
+            if from_store:
+                save_data = self.session_store.load_session(self.session_name)
+                if save_data is None:
+                    raise KeyError(f"Sesión no encontrada: {self.session_name}")
+            else:
+                save_data = load_save(save_path)
+                # Seguir guardando la sesión en el formato en que estaba
+                self.save_format = FORMAT_BINARY if is_binary_save(save_path) else FORMAT_JSON
             
             self.seed = save_data["world"]["seed"]
             self.session_name = save_data.get("session_name", self.session_name)
-            self.generator = MapGenerator(seed=self.seed, world_size=128)
+            self.world_size = save_data["world"].get("world_size", DEFAULT_WORLD_SIZE)
+            self.generator = MapGenerator(seed=self.seed, world_size=self.world_size)
+            # Las regiones en memoria o en precarga eran de la semilla anterior
+            self.local_map_cache = {}
+            if self.prefetcher is not None:
+                self.prefetcher.cancel()
             
             pos = save_data["world"]["player_position"]
             saved_x = pos["x"]
             saved_y = pos["y"]
             
             self.player_data = save_data.get("player", {})
+            self.npc_data = save_data.get("npcs", {})
+            self.npc_population = None
             
-            # Regenerar el mundo con la misma semilla
-            self.generate_world()
-            
-            # Restaurar posición guardada (después de generar mundo)
+            # Mapa por chunks de la misma semilla: los ya visitados se mapean
+            # desde la caché de la sesión, no hace falta buscar punto de inicio
+            self._create_world_map(self.world_size, self.world_size)
             self.player_world_x = saved_x
             self.player_world_y = saved_y
             
+            # Cambios posteriores a la instantánea (p. ej. tras un cierre inesperado)
+            replayed = 0
+            if replay_journal:
+                replayed = self._replay_journal(save_data.get("journal_seq", 0))
+            
             self.load_local_map()
             
+            # Recién cargado: nada que guardar salvo lo recuperado del diario
+            self.dirty = replayed > 0
             return True
         except Exception as e:
             print(f"Error loading game: {e}")
             return False
     
     @staticmethod
-    def get_session_list():
+    def get_session_list(session_store=None):
         """
         Obtiene lista de sesiones guardadas.
         
+        Args:
+            session_store: SessionStore del que listar (por defecto, las
+                           carpetas de saves/games)
+        
         Returns:
             Lista de nombres de sesiones disponibles
         """
-        games_dir = Path(__file__).parent.parent.parent / "saves" / "games"
-        if not games_dir.exists():
-            return []
+        if session_store is not None:
+            return session_store.session_names()
         
-        sessions = []
-        for session_dir in games_dir.iterdir():
-            if session_dir.is_dir() and (session_dir / "save.json").exists():
-                sessions.append(session_dir.name)
+        if not GAMES_DIR.exists():
+            return []
         
-        return sorted(sessions)
+        # El índice solo vuelve a leer las sesiones que cambiaron en disco
+        return SessionIndex(GAMES_DIR).session_names()
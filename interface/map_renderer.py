@@ -0,0 +1,201 @@
+# interface/map_renderer.py
+"""
+Renderizado de mapas mediante superficies precalculadas.
+
+En lugar de dibujar un pg.draw.rect por tile en cada frame, se construye una
+vez una Surface con todo el mapa (a escala de tile, con la separación de 1px
+entre celdas como color transparente) a partir de TerrainGrid.colors(), y
+cada frame solo se copia el rectángulo visible.
+
+Con un ChunkedWorldMap no se construye el mapa entero: hay una Surface por
+chunk visible, guardada en un LRU pequeño.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+import pygame as pg
+
+from engine.world.chunked_map import chunk_range
+
+# Color transparente (colorkey) para la separación entre tiles: así se ve lo
+# que haya debajo, igual que cuando cada tile se dibuja con pg.draw.rect.
+# No aparece en TERRAIN_PALETTE.
+GAP_COLORKEY = (255, 0, 255)
+
+
+def tile_image(colors, tile_w, tile_h, gap_color=GAP_COLORKEY):
+    """
+    Expande una imagen de colores por tile a píxeles de pantalla.
+
+    Reproduce el dibujo por tiles: cada celda ocupa (tile_w - 1) x (tile_h - 1)
+    píxeles y la última fila/columna queda con gap_color.
+
+    Args:
+        colors: Array uint8 (alto, ancho, 3) con un color por tile
+        tile_w: Ancho de cada tile en píxeles
+        tile_h: Alto de cada tile en píxeles
+        gap_color: Color de la separación entre tiles (None para no dejarla)
+
+    Returns:
+        Array uint8 (alto * tile_h, ancho * tile_w, 3)
+    """
+    image = np.repeat(np.repeat(colors, tile_h, axis=0), tile_w, axis=1)
+    if gap_color is not None:
+        image[tile_h - 1::tile_h, :] = gap_color
+        image[:, tile_w - 1::tile_w] = gap_color
+    return image
+
+
+def surface_from_image(image, colorkey=GAP_COLORKEY):
+    """
+    Crea una Surface de pygame a partir de un array (alto, ancho, 3).
+
+    Args:
+        image: Array uint8 (alto, ancho, 3)
+        colorkey: Color que se trata como transparente (None para ninguno)
+
+    Returns:
+        pg.Surface (convertida al formato de pantalla si hay display)
+    """
+    # surfarray trabaja con (ancho, alto, 3)
+    surface = pg.surfarray.make_surface(np.ascontiguousarray(image.swapaxes(0, 1)))
+    if pg.display.get_init() and pg.display.get_surface() is not None:
+        surface = surface.convert()
+    if colorkey is not None:
+        surface.set_colorkey(colorkey)
+    return surface
+
+
+class MapRenderer:
+    """Cachea Surfaces del mapa mundial y de las regiones locales."""
+
+    def __init__(self, tile_size, max_local_surfaces=9, max_chunk_surfaces=12):
+        """
+        Inicializa el renderer.
+
+        Args:
+            tile_size: Tamaño en píxeles de un tile del mapa mundial
+            max_local_surfaces: Número de regiones locales con Surface cacheada
+            max_chunk_surfaces: Número de chunks del mapa mundial con Surface cacheada
+        """
+        self.tile_size = tile_size
+        self.max_local_surfaces = max_local_surfaces
+        self.max_chunk_surfaces = max_chunk_surfaces
+
+        self._world_grid = None
+        self._world_surface = None
+        self._local_surfaces = OrderedDict()
+        self._chunk_surfaces = OrderedDict()
+
+    def world_surface(self, world_map):
+        """Retorna la Surface del mapa mundial, construyéndola solo si cambió el mapa."""
+        if self._world_grid is not world_map:
+            image = tile_image(world_map.colors(), self.tile_size, self.tile_size)
+            self._world_surface = surface_from_image(image)
+            self._world_grid = world_map
+        return self._world_surface
+
+    def chunk_surface(self, world_map, chunk_x, chunk_y):
+        """
+        Retorna la Surface de un chunk de un ChunkedWorldMap.
+
+        Se identifica por el objeto del chunk, así que si el mapa lo descarta
+        y lo vuelve a generar la Surface se reconstruye.
+        """
+        chunk = world_map.chunk(chunk_x, chunk_y)
+        key = (id(world_map), chunk_x, chunk_y)
+        entry = self._chunk_surfaces.get(key)
+        if entry is not None and entry[0] is chunk:
+            self._chunk_surfaces.move_to_end(key)
+            return entry[1]
+
+        image = tile_image(chunk.colors(), self.tile_size, self.tile_size)
+        surface = surface_from_image(image)
+        self._chunk_surfaces[key] = (chunk, surface)
+        while len(self._chunk_surfaces) > self.max_chunk_surfaces:
+            self._chunk_surfaces.popitem(last=False)
+        return surface
+
+    def local_surface(self, local_map, tile_w, tile_h):
+        """
+        Retorna la Surface de una región local a la escala pedida.
+
+        Las regiones se identifican por su objeto TerrainGrid (World las
+        mantiene en local_map_cache) y se guardan en un LRU pequeño.
+        """
+        key = (id(local_map), tile_w, tile_h)
+        entry = self._local_surfaces.get(key)
+        if entry is not None and entry[0] is local_map:
+            self._local_surfaces.move_to_end(key)
+            return entry[1]
+
+        image = tile_image(local_map.colors(), tile_w, tile_h)
+        surface = surface_from_image(image)
+        self._local_surfaces[key] = (local_map, surface)
+        while len(self._local_surfaces) > self.max_local_surfaces:
+            self._local_surfaces.popitem(last=False)
+        return surface
+
+    def draw_world(self, target, world_map, dest, view_start_x, view_start_y, view_end_x, view_end_y):
+        """
+        Copia la ventana visible del mapa mundial sobre target.
+
+        Args:
+            target: Surface destino
+            world_map: TerrainGrid del mundo
+            dest: Posición (x, y) en pantalla del tile (view_start_x, view_start_y)
+            view_start_x, view_start_y: Primer tile visible
+            view_end_x, view_end_y: Límite (exclusivo) de tiles visibles
+        """
+        chunk_size = getattr(world_map, "chunk_size", None)
+        if chunk_size is not None:
+            self._draw_world_chunks(
+                target, world_map, dest, view_start_x, view_start_y, view_end_x, view_end_y
+            )
+            return
+
+        surface = self.world_surface(world_map)
+        area = pg.Rect(
+            view_start_x * self.tile_size,
+            view_start_y * self.tile_size,
+            (view_end_x - view_start_x) * self.tile_size,
+            (view_end_y - view_start_y) * self.tile_size,
+        )
+        target.blit(surface, dest, area)
+
+    def _draw_world_chunks(self, target, world_map, dest, view_start_x, view_start_y,
+                           view_end_x, view_end_y):
+        """Copia la ventana visible chunk a chunk (ver draw_world)."""
+        size = world_map.chunk_size
+        for chunk_y in chunk_range(view_start_y, view_end_y, size):
+            for chunk_x in chunk_range(view_start_x, view_end_x, size):
+                surface = self.chunk_surface(world_map, chunk_x, chunk_y)
+                # Parte visible del chunk, en tiles del mundo
+                left = max(view_start_x, chunk_x * size)
+                top = max(view_start_y, chunk_y * size)
+                right = min(view_end_x, (chunk_x + 1) * size)
+                bottom = min(view_end_y, (chunk_y + 1) * size)
+
+                area = pg.Rect(
+                    (left - chunk_x * size) * self.tile_size,
+                    (top - chunk_y * size) * self.tile_size,
+                    (right - left) * self.tile_size,
+                    (bottom - top) * self.tile_size,
+                )
+                position = (
+                    dest[0] + (left - view_start_x) * self.tile_size,
+                    dest[1] + (top - view_start_y) * self.tile_size,
+                )
+                target.blit(surface, position, area)
+
+    def draw_local(self, target, local_map, dest, tile_w, tile_h):
+        """Copia una región local completa sobre target en la posición dest."""
+        target.blit(self.local_surface(local_map, tile_w, tile_h), dest)
+
+    def clear(self):
+        """Descarta todas las Surfaces cacheadas."""
+        self._world_grid = None
+        self._world_surface = None
+        self._local_surfaces.clear()
+        self._chunk_surfaces.clear()
@@ -2,11 +2,27 @@
 import pygame as pg
 import os
 
+# Eventos que obligan a redibujar la pantalla completa
+REDRAW_EVENTS = {
+    pg.KEYDOWN,
+    pg.VIDEOEXPOSE,
+    pg.VIDEORESIZE,
+    getattr(pg, "WINDOWEXPOSED", pg.VIDEOEXPOSE),
+}
+
+
 class BaseScreen:
+    FPS = 30
+    IDLE_TIMEOUT_MS = 500  # Espera máxima por eventos cuando no hay nada que animar
+
     def __init__(self, screen):
         self.screen = screen
         self.running = True
 
+        # Estado de redibujado: pantalla completa o lista de rectángulos cambiados
+        self.full_redraw = True
+        self.dirty_rects = []
+
     def handle_event(self, event):
         pass
 
@@ -16,17 +32,74 @@ class BaseScreen:
     def draw(self):
         pass
 
+    # ------------------------------
+    # Redibujado bajo demanda
+    # ------------------------------
+
+    def mark_dirty(self, rect=None):
+        """
+        Marca la pantalla para redibujar.
+
+        Args:
+            rect: Rectángulo cambiado; si es None se actualiza la pantalla completa
+        """
+        if rect is None:
+            self.full_redraw = True
+        else:
+            self.dirty_rects.append(pg.Rect(rect))
+
+    @property
+    def is_dirty(self):
+        return self.full_redraw or bool(self.dirty_rects)
+
+    def is_animating(self):
+        """True si la pantalla necesita update() en cada tick aunque no haya input."""
+        return False
+
+    def present(self):
+        """
+        Dibuja y actualiza el display solo si hay cambios pendientes.
+
+        Returns:
+            True si se dibujó el frame
+        """
+        if not self.is_dirty:
+            return False
+
+        self.draw()
+        if self.full_redraw:
+            pg.display.flip()
+        else:
+            pg.display.update(self.dirty_rects)
+
+        self.full_redraw = False
+        self.dirty_rects = []
+        return True
+
+    def wait_for_events(self):
+        """
+        Recoge los eventos pendientes. Si la pantalla está en reposo bloquea
+        en pg.event.wait (con timeout) en lugar de girar a 30 FPS.
+        """
+        events = pg.event.get()
+        if not events and not self.is_dirty and not self.is_animating():
+            event = pg.event.wait(self.IDLE_TIMEOUT_MS)
+            if event.type != pg.NOEVENT:
+                events = [event] + pg.event.get()
+        return events
+
     # Loop propio de cada pantalla
     def run(self):
         clock = pg.time.Clock()
         while self.running:
-            for event in pg.event.get():
+            for event in self.wait_for_events():
                 if event.type == pg.QUIT:
                     pg.quit()
                     os._exit(0)
+                if event.type in REDRAW_EVENTS:
+                    self.mark_dirty()
                 self.handle_event(event)
 
             self.update()
-            self.draw()
-            pg.display.flip()
-            clock.tick(30)
+            self.present()
+            clock.tick(self.FPS)
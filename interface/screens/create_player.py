@@ -1,13 +1,15 @@
 # interface/screens/create_player.py
 import pygame as pg
+import hashlib
 import json
-import random
 import os
 from pathlib import Path
 from .base_screen import BaseScreen
 from .text_input import TextInput
 from .exploration import Exploration
 from engine.entities.entity import Entity
+from engine.utils.data_registry import get_registry, thaw
+from engine.utils.rng_streams import STREAM_CHILDHOOD, py_stream
 
 # === CONFIGURACIÓN DE INTERFAZ ===
 # Nota: asumimos pg.init() y display ya inicializados antes de instanciar pantallas
@@ -21,10 +23,19 @@ BLACK = (10, 10, 10)
 
 # === RUTAS BASE ===
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
-DATA = BASE_DIR / "data"
 GAMES = BASE_DIR / "saves" / "games"
 
 
+def world_seed_for(name):
+    """Semilla del mundo de un personaje: hash del nombre (reproducible)."""
+    return int(hashlib.md5(name.encode()).hexdigest(), 16) % (2**31)
+
+
+def session_name_for(name):
+    """Nombre de sesión (y de archivo) de un personaje."""
+    return name.lower().replace(" ", "_")
+
+
 def draw_centered(surface, text, font, color, y):
     """Dibuja texto centrado horizontalmente."""
     s = font.render(str(text), True, color)
@@ -55,17 +66,27 @@ def wrap_text(text, max_width, font):
 
 
 class CreatePlayer(BaseScreen):
-    def __init__(self, screen):
+    def __init__(self, screen, rng=None, root_seed=None):
+        """
+        Args:
+            screen: Superficie pygame de pantalla
+            rng: Flujo aleatorio (eventos de infancia, altura); por defecto
+                 py_stream(semilla raíz, STREAM_CHILDHOOD, sesión), creado al
+                 conocer el nombre
+            root_seed: Semilla raíz del personaje y de su mundo (por defecto,
+                       world_seed_for(nombre))
+        """
         super().__init__(screen)
         self.phase = "name"
+        self.rng = rng
+        self.root_seed = root_seed
         # clock used by modal summary and other waits
         self.clock = pg.time.Clock()
 
-        # Cargar data desde JSON
-        with open(DATA / "races.json", encoding="utf-8") as f:
-            self.races = json.load(f)
-        with open(DATA / "stats.json", encoding="utf-8") as f:
-            self.stats_data = json.load(f)
+        # Datos compartidos (cargados una vez por proceso, solo lectura)
+        registry = get_registry()
+        self.races = registry.races
+        self.stats_data = registry.stats
 
         self.name = ""
         self.age = 0
@@ -74,8 +95,7 @@ class CreatePlayer(BaseScreen):
         self.maturity_age = 18  # Default, will be set from race
         
         # Childhood events selection
-        with open(DATA / "childhood_events.json", encoding="utf-8") as f:
-            self.childhood_data = json.load(f)
+        self.childhood_data = registry.childhood_events
 
         # Childhood progression tracking
         self.available_events = []
@@ -163,7 +183,14 @@ class CreatePlayer(BaseScreen):
                 self.running = False
                 return
             self.name = inp.result
+            if self.root_seed is None:
+                self.root_seed = world_seed_for(self.name)
+            if self.rng is None:
+                # Misma creación con la misma (semilla raíz, sesión)
+                self.rng = py_stream(self.root_seed, STREAM_CHILDHOOD, session_name_for(self.name))
             self.phase = "race"
+            # TextInput dibujó encima: repintar la pantalla completa
+            self.mark_dirty()
 
         elif self.phase == "race":
             # aquí solo hacemos lógica por frame si hace falta (por ahora nada)
@@ -202,12 +229,12 @@ class CreatePlayer(BaseScreen):
             self.available_events = []
             for event in events:
                 rareness = event.get("rareness", 0.5)
-                if random.random() < rareness:
+                if self.rng.random() < rareness:
                     self.available_events.append(event)
             
             # Ensure we have at least 1 event; if not, pick a random one
             if not self.available_events and events:
-                self.available_events = [random.choice(events)]
+                self.available_events = [self.rng.choice(events)]
         else:
             self.available_events = []
         
@@ -216,7 +243,7 @@ class CreatePlayer(BaseScreen):
         if special_events:
             for event in special_events:
                 rareness = event.get("rareness", 0.5)
-                if random.random() < rareness:
+                if self.rng.random() < rareness:
                     self.available_events.append(event)
         
         self.event_index = 0
@@ -263,7 +290,7 @@ class CreatePlayer(BaseScreen):
                 "age": self.age,
                 "event_name": self.selected_event.get("event_name"),
                 "option_name": self.selected_option.get("option_name"),
-                "effects": effects
+                "effects": thaw(effects)
             })
 
     def _prepare_childhood_events(self):
@@ -400,7 +427,7 @@ class CreatePlayer(BaseScreen):
         player = Entity(
             name=self.name,
             new_stats=stats,
-            height=random.randint(
+            height=self.rng.randint(
                 int(self.selected_race.get("min_height", 150)),
                 int(self.selected_race.get("max_height", 190)),
             ),
@@ -409,7 +436,7 @@ class CreatePlayer(BaseScreen):
         player.age = self.age
 
         os.makedirs(GAMES, exist_ok=True)
-        path = GAMES / f"{self.name.lower().replace(' ', '_')}.json"
+        path = GAMES / f"{session_name_for(self.name)}.json"
 
         # Include full childhood history in save
         with open(path, "w", encoding="utf-8") as f:
@@ -476,12 +503,11 @@ class CreatePlayer(BaseScreen):
             "race": {self.selected_race.get("race_name", self.selected_race.get("display")): 100},
         }
         
-        # Usar hash del nombre como semilla para reproducibilidad
-        import hashlib
-        seed = int(hashlib.md5(self.name.encode()).hexdigest(), 16) % (2**31)
+        # La semilla raíz (hash del nombre por defecto) es también la del mundo
+        seed = self.root_seed if self.root_seed is not None else world_seed_for(self.name)
         
         # Usar nombre del personaje como nombre de sesión
-        session_name = self.name.lower().replace(" ", "_")
+        session_name = session_name_for(self.name)
         
         # Crear y ejecutar pantalla de exploración
         exploration_screen = Exploration(
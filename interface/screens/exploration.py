@@ -7,7 +7,10 @@ Permite al jugador navegar por el mapa, ver información de terrenos y gestionar
 import pygame as pg
 from pathlib import Path
 from .base_screen import BaseScreen
-from engine.world.world import World
+from interface.map_renderer import MapRenderer
+from engine.world.autosave import AutoSaver
+from engine.world.save_format import FORMAT_BINARY
+from engine.world.world import World, DEFAULT_WORLD_SIZE
 
 # === CONFIGURACIÓN DE INTERFAZ ===
 FONT_SMALL = pg.font.SysFont("consolas", 18)
@@ -45,7 +48,8 @@ def draw_centered(surface, text, font, color, y, x=None):
 class Exploration(BaseScreen):
     """Pantalla de exploración del mundo."""
     
-    def __init__(self, screen, player_data=None, world_seed=42, session_name="default"):
+    def __init__(self, screen, player_data=None, world_seed=42, session_name="default",
+                 world_size=DEFAULT_WORLD_SIZE, save_format=FORMAT_BINARY, world=None):
         """
         Inicializa la pantalla de exploración.
         
@@ -54,16 +58,29 @@ class Exploration(BaseScreen):
             player_data: Datos del jugador creado
             world_seed: Semilla para generación del mundo
             session_name: Nombre de la sesión para guardado
+            world_size: Celdas por lado del mapa mundial
+            save_format: Formato de guardado (binario; JSON queda para exportar)
+            world: World ya cargado (desde el menú de carga); si se pasa, se
+                   usa tal cual en lugar de generar un mundo nuevo
         """
         super().__init__(screen)
-        self.player_data = player_data or {}
-        self.session_name = session_name
-        self.world = World(seed=world_seed, session_name=session_name)
-        
-        # Generar mundo
-        self.world.generate_world(width=128, height=128)
-        self.world.player_data = self.player_data  # Asignar datos del jugador
-        self.world.load_local_map()
+        if world is not None:
+            # Partida cargada: mundo, posición y jugador ya restaurados
+            self.world = world
+            self.player_data = world.player_data or {}
+            self.session_name = world.session_name
+            if world.current_local_map is None:
+                world.load_local_map()
+        else:
+            self.player_data = player_data or {}
+            self.session_name = session_name
+            self.world = World(seed=world_seed, session_name=session_name, world_size=world_size,
+                               save_format=save_format)
+            
+            # Generar mundo (por chunks, bajo demanda)
+            self.world.generate_world()
+            self.world.player_data = self.player_data  # Asignar datos del jugador
+            self.world.load_local_map()
         
         # Estado de la interfaz
         self.show_legend = False
@@ -72,20 +89,30 @@ class Exploration(BaseScreen):
         self.message_time = 0
         self.clock = pg.time.Clock()
         
+        # Renderizado del mapa con Surfaces precalculadas
+        # (False = dibujo tile a tile, se mantiene como referencia)
+        self.renderer = MapRenderer(TILE_SIZE)
+        self.use_surface_renderer = True
+        
         # Centro de vista del mapa en pantalla
         self.view_center_x = self.screen.get_width() // 2
         self.view_center_y = self.screen.get_height() // 2 - 100
         
-        # Contador para guardado automático (cada 30 segundos)
-        self.autosave_counter = 0
-        self.autosave_interval = 1800  # 30 segundos a 60 FPS
+        # Guardado automático por tiempo real (cada 30 segundos): el loop ya no
+        # corre a FPS fijos cuando la pantalla está en reposo. Solo guarda si
+        # hubo cambios y escribe en un hilo aparte.
+        self.autosaver = AutoSaver(self.world)
+        self.autosave_interval_ms = 30000
+        self.last_autosave = pg.time.get_ticks()
     
     def handle_event(self, event):
         """Maneja eventos de entrada."""
         if event.type == pg.KEYDOWN:
             if event.key == pg.K_ESCAPE:
-                # Guardar antes de salir
+                # Guardar antes de salir (tras terminar el autoguardado en curso)
+                self.autosaver.shutdown()
                 self.world.save_game()
+                self.world.close()
                 self.running = False
             
             elif event.key == pg.K_UP or event.key == pg.K_w:
@@ -137,23 +164,39 @@ class Exploration(BaseScreen):
                     self.message_time = 180
             
             elif event.key == pg.K_F5:
-                # Guardar manualmente
-                self.world.save_game()
-                self.message = f"Partida guardada - Sesion: {self.session_name}"
+                # Guardar manualmente (en segundo plano)
+                if self.autosaver.request_save(force=True):
+                    self.message = f"Partida guardada - Sesion: {self.session_name}"
+                else:
+                    self.message = "Guardado en curso..."
                 self.message_time = 120
     
+    def is_animating(self):
+        """Mientras hay un mensaje temporal, el loop sigue contando ticks."""
+        return self.message_time > 0
+    
+    def message_rect(self):
+        """Rectángulo de pantalla ocupado por la línea de mensaje."""
+        msg_y = self.screen.get_height() - 100
+        return pg.Rect(0, msg_y, self.screen.get_width(), FONT_NORMAL.get_linesize())
+    
     def update(self):
         """Actualiza la lógica del juego."""
         if self.message_time > 0:
             self.message_time -= 1
-        else:
+            if self.message_time == 0:
+                self.message = ""
+                self.mark_dirty(self.message_rect())
+        elif self.message:
             self.message = ""
+            self.mark_dirty(self.message_rect())
         
         # Guardado automático
-        self.autosave_counter += 1
-        if self.autosave_counter >= self.autosave_interval:
-            self.world.save_game()
-            self.autosave_counter = 0
+        now = pg.time.get_ticks()
+        if (now - self.last_autosave >= self.autosave_interval_ms
+                or self.world.journal_needs_snapshot()):
+            self.autosaver.request_save()
+            self.last_autosave = now
     
     def draw(self):
         """Dibuja la pantalla."""
@@ -255,15 +298,13 @@ class Exploration(BaseScreen):
         view_end_y = min(world_height, view_start_y + view_tiles_y)
         
         # Dibujar tiles
-        for y in range(view_start_y, view_end_y):
-            for x in range(view_start_x, view_end_x):
-                tile = self.world.world_map[y, x]
-                color = tile.get_color()
-                
-                screen_x = map_x + 20 + (x - view_start_x) * TILE_SIZE
-                screen_y = map_y + 15 + (y - view_start_y) * TILE_SIZE
-                
-                pg.draw.rect(self.screen, color, (screen_x, screen_y, TILE_SIZE - 1, TILE_SIZE - 1))
+        if self.use_surface_renderer:
+            self.renderer.draw_world(
+                self.screen, self.world.world_map, (map_x + 20, map_y + 15),
+                view_start_x, view_start_y, view_end_x, view_end_y
+            )
+        else:
+            self._draw_world_tiles(map_x, map_y, view_start_x, view_start_y, view_end_x, view_end_y)
         
         # Dibujar región actual como rectángulo de referencia
         region_x = self.world.player_world_x // 64
@@ -291,11 +332,25 @@ class Exploration(BaseScreen):
                       (player_screen_x + TILE_SIZE // 2, player_screen_y + TILE_SIZE // 2), 5)
         
         # Mostrar información de posición
-        draw_text(self.screen, f"MAPA GLOBAL (128x128) - Posicion: ({self.world.player_world_x}, {self.world.player_world_y})", 
+        draw_text(self.screen, f"MAPA GLOBAL ({world_width}x{world_height}) - Posicion: ({self.world.player_world_x}, {self.world.player_world_y})", 
                  FONT_NORMAL, HIGHLIGHT, map_x, map_y - 30)
         draw_text(self.screen, f"Region detectada: ({region_x}, {region_y}) [Presiona M para zoom]", 
                  FONT_SMALL, GRAY, map_x, map_y - 5)
     
+    def _draw_world_tiles(self, map_x, map_y, view_start_x, view_start_y, view_end_x, view_end_y):
+        """Dibuja la ventana visible del mapa mundial tile a tile (referencia)."""
+        # Colores de la ventana visible en una sola consulta a la paleta
+        colors = self.world.world_map[view_start_y:view_end_y, view_start_x:view_end_x].colors().tolist()
+        
+        for y in range(view_start_y, view_end_y):
+            for x in range(view_start_x, view_end_x):
+                color = colors[y - view_start_y][x - view_start_x]
+                
+                screen_x = map_x + 20 + (x - view_start_x) * TILE_SIZE
+                screen_y = map_y + 15 + (y - view_start_y) * TILE_SIZE
+                
+                pg.draw.rect(self.screen, color, (screen_x, screen_y, TILE_SIZE - 1, TILE_SIZE - 1))
+    
     def draw_legend(self):
         """Dibuja la leyenda de terrenos."""
         legend_x = self.screen.get_width() - LEGEND_WIDTH - 10
@@ -384,16 +439,12 @@ class Exploration(BaseScreen):
         tile_size_y = max(2, local_height // 64)
         
         # Dibujar tiles del mapa local
-        local_map = self.world.current_local_map
-        for y in range(64):
-            for x in range(64):
-                tile = local_map[y, x]
-                color = tile.get_color()
-                
-                screen_x = map_x + x * tile_size_x
-                screen_y = map_y + y * tile_size_y
-                
-                pg.draw.rect(self.screen, color, (screen_x, screen_y, tile_size_x - 1, tile_size_y - 1))
+        if self.use_surface_renderer:
+            self.renderer.draw_local(
+                self.screen, self.world.current_local_map, (map_x, map_y), tile_size_x, tile_size_y
+            )
+        else:
+            self._draw_local_tiles(map_x, map_y, tile_size_x, tile_size_y)
         
         # Calcular posición del jugador dentro del mapa local (64x64)
         player_local_x = self.world.player_world_x % 64
@@ -421,3 +472,15 @@ class Exploration(BaseScreen):
         if terrain_info:
             draw_text(self.screen, f"Terreno: {terrain_info['terrain_name']}", 
                      FONT_NORMAL, GREEN, map_x, info_y + 60)
+    
+    def _draw_local_tiles(self, map_x, map_y, tile_size_x, tile_size_y):
+        """Dibuja el mapa local tile a tile (referencia)."""
+        colors = self.world.current_local_map.colors().tolist()
+        for y in range(64):
+            for x in range(64):
+                color = colors[y][x]
+                
+                screen_x = map_x + x * tile_size_x
+                screen_y = map_y + y * tile_size_y
+                
+                pg.draw.rect(self.screen, color, (screen_x, screen_y, tile_size_x - 1, tile_size_y - 1))
@@ -1,9 +1,11 @@
 # interface/screens/load_player.py
 import pygame as pg
-import json
+import shutil
 from pathlib import Path
 from .base_screen import BaseScreen
 from .exploration import Exploration
+from engine.world.save_format import SAVE_FILENAMES
+from engine.world.session_index import SessionIndex
 from engine.world.world import World
 
 FONT = pg.font.SysFont("consolas", 32)
@@ -27,9 +29,20 @@ def draw_text(surface, text, font, color, x, y):
     surface.blit(s, (x, y))
 
 class LoadPlayer(BaseScreen):
-    def __init__(self, screen):
+    def __init__(self, screen, session_store=None):
+        """
+        Args:
+            screen: Superficie pygame de pantalla
+            session_store: SessionStore (SQLite) opcional; sin él se listan
+                           las carpetas de saves/games mediante su índice
+        """
         super().__init__(screen)
-        self.sessions = World.get_session_list()
+        # Datos de las sesiones leídos una sola vez del índice
+        self.session_store = session_store
+        self.session_index = SessionIndex(GAMES)
+        source = session_store if session_store is not None else self.session_index
+        self.session_info = {entry["name"]: entry for entry in source.entries()}
+        self.sessions = sorted(self.session_info)
         self.index = 0
         self.message = ""
         self.message_time = 0
@@ -60,15 +73,10 @@ class LoadPlayer(BaseScreen):
     def load_session(self, session_name):
         """Carga una sesión guardada."""
         try:
-            world = World(session_name=session_name)
+            world = World(session_name=session_name, session_store=self.session_store)
             if world.load_game():
-                # Pasar a exploración
-                exploration_screen = Exploration(
-                    self.screen,
-                    player_data=world.player_data,
-                    world_seed=world.seed,
-                    session_name=session_name
-                )
+                # Pasar a exploración con el mundo ya cargado (sin regenerarlo)
+                exploration_screen = Exploration(self.screen, world=world)
                 exploration_screen.run()
                 self.running = False
             else:
@@ -80,25 +88,60 @@ class LoadPlayer(BaseScreen):
 
     def delete_session(self, session_name):
         """Elimina una sesión guardada."""
+        if self.session_store is not None:
+            self._delete_stored_session(session_name)
+            return
         try:
             session_dir = GAMES / session_name
-            save_file = session_dir / "save.json"
+            save_files = [session_dir / name for name in SAVE_FILENAMES.values()]
             
-            if save_file.exists():
-                save_file.unlink()
+            if any(path.exists() for path in save_files):
+                # La carpeta entera: guardado, copias de seguridad y cachés
+                # (regions/, world/, journal/)
+                shutil.rmtree(session_dir)
                 self.message = f"Sesion '{session_name}' eliminada"
                 self.message_time = 120
-                self.sessions = World.get_session_list()
-                if self.index >= len(self.sessions) and self.sessions:
-                    self.index = len(self.sessions) - 1
+                self.session_index.remove(session_name)
+                self._forget_session(session_name)
         except Exception as e:
             self.message = f"Error al eliminar: {str(e)[:40]}"
             self.message_time = 120
 
+    def _delete_stored_session(self, session_name):
+        """
+        Elimina una sesión del SessionStore (instantánea y cachés a la vez)
+        y su carpeta en saves/games, donde World sigue escribiendo el diario.
+        """
+        try:
+            if self.session_store.delete(session_name):
+                session_dir = GAMES / session_name
+                if session_dir.exists():
+                    shutil.rmtree(session_dir)
+                self.message = f"Sesion '{session_name}' eliminada"
+                self.message_time = 120
+                self._forget_session(session_name)
+        except Exception as e:
+            self.message = f"Error al eliminar: {str(e)[:40]}"
+            self.message_time = 120
+
+    def _forget_session(self, session_name):
+        """Quita una sesión borrada de la lista del menú."""
+        self.session_info.pop(session_name, None)
+        self.sessions = sorted(self.session_info)
+        if self.index >= len(self.sessions) and self.sessions:
+            self.index = len(self.sessions) - 1
+
+    def is_animating(self):
+        """Mientras hay un mensaje temporal, el loop sigue contando ticks."""
+        return self.message_time > 0
+
     def update(self):
         """Actualiza la lógica."""
         if self.message_time > 0:
             self.message_time -= 1
+            if self.message_time == 0:
+                # El mensaje se dibuja en la línea de instrucciones (y=150)
+                self.mark_dirty((0, 150, self.screen.get_width(), FONT.get_linesize()))
 
     def draw(self):
         self.screen.fill(BLACK)
@@ -122,21 +165,12 @@ class LoadPlayer(BaseScreen):
                 # Nombre de la sesión
                 draw_centered(self.screen, f"> {session_name} <", FONT, color, start_y + i * 70)
                 
-                # Información de la sesión
-                try:
-                    session_dir = GAMES / session_name
-                    save_file = session_dir / "save.json"
-                    
-                    if save_file.exists():
-                        with open(save_file, "r", encoding="utf-8") as f:
-                            data = json.load(f)
-                            player_name = data.get("player", {}).get("name", "Desconocido")
-                            pos = data.get("world", {}).get("player_position", {})
-                            x, y = pos.get("x", 0), pos.get("y", 0)
-                            info = f"  Posicion: ({x}, {y})"
-                            draw_text(self.screen, info, FONT, GRAY, 100, start_y + i * 70 + 35)
-                except:
-                    pass
+                # Información de la sesión (del índice, sin abrir el guardado)
+                entry = self.session_info.get(session_name)
+                if entry is not None:
+                    x, y = entry["position"]
+                    info = f"  Posicion: ({x}, {y})"
+                    draw_text(self.screen, info, FONT, GRAY, 100, start_y + i * 70 + 35)
         
         # Mensaje
         if self.message_time > 0:
@@ -14,6 +14,10 @@ def initialize_game():
     # Solo ahora importamos las pantallas (ya hay display y fuentes listas)
     from interface import screens as scr  
 
+    # Datos del juego en una sola lectura (paquete precompilado)
+    from engine.utils.data_registry import get_registry
+    get_registry().preload()
+
     menu = scr.main_menu.MainMenu(screen)
     choice = menu.run()
 
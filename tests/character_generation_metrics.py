@@ -10,6 +10,7 @@ import random
 from pathlib import Path
 from collections import Counter, defaultdict
 from engine.entities.entity import Entity
+from engine.utils.rng_streams import STREAM_CHARACTER, py_stream
 
 BASE_DIR = Path(__file__).resolve().parent
 DATA = BASE_DIR / "data"
@@ -26,10 +27,16 @@ with open(DATA / "childhood_events.json", encoding="utf-8") as f:
     childhood_data = json.load(f)
 
 
-def generate_character():
+# Semilla raíz: el personaje i se reproduce con py_stream(ROOT_SEED, STREAM_CHARACTER, i)
+ROOT_SEED = 20240101
+
+
+def generate_character(rng=None):
     """Genera un personaje único con su journey de infancia."""
+    if rng is None:
+        rng = random.Random()
     # Seleccionar raza
-    selected_race = random.choice(races_data)
+    selected_race = rng.choice(races_data)
     maturity_age = int(selected_race.get("maturity", 18))
     
     # Inicializar stats
@@ -73,7 +80,7 @@ def generate_character():
         available_events = []
         for event in events:
             rareness = event.get("rareness", 0.5)
-            if random.random() < rareness:
+            if rng.random() < rareness:
                 available_events.append(event)
         
         # Si no hay eventos en la categoría, agregar special events
@@ -81,22 +88,22 @@ def generate_character():
             special_events = childhood_data.get("special_events", [])
             for event in special_events:
                 rareness = event.get("rareness", 0.5)
-                if random.random() < rareness:
+                if rng.random() < rareness:
                     available_events.append(event)
         
         # Si aún no hay eventos, crear uno aleatorio de la categoría
         if not available_events and events:
-            available_events = [random.choice(events)]
+            available_events = [rng.choice(events)]
         
         if not available_events:
             break
         
         # Seleccionar evento y opción
-        selected_event = random.choice(available_events)
+        selected_event = rng.choice(available_events)
         opts = selected_event.get("options", [])
         
         if opts:
-            selected_option = random.choice(opts)
+            selected_option = rng.choice(opts)
         else:
             selected_option = None
         
@@ -127,9 +134,9 @@ def generate_character():
         min_h, max_h = max_h, min_h
     
     player = Entity(
-        name=f"Char_{random.randint(1000, 9999)}",
+        name=f"Char_{rng.randint(1000, 9999)}",
         new_stats=stats,
-        height=random.randint(min_h, max_h),
+        height=rng.randint(min_h, max_h),
     )
     player.race = {selected_race.get("race_name", selected_race.get("display")): 100}
     player.age = age
@@ -160,7 +167,7 @@ def main():
     
     print(f"Generando {NUM_CHARACTERS} personajes...")
     for i in range(NUM_CHARACTERS):
-        char = generate_character()
+        char = generate_character(py_stream(ROOT_SEED, STREAM_CHARACTER, i))
         characters.append(char)
         
         # Contar eventos
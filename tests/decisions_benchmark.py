@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark de las decisiones de NPCs en lote.
+
+Compara preguntar NPC por NPC (would_initiate_combat / would_betray) con
+los kernels vectorizados de engine/systems/decisions.py sobre la misma
+población. Uso:
+
+    python tests/decisions_benchmark.py [cantidad] [rondas]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.entities.npc import NPC
+from engine.systems.decisions import would_betray, would_initiate_combat
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) >= 2 else 5000
+    rounds = int(sys.argv[2]) if len(sys.argv) >= 3 else 20
+
+    population = NPC.batch_create(["warrior", "rogue", "merchant", "assassin"], ["human", "orc"], count,
+                                  seed=1, columnar=True)
+    npcs = population.to_npcs()
+
+    rng = np.random.default_rng(1)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        [npc.would_initiate_combat(rng) for npc in npcs]
+        [npc.would_betray(rng) for npc in npcs]
+    loop_ms = (time.perf_counter() - start) / rounds * 1000
+
+    rng = np.random.default_rng(1)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        would_initiate_combat(npcs, rng)
+        would_betray(npcs, rng)
+    objects_ms = (time.perf_counter() - start) / rounds * 1000
+
+    rng = np.random.default_rng(1)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        would_initiate_combat(population, rng)
+        would_betray(population, rng)
+    columns_ms = (time.perf_counter() - start) / rounds * 1000
+
+    print("=" * 60)
+    print(f"BENCHMARK DE DECISIONES - {count} NPCs, combate + traición, {rounds} rondas")
+    print("=" * 60)
+    print(f"  NPC por NPC:           {loop_ms:8.2f} ms/ronda")
+    print(f"  Lote desde objetos:    {objects_ms:8.2f} ms/ronda | x{loop_ms / objects_ms:.1f}")
+    print(f"  Lote desde columnas:   {columns_ms:8.2f} ms/ronda | x{loop_ms / columns_ms:.0f}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
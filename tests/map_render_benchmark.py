@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark del renderizado de mapas en la pantalla de exploración.
+
+Compara el dibujo tile a tile (pg.draw.rect por celda) con el renderer de
+Surfaces precalculadas, para la vista global y la local, con el TILE_SIZE
+actual. Uso:
+
+    python tests/map_render_benchmark.py [ancho alto] [frames]
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+
+
+def time_frames(screen, draw, frames):
+    """Retorna el tiempo medio por frame en milisegundos."""
+    draw()  # Primer frame fuera de la medida (construye caches)
+    start = time.perf_counter()
+    for _ in range(frames):
+        draw()
+        pg.display.flip()
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def main():
+    width, height = 1920, 1080
+    frames = 60
+    if len(sys.argv) >= 3:
+        width, height = int(sys.argv[1]), int(sys.argv[2])
+    if len(sys.argv) >= 4:
+        frames = int(sys.argv[3])
+
+    pg.init()
+    screen = pg.display.set_mode((width, height))
+
+    from interface.screens.exploration import Exploration, TILE_SIZE
+
+    exploration = Exploration(screen, player_data={"name": "Benchmark"}, world_seed=42,
+                              session_name="benchmark")
+
+    print("=" * 60)
+    print(f"BENCHMARK DE RENDERIZADO - {width}x{height}, TILE_SIZE={TILE_SIZE}, {frames} frames")
+    print("=" * 60)
+
+    results = {}
+    for view_name, local in (("global", False), ("local", True)):
+        exploration.show_local_map = local
+        for path_name, use_surface in (("tiles", False), ("surface", True)):
+            exploration.use_surface_renderer = use_surface
+            results[(view_name, path_name)] = time_frames(screen, exploration.draw, frames)
+
+    for view_name in ("global", "local"):
+        tiles = results[(view_name, "tiles")]
+        surface = results[(view_name, "surface")]
+        print(f"  Vista {view_name:7}: tiles {tiles:7.2f} ms/frame | "
+              f"surface {surface:7.2f} ms/frame | x{tiles / max(surface, 1e-9):.1f}")
+    print("=" * 60)
+
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la simulación de necesidades.
+
+Compara actualizar las necesidades entidad por entidad (Entity.update_needs)
+con un tick vectorizado de NeedsStore sobre la misma población. Uso:
+
+    python tests/needs_benchmark.py [cantidad] [ticks]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.entities.npc import NPC
+from engine.systems.needs import DEFAULT_RATES, NeedsStore
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) >= 2 else 10000
+    ticks = int(sys.argv[2]) if len(sys.argv) >= 3 else 100
+
+    npcs = NPC.batch_create(["warrior", "merchant", "mage"], ["human", "elf"], count, seed=1)
+    rates = (DEFAULT_RATES["hunger_rate"], DEFAULT_RATES["thirst_rate"],
+             DEFAULT_RATES["tiredness_rate"], DEFAULT_RATES["magic_heat_rate"])
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        for npc in npcs:
+            npc.update_needs(0.01, *rates)
+    loop_ms = (time.perf_counter() - start) / ticks * 1000
+
+    store = NeedsStore(capacity=count)
+    store.add_many(npcs)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        store.tick(0.01)
+    tick_ms = (time.perf_counter() - start) / ticks * 1000
+
+    print("=" * 60)
+    print(f"BENCHMARK DE NECESIDADES - {count} NPCs, {ticks} ticks")
+    print("=" * 60)
+    print(f"  Entidad por entidad: {loop_ms:8.2f} ms/tick")
+    print(f"  NeedsStore.tick:     {tick_ms:8.2f} ms/tick | x{loop_ms / tick_ms:.0f}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
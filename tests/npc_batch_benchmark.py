@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark de NPC.batch_create.
+
+Compara crear NPCs uno a uno con la creación en lote, tanto devolviendo
+objetos NPC como la población por columnas (NPCPopulation). Uso:
+
+    python tests/npc_batch_benchmark.py [cantidad ...]
+
+Por defecto mide 10000 y 100000 NPCs. La creación uno a uno solo se mide
+hasta 10000 y se extrapola para cantidades mayores.
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.entities.npc import NPC
+
+PROFESSIONS = ["warrior", "mage", "rogue", "merchant", "cleric", "bard"]
+RACES = ["human", "elf", "dwarf", "orc"]
+SINGLE_LIMIT = 10000
+
+
+def timed(function):
+    """Retorna los segundos que tarda function()."""
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def single(count):
+    random.seed(1)
+    for i in range(count):
+        NPC(f"npc_{i}", PROFESSIONS[i % len(PROFESSIONS)], RACES[i % len(RACES)])
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [10000, 100000]
+
+    print("=" * 72)
+    print("BENCHMARK DE CREACIÓN EN LOTE DE NPCs")
+    print("=" * 72)
+
+    for count in counts:
+        measured = min(count, SINGLE_LIMIT)
+        single_s = timed(lambda: single(measured)) * count / measured
+        columnar_s = timed(lambda: NPC.batch_create(PROFESSIONS, RACES, count, seed=1, columnar=True))
+        objects_s = timed(lambda: NPC.batch_create(PROFESSIONS, RACES, count, seed=1))
+
+        note = "" if measured == count else " (extrapolado)"
+        print(f"  {count:>7} NPCs")
+        print(f"    Uno a uno:         {single_s * 1000:9.1f} ms{note}")
+        print(f"    Lote (objetos):    {objects_s * 1000:9.1f} ms | x{single_s / objects_s:.1f}")
+        print(f"    Lote (columnas):   {columnar_s * 1000:9.1f} ms | x{single_s / columnar_s:.1f}")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark de creación de NPCs.
+
+Compara crear NPCs releyendo los JSON de data/ en cada construcción (como
+se hacía antes del DataRegistry) con el registro compartido, que los lee
+una sola vez por proceso. También mide el arranque del registro parseando
+los JSON y desde el paquete precompilado. Uso:
+
+    python tests/npc_generation_benchmark.py [cantidad]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.entities.npc import NPC
+from engine.utils.data_registry import DataRegistry, get_registry
+
+PROFESSIONS = ["warrior", "mage", "rogue", "merchant", "cleric", "bard"]
+RACES = ["human", "elf", "dwarf", "orc"]
+
+
+def npcs_per_second(count, reload_data):
+    """Retorna los NPCs creados por segundo."""
+    registry = get_registry()
+    random.seed(1)
+    start = time.perf_counter()
+    for i in range(count):
+        if reload_data:
+            registry.clear()  # Fuerza la relectura de los datos
+        NPC(f"npc_{i}", PROFESSIONS[i % len(PROFESSIONS)], RACES[i % len(RACES)])
+    return count / (time.perf_counter() - start)
+
+
+def startup_ms(use_bundle, repeats=20):
+    """Retorna el mejor tiempo (ms) para tener listos los datos de CreatePlayer y NPC."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        registry = DataRegistry(use_bundle=use_bundle)
+        registry.races, registry.stats, registry.childhood_events
+        registry.professions_by_name, registry.races_by_name, registry.traits_by_id
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) >= 2 else 5000
+
+    print("=" * 60)
+    print(f"BENCHMARK DE CREACIÓN DE NPCs - {count} NPCs")
+    print("=" * 60)
+
+    DataRegistry().preload()  # Compila el paquete si hace falta
+    json_ms = startup_ms(use_bundle=False)
+    bundle_ms = startup_ms(use_bundle=True)
+    print(f"  Arranque con JSON:    {json_ms:6.2f} ms")
+    print(f"  Arranque con paquete: {bundle_ms:6.2f} ms")
+
+    reload_rate = npcs_per_second(count, reload_data=True)
+    shared_rate = npcs_per_second(count, reload_data=False)
+    print(f"  Releyendo datos:     {reload_rate:10.0f} NPCs/s")
+    print(f"  Registro compartido: {shared_rate:10.0f} NPCs/s | x{shared_rate / reload_rate:.1f}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
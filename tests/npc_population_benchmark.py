@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la población virtual de NPCs.
+
+Compara la memoria de construir todos los NPCs de un asentamiento con la
+de una VirtualPopulation en la que el jugador solo interactúa con unos
+pocos, y mide el tiempo de get() con y sin el NPC en el LRU. Uso:
+
+    python tests/npc_population_benchmark.py [habitantes] [interacciones]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.entities.npc import NPC
+from engine.entities.npc_population import VirtualPopulation
+
+MIX = {"warrior": 2, "merchant": 5, "mage": 1}
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) >= 2 else 20000
+    interactions = int(sys.argv[2]) if len(sys.argv) >= 3 else 2000
+
+    tracemalloc.start()
+    npcs = NPC.batch_create(MIX, "human", size, seed=1)
+    full_bytes = tracemalloc.get_traced_memory()[0]
+    del npcs
+    tracemalloc.stop()
+
+    rng = random.Random(1)
+    visits = [rng.randrange(size) for _ in range(interactions)]
+
+    tracemalloc.start()
+    population = VirtualPopulation(1)
+    population.add_settlement("town", size, MIX)
+    start = time.perf_counter()
+    for index in visits:
+        population.get("town", index).modify_reputation(1)
+    population.clear()
+    visit_ms = (time.perf_counter() - start) * 1000
+    virtual_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    npc = population.get("town", 0)
+    start = time.perf_counter()
+    for _ in range(10000):
+        population.get("town", 0)
+    hit_us = (time.perf_counter() - start) / 10000 * 1e6
+
+    print("=" * 60)
+    print(f"BENCHMARK DE POBLACIÓN VIRTUAL - {size} habitantes, {interactions} interacciones")
+    print("=" * 60)
+    print(f"  Todos los NPCs construidos: {full_bytes / 1e6:8.2f} MB")
+    print(f"  Población virtual:          {virtual_bytes / 1e6:8.2f} MB "
+          f"({len(population.deltas())} NPCs con deltas)")
+    print(f"  get() sin caché:            {visit_ms / interactions * 1000:8.1f} us")
+    print(f"  get() en el LRU:            {hit_us:8.2f} us ({npc.name})")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
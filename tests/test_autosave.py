@@ -0,0 +1,147 @@
+"""
+Tests for atomic saves, rotating backups and the background autosaver.
+"""
+
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Setup path to import from project
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.world import autosave
+from engine.world import world as world_module
+from engine.world.autosave import AutoSaver, backup_path, write_atomic
+from engine.world.world import World
+
+
+class TestWriteAtomic(unittest.TestCase):
+    """Test the temp-file + fsync + rename writer."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "save.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_rotating_backups(self):
+        """Test that the last N versions are kept as .1, .2, ..."""
+        for version in range(5):
+            write_atomic(self.path, f"v{version}".encode(), backups=3)
+
+        self.assertEqual(self.path.read_bytes(), b"v4")
+        self.assertEqual(backup_path(self.path, 1).read_bytes(), b"v3")
+        self.assertEqual(backup_path(self.path, 2).read_bytes(), b"v2")
+        self.assertEqual(backup_path(self.path, 3).read_bytes(), b"v1")
+        self.assertFalse(backup_path(self.path, 4).exists())
+
+    def test_failed_write_keeps_previous_save(self):
+        """Test that an error before the rename leaves the old file intact."""
+        write_atomic(self.path, b"good", backups=0)
+        with mock.patch.object(autosave.os, "fsync", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                write_atomic(self.path, b"partial", backups=0)
+
+        self.assertEqual(self.path.read_bytes(), b"good")
+        self.assertEqual(sorted(p.name for p in Path(self.tmp.name).iterdir()), ["save.json"])
+
+
+class TestAutoSaver(unittest.TestCase):
+    """Test dirty tracking and background writes."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(world_module, "GAMES_DIR", Path(self.tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.world = World(seed=3, session_name="auto", prefetch_workers=0)
+        self.world.generate_world(width=64, height=64)
+        self.saver = AutoSaver(self.world, backups=2)
+
+    def tearDown(self):
+        self.saver.shutdown()
+        self.tmp.cleanup()
+
+    def _saved_position(self):
+        with open(self.world.default_save_path(), "r", encoding="utf-8") as f:
+            position = json.load(f)["world"]["player_position"]
+        return position["x"], position["y"]
+
+    def test_saves_only_when_dirty(self):
+        """Test that a clean world is not written again."""
+        self.assertTrue(self.saver.request_save())
+        self.saver.flush()
+        self.assertFalse(self.world.dirty)
+
+        self.assertFalse(self.saver.request_save())
+        self.assertEqual(self.saver.stats()["saves"], 1)
+        self.assertEqual(self.saver.stats()["skipped"], 1)
+
+        self.world.mark_dirty()
+        self.assertTrue(self.saver.request_save())
+        self.saver.flush()
+        self.assertEqual(self.saver.stats()["saves"], 2)
+        self.assertGreater(self.saver.stats()["last_write_ms"], 0)
+
+    def test_snapshot_is_taken_on_request(self):
+        """Test that changes after request_save do not leak into that write."""
+        release = threading.Event()
+        original = world_module.write_atomic
+
+        def slow_write(*args, **kwargs):
+            release.wait(5)
+            return original(*args, **kwargs)
+
+        self.world.player_world_x, self.world.player_world_y = 10, 11
+        with mock.patch.object(world_module, "write_atomic", side_effect=slow_write):
+            self.saver.request_save()
+            self.world.player_world_x = 50
+            self.world.mark_dirty()
+            self.assertFalse(self.saver.request_save())  # Ya hay una escritura en curso
+            release.set()
+            self.saver.flush()
+
+        self.assertEqual(self._saved_position(), (10, 11))
+        self.assertTrue(self.world.dirty)
+
+    def test_background_thread_sees_serialized_player(self):
+        """Test that player changes after request_save do not reach the index update."""
+        release = threading.Event()
+        original = world_module.write_atomic
+        indexed = []
+
+        def slow_write(*args, **kwargs):
+            release.wait(5)
+            return original(*args, **kwargs)
+
+        self.world.player_data = {"name": "Ana", "level": 1}
+        with mock.patch.object(world_module, "write_atomic", side_effect=slow_write), \
+                mock.patch.object(self.world, "update_session_index",
+                                  side_effect=lambda data: indexed.append(data["player"])):
+            self.saver.request_save()
+            self.world.update_player_data({"name": "Bo", "level": 2})
+            release.set()
+            self.saver.flush()
+
+        self.assertEqual(indexed, [{"name": "Ana", "level": 1}])
+        self.assertEqual(self.world.player_data, {"name": "Bo", "level": 2})
+
+    def test_failed_write_marks_world_dirty_again(self):
+        """Test that a failed background write is retried next time."""
+        with mock.patch.object(world_module, "write_atomic", side_effect=OSError("read-only")):
+            with mock.patch("builtins.print"):
+                self.saver.request_save()
+                self.saver.flush()
+
+        self.assertTrue(self.world.dirty)
+        self.assertEqual(self.saver.stats()["failures"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,192 @@
+"""
+Tests for the lazily generated, chunked world map.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+# Setup path to import from project
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.world import world as world_module
+from engine.world.chunked_map import ChunkedWorldMap
+from engine.world.map_generator import TERRAIN_CODE, MapGenerator, Terrain
+from engine.world.region_cache import RegionCache
+from engine.world.world import SPAWN_SEARCH_CHUNKS, World
+
+
+class TestChunkedWorldMap(unittest.TestCase):
+    """Test that chunks reproduce the eagerly generated map."""
+
+    def setUp(self):
+        self.generator = MapGenerator(seed=42)
+
+    def _assert_matches_full_map(self, width, height, chunk_size):
+        full = self.generator.generate_world_map(width=width, height=height)
+        chunked = ChunkedWorldMap(self.generator, width, height, chunk_size=chunk_size)
+        window = chunked[:, :]
+
+        np.testing.assert_array_equal(window.terrain_codes, full.terrain_codes)
+        np.testing.assert_array_equal(window.heights, full.heights)
+        np.testing.assert_array_equal(window.temperatures, full.temperatures)
+
+    def test_matches_full_map(self):
+        """Test a world that is an exact multiple of the chunk size."""
+        self._assert_matches_full_map(128, 128, 64)
+
+    def test_matches_full_map_with_partial_chunks(self):
+        """Test border chunks smaller than chunk_size, including water borders."""
+        self._assert_matches_full_map(100, 70, 32)
+
+    def test_generates_only_touched_chunks(self):
+        """Test that single-cell access generates a single chunk."""
+        chunked = ChunkedWorldMap(self.generator, 1024, 1024, chunk_size=64)
+        self.assertEqual(chunked.loaded_chunks, 0)
+
+        tile = chunked[300, 200]
+        self.assertEqual((tile.x, tile.y), (200, 300))
+        self.assertEqual(chunked.terrain_at(201, 301), chunked[301, 201].terrain)
+        self.assertEqual(chunked.loaded_chunks, 1)
+        self.assertTrue(chunked.is_loaded(200 // 64, 300 // 64))
+
+    def test_window_across_chunks(self):
+        """Test that a slice spanning four chunks keeps world coordinates."""
+        chunked = ChunkedWorldMap(self.generator, 256, 256, chunk_size=64)
+        window = chunked[60:70, 120:130]
+
+        self.assertEqual(window.shape, (10, 10))
+        self.assertEqual((window.origin_x, window.origin_y), (120, 60))
+        self.assertEqual(window.terrain_at(5, 5), chunked.terrain_at(125, 65))
+        self.assertEqual(chunked.loaded_chunks, 4)
+
+    def test_evicts_least_recently_used_chunks(self):
+        """Test the chunk limit."""
+        chunked = ChunkedWorldMap(self.generator, 512, 512, chunk_size=64, max_chunks=2)
+        chunked.terrain_at(0, 0)
+        chunked.terrain_at(64, 0)
+        chunked.terrain_at(0, 0)
+        chunked.terrain_at(128, 0)
+
+        self.assertEqual(chunked.loaded_chunks, 2)
+        self.assertEqual(chunked.evicted, 1)
+        self.assertTrue(chunked.is_loaded(0, 0))
+        self.assertFalse(chunked.is_loaded(1, 0))
+
+    def test_out_of_bounds(self):
+        """Test that cells outside the world raise IndexError."""
+        chunked = ChunkedWorldMap(self.generator, 64, 64)
+        with self.assertRaises(IndexError):
+            chunked.terrain_at(64, 0)
+
+
+class TestChunkStore(unittest.TestCase):
+    """Test persisting generated chunks and mapping them back."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.generator = MapGenerator(seed=9)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_chunks_are_reloaded_from_disk(self):
+        """Test that a second map reads stored chunks instead of generating them."""
+        first = ChunkedWorldMap(self.generator, 96, 96, chunk_size=32,
+                                store=RegionCache(self.tmp.name, seed=9))
+        expected = first[:, :]
+        self.assertEqual(first.generated, 9)
+
+        second = ChunkedWorldMap(self.generator, 96, 96, chunk_size=32,
+                                 store=RegionCache(self.tmp.name, seed=9))
+        with mock.patch.object(self.generator, "generate_world_chunk") as generate:
+            window = second[:, :]
+        generate.assert_not_called()
+        self.assertEqual(second.loaded, 9)
+        self.assertIsInstance(second.chunk(0, 0).heights, np.memmap)
+        np.testing.assert_array_equal(window.terrain_codes, expected.terrain_codes)
+        np.testing.assert_array_equal(window.heights, expected.heights)
+
+    def test_other_seed_does_not_reuse_chunks(self):
+        """Test that chunks are keyed by seed."""
+        ChunkedWorldMap(self.generator, 64, 64, store=RegionCache(self.tmp.name, seed=9)).chunk(0, 0)
+        other = ChunkedWorldMap(MapGenerator(seed=10), 64, 64,
+                                store=RegionCache(self.tmp.name, seed=10))
+        other.chunk(0, 0)
+        self.assertEqual((other.loaded, other.generated), (0, 1))
+
+
+class TestLargeWorld(unittest.TestCase):
+    """Test World with sizes that could not be materialized eagerly."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(world_module, "GAMES_DIR", Path(self.tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_startup_touches_only_nearby_chunks(self):
+        """Test that a 65536x65536 world starts with a handful of chunks."""
+        world = World(seed=42, session_name="large", world_size=65536, prefetch_workers=0)
+        world_map = world.generate_world()
+
+        self.assertEqual(world_map.shape, (65536, 65536))
+        self.assertLessEqual(world_map.loaded_chunks, 4)
+        self.assertTrue(world.is_terrain_walkable(
+            world_map.terrain_at(world.player_world_x, world.player_world_y)
+        ))
+
+    def test_spawn_search_is_bounded(self):
+        """Test that a world without land near the centre does not generate every chunk."""
+        world = World(seed=42, session_name="ocean", world_size=4096, prefetch_workers=0,
+                      use_region_cache=False)
+        generate_chunk = world.generator.generate_world_chunk
+
+        def ocean_chunk(*args):
+            grid = generate_chunk(*args)
+            grid.terrain_codes[:] = TERRAIN_CODE[Terrain.OCEAN]
+            return grid
+
+        with mock.patch.object(world.generator, "generate_world_chunk", side_effect=ocean_chunk):
+            world_map = world.generate_world()
+
+        self.assertLessEqual(world_map.generated, SPAWN_SEARCH_CHUNKS)
+        self.assertEqual((world.player_world_x, world.player_world_y), (0, 0))
+
+    def test_world_size_is_saved(self):
+        """Test that load_game restores the world size."""
+        world = World(seed=5, session_name="sized", world_size=256, prefetch_workers=0)
+        world.generate_world()
+        world.save_game()
+
+        loaded = World(session_name="sized", prefetch_workers=0)
+        self.assertTrue(loaded.load_game())
+        self.assertEqual(loaded.world_size, 256)
+        self.assertEqual(loaded.world_map.shape, (256, 256))
+
+    def test_load_maps_cached_chunks(self):
+        """Test that loading a session does not regenerate visited chunks."""
+        world = World(seed=5, session_name="cached", prefetch_workers=0)
+        world.generate_world()
+        world.save_game()
+        visited = world.world_map.loaded_chunks
+
+        loaded = World(session_name="cached", prefetch_workers=0)
+        with mock.patch.object(MapGenerator, "generate_world_chunk") as generate:
+            self.assertTrue(loaded.load_game())
+            loaded.get_current_terrain_info()
+        generate.assert_not_called()
+        self.assertTrue(1 <= loaded.world_map.loaded <= visited)
+        self.assertEqual((loaded.player_world_x, loaded.player_world_y),
+                         (world.player_world_x, world.player_world_y))
+
+
+if __name__ == "__main__":
+    unittest.main()
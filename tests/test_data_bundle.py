@@ -0,0 +1,118 @@
+"""
+Tests for the precompiled game-data bundle.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Setup path to import from project
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.utils import data_bundle
+from engine.utils.data_bundle import (
+    DATA, DataBundleError, build_bundle, default_bundle_path, load_bundle, read_bundle,
+)
+from engine.utils.data_registry import DataRegistry, thaw
+
+
+class TestDataBundle(unittest.TestCase):
+    """Test building, validating and refreshing the bundle."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data_dir = Path(self.tmp.name) / "data"
+        shutil.copytree(DATA, self.data_dir, ignore=shutil.ignore_patterns("__pycache__"))
+        self.bundle_path = default_bundle_path(self.data_dir)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _edit(self, name, change):
+        path = self.data_dir / f"{name}.json"
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        change(data)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    def test_bundle_matches_sources(self):
+        """Test that the bundle holds every JSON file and valid indexes."""
+        bundle = load_bundle(self.data_dir)
+        self.assertTrue(self.bundle_path.exists())
+        for path in self.data_dir.glob("*.json"):
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(bundle["files"][path.stem], json.load(f))
+        professions = bundle["files"]["professions"]
+        for name, position in bundle["indexes"]["professions_by_name"].items():
+            self.assertEqual(professions[position]["profession_name"], name)
+
+    def test_bundle_is_reused(self):
+        """Test that an up-to-date bundle is loaded without parsing JSON."""
+        load_bundle(self.data_dir)
+        with mock.patch.object(data_bundle, "build_bundle") as build:
+            load_bundle(self.data_dir)
+        build.assert_not_called()
+
+    def test_rebuilt_when_source_changes(self):
+        """Test that editing a JSON file rebuilds the bundle."""
+        load_bundle(self.data_dir)
+        self._edit("stats", lambda stats: stats.append({"stat_name": "luck"}))
+
+        bundle = load_bundle(self.data_dir)
+        self.assertIn("luck", bundle["indexes"]["stats_by_name"])
+        self.assertIn("luck", read_bundle(self.bundle_path)["indexes"]["stats_by_name"])
+
+    def test_touched_source_is_not_rebuilt(self):
+        """Test that a new mtime with the same content only refreshes stamps."""
+        load_bundle(self.data_dir)
+        path = self.data_dir / "races.json"
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        with mock.patch.object(data_bundle, "build_bundle") as build:
+            bundle = load_bundle(self.data_dir)
+        build.assert_not_called()
+        self.assertEqual(bundle["sources"]["races"][1], stat.st_mtime_ns + 10**9)
+
+    def test_corrupt_bundle_is_rebuilt(self):
+        """Test that an unreadable bundle is replaced."""
+        load_bundle(self.data_dir)
+        self.bundle_path.write_bytes(b"not marshal")
+        self.assertIsNone(read_bundle(self.bundle_path))
+        self.assertIn("professions", load_bundle(self.data_dir)["files"])
+        self.assertIsNotNone(read_bundle(self.bundle_path))
+
+    def test_invalid_data_is_rejected(self):
+        """Test that duplicated or missing index keys raise DataBundleError."""
+        self._edit("races", lambda races: races.append(dict(races[0])))
+        with self.assertRaises(DataBundleError):
+            build_bundle(self.data_dir)
+
+        self._edit("races", lambda races: races.pop())
+        self._edit("stats", lambda stats: stats.append({"display": "?"}))
+        with self.assertRaises(DataBundleError):
+            build_bundle(self.data_dir)
+
+        (self.data_dir / "broken.json").write_text("{", encoding="utf-8")
+        with self.assertRaises(DataBundleError):
+            build_bundle(self.data_dir)
+
+    def test_registry_uses_bundle(self):
+        """Test that the registry gives the same data from bundle or JSON."""
+        from_bundle = DataRegistry(self.data_dir)
+        from_json = DataRegistry(self.data_dir, use_bundle=False)
+        self.assertEqual(thaw(from_bundle.races_by_name), thaw(from_json.races_by_name))
+        self.assertEqual(thaw(from_bundle.childhood_events), thaw(from_json.childhood_events))
+        self.assertTrue(self.bundle_path.exists())
+        with self.assertRaises(FileNotFoundError):
+            from_bundle.load("missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
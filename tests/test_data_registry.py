@@ -0,0 +1,109 @@
+"""
+Tests for the shared data registry.
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+# Setup path to import from project
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.entities.npc import NPC
+from engine.utils.data_registry import DATA, DataRegistry, freeze, get_registry, thaw
+from engine.utils.name_generator import NameGenerator
+
+
+class TestDataRegistry(unittest.TestCase):
+    """Test loading, indexes and immutability."""
+
+    def setUp(self):
+        self.registry = DataRegistry()
+
+    def test_files_are_loaded_once(self):
+        """Test that repeated lookups do not read the files again."""
+        for _ in range(3):
+            self.registry.professions_by_name["warrior"]
+            self.registry.races_by_name["human"]
+            self.registry.traits_by_id
+            self.registry.stats_by_name
+        self.assertEqual(self.registry.loads, 4)
+
+    def test_indexes_match_files(self):
+        """Test that every index covers its whole file, in order."""
+        with open(DATA / "professions.json", encoding="utf-8") as f:
+            professions = json.load(f)
+        with open(DATA / "personality_traits.json", encoding="utf-8") as f:
+            traits = json.load(f)["traits"]
+
+        self.assertEqual(list(self.registry.professions_by_name),
+                         [p["profession_name"] for p in professions])
+        self.assertEqual(thaw(self.registry.professions_by_name["mage"]),
+                         next(p for p in professions if p["profession_name"] == "mage"))
+        self.assertEqual(set(self.registry.traits_by_id), {t["id"] for t in traits})
+        self.assertEqual(self.registry.stat_names[0], self.registry.stats[0]["stat_name"])
+        self.assertIs(self.registry.races_by_display["humano"], self.registry.races_by_name["human"])
+
+    def test_views_are_immutable(self):
+        """Test that shared data cannot be modified by callers."""
+        warrior = self.registry.professions_by_name["warrior"]
+        with self.assertRaises(TypeError):
+            warrior["display"] = "x"
+        with self.assertRaises(TypeError):
+            self.registry.professions_by_name["new"] = warrior
+        with self.assertRaises(AttributeError):
+            warrior["personality_traits"].append("x")
+
+    def test_freeze_and_thaw(self):
+        """Test that thaw gives back plain JSON data."""
+        value = {"a": [1, {"b": 2}], "c": "d"}
+        frozen = freeze(value)
+        self.assertIsInstance(frozen["a"], tuple)
+        self.assertEqual(thaw(frozen), value)
+        self.assertEqual(json.loads(json.dumps(thaw(frozen))), value)
+
+    def test_custom_directory(self):
+        """Test a registry over another data directory."""
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(Path(tmp) / "stats.json", "w", encoding="utf-8") as f:
+                json.dump([{"stat_name": "luck"}], f)
+            registry = DataRegistry(tmp)
+            self.assertEqual(registry.stat_names, ("luck",))
+
+    def test_shared_registry(self):
+        """Test that the process-wide registry is a single instance."""
+        self.assertIs(get_registry(), get_registry())
+
+
+class TestRegistryUsers(unittest.TestCase):
+    """Test that NPCs and names use the shared registry."""
+
+    def test_npc_does_not_reload(self):
+        """Test that creating NPCs does not read the data files again."""
+        registry = get_registry()
+        NPC("First", "warrior", "human")
+        loads = registry.loads
+        for i in range(20):
+            NPC(f"npc_{i}", "mage", "elf")
+        self.assertEqual(registry.loads, loads)
+
+    def test_npc_errors_are_kept(self):
+        """Test that unknown professions and races still raise ValueError."""
+        with self.assertRaises(ValueError):
+            NPC("X", "astronaut", "human")
+        with self.assertRaises(ValueError):
+            NPC("X", "warrior", "martian")
+
+    def test_npc_summary_and_title(self):
+        """Test personality summaries and profession titles."""
+        npc = NPC("Ana", "warrior", "human")
+        self.assertTrue(npc.get_personality_summary())
+        expected = get_registry().professions_by_name["warrior"]["title"]
+        self.assertEqual(NameGenerator.get_profession_title("warrior"), expected)
+        self.assertEqual(NameGenerator.get_profession_title("astronaut"), "el Astronaut")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Tests for batch NPC decision kernels.
+"""
+
+import random
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+# Setup path to import from project
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.entities.npc import NPC
+from engine.entities.npc_batch import VALUE_NAMES
+from engine.systems.decisions import (
+    DECISION_BETRAY, DECISION_COMBAT, decide, probabilities, probability, set_formula,
+    would_betray, would_initiate_combat,
+)
+
+
+class TestDecisionKernels(unittest.TestCase):
+    """Test the vectorized decisions against the scalar NPC methods."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.population = NPC.batch_create(["warrior", "rogue", "merchant", "assassin"], "human", 3000,
+                                          seed=8, columnar=True)
+        cls.npcs = cls.population.to_npcs()
+
+    def test_matches_scalar_methods(self):
+        """Test batch masks equal a scalar loop with the same stream."""
+        combat = would_initiate_combat(self.population, np.random.default_rng(1))
+        rng = np.random.default_rng(1)
+        self.assertEqual(combat.tolist(), [npc.would_initiate_combat(rng) for npc in self.npcs])
+        self.assertTrue(combat.any() and not combat.all())
+
+        betray = would_betray(self.npcs, np.random.default_rng(2))
+        rng = np.random.default_rng(2)
+        self.assertEqual(betray.tolist(), [npc.would_betray(rng) for npc in self.npcs])
+
+    def test_probabilities(self):
+        """Test probabilities are clipped and equal the scalar formula."""
+        chances = probabilities(DECISION_COMBAT, self.population)
+        self.assertTrue(((chances >= 0) & (chances <= 1)).all())
+        for npc, chance in zip(self.npcs[:200], chances[:200].tolist()):
+            self.assertEqual(chance, probability(DECISION_COMBAT, npc.npc_values))
+        self.assertGreater(chances.max(), 0)
+
+    def test_sources(self):
+        """Test arrays, column dicts and missing values."""
+        values = np.array([[90, 50, 0, 10], [10, 50, 100, 90]], dtype=np.int8)
+        np.testing.assert_allclose(probabilities(DECISION_COMBAT, values, VALUE_NAMES), [0.8, 0.0])
+        np.testing.assert_allclose(probabilities(DECISION_BETRAY, {"loyalty": [0, 100, 75]}), [1.0, 0.0, 0.25])
+        # Missing caution counts as 50, like npc_values.get(..., 50)
+        np.testing.assert_allclose(probabilities(DECISION_COMBAT, {"aggressiveness": [100]}), [0.5])
+        with self.assertRaises(ValueError):
+            probabilities(DECISION_COMBAT, values)
+        with self.assertRaises(KeyError):
+            decide("dance", values, value_names=VALUE_NAMES)
+        self.assertEqual(would_betray([], np.random.default_rng(0)).shape, (0,))
+
+    def test_pluggable_formula(self):
+        """Test replacing a formula changes both the batch and scalar paths."""
+        previous = set_formula(DECISION_BETRAY, lambda values: 1.0)
+        try:
+            self.assertTrue(would_betray(self.population, np.random.default_rng(0)).all())
+            self.assertTrue(self.npcs[0].would_betray(random.Random(0)))
+        finally:
+            set_formula(DECISION_BETRAY, previous)
+        self.assertFalse(probabilities(DECISION_BETRAY, {"loyalty": [100]}).any())
+
+
+if __name__ == "__main__":
+    unittest.main()
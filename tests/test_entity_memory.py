@@ -0,0 +1,127 @@
+"""
+Tests for the slotted Entity layout and its memory use.
+"""
+
+import copy
+import pickle
+import tracemalloc
+import unittest
+from pathlib import Path
+
+# Setup path to import from project
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.entities.entity import EMPTY_EQUIPMENT, EQUIPMENT_SLOTS, Entity
+from engine.entities.npc import NPC
+
+STATS = {
+    "strength": 12, "agility": 10, "dexterity": 11, "constitution": 14, "intellect": 9,
+    "psique": 10, "will": 10, "perception": 10, "education": 8, "charisma": 10,
+}
+
+# Límites holgados: antes de __slots__ eran ~3.4 KB por Entity y ~3.9 KB por NPC
+MAX_ENTITY_BYTES = 1000
+MAX_NPC_BYTES = 1800
+
+
+def bytes_per_item(factory, count=2000):
+    """Bytes asignados por elemento al crear `count` elementos (tracemalloc)."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        items = [factory(i) for i in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del items
+    return (after - before) / count
+
+
+class TestEntityMemory(unittest.TestCase):
+    """Measure bytes per entity with tracemalloc."""
+
+    def test_entity_bytes(self):
+        """Test that a fresh Entity stays under the memory budget."""
+        size = bytes_per_item(lambda i: Entity(f"e{i}", dict(STATS), 170))
+        self.assertLess(size, MAX_ENTITY_BYTES)
+
+    def test_npc_bytes(self):
+        """Test that a batch-built NPC stays under the memory budget."""
+        population = NPC.batch_create(["warrior", "mage"], "human", 2000, seed=1, columnar=True)
+        size = bytes_per_item(population.to_npc)
+        self.assertLess(size, MAX_NPC_BYTES)
+
+    def test_no_instance_dict(self):
+        """Test that entities and NPCs do not carry a __dict__."""
+        self.assertFalse(hasattr(Entity("e", dict(STATS), 170), "__dict__"))
+        self.assertFalse(hasattr(NPC("Ana", "warrior", "human"), "__dict__"))
+
+
+class TestEntityLayout(unittest.TestCase):
+    """Test that the slotted layout keeps the Entity API."""
+
+    def setUp(self):
+        self.entity = Entity("Test", dict(STATS), 175)
+
+    def test_shared_empty_equipment(self):
+        """Test that nothing is allocated until an item is equipped."""
+        other = Entity("Other", dict(STATS), 160)
+        self.assertIsNone(self.entity.get_equipped("main"))
+        self.assertIsNone(self.entity._equipped)
+
+        self.assertIsNone(self.entity.equip("main", "sword"))
+        self.assertEqual(self.entity.get_equipped("main"), "sword")
+        self.assertEqual(self.entity.unequip("main"), "sword")
+        self.assertIsNone(other._equipped)
+        self.assertIsNone(EMPTY_EQUIPMENT["main"])
+        with self.assertRaises(ValueError):
+            self.entity.equip("tail", "ring")
+
+    def test_equipped_dict_still_works(self):
+        """Test direct access to the equipped dict."""
+        self.assertEqual(list(self.entity.equipped), list(EQUIPMENT_SLOTS))
+        self.entity.equipped["head"] = "helmet"
+        self.assertEqual(self.entity.get_equipped("head"), "helmet")
+        self.assertIsNone(Entity("Other", dict(STATS), 160).equipped["head"])
+
+    def test_lazy_containers(self):
+        """Test skills, magic, inventory, quests and family."""
+        self.entity.add_skill("short_blades")
+        self.entity.add_holded_skill_experience(600, "short_blades")
+        self.entity.add_holded_magic_experience(10, "fire")
+        self.entity.apply_experience()
+        self.assertEqual(self.entity.skills["short_blades"]["level"], 2)
+        self.assertEqual(self.entity.magic["fire"]["experience"], 10)
+
+        self.entity.add_to_inventory("apple", 1)
+        self.entity.add_quest("q", {"goal": 1})
+        self.entity.add_family_member("mother", "parent")
+        self.assertEqual(self.entity.inventory, ["apple"])
+        self.assertEqual(self.entity.quests, {"q": {"goal": 1}})
+        self.assertEqual(len(self.entity.family), 1)
+
+        self.entity.inventory = ["stone"]
+        self.assertEqual(self.entity.inventory, ["stone"])
+        self.assertEqual(Entity("Other", dict(STATS), 160).inventory, [])
+
+    def test_vitals(self):
+        """Test that vitals keep their values and update rules."""
+        self.assertEqual((self.entity.hunger, self.entity.thirst, self.entity.tiredness), (100, 100, 100))
+        self.entity.update_needs(2, 5, 10, 1, 0)
+        self.assertEqual((self.entity.hunger, self.entity.thirst, self.entity.tiredness), (90, 80, 98))
+        self.entity.take_damage(self.entity.max_health)
+        self.assertEqual(self.entity.state, "knocked_out")
+
+    def test_copy_and_pickle(self):
+        """Test that slotted entities can be copied and pickled."""
+        npc = NPC("Ana", "mage", "elf")
+        npc.equip("main", "staff")
+        for clone in (copy.deepcopy(npc), pickle.loads(pickle.dumps(npc))):
+            self.assertEqual(clone.stats, npc.stats)
+            self.assertEqual(clone.personality, npc.personality)
+            self.assertEqual(clone.get_equipped("main"), "staff")
+
+
+if __name__ == "__main__":
+    unittest.main()
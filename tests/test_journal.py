@@ -0,0 +1,165 @@
+"""
+Tests for the append-only session journal and its replay on load.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Setup path to import from project
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.world import world as world_module
+from engine.world.autosave import AutoSaver
+from engine.world.journal import RECORD_EVENT, RECORD_MOVE, RECORD_PLAYER, Journal
+from engine.world.world import World
+
+
+class TestJournal(unittest.TestCase):
+    """Test record encoding, recovery and compaction."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmp.name) / "journal"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_records_round_trip(self):
+        """Test that every record kind is read back in order."""
+        journal = Journal(self.directory)
+        journal.record_move(3, -4)
+        journal.record_player({"hunger": 12})
+        journal.record_event({"type": "npc_met", "id": 7})
+        journal.close()
+
+        records = Journal(self.directory).records_after(0)
+        self.assertEqual(records, [
+            (1, RECORD_MOVE, (3, -4)),
+            (2, RECORD_PLAYER, {"hunger": 12}),
+            (3, RECORD_EVENT, {"type": "npc_met", "id": 7}),
+        ])
+
+    def test_records_are_tiny(self):
+        """Test that a move costs a few dozen bytes on disk."""
+        journal = Journal(self.directory)
+        for i in range(100):
+            journal.record_move(i, i)
+        journal.close()
+        size = sum(path.stat().st_size for _, path in journal.segments())
+        self.assertLessEqual(size, 100 * 32)
+
+    def test_torn_tail_is_discarded(self):
+        """Test that a partially written last record is dropped on open."""
+        journal = Journal(self.directory)
+        journal.record_move(1, 1)
+        journal.record_move(2, 2)
+        journal.close()
+        _, path = journal.segments()[-1]
+        with open(path, "r+b") as f:
+            f.truncate(path.stat().st_size - 3)
+
+        reopened = Journal(self.directory)
+        self.assertEqual(reopened.last_seq, 1)
+        self.assertEqual(reopened.record_move(5, 5), 2)
+        self.assertEqual([r[2] for r in reopened.records_after(0)], [(1, 1), (5, 5)])
+
+    def test_compaction_keeps_records_after_snapshot(self):
+        """Test that only segments covered by the snapshot are removed."""
+        journal = Journal(self.directory)
+        journal.record_move(1, 1)
+        snapshot_seq = journal.rotate()
+        journal.record_move(2, 2)
+
+        self.assertEqual(journal.compact(snapshot_seq), 1)
+        self.assertEqual(journal.records_after(snapshot_seq), [(2, RECORD_MOVE, (2, 2))])
+        self.assertEqual(len(journal.segments()), 1)
+
+
+class TestWorldJournal(unittest.TestCase):
+    """Test that World recovers state written after the last snapshot."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(world_module, "GAMES_DIR", Path(self.tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.world = World(seed=21, session_name="crash", prefetch_workers=0)
+        self.world.generate_world(width=64, height=64)
+        self.world.player_data = {"name": "Tester", "hunger": 0}
+        self.world.save_game()
+
+    def tearDown(self):
+        self.world.close()
+        self.tmp.cleanup()
+
+    def _walk(self, steps=6):
+        moved = 0
+        for direction in ["right", "down", "left", "up"] * steps:
+            moved += self.world.move_player(direction)
+        return moved
+
+    def test_replay_after_crash(self):
+        """Test that moves and player changes survive without a new save."""
+        self.assertGreater(self._walk(), 0)
+        self.world.update_player_data({"hunger": 40})
+        self.world.record_event({"type": "npc_met", "id": 3})
+        expected = (self.world.player_world_x, self.world.player_world_y)
+        # Sin save_game: simula un cierre inesperado
+
+        loaded = World(session_name="crash", prefetch_workers=0)
+        self.assertTrue(loaded.load_game())
+        self.assertEqual((loaded.player_world_x, loaded.player_world_y), expected)
+        self.assertEqual(loaded.player_data["hunger"], 40)
+        self.assertEqual(loaded.replayed_events, [{"type": "npc_met", "id": 3}])
+        self.assertTrue(loaded.dirty)
+        loaded.close()
+
+    def test_snapshot_compacts_journal(self):
+        """Test that a new snapshot removes the journal it covers."""
+        self._walk()
+        self.world.save_game()
+        snapshot_seq = self.world.journal.last_seq
+        self.assertEqual(self.world.journal.segments(), [])
+
+        loaded = World(session_name="crash", prefetch_workers=0)
+        self.assertTrue(loaded.load_game())
+        self.assertFalse(loaded.dirty)
+        # Los registros nuevos siguen numerándose tras la instantánea
+        self.assertTrue(any(loaded.move_player(d) for d in ["right", "left", "up", "down"]))
+        self.assertEqual(loaded.journal.last_seq, snapshot_seq + 1)
+        loaded.close()
+
+    def test_autosave_compacts_in_background(self):
+        """Test that AutoSaver writes the snapshot and compacts the journal."""
+        self._walk()
+        saver = AutoSaver(self.world)
+        try:
+            self.assertTrue(saver.request_save())
+            saver.flush()
+        finally:
+            saver.shutdown()
+        self.assertEqual(self.world.journal.segments(), [])
+
+    def test_fresh_world_ignores_stale_journal(self):
+        """Test that a new game saved over a session does not replay old records."""
+        self._walk()
+        self.world.close()
+
+        fresh = World(seed=22, session_name="crash", prefetch_workers=0)
+        fresh.generate_world(width=64, height=64)
+        fresh.save_game()
+        position = (fresh.player_world_x, fresh.player_world_y)
+        fresh.close()
+
+        loaded = World(session_name="crash", prefetch_workers=0)
+        self.assertTrue(loaded.load_game())
+        self.assertEqual((loaded.player_world_x, loaded.player_world_y), position)
+        loaded.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
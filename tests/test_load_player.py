@@ -0,0 +1,131 @@
+"""
+Tests for deleting sessions from the load screen.
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Setup path to import from project
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame as pg
+
+pg.init()
+
+from interface.screens import load_player
+from engine.world import world as world_module
+from engine.world.journal import Journal
+from engine.world.map_generator import TerrainGrid
+from engine.world.region_cache import RegionCache
+from engine.world.session_index import SessionIndex
+from engine.world.session_store import SessionStore
+from engine.world.world import World
+
+
+class TestDeleteSession(unittest.TestCase):
+    """Test that deleting a folder session removes its caches too."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.games = Path(self.tmp.name)
+        patcher = mock.patch.object(load_player, "GAMES", self.games)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def make_session(self, name):
+        session_dir = self.games / name
+        session_dir.mkdir()
+        (session_dir / "save.json").write_text('{"world": {"seed": 1}}', encoding="utf-8")
+        (session_dir / "save.json.1").write_text("{}", encoding="utf-8")
+        (session_dir / "regions").mkdir()
+        (session_dir / "regions" / "data.region").write_bytes(b"x" * 16)
+        return session_dir
+
+    def test_delete_removes_whole_session_dir(self):
+        """Test the save, its backups and the region cache are all removed."""
+        session_dir = self.make_session("doomed")
+        keep_dir = self.make_session("kept")
+
+        screen = load_player.LoadPlayer(pg.Surface((10, 10)))
+        self.assertIn("doomed", screen.sessions)
+        screen.delete_session("doomed")
+
+        self.assertFalse(session_dir.exists())
+        self.assertTrue((keep_dir / "regions" / "data.region").exists())
+        self.assertEqual(screen.sessions, ["kept"])
+        self.assertNotIn("doomed", SessionIndex(self.games).session_names())
+
+    def test_delete_removes_world_cache(self):
+        """Test the world chunk cache (world/<w>x<h>/) goes with the session."""
+        session_dir = self.make_session("doomed")
+        cache = RegionCache(session_dir / "world" / "64x64", seed=1)
+        grid = TerrainGrid.from_arrays(np.zeros((8, 8), dtype=np.float32), np.zeros((8, 8), dtype=np.float32),
+                                       np.zeros((8, 8), dtype=np.uint8), 0, 0)
+        cache.put(0, 0, grid)
+        self.assertEqual(len(cache), 1)
+
+        load_player.LoadPlayer(pg.Surface((10, 10))).delete_session("doomed")
+
+        self.assertFalse((session_dir / "world").exists())
+        self.assertEqual(len(RegionCache(session_dir / "world" / "64x64", seed=1)), 0)
+
+    def test_delete_removes_journal(self):
+        """Test the journal segments go with the session and are not replayed."""
+        session_dir = self.make_session("doomed")
+        journal = Journal(session_dir / "journal")
+        journal.record_move(3, 4)
+        journal.close()
+        self.assertTrue(journal.segments())
+
+        load_player.LoadPlayer(pg.Surface((10, 10))).delete_session("doomed")
+
+        self.assertFalse((session_dir / "journal").exists())
+        self.assertEqual(list(Journal(session_dir / "journal").records_after(0)), [])
+
+
+class TestDeleteStoredSession(unittest.TestCase):
+    """Test that deleting a SessionStore session removes its journal folder too."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.games = Path(self.tmp.name) / "games"
+        for module, name in ((load_player, "GAMES"), (world_module, "GAMES_DIR")):
+            patcher = mock.patch.object(module, name, self.games)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.store = SessionStore(Path(self.tmp.name) / "sessions.db")
+        self.addCleanup(self.tmp.cleanup)
+        self.addCleanup(self.store.close)
+
+    def make_session(self, name):
+        world = World(seed=4, session_name=name, prefetch_workers=0, session_store=self.store)
+        world.generate_world(width=64, height=64)
+        world.save_game()
+        world.record_event({"type": "test"})
+        world.close()
+        return self.games / name
+
+    def test_delete_removes_journal_folder(self):
+        """Test the store rows and the on-disk journal are both removed."""
+        session_dir = self.make_session("doomed")
+        keep_dir = self.make_session("kept")
+        self.assertTrue(list((session_dir / "journal").iterdir()))
+
+        screen = load_player.LoadPlayer(pg.Surface((10, 10)), session_store=self.store)
+        screen.delete_session("doomed")
+
+        self.assertNotIn("doomed", self.store)
+        self.assertFalse(session_dir.exists())
+        self.assertTrue((keep_dir / "journal").exists())
+        self.assertEqual(screen.sessions, ["kept"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Tests for the Surface-blit map renderer used by the Exploration screen.
+The blitted output must be pixel-identical to the per-tile drawing path.
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+# Setup path to import from project
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+
+from interface.map_renderer import tile_image, GAP_COLORKEY
+import engine.world.world as world_module
+
+
+class TestTileImage(unittest.TestCase):
+    """Test the per-tile to per-pixel expansion."""
+
+    def test_tiles_leave_one_pixel_gap(self):
+        """Test that each tile keeps a 1px transparent border on the right/bottom."""
+        colors = np.array([[[255, 0, 0], [0, 255, 0]]], dtype=np.uint8)
+        image = tile_image(colors, 4, 3)
+
+        self.assertEqual(image.shape, (3, 8, 3))
+        self.assertEqual(tuple(image[0, 0]), (255, 0, 0))
+        self.assertEqual(tuple(image[1, 6]), (0, 255, 0))
+        self.assertEqual(tuple(image[0, 3]), GAP_COLORKEY)
+        self.assertEqual(tuple(image[2, 0]), GAP_COLORKEY)
+
+
+class TestExplorationRendering(unittest.TestCase):
+    """Test that both Exploration render paths produce the same pixels."""
+
+    @classmethod
+    def setUpClass(cls):
+        # Keep the session caches out of saves/games
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.patcher = mock.patch.object(world_module, "GAMES_DIR", Path(cls.tmp.name))
+        cls.patcher.start()
+        pg.init()
+        cls.screen = pg.display.set_mode((1280, 800))
+        from interface.screens.exploration import Exploration
+        cls.exploration = Exploration(cls.screen, player_data={"name": "Test"}, world_seed=42,
+                                      session_name="test_renderer")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.exploration.world.close()
+        cls.patcher.stop()
+        cls.tmp.cleanup()
+        pg.quit()
+
+    def _render(self, use_surface):
+        self.exploration.use_surface_renderer = use_surface
+        self.exploration.draw()
+        return pg.surfarray.array3d(self.screen)
+
+    def _assert_paths_match(self):
+        tiles = self._render(False)
+        surface = self._render(True)
+        np.testing.assert_array_equal(tiles, surface)
+
+    def test_world_view_matches_tiles(self):
+        """Test the global view."""
+        self.exploration.show_local_map = False
+        self._assert_paths_match()
+
+    def test_local_view_matches_tiles(self):
+        """Test the local view."""
+        self.exploration.show_local_map = True
+        self._assert_paths_match()
+
+    def test_surface_is_cached(self):
+        """Test that the world surface is built once per map."""
+        renderer = self.exploration.renderer
+        first = renderer.world_surface(self.exploration.world.world_map)
+        second = renderer.world_surface(self.exploration.world.world_map)
+        self.assertIs(first, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+"""
+Tests for the vectorized needs store.
+"""
+
+import copy
+import pickle
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+# Setup path to import from project
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.entities.entity import Entity
+from engine.entities.npc import NPC
+from engine.systems.needs import NeedsStore
+
+STATS = {
+    "strength": 12, "agility": 10, "dexterity": 11, "constitution": 14, "intellect": 9,
+    "psique": 10, "will": 10, "perception": 10, "education": 8, "charisma": 10,
+}
+
+
+def make_entity(name="e"):
+    return Entity(name, dict(STATS), 175)
+
+
+class TestNeedsStore(unittest.TestCase):
+    """Test rows, views, ticks and state changes."""
+
+    def setUp(self):
+        self.store = NeedsStore(capacity=2)
+
+    def test_entity_is_view_of_row(self):
+        """Test that reads and writes go through the store row."""
+        entity = make_entity()
+        row = self.store.add(entity, hunger_rate=2.0)
+        self.assertIn(entity, self.store)
+
+        entity.alter_hunger(-30)
+        self.assertEqual(self.store.column("hunger")[row], 70)
+        self.store.column("thirst")[row] = 55
+        self.assertEqual(entity.thirst, 55)
+        entity.state = "poisoned"
+        self.assertEqual(self.store.get_state(row), "poisoned")
+        self.assertEqual(self.store.state_counts(), {"poisoned": 1})
+
+    def test_tick_matches_update_needs(self):
+        """Test that one tick equals Entity.update_needs on a loose entity."""
+        loose = make_entity("loose")
+        loose.magic_heat = 40
+        stored = make_entity("stored")
+        stored.magic_heat = 40
+        self.store.add(stored, hunger_rate=3, thirst_rate=4, tiredness_rate=5, magic_heat_rate=6)
+
+        for _ in range(4):
+            loose.update_needs(2.5, 3, 4, 5, 6)
+            self.store.tick(2.5)
+        for name in ("hunger", "thirst", "tiredness", "magic_heat"):
+            self.assertAlmostEqual(getattr(stored, name), getattr(loose, name), msg=name)
+        self.assertEqual(stored.magic_heat, 0)
+
+    def test_starvation_changes_state(self):
+        """Test knocked out and dead transitions."""
+        entity = make_entity()
+        entity.hunger = 0
+        entity.thirst = 0
+        entity.current_health = 1
+        store = NeedsStore(starvation_damage=1.0)
+        store.add(entity)
+
+        changed = store.tick(1)
+        self.assertEqual(entity.state, "knocked_out")
+        self.assertEqual(changed.tolist(), [0])
+        self.assertEqual(store.tick(1).tolist(), [])  # Sigue inconsciente
+
+        store.tick(entity.max_health / 4)
+        self.assertEqual(entity.state, "dead")
+        health = entity.current_health
+        store.tick(10)
+        self.assertEqual(entity.current_health, health)  # Los muertos no cambian
+
+    def test_stamina_recovery_is_clamped(self):
+        """Test that stamina only changes when it has a recovery rate."""
+        still = make_entity("still")
+        resting = make_entity("resting")
+        self.store.add(still)
+        self.store.add(resting, stamina_rate=50)
+        before = still.stamina
+        self.store.tick(1)
+        self.assertEqual(still.stamina, before)
+        self.assertEqual(resting.stamina, 100)
+
+    def test_remove_restores_values(self):
+        """Test that removed entities keep their values and other rows move."""
+        entities = [make_entity(f"e{i}") for i in range(5)]
+        self.store.add_many(entities)
+        self.store.tick(10)
+        first = entities[0]
+        hunger = first.hunger
+
+        self.store.remove(first)
+        self.assertNotIn(first, self.store)
+        self.assertEqual(first.hunger, hunger)
+        first.alter_hunger(-5)
+        self.assertEqual(first.hunger, hunger - 5)
+
+        # La última entidad ocupa la fila libre y sigue viendo sus valores
+        last = entities[-1]
+        self.assertEqual(last._needs_row, 0)
+        last.alter_thirst(-1)
+        self.assertEqual(self.store.column("thirst")[0], last.thirst)
+        self.assertEqual(len(self.store), 4)
+
+    def test_errors(self):
+        """Test that double adds, unknown rates and foreign removes fail."""
+        entity = make_entity()
+        self.store.add(entity)
+        with self.assertRaises(ValueError):
+            self.store.add(entity)
+        with self.assertRaises(ValueError):
+            self.store.add(make_entity(), speed=1)
+        with self.assertRaises(ValueError):
+            NeedsStore().remove(entity)
+
+    def test_copies_are_detached(self):
+        """Test that copies of a stored entity do not share the store."""
+        npc = NPC("Ana", "warrior", "human")
+        self.store.add(npc)
+        self.store.tick(3)
+        for clone in (copy.deepcopy(npc), pickle.loads(pickle.dumps(npc))):
+            self.assertIsNone(clone._needs)
+            self.assertEqual(clone.hunger, npc.hunger)
+            self.assertEqual(clone.personality, npc.personality)
+        self.assertEqual(len(self.store), 1)
+
+    def test_large_population(self):
+        """Test one tick over thousands of NPCs."""
+        npcs = NPC.batch_create(["warrior", "merchant"], "human", 3000, seed=2)
+        self.store.add_many(npcs)
+        self.store.tick(20)
+        self.assertTrue(np.all(self.store.column("hunger") == 80))
+        self.assertEqual(npcs[1234].hunger, 80)
+        self.assertEqual(self.store.state_counts(), {"conscious": 3000})
+
+
+if __name__ == "__main__":
+    unittest.main()
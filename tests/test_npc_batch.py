@@ -0,0 +1,139 @@
+"""
+Tests for batch NPC creation.
+"""
+
+import random
+import unittest
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+# Setup path to import from project
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.entities.npc import NPC
+from engine.entities.npc_batch import NO_TRAIT, NPCPopulation
+from engine.utils.data_registry import get_registry
+from engine.utils.name_generator import NameGenerator
+
+
+class TestBatchCreate(unittest.TestCase):
+    """Test the columnar population and NPC materialization."""
+
+    def test_columns_and_ranges(self):
+        """Test shapes and that stats stay inside profession and race ranges."""
+        registry = get_registry()
+        pop = NPC.batch_create(["warrior", "mage"], {"human": 1, "dwarf": 3}, 2000, seed=1,
+                               columnar=True)
+        self.assertIsInstance(pop, NPCPopulation)
+        self.assertEqual(len(pop), 2000)
+        self.assertEqual(pop.stats.shape, (2000, len(registry.stat_names)))
+        self.assertEqual(pop.personality.shape, (2000, len(registry.traits_by_id)))
+        self.assertTrue(all(pop.names))
+
+        for i in range(0, 2000, 97):
+            profession = registry.professions_by_name[pop.profession_of(i)]
+            race = registry.races_by_name[pop.race_of(i)]
+            modifiers = {m["stat_name"]: int(m["modifier"]) for m in race["modifiers"]}
+            for stat_name, value in pop.stats_of(i).items():
+                base = value - modifiers.get(stat_name, 0)
+                stat_range = profession["stat_ranges"].get(stat_name)
+                if stat_range:
+                    self.assertGreaterEqual(base, stat_range["min"])
+                    self.assertLessEqual(base, stat_range["max"])
+                else:
+                    self.assertEqual(base, 10)
+            # Mismos valores por defecto que NPC (algunas razas no definen min_height)
+            heights = sorted([int(race.get("min_height", 150)), int(race.get("max_height", 200))])
+            self.assertGreaterEqual(pop.heights[i], heights[0])
+            self.assertLessEqual(pop.heights[i], heights[1])
+
+        # Mezcla con pesos 1:3
+        self.assertAlmostEqual((pop.race_ids == pop.races.index("dwarf")).mean(), 0.75, delta=0.05)
+
+    def test_seed_is_reproducible(self):
+        """Test that the same seed gives the same population."""
+        a = NPC.batch_create("rogue", ["elf", "orc"], 500, seed=9, columnar=True)
+        b = NPC.batch_create("rogue", ["elf", "orc"], 500, seed=9, columnar=True)
+        c = NPC.batch_create("rogue", ["elf", "orc"], 500, seed=10, columnar=True)
+        self.assertEqual(a.names, b.names)
+        np.testing.assert_array_equal(a.stats, b.stats)
+        np.testing.assert_array_equal(a.personality, b.personality)
+        self.assertFalse(np.array_equal(a.stats, c.stats))
+
+    def test_objects_keep_npc_api(self):
+        """Test that batch NPCs behave like NPCs built one at a time."""
+        npcs = NPC.batch_create("paladin", "human", 20, seed=3)
+        self.assertEqual(len(npcs), 20)
+        for npc in npcs:
+            self.assertIsInstance(npc, NPC)
+            self.assertEqual(npc.profession, "paladin")
+            self.assertEqual(npc.race, {"human": 100})
+            self.assertTrue(npc.get_reference_by_profession().startswith(npc.name))
+            self.assertTrue(npc.get_personality_summary())
+            self.assertIsInstance(npc.would_betray(), bool)
+            self.assertGreater(npc.max_health, 0)
+
+        pop = NPC.batch_create("paladin", "human", 20, seed=3, columnar=True)
+        single = pop.to_npc(5)
+        self.assertEqual(single.stats, npcs[5].stats)
+        self.assertEqual(single.personality, npcs[5].personality)
+        self.assertEqual(single.npc_values, npcs[5].npc_values)
+
+    def test_unknown_names_raise(self):
+        """Test that unknown professions and races raise ValueError."""
+        with self.assertRaises(ValueError):
+            NPC.batch_create("astronaut", "human", 10)
+        with self.assertRaises(ValueError):
+            NPC.batch_create("warrior", ["human", "martian"], 10)
+        with self.assertRaises(ValueError):
+            NPC.batch_create([], "human", 10)
+
+    def test_matches_single_generation(self):
+        """Test that trait, value and stat distributions match single NPCs."""
+        count = 3000
+        random.seed(11)
+        singles = [NPC(f"npc_{i}", "rogue", "elf") for i in range(count)]
+        pop = NPC.batch_create("rogue", "elf", count, seed=11, columnar=True)
+
+        single_traits = Counter(t for npc in singles for t in npc.personality)
+        for column, trait_id in enumerate(pop.trait_ids):
+            batch_rate = (pop.personality[:, column] != NO_TRAIT).mean()
+            self.assertAlmostEqual(single_traits[trait_id] / count, batch_rate, delta=0.04, msg=trait_id)
+
+        for column, value_name in enumerate(pop.value_names):
+            single_mean = np.mean([npc.npc_values[value_name] for npc in singles])
+            self.assertAlmostEqual(single_mean, pop.npc_values[:, column].mean(), delta=1.5, msg=value_name)
+
+        for column, stat_name in enumerate(pop.stat_names):
+            single_mean = np.mean([npc.stats[stat_name] for npc in singles])
+            self.assertAlmostEqual(single_mean, pop.stats[:, column].mean(), delta=0.3, msg=stat_name)
+        self.assertAlmostEqual(np.mean([npc.height for npc in singles]), pop.heights.mean(), delta=1.0)
+
+
+class TestGenerateNames(unittest.TestCase):
+    """Test bulk name generation."""
+
+    def test_names_follow_race_syllables(self):
+        """Test that bulk names use the race prefixes and suffixes."""
+        generator = NameGenerator()
+        syllables = generator.syllables["orc"]
+        names = generator.generate_names("orc", 300, np.random.default_rng(4))
+        self.assertEqual(len(names), 300)
+        self.assertGreater(len(set(names)), 50)
+        for name in names:
+            self.assertTrue(any(name.startswith(p.capitalize()) for p in syllables["prefixes"]), name)
+            self.assertTrue(any(name.endswith(s) for s in syllables["suffixes"]), name)
+
+    def test_names_are_reproducible(self):
+        """Test that the same generator seed gives the same names."""
+        generator = NameGenerator()
+        self.assertEqual(generator.generate_names("elf", 50, np.random.default_rng(1)),
+                         generator.generate_names("elf", 50, np.random.default_rng(1)))
+        self.assertEqual(generator.generate_names("elf", 0), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
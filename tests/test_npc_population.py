@@ -0,0 +1,142 @@
+"""
+Tests for the on-demand virtual NPC population.
+"""
+
+import json
+import unittest
+from pathlib import Path
+
+# Setup path to import from project
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.entities.npc_population import VirtualPopulation, capture
+from engine.systems.needs import NeedsStore
+from engine.world.save_format import migrate
+from engine.world.world import World
+
+
+def make_population(max_loaded=8):
+    population = VirtualPopulation(2024, max_loaded=max_loaded)
+    population.add_settlement("riverside", 10000, {"warrior": 3, "mage": 1}, {"human": 2, "dwarf": 1})
+    population.add_settlement(7, 50, "warrior")
+    return population
+
+
+class TestVirtualPopulation(unittest.TestCase):
+    """Test deterministic regeneration and the LRU."""
+
+    def test_deterministic(self):
+        """Test the same (seed, settlement, index) gives the same NPC."""
+        a, b = make_population(), make_population()
+        for index in (0, 1, 9999):
+            self.assertEqual(capture(a.get("riverside", index)), capture(b.get("riverside", index)))
+            self.assertEqual(a.profile("riverside", index), (a.get("riverside", index).profession,
+                                                             next(iter(a.get("riverside", index).race))))
+        self.assertNotEqual(capture(a.get("riverside", 0)), capture(a.get(7, 0)))
+        self.assertEqual(len(a), 10050)
+
+    def test_lru(self):
+        """Test only max_loaded NPCs stay in memory and hits reuse the object."""
+        population = make_population(max_loaded=4)
+        npc = population.get("riverside", 0)
+        self.assertIs(population.get("riverside", 0), npc)
+        for index in range(1, 10):
+            population.get("riverside", index)
+        self.assertEqual(population.loaded, 4)
+        self.assertFalse(population.is_loaded("riverside", 0))
+        self.assertEqual(population.hits, 1)
+        self.assertEqual(population.evicted, 6)
+
+    def test_unknown_ids(self):
+        """Test unknown settlements and out-of-range indexes are rejected."""
+        population = make_population()
+        with self.assertRaises(KeyError):
+            population.get("nowhere", 0)
+        with self.assertRaises(IndexError):
+            population.get(7, 50)
+        with self.assertRaises(ValueError):
+            population.add_settlement("bad", 10, "not_a_profession")
+
+
+class TestDeltas(unittest.TestCase):
+    """Test that only gameplay changes are kept and restored."""
+
+    def test_delta_survives_eviction(self):
+        """Test changes are reapplied after the NPC is regenerated."""
+        population = make_population(max_loaded=2)
+        npc = population.get("riverside", 5)
+        npc.take_damage(10)
+        npc.add_to_inventory("sword", 3)
+        expected = capture(npc)
+        self.assertEqual(set(population.delta("riverside", 5)),
+                         {"current_health", "inventory", "weight"})
+
+        for index in range(10, 15):
+            population.get("riverside", index)
+        self.assertFalse(population.is_loaded("riverside", 5))
+        restored = population.get("riverside", 5)
+        self.assertIsNot(restored, npc)
+        self.assertEqual(capture(restored), expected)
+
+    def test_untouched_npcs_have_no_delta(self):
+        """Test NPCs that were only looked at store nothing."""
+        population = make_population(max_loaded=2)
+        for index in range(20):
+            population.get("riverside", index).inventory  # creating an empty container is not a change
+        self.assertEqual(population.deltas(), {})
+
+    def test_reset(self):
+        """Test reset drops the changes of an NPC."""
+        population = make_population()
+        population.get(7, 1).modify_reputation(5)
+        population.reset(7, 1)
+        self.assertEqual(population.delta(7, 1), {})
+        self.assertEqual(population.get(7, 1).reputation, 0)
+
+    def test_eviction_leaves_needs_store(self):
+        """Test evicted NPCs are removed from their NeedsStore."""
+        population = make_population(max_loaded=1)
+        store = NeedsStore()
+        npc = population.get(7, 0)
+        store.add(npc)
+        store.set("hunger", 0, 40)
+        population.get(7, 1)
+        self.assertEqual(len(store), 0)
+        self.assertEqual(population.delta(7, 0)["hunger"], 40)
+
+    def test_json_roundtrip(self):
+        """Test to_dict/from_dict through JSON keeps settlements and deltas."""
+        population = make_population()
+        population.get(7, 3).modify_stat("strength", 2)
+        population.get("riverside", 42).change_state("dead")
+        data = json.loads(json.dumps(population.to_dict()))
+
+        loaded = VirtualPopulation.from_dict(2024, data)
+        self.assertEqual(set(loaded.settlements), {"riverside", 7})
+        self.assertEqual(capture(loaded.get(7, 3)), capture(population.get(7, 3)))
+        self.assertEqual(loaded.get("riverside", 42).state, "dead")
+        self.assertEqual(set(loaded.deltas()), {(7, 3), ("riverside", 42)})
+
+
+class TestWorldIntegration(unittest.TestCase):
+    """Test the population is part of the save data."""
+
+    def test_save_data(self):
+        """Test deltas go into the snapshot and old saves migrate."""
+        world = World(seed=11, use_region_cache=False, prefetch_workers=0, use_journal=False)
+        population = world.get_npc_population()
+        population.add_settlement("camp", 100, "warrior")
+        population.get("camp", 0).modify_reputation(3)
+        save_data = json.loads(json.dumps(world.build_save_data()))
+        self.assertEqual(save_data["npcs"]["settlements"][0]["deltas"]["0"], {"reputation": 3})
+
+        world.npc_population = None
+        world.npc_data = save_data["npcs"]
+        self.assertEqual(world.get_npc_population().get("camp", 0).reputation, 3)
+
+        self.assertEqual(migrate({"schema_version": 3, "world": {"seed": 1}})["npcs"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Tests for tiled, multiprocess map generation.
+The output must be bit-identical to single-process generation.
+"""
+
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+# Setup path to import from project
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.world import tiling
+from engine.world.map_generator import MapGenerator
+
+
+def assert_grids_equal(test, a, b):
+    """Assert two TerrainGrids hold exactly the same data."""
+    test.assertEqual(a.shape, b.shape)
+    np.testing.assert_array_equal(a.heights, b.heights)
+    np.testing.assert_array_equal(a.temperatures, b.temperatures)
+    np.testing.assert_array_equal(a.terrain_codes, b.terrain_codes)
+
+
+class TestPlanTiles(unittest.TestCase):
+    """Test the tiling of a rectangle."""
+
+    def test_tiles_cover_area_once(self):
+        """Test that tiles cover every cell exactly once, including partial tiles."""
+        coverage = np.zeros((70, 100), dtype=int)
+        for x, y, w, h in tiling.plan_tiles(100, 70, 32):
+            coverage[y:y + h, x:x + w] += 1
+        self.assertTrue((coverage == 1).all())
+
+    def test_resolve_workers(self):
+        """Test worker count normalization."""
+        self.assertEqual(tiling.resolve_workers(0), 1)
+        self.assertEqual(tiling.resolve_workers(3), 3)
+        self.assertGreaterEqual(tiling.resolve_workers(None), 1)
+
+
+class TestParallelGeneration(unittest.TestCase):
+    """Test that tiled generation matches serial generation."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.generator = MapGenerator(seed=42)
+        cls.serial = cls.generator.generate_world_map(width=100, height=70)
+
+    def test_world_map_with_process_pool(self):
+        """Test a world split into partial tiles across two processes."""
+        parallel = self.generator.generate_world_map(width=100, height=70, workers=2, tile_size=32)
+        assert_grids_equal(self, parallel, self.serial)
+
+    def test_serial_fallback_when_pool_fails(self):
+        """Test that generation still completes if processes cannot be started."""
+        with mock.patch.object(tiling, "ProcessPoolExecutor", side_effect=OSError("no fork")):
+            with mock.patch("builtins.print"):
+                fallback = self.generator.generate_world_map(width=100, height=70, workers=4, tile_size=32)
+        assert_grids_equal(self, fallback, self.serial)
+
+    def test_local_map_batch(self):
+        """Test a batch of local regions in worker processes."""
+        positions = [(0, 0), (64, 0), (0, 64), (64, 64)]
+        parallel = self.generator.generate_local_maps(positions, 32, 32, workers=2)
+        for (world_x, world_y), grid in zip(positions, parallel):
+            expected = self.generator.generate_local_map(world_x, world_y, 32, 32)
+            assert_grids_equal(self, grid, expected)
+            self.assertEqual((grid.origin_x, grid.origin_y), (expected.origin_x, expected.origin_y))
+
+    def test_batch_of_seeds(self):
+        """Test generating one world per seed in parallel."""
+        seeds = [1, 2, 3]
+        worlds = tiling.generate_world_maps(seeds, 40, 30, workers=2)
+        for seed, world_map in zip(seeds, worlds):
+            expected = MapGenerator(seed=seed).generate_world_map(width=40, height=30)
+            assert_grids_equal(self, world_map, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+"""
+Tests for the persistent on-disk region cache.
+Covers round-tripping, memory-mapped loading, key validation, LRU eviction
+and the integration with World.load_local_map.
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+# Setup path to import from project
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.world import world as world_module
+from engine.world.map_generator import MapGenerator, TerrainGrid
+from engine.world.region_cache import RegionCache, REGION_DATA_OFFSET
+from engine.world.world import World
+
+
+def make_grid(width=16, height=8, origin_x=0, origin_y=0, seed=0):
+    """Build a small random TerrainGrid."""
+    rng = np.random.default_rng(seed)
+    return TerrainGrid(
+        rng.uniform(-1, 1, (height, width)),
+        rng.uniform(-1, 1, (height, width)),
+        rng.integers(0, 10, (height, width)),
+        origin_x,
+        origin_y,
+    )
+
+
+class TestRegionCache(unittest.TestCase):
+    """Test the RegionCache file format and eviction."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmp.name) / "regions"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_is_memory_mapped(self):
+        """Test that a stored region loads back identical and memory-mapped."""
+        cache = RegionCache(self.directory, seed=42)
+        grid = make_grid(origin_x=64, origin_y=128)
+        cache.put(1, 2, grid)
+
+        loaded = cache.get(1, 2, 16, 8)
+        self.assertIsNotNone(loaded)
+        self.assertIsInstance(loaded.heights, np.memmap)
+        np.testing.assert_array_equal(loaded.heights, grid.heights)
+        np.testing.assert_array_equal(loaded.temperatures, grid.temperatures)
+        np.testing.assert_array_equal(loaded.terrain_codes, grid.terrain_codes)
+        self.assertEqual((loaded.origin_x, loaded.origin_y), (64, 128))
+        self.assertEqual(loaded[3, 5].terrain, grid[3, 5].terrain)
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_survives_reopen(self):
+        """Test that a new cache instance finds regions written earlier."""
+        RegionCache(self.directory, seed=42).put(0, 0, make_grid())
+        cache = RegionCache(self.directory, seed=42)
+        self.assertEqual(len(cache), 1)
+        self.assertIsNotNone(cache.get(0, 0, 16, 8))
+
+    def test_key_includes_seed_and_generator_version(self):
+        """Test that other seeds or generator versions miss."""
+        RegionCache(self.directory, seed=42).put(0, 0, make_grid())
+
+        self.assertIsNone(RegionCache(self.directory, seed=43).get(0, 0, 16, 8))
+        other_version = RegionCache(
+            self.directory, seed=42, generator_version=MapGenerator.VERSION + 1
+        )
+        self.assertIsNone(other_version.get(0, 0, 16, 8))
+        self.assertIsNone(RegionCache(self.directory, seed=42).get(0, 0, 32, 8))
+
+    def test_corrupt_file_is_discarded(self):
+        """Test that a truncated file is treated as a miss and removed."""
+        cache = RegionCache(self.directory, seed=42)
+        cache.put(0, 0, make_grid())
+        path = self.directory / cache.filename(0, 0, 16, 8)
+        with open(path, "r+b") as f:
+            f.truncate(REGION_DATA_OFFSET + 10)
+
+        self.assertIsNone(cache.get(0, 0, 16, 8))
+        self.assertFalse(path.exists())
+        self.assertEqual(len(cache), 0)
+
+    def test_evicts_least_recently_used(self):
+        """Test that the byte budget removes the oldest unused regions."""
+        region_bytes = REGION_DATA_OFFSET + 16 * 8 * 9
+        cache = RegionCache(self.directory, seed=42, max_bytes=region_bytes * 2)
+
+        cache.put(0, 0, make_grid())
+        cache.put(1, 0, make_grid())
+        cache.get(0, 0, 16, 8)  # (0, 0) pasa a ser la más reciente
+        cache.put(2, 0, make_grid())
+
+        self.assertLessEqual(cache.total_bytes, region_bytes * 2)
+        self.assertIn((0, 0, 16, 8), cache)
+        self.assertNotIn((1, 0, 16, 8), cache)
+        self.assertIn((2, 0, 16, 8), cache)
+        self.assertEqual(len(list(self.directory.glob("*.region"))), 2)
+
+
+class TestWorldRegionCache(unittest.TestCase):
+    """Test that World reuses regions stored on disk."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(world_module, "GAMES_DIR", Path(self.tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_second_session_loads_from_disk(self):
+        """Test that a fresh World does not regenerate a cached region."""
+        world = World(seed=7, session_name="cache_test")
+        generated = world.load_local_map()
+        region_dir = Path(self.tmp.name) / "cache_test" / "regions"
+        self.assertEqual(len(os.listdir(region_dir)), 1)
+
+        fresh = World(seed=7, session_name="cache_test")
+        with mock.patch.object(fresh.generator, "generate_local_map") as generate:
+            loaded = fresh.load_local_map()
+            generate.assert_not_called()
+
+        np.testing.assert_array_equal(loaded.terrain_codes, generated.terrain_codes)
+        np.testing.assert_array_equal(loaded.heights, generated.heights)
+
+    def test_cache_can_be_disabled(self):
+        """Test that use_region_cache=False writes nothing."""
+        world = World(seed=7, session_name="no_cache", use_region_cache=False)
+        world.load_local_map()
+        self.assertFalse((Path(self.tmp.name) / "no_cache").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Tests for background prefetching of neighbouring local regions.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+# Setup path to import from project
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.world import world as world_module
+from engine.world.region_prefetcher import RegionPrefetcher
+from engine.world.world import World
+
+
+class TestNeighbourSelection(unittest.TestCase):
+    """Test which regions the prefetcher asks for."""
+
+    def setUp(self):
+        self.prefetcher = RegionPrefetcher(lambda x, y: None, max_workers=0, margin=8)
+
+    def test_centre_of_region_prefetches_nothing(self):
+        """Test that no neighbours are requested far from any edge."""
+        self.assertEqual(self.prefetcher.neighbours(32, 32), [])
+
+    def test_near_edge_prefetches_region_across(self):
+        """Test the region on the other side of a nearby edge."""
+        self.assertEqual(self.prefetcher.neighbours(60, 32), [(1, 0)])
+        self.assertEqual(self.prefetcher.neighbours(64 + 3, 32), [(0, 0)])
+
+    def test_heading_comes_first_near_corner(self):
+        """Test that the region in the direction of travel is scheduled first."""
+        keys = self.prefetcher.neighbours(60, 60, dx=0, dy=1)
+        self.assertEqual(sorted(keys), [(0, 1), (1, 0), (1, 1)])
+        self.assertEqual(keys[0][1], 1)
+        self.assertEqual(keys[-1], (1, 0))
+
+
+class TestTake(unittest.TestCase):
+    """Test that take() never raises a worker failure into the caller."""
+
+    def test_cancelled_and_failed_futures(self):
+        """Test that failed or cancelled regions come back as (None, False)."""
+        prefetcher = RegionPrefetcher(lambda x, y: None, max_workers=1)
+        failed = mock.Mock(**{"done.return_value": True, "cancelled.return_value": False,
+                              "exception.return_value": RuntimeError("boom")})
+        cancelled = mock.Mock(**{"done.return_value": True, "cancelled.return_value": True})
+        prefetcher._pending = {(0, 0): failed, (1, 0): cancelled}
+
+        with mock.patch("builtins.print"):
+            self.assertEqual(prefetcher.take((0, 0)), (None, False))
+        self.assertEqual(prefetcher.take((1, 0)), (None, False))
+        self.assertEqual(prefetcher.stats()["failed"], 2)
+        failed.result.assert_not_called()
+
+
+class TestWorldPrefetch(unittest.TestCase):
+    """Test that World picks up prefetched regions without stalling."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(world_module, "GAMES_DIR", Path(self.tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.world = World(seed=42, session_name="prefetch_test", use_region_cache=False)
+        self.world.generate_world(width=128, height=128)
+
+    def tearDown(self):
+        self.world.close()
+        self.tmp.cleanup()
+
+    def _wait_for_prefetch(self):
+        for future in list(self.world.prefetcher._pending.values()):
+            future.result(timeout=30)
+
+    def _wait_for_prefetch_errors(self):
+        for future in list(self.world.prefetcher._pending.values()):
+            future.exception(timeout=30)
+
+    def test_crossing_boundary_uses_prefetched_region(self):
+        """Test that the next region is generated before the player arrives."""
+        self.world.player_world_x, self.world.player_world_y = 60, 10
+        self.world.load_local_map()
+        self.assertTrue(self.world.prefetcher.is_pending((1, 0)))
+        self._wait_for_prefetch()
+
+        self.world.player_world_x = 64
+        with mock.patch.object(self.world.generator, "generate_local_map") as generate:
+            local_map = self.world.load_local_map()
+            generate.assert_not_called()
+
+        expected = self.world.generator.generate_local_map(64, 0, 64, 64)
+        np.testing.assert_array_equal(local_map.terrain_codes, expected.terrain_codes)
+
+        stats = self.world.prefetcher.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)  # Solo la primera región
+        self.assertGreater(stats["stall_ms"], 0)
+
+    def test_failed_prefetch_falls_back_to_generation(self):
+        """Test that a worker error is counted and the region is generated synchronously."""
+        self.world.player_world_x, self.world.player_world_y = 60, 10
+        with mock.patch.object(self.world.prefetcher, "generate", side_effect=RuntimeError("boom")), \
+                mock.patch("builtins.print"):
+            self.world.load_local_map()
+            self.assertTrue(self.world.prefetcher.is_pending((1, 0)))
+            self._wait_for_prefetch_errors()
+
+            self.world.player_world_x = 64
+            local_map = self.world.load_local_map()
+
+        expected = self.world.generator.generate_local_map(64, 0, 64, 64)
+        np.testing.assert_array_equal(local_map.terrain_codes, expected.terrain_codes)
+        self.assertGreaterEqual(self.world.prefetcher.stats()["failed"], 1)
+
+    def test_regions_outside_world_are_not_prefetched(self):
+        """Test that nothing is scheduled past the map border."""
+        self.world.player_world_x, self.world.player_world_y = 2, 2
+        self.world.load_local_map()
+        self.assertEqual(self.world.prefetcher.stats()["pending"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
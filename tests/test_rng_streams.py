@@ -0,0 +1,152 @@
+"""
+Tests for independent RNG streams derived from a root seed.
+"""
+
+import os
+import random
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+# Setup path to import from project
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from engine.entities.npc import NPC
+from engine.utils.name_generator import NameGenerator
+from engine.utils.rng_streams import STREAM_CHILDHOOD, STREAM_NPC, derive_seed, np_stream, py_stream
+
+
+def snapshot(npc):
+    """Comparable view of a generated NPC."""
+    return (npc.name, npc.height, dict(npc.stats), dict(npc.personality), dict(npc.npc_values))
+
+
+class TestDeriveSeed(unittest.TestCase):
+    """Test seed derivation."""
+
+    def test_stable_and_distinct(self):
+        """Test the same keys give the same seed and different keys differ."""
+        self.assertEqual(derive_seed(42, "npc", 7), derive_seed(42, "npc", 7))
+        seeds = {derive_seed(42, "npc", i) for i in range(1000)}
+        self.assertEqual(len(seeds), 1000)
+        self.assertNotEqual(derive_seed(42, "npc", 7), derive_seed(43, "npc", 7))
+        self.assertNotEqual(derive_seed(42, "npc", 7), derive_seed(42, "childhood", 7))
+        # Int and str keys never collide
+        self.assertNotEqual(derive_seed(42, 7), derive_seed(42, "7"))
+        self.assertTrue(0 <= derive_seed(1) < 2 ** 64)
+
+    def test_rejects_unsupported_keys(self):
+        """Test only int and str keys are accepted."""
+        with self.assertRaises(TypeError):
+            derive_seed(1, 2.5)
+        with self.assertRaises(TypeError):
+            derive_seed(1, True)
+
+    def test_streams(self):
+        """Test Python and NumPy streams are reproducible."""
+        self.assertEqual(py_stream(5, "a").random(), py_stream(5, "a").random())
+        np.testing.assert_array_equal(np_stream(5, "a").integers(0, 100, 10),
+                                      np_stream(5, "a").integers(0, 100, 10))
+
+
+class TestReproducibleNPCs(unittest.TestCase):
+    """Test NPCs rebuilt from root seed and id."""
+
+    def test_from_seed_reproduces(self):
+        """Test the same id gives the same NPC regardless of generation order."""
+        first = [snapshot(NPC.from_seed(99, i, "warrior")) for i in range(20)]
+        random.seed(0)
+        again = [snapshot(NPC.from_seed(99, i, "warrior")) for i in reversed(range(20))]
+        self.assertEqual(first, list(reversed(again)))
+        self.assertGreater(len({s[0] for s in first} | {str(s[2]) for s in first}), 1)
+
+    def test_from_seed_does_not_touch_global_random(self):
+        """Test generating NPCs leaves the global random state untouched."""
+        random.seed(123)
+        expected = random.random()
+        random.seed(123)
+        NPC.from_seed(1, 1, "mage", "elf")
+        self.assertEqual(random.random(), expected)
+
+    def test_threads(self):
+        """Test NPCs generated in parallel match the sequential ones."""
+        ids = list(range(40))
+        sequential = [snapshot(NPC.from_seed(7, i, "warrior")) for i in ids]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            parallel = list(pool.map(lambda i: snapshot(NPC.from_seed(7, i, "warrior")), ids))
+        self.assertEqual(sequential, parallel)
+
+    def test_explicit_rng(self):
+        """Test an explicit stream is equivalent to from_seed."""
+        npc = NPC(profession_name="warrior", rng=py_stream(3, STREAM_NPC, 11))
+        self.assertEqual(snapshot(npc), snapshot(NPC.from_seed(3, 11, "warrior")))
+
+
+class TestNameGeneratorStreams(unittest.TestCase):
+    """Test name generation with explicit streams."""
+
+    def test_seed_is_local(self):
+        """Test a seed reproduces a name without reseeding the global random."""
+        gen = NameGenerator()
+        random.seed(5)
+        expected = random.random()
+        random.seed(5)
+        name = gen.generate_name("elf", seed=10)
+        self.assertEqual(random.random(), expected)
+        self.assertEqual(name, gen.generate_name("elf", seed=10))
+
+    def test_rng(self):
+        """Test an explicit stream reproduces names."""
+        gen = NameGenerator()
+        rng_a, rng_b = py_stream(1, "name"), py_stream(1, "name")
+        self.assertEqual([gen.generate_name("dwarf", rng=rng_a) for _ in range(5)],
+                         [gen.generate_name("dwarf", rng=rng_b) for _ in range(5)])
+
+
+class TestCharacterCreationStream(unittest.TestCase):
+    """Test that CreatePlayer derives its childhood stream from (root seed, session)."""
+
+    @classmethod
+    def setUpClass(cls):
+        import pygame as pg
+        pg.init()
+        cls.surface = pg.Surface((10, 10))
+        from interface.screens import create_player
+        cls.module = create_player
+
+    def _create(self, name, **kwargs):
+        screen = self.module.CreatePlayer(self.surface, **kwargs)
+        with mock.patch.object(self.module, "TextInput") as text_input:
+            text_input.return_value.result = name
+            screen.update()
+        return screen
+
+    def test_default_stream_is_reproducible(self):
+        """Test the same name rolls the same childhood events."""
+        first, second = self._create("Ana Maria"), self._create("Ana Maria")
+        self.assertEqual(first.root_seed, self.module.world_seed_for("Ana Maria"))
+        expected = py_stream(first.root_seed, STREAM_CHILDHOOD, "ana_maria")
+        self.assertEqual(first.rng.getstate(), expected.getstate())
+
+        for screen in (first, second):
+            screen._init_stats()
+            screen._prepare_next_childhood_events()
+        self.assertEqual(first.available_events, second.available_events)
+
+    def test_root_seed_and_explicit_rng(self):
+        """Test an explicit root seed or rng replaces the name-derived stream."""
+        seeded = self._create("Ana", root_seed=99)
+        self.assertEqual(seeded.rng.getstate(), self._create("Ana", root_seed=99).rng.getstate())
+        self.assertNotEqual(seeded.rng.getstate(), self._create("Ana").rng.getstate())
+
+        rng = random.Random(3)
+        self.assertIs(self._create("Ana", rng=rng).rng, rng)
+
+
+if __name__ == "__main__":
+    unittest.main()
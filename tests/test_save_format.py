@@ -0,0 +1,181 @@
+"""
+Tests for the binary save format, schema migrations and World integration.
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Setup path to import from project
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.world import world as world_module
+from engine.world.save_format import (
+    FORMAT_BINARY, SCHEMA_VERSION, SaveFile, SaveFormatError,
+    encode_binary, export_json, find_save_file, load_save, migrate,
+)
+from engine.world.session_index import SessionIndex
+from engine.world.world import World
+
+
+def sample_save(name="Ana"):
+    """Save data in the current schema with a sizeable player section."""
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "world": {"seed": 99, "world_size": 96, "player_position": {"x": 12, "y": -3}},
+        "player": {
+            "name": name,
+            "race": "Humano",
+            "stats": {"fuerza": 5, "destreza": 7, "inteligencia": 4},
+            "childhood": [{"age": i, "event": f"Evento número {i}"} for i in range(40)],
+        },
+        "session_name": "partida",
+    }
+
+
+class TestBinaryFormat(unittest.TestCase):
+    """Test encoding, lazy reading and corruption checks."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "save.bin"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        """Test that a binary save loads back to the same data."""
+        data = sample_save()
+        self.path.write_bytes(encode_binary(data))
+        self.assertEqual(load_save(self.path), data)
+
+    def test_smaller_than_pretty_json(self):
+        """Test that the binary save is more compact than save.json."""
+        data = sample_save()
+        pretty = json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+        self.assertLess(len(encode_binary(data)), len(pretty) // 2)
+
+    def test_header_is_read_without_sections(self):
+        """Test that opening a save only reads the header and section table."""
+        self.path.write_bytes(encode_binary(sample_save("Núria"), saved_at=123.5))
+
+        with mock.patch("engine.world.save_format.zlib.decompress") as decompress:
+            save_file = SaveFile(self.path)
+            summary = save_file.summary()
+        decompress.assert_not_called()
+
+        self.assertEqual(summary["player_name"], "Núria")
+        self.assertEqual(summary["position"], [12, -3])
+        self.assertEqual(summary["seed"], 99)
+        self.assertEqual(summary["world_size"], 96)
+        self.assertEqual(summary["saved_at"], 123.5)
+        self.assertEqual(set(save_file.sections), {"world", "player", "session_name"})
+
+    def test_single_section_is_loaded_lazily(self):
+        """Test that one section can be read on its own."""
+        self.path.write_bytes(encode_binary(sample_save()))
+        save_file = SaveFile(self.path)
+        self.assertEqual(save_file.section("world")["seed"], 99)
+        self.assertEqual(list(save_file._cache), ["world"])
+
+    def test_corrupted_section_is_detected(self):
+        """Test that damaged payloads raise SaveFormatError."""
+        payload = bytearray(encode_binary(sample_save()))
+        payload[-5] ^= 0xFF
+        self.path.write_bytes(bytes(payload))
+        with self.assertRaises(SaveFormatError):
+            SaveFile(self.path).load()
+
+    def test_not_a_binary_save(self):
+        """Test that other files are rejected by SaveFile."""
+        self.path.write_bytes(b"{}")
+        with self.assertRaises(SaveFormatError):
+            SaveFile(self.path)
+
+
+class TestMigrations(unittest.TestCase):
+    """Test the migration chain from the original save.json layout."""
+
+    def test_original_json_layout(self):
+        """Test that a schema 1 save gets world_size and a schema version."""
+        legacy = {
+            "world": {"seed": 5, "player_position": {"x": 1, "y": 2}},
+            "player": {"name": "Old"},
+            "session_name": "legacy",
+        }
+        migrated = migrate(legacy)
+        self.assertEqual(migrated["schema_version"], SCHEMA_VERSION)
+        self.assertEqual(migrated["world"]["world_size"], 128)
+        self.assertNotIn("world_size", legacy["world"])  # No modifica el original
+
+    def test_newer_schema_is_rejected(self):
+        """Test that saves from a newer version are not silently loaded."""
+        with self.assertRaises(SaveFormatError):
+            migrate({"schema_version": SCHEMA_VERSION + 1})
+
+    def test_export_json(self):
+        """Test exporting a binary save back to readable JSON."""
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / "save.bin"
+            source.write_bytes(encode_binary(sample_save()))
+            exported = export_json(source, Path(tmp) / "export.json")
+            with open(exported, "r", encoding="utf-8") as f:
+                self.assertEqual(json.load(f), sample_save())
+
+
+class TestWorldBinarySaves(unittest.TestCase):
+    """Test World save/load with the binary format."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.games_dir = Path(self.tmp.name)
+        patcher = mock.patch.object(world_module, "GAMES_DIR", self.games_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_save_and_load_binary(self):
+        """Test that a binary session saves, indexes and loads back."""
+        world = World(seed=11, session_name="bin", prefetch_workers=0, world_size=64,
+                      save_format=FORMAT_BINARY)
+        world.generate_world()
+        world.player_data = {"name": "Bina"}
+        world.save_game()
+        self.assertEqual(world.default_save_path().name, "save.bin")
+        self.assertEqual(find_save_file(world.session_dir), world.default_save_path())
+
+        entry = SessionIndex(self.games_dir).get("bin")
+        self.assertEqual(entry["player_name"], "Bina")
+
+        loaded = World(session_name="bin", prefetch_workers=0)
+        self.assertTrue(loaded.load_game())
+        self.assertEqual(loaded.save_format, FORMAT_BINARY)
+        self.assertEqual((loaded.seed, loaded.world_size), (11, 64))
+        self.assertEqual(loaded.player_data, {"name": "Bina"})
+        self.assertEqual((loaded.player_world_x, loaded.player_world_y),
+                         (world.player_world_x, world.player_world_y))
+
+    def test_legacy_json_session_loads(self):
+        """Test that an old save.json without schema_version still loads."""
+        session_dir = self.games_dir / "old"
+        session_dir.mkdir()
+        with open(session_dir / "save.json", "w", encoding="utf-8") as f:
+            json.dump({
+                "world": {"seed": 4, "player_position": {"x": 3, "y": 4}},
+                "player": {"name": "Old"},
+                "session_name": "old",
+            }, f)
+
+        world = World(session_name="old", prefetch_workers=0, use_region_cache=False)
+        self.assertTrue(world.load_game())
+        self.assertEqual(world.world_size, 128)
+        self.assertEqual((world.player_world_x, world.player_world_y), (3, 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
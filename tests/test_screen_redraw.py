@@ -0,0 +1,114 @@
+"""
+Tests for dirty-rectangle redraw and idle frame skipping in BaseScreen.
+"""
+
+import os
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Setup path to import from project
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+
+pg.init()
+
+from interface.screens.base_screen import BaseScreen
+
+
+class CountingScreen(BaseScreen):
+    """BaseScreen that counts draw() calls and stops after max_updates updates."""
+
+    IDLE_TIMEOUT_MS = 20
+
+    def __init__(self, surface, max_updates):
+        super().__init__(surface)
+        self.max_updates = max_updates
+        self.draws = 0
+        self.updates = 0
+        self.keys = []
+
+    def handle_event(self, event):
+        if event.type == pg.KEYDOWN:
+            self.keys.append(event.key)
+
+    def update(self):
+        self.updates += 1
+        if self.updates >= self.max_updates:
+            self.running = False
+
+    def draw(self):
+        self.draws += 1
+
+
+class TestBaseScreenRedraw(unittest.TestCase):
+    """Test that static screens skip drawing and only update changed areas."""
+
+    @classmethod
+    def setUpClass(cls):
+        pg.init()
+        cls.screen = pg.display.set_mode((320, 240))
+
+    @classmethod
+    def tearDownClass(cls):
+        pg.quit()
+
+    def setUp(self):
+        pg.event.clear()
+
+    def test_idle_screen_draws_once(self):
+        """Test that without input only the first frame is drawn."""
+        screen = CountingScreen(self.screen, max_updates=5)
+        screen.run()
+        self.assertEqual(screen.updates, 5)
+        self.assertEqual(screen.draws, 1)
+
+    def test_idle_wait_blocks_with_timeout(self):
+        """Test that an idle screen blocks in pg.event.wait instead of spinning."""
+        screen = CountingScreen(self.screen, max_updates=1)
+        screen.present()
+        start = time.perf_counter()
+        self.assertEqual(screen.wait_for_events(), [])
+        self.assertGreaterEqual(time.perf_counter() - start, 0.015)
+
+    def test_key_press_marks_dirty(self):
+        """Test that input wakes the loop and triggers a full redraw."""
+        screen = CountingScreen(self.screen, max_updates=3)
+        pg.event.post(pg.event.Event(pg.KEYDOWN, key=pg.K_DOWN, mod=0, unicode="", scancode=0))
+        screen.run()
+        self.assertEqual(screen.keys, [pg.K_DOWN])
+        self.assertEqual(screen.draws, 1)  # Primer frame y tecla en el mismo tick
+
+    def test_dirty_rects_use_partial_update(self):
+        """Test that rectangle-only changes call pg.display.update(rects)."""
+        screen = CountingScreen(self.screen, max_updates=1)
+        screen.present()
+        screen.mark_dirty((10, 20, 30, 40))
+        with patch.object(pg.display, "update") as update, patch.object(pg.display, "flip") as flip:
+            self.assertTrue(screen.present())
+        update.assert_called_once_with([pg.Rect(10, 20, 30, 40)])
+        flip.assert_not_called()
+        self.assertFalse(screen.is_dirty)
+        self.assertFalse(screen.present())
+
+
+class TestMainMenu(unittest.TestCase):
+    """Test that MainMenu keeps returning the chosen option."""
+
+    def test_menu_returns_choice(self):
+        pg.init()
+        surface = pg.display.set_mode((320, 240))
+        from interface.screens.main_menu import MainMenu
+
+        pg.event.clear()
+        for key in (pg.K_DOWN, pg.K_RETURN):
+            pg.event.post(pg.event.Event(pg.KEYDOWN, key=key, mod=0, unicode="", scancode=0))
+        self.assertEqual(MainMenu(surface).run(), "Cargar Partida")
+
+
+if __name__ == "__main__":
+    unittest.main()
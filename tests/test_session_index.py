@@ -0,0 +1,139 @@
+"""
+Tests for the saved-session index used by the load menu.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Setup path to import from project
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.world import world as world_module
+from engine.world.session_index import SessionIndex
+from engine.world.world import World
+
+
+def write_save(games_dir, name, x=1, y=2, player_name="Tester"):
+    """Write a minimal save.json like World.save_game does."""
+    session_dir = Path(games_dir) / name
+    session_dir.mkdir(parents=True, exist_ok=True)
+    data = {
+        "world": {"seed": 7, "world_size": 128, "player_position": {"x": x, "y": y}},
+        "player": {"name": player_name},
+        "session_name": name,
+    }
+    with open(session_dir / "save.json", "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    return data
+
+
+class TestSessionIndex(unittest.TestCase):
+    """Test building and validating the index."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.games_dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_builds_entries_from_saves(self):
+        """Test that existing saves are listed with their metadata."""
+        write_save(self.games_dir, "beta", x=5, y=6)
+        write_save(self.games_dir, "alpha", player_name="Ana")
+        (self.games_dir / "empty").mkdir()
+
+        entries = SessionIndex(self.games_dir).entries()
+        self.assertEqual([e["name"] for e in entries], ["alpha", "beta"])
+        self.assertEqual(entries[0]["player_name"], "Ana")
+        self.assertEqual(entries[1]["position"], [5, 6])
+        self.assertEqual(entries[1]["seed"], 7)
+        self.assertGreater(entries[1]["size"], 0)
+
+    def test_unchanged_saves_are_not_parsed_again(self):
+        """Test that a second load only stats files."""
+        for i in range(5):
+            write_save(self.games_dir, f"s{i}")
+        SessionIndex(self.games_dir).load()
+
+        with mock.patch("engine.world.session_index.json.load", wraps=json.load) as load:
+            SessionIndex(self.games_dir).entries()
+        self.assertEqual(load.call_count, 1)  # Solo el propio índice
+
+    def test_external_changes_are_detected(self):
+        """Test that edited, added and deleted saves invalidate their entries."""
+        write_save(self.games_dir, "a", x=1)
+        write_save(self.games_dir, "b")
+        SessionIndex(self.games_dir).load()
+
+        write_save(self.games_dir, "a", x=40)
+        save_file = self.games_dir / "a" / "save.json"
+        stat = save_file.stat()
+        os.utime(save_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        (self.games_dir / "b" / "save.json").unlink()
+        write_save(self.games_dir, "c")
+
+        index = SessionIndex(self.games_dir)
+        self.assertEqual(index.session_names(), ["a", "c"])
+        self.assertEqual(index.get("a")["position"], [40, 2])
+
+    def test_update_and_remove(self):
+        """Test explicit updates keep the creation time."""
+        index = SessionIndex(self.games_dir)
+        data = write_save(self.games_dir, "game")
+        index.update("game", data)
+        created = SessionIndex(self.games_dir).get("game")["created"]
+
+        data["world"]["player_position"]["x"] = 99
+        index.update("game", data)
+        entry = SessionIndex(self.games_dir).get("game")
+        self.assertEqual(entry["position"], [99, 2])
+        self.assertEqual(entry["created"], created)
+
+        index.remove("game")
+        with mock.patch("engine.world.session_index.json.load", wraps=json.load) as load:
+            # El archivo sigue existiendo, así que se vuelve a indexar al validar
+            self.assertEqual(SessionIndex(self.games_dir).session_names(), ["game"])
+        self.assertEqual(load.call_count, 2)
+
+    def test_first_update_does_not_hide_other_sessions(self):
+        """Test that creating the index from save_game still lists older saves."""
+        write_save(self.games_dir, "old")
+        data = write_save(self.games_dir, "new")
+        SessionIndex(self.games_dir).update("new", data)
+
+        self.assertEqual(SessionIndex(self.games_dir).session_names(), ["new", "old"])
+
+
+class TestWorldUpdatesIndex(unittest.TestCase):
+    """Test that World.save_game keeps the index current."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(world_module, "GAMES_DIR", Path(self.tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_save_game_updates_index(self):
+        """Test that saving records the new position without reparsing."""
+        world = World(seed=3, session_name="indexed", prefetch_workers=0)
+        world.player_world_x, world.player_world_y = 12, 34
+        world.player_data = {"name": "Hero"}
+        world.save_game()
+
+        entry = SessionIndex(self.tmp.name).get("indexed")
+        self.assertEqual(entry["position"], [12, 34])
+        self.assertEqual(entry["player_name"], "Hero")
+        self.assertEqual(World.get_session_list(), ["indexed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,251 @@
+"""
+Tests for the optional SQLite session store.
+"""
+
+import sqlite3
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+# Setup path to import from project
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.world import world as world_module
+from engine.world.autosave import AutoSaver
+from engine.world.map_generator import MapGenerator
+from engine.world.save_format import SCHEMA_VERSION
+from engine.world.session_store import STORE_SCHEMA_VERSION, SessionStore
+from engine.world.world import World
+
+
+def make_save(name, player_name="Tester", seed=7, x=1, y=2):
+    """Save data like World.build_save_data produces."""
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "world": {"seed": seed, "world_size": 128, "player_position": {"x": x, "y": y}},
+        "player": {"name": player_name},
+        "session_name": name,
+        "journal_seq": 0,
+    }
+
+
+class TestSessionStore(unittest.TestCase):
+    """Test sessions, queries and blobs."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = SessionStore(Path(self.tmp.name) / "sessions.db")
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_save_and_load(self):
+        """Test that a snapshot round-trips through the database."""
+        data = make_save("alpha", player_name="Ana", x=5, y=6)
+        self.store.save_session("alpha", data)
+
+        self.assertEqual(self.store.load_session("alpha"), data)
+        self.assertIsNone(self.store.load_session("missing"))
+        entry = self.store.get("alpha")
+        self.assertEqual(entry["player_name"], "Ana")
+        self.assertEqual(entry["position"], [5, 6])
+        self.assertGreater(entry["size"], 0)
+
+    def test_created_is_kept_on_update(self):
+        """Test that re-saving a session only changes its modified time."""
+        self.store.save_session("alpha", make_save("alpha"))
+        created = self.store.get("alpha")["created"]
+        time.sleep(0.01)
+        self.store.save_session("alpha", make_save("alpha", x=9))
+        entry = self.store.get("alpha")
+        self.assertEqual(entry["created"], created)
+        self.assertGreater(entry["modified"], created)
+        self.assertEqual(len(self.store), 1)
+
+    def test_queries(self):
+        """Test most recent, by player and by seed."""
+        for i in range(6):
+            self.store.save_session(f"s{i}", make_save(f"s{i}", player_name="Ana" if i % 2 else "Bo",
+                                                       seed=i % 3))
+        self.assertEqual([e["name"] for e in self.store.recent(2)], ["s5", "s4"])
+        self.assertEqual({e["name"] for e in self.store.by_player("ana")}, {"s1", "s3", "s5"})
+        self.assertEqual({e["name"] for e in self.store.by_seed(0)}, {"s0", "s3"})
+        self.assertEqual(self.store.session_names(), [f"s{i}" for i in range(6)])
+
+    def test_queries_use_indexes(self):
+        """Test that lookups do not scan the sessions table."""
+        plans = {
+            "recent": "SELECT name FROM sessions ORDER BY modified DESC, rowid DESC LIMIT 5",
+            "player": "SELECT name FROM sessions WHERE player_name = 'x' COLLATE NOCASE",
+            "seed": "SELECT name FROM sessions WHERE seed = 3",
+        }
+        for label, sql in plans.items():
+            plan = " ".join(row[-1] for row in self.store._query("EXPLAIN QUERY PLAN " + sql))
+            self.assertIn("INDEX", plan, label)
+
+    def test_many_sessions(self):
+        """Test listing and loading with thousands of sessions."""
+        for i in range(2000):
+            self.store.save_session(f"session_{i:04d}", make_save(f"session_{i:04d}", seed=i))
+
+        start = time.perf_counter()
+        names = self.store.session_names()
+        recent = self.store.recent(10)
+        loaded = self.store.load_session("session_1234")
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(names), 2000)
+        self.assertEqual(recent[0]["name"], "session_1999")
+        self.assertEqual(loaded["world"]["seed"], 1234)
+        self.assertLess(elapsed, 0.5)
+
+    def test_delete_removes_blobs(self):
+        """Test that deleting a session also deletes its caches."""
+        self.store.save_session("alpha", make_save("alpha"))
+        self.store.put_blob("alpha", "region", "k", b"data")
+        self.store.put_blob("beta", "region", "k", b"other")
+
+        self.assertTrue(self.store.delete("alpha"))
+        self.assertFalse(self.store.delete("alpha"))
+        self.assertNotIn("alpha", self.store)
+        self.assertIsNone(self.store.get_blob("alpha", "region", "k"))
+        self.assertEqual(self.store.get_blob("beta", "region", "k"), b"other")
+        self.store.vacuum()
+
+    def test_failed_transaction_rolls_back(self):
+        """Test that an error inside a transaction leaves no partial writes."""
+        self.store.put_blob("alpha", "region", "k", b"data")
+        with self.assertRaises(RuntimeError):
+            with self.store.transaction() as cursor:
+                cursor.execute("DELETE FROM blobs")
+                raise RuntimeError("boom")
+        self.assertEqual(self.store.get_blob("alpha", "region", "k"), b"data")
+
+    def test_blob_cache(self):
+        """Test that terrain grids round-trip through blobs."""
+        grid = MapGenerator(seed=3).generate_world_chunk(32, 0, 32, 32, 64, 64)
+        cache = self.store.blob_cache("alpha", "world", seed=3)
+        self.assertIsNone(cache.get(1, 0, 32, 32))
+        cache.put(1, 0, grid)
+
+        self.assertIn((1, 0, 32, 32), cache)
+        loaded = cache.get(1, 0, 32, 32)
+        self.assertEqual((loaded.origin_x, loaded.origin_y), (32, 0))
+        np.testing.assert_array_equal(loaded.terrain_codes, grid.terrain_codes)
+        np.testing.assert_array_equal(loaded.heights, grid.heights)
+        self.assertIsNone(self.store.blob_cache("alpha", "world", seed=4).get(1, 0, 32, 32))
+
+    def test_blob_cache_budget(self):
+        """Test that the blob cache trims the least recently used grids."""
+        generator = MapGenerator(seed=3)
+        grids = [generator.generate_world_chunk(32 * i, 0, 32, 32, 256, 64) for i in range(4)]
+        cache = self.store.blob_cache("alpha", "world", seed=3)
+        cache.put(0, 0, grids[0])
+        cache.max_bytes = cache.total_bytes * 3
+
+        cache.put(1, 0, grids[1])
+        cache.put(2, 0, grids[2])
+        self.assertIsNotNone(cache.get(0, 0, 32, 32))
+        cache.put(3, 0, grids[3])
+
+        self.assertEqual(len(cache), 3)
+        self.assertLessEqual(cache.total_bytes, cache.max_bytes)
+        self.assertNotIn((1, 0, 32, 32), cache)
+        self.assertIn((0, 0, 32, 32), cache)
+
+        # A reopened cache rebuilds its LRU order from the accessed column
+        reopened = self.store.blob_cache("alpha", "world", seed=3, max_bytes=cache.total_bytes // 3)
+        self.assertEqual(reopened.total_bytes, cache.total_bytes)
+        reopened.put(3, 0, grids[3])
+        self.assertEqual(len(reopened), 1)
+        self.assertIn((3, 0, 32, 32), reopened)
+
+    def test_migrates_v1_database(self):
+        """Test that a store without the accessed column is upgraded in place."""
+        path = Path(self.tmp.name) / "old.db"
+        conn = sqlite3.connect(str(path))
+        conn.executescript("""
+            CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            INSERT INTO meta VALUES ('schema_version', '1');
+            CREATE TABLE blobs (session TEXT NOT NULL, kind TEXT NOT NULL, key TEXT NOT NULL,
+                                data BLOB NOT NULL, PRIMARY KEY (session, kind, key)) WITHOUT ROWID;
+            INSERT INTO blobs VALUES ('alpha', 'region', 'k', x'0102');
+        """)
+        conn.close()
+
+        with SessionStore(path) as store:
+            self.assertEqual(store._query("SELECT value FROM meta")[0][0], str(STORE_SCHEMA_VERSION))
+            self.assertEqual(store.get_blob("alpha", "region", "k", touch=True), b"\x01\x02")
+            store.put_blob("alpha", "region", "new", b"3")
+            self.assertEqual([key for key, _ in store.blob_sizes("alpha", "region")], ["k", "new"])
+
+    def test_import_directory(self):
+        """Test importing folder-based sessions."""
+        games_dir = Path(self.tmp.name) / "games"
+        with mock.patch.object(world_module, "GAMES_DIR", games_dir):
+            world = World(seed=8, session_name="folder", prefetch_workers=0, use_journal=False)
+            world.generate_world(width=64, height=64)
+            world.save_game()
+        self.assertEqual(self.store.import_directory(games_dir), 1)
+        self.assertEqual(self.store.get("folder")["seed"], 8)
+
+
+class TestWorldWithStore(unittest.TestCase):
+    """Test World saving, loading and caching through a SessionStore."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(world_module, "GAMES_DIR", Path(self.tmp.name) / "games")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.store = SessionStore(Path(self.tmp.name) / "sessions.db")
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_save_load_and_caches(self):
+        """Test a full session lifecycle without session folders."""
+        world = World(seed=12, session_name="db", prefetch_workers=0, use_journal=False,
+                      session_store=self.store)
+        world.generate_world()
+        world.load_local_map()
+        world.player_data = {"name": "Sql"}
+        world.save_game()
+        self.assertFalse((Path(self.tmp.name) / "games").exists())
+        self.assertEqual(World.get_session_list(self.store), ["db"])
+
+        loaded = World(session_name="db", prefetch_workers=0, use_journal=False,
+                       session_store=self.store)
+        with mock.patch.object(MapGenerator, "generate_world_chunk") as generate_chunk, \
+                mock.patch.object(MapGenerator, "generate_local_map") as generate_local:
+            self.assertTrue(loaded.load_game())
+            loaded.get_current_terrain_info()
+        generate_chunk.assert_not_called()
+        generate_local.assert_not_called()
+        self.assertEqual(loaded.player_data, {"name": "Sql"})
+        self.assertEqual((loaded.player_world_x, loaded.player_world_y),
+                         (world.player_world_x, world.player_world_y))
+
+    def test_autosave_writes_to_store(self):
+        """Test that background autosaves go to the database."""
+        world = World(seed=12, session_name="auto", prefetch_workers=0, use_journal=False,
+                      session_store=self.store)
+        world.generate_world(width=64, height=64)
+        saver = AutoSaver(world)
+        try:
+            self.assertTrue(saver.request_save())
+            saver.flush()
+        finally:
+            saver.shutdown()
+        self.assertEqual(self.store.get("auto")["seed"], 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Tests for the struct-of-arrays TerrainGrid returned by MapGenerator.
+"""
+
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+# Setup path to import from project
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.world.map_generator import (
+    MapGenerator,
+    MapTile,
+    Terrain,
+    TerrainGrid,
+    TERRAIN_CODE,
+)
+
+
+class TestTerrainGridLayout(unittest.TestCase):
+    """Test the array layout and the MapTile views."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.generator = MapGenerator(seed=42)
+        cls.world_map = cls.generator.generate_world_map(width=40, height=30)
+
+    def test_array_dtypes(self):
+        """Test that the grid stores contiguous float32/uint8 arrays."""
+        grid = self.world_map
+        self.assertIsInstance(grid, TerrainGrid)
+        self.assertEqual(grid.shape, (30, 40))
+        self.assertEqual(grid.heights.dtype, np.float32)
+        self.assertEqual(grid.temperatures.dtype, np.float32)
+        self.assertEqual(grid.terrain_codes.dtype, np.uint8)
+        self.assertTrue(grid.heights.flags["C_CONTIGUOUS"])
+        self.assertEqual(grid.nbytes, 30 * 40 * 9)
+
+    def test_tile_view(self):
+        """Test that grid[y, x] builds a MapTile from the arrays."""
+        tile = self.world_map[5, 7]
+        self.assertIsInstance(tile, MapTile)
+        self.assertEqual((tile.x, tile.y), (7, 5))
+        self.assertAlmostEqual(tile.height, float(self.world_map.heights[5, 7]))
+        self.assertEqual(tile.terrain, self.world_map.terrain_at(7, 5))
+        self.assertEqual(self.world_map[-1, -1].x, 39)
+
+    def test_slice_shares_memory(self):
+        """Test that slicing returns a sub-grid with shifted coordinates."""
+        sub = self.world_map[10:20, 5:15]
+        self.assertIsInstance(sub, TerrainGrid)
+        self.assertEqual(sub.shape, (10, 10))
+        self.assertEqual((sub[0, 0].x, sub[0, 0].y), (5, 10))
+        self.assertTrue(np.shares_memory(sub.heights, self.world_map.heights))
+
+    def test_flat_and_assignment(self):
+        """Test iteration over tiles and assigning a tile back."""
+        grid = TerrainGrid.empty(2, 3)
+        grid[1, 2] = MapTile(2, 1, 0.5, Terrain.FOREST, -0.25)
+        self.assertEqual(len(list(grid.flat)), 6)
+        self.assertEqual(grid.terrain_codes[1, 2], TERRAIN_CODE[Terrain.FOREST])
+        self.assertEqual(grid[1, 2].temperature, -0.25)
+
+    def test_from_tiles_roundtrip(self):
+        """Test converting the reference object array into a TerrainGrid."""
+        reference = self.generator.generate_world_map_reference(width=12, height=10)
+        grid = TerrainGrid.from_tiles(reference)
+        for tile in reference.flat:
+            self.assertEqual(grid[tile.y, tile.x].terrain, tile.terrain)
+
+    def test_temperature_categories_match_tiles(self):
+        """Test the vectorized temperature buckets against MapTile."""
+        categories = self.world_map.temperature_categories()
+        names = [t.get_temperature_category() for t in self.world_map.flat]
+        from engine.world.map_generator import Temperature
+        expected = [list(Temperature).index(c) for c in names]
+        self.assertEqual(categories.ravel().tolist(), expected)
+
+
+class TestLocalMapGrid(unittest.TestCase):
+    """Test that local maps use the same representation."""
+
+    def test_local_map_global_coordinates(self):
+        """Test that local tiles keep their global coordinates."""
+        generator = MapGenerator(seed=42)
+        local_map = generator.generate_local_map(2, 3, local_width=16, local_height=16)
+        self.assertIsInstance(local_map, TerrainGrid)
+        tile = local_map[4, 5]
+        self.assertEqual((tile.x, tile.y), (2 * 16 + 5, 3 * 16 + 4))
+
+    def test_statistics_from_arrays(self):
+        """Test that statistics count every tile."""
+        generator = MapGenerator(seed=42)
+        stats = generator.get_map_statistics(generator.generate_world_map(width=20, height=20))
+        self.assertEqual(stats["total_tiles"], 400)
+        self.assertEqual(sum(stats["terrain_counts"].values()), 400)
+        self.assertEqual(sum(stats["temperature_counts"].values()), 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
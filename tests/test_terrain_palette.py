@@ -0,0 +1,73 @@
+"""
+Tests for the precomputed terrain/temperature colour lookup table.
+"""
+
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+# Setup path to import from project
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.world.map_generator import (
+    MapGenerator,
+    TerrainGrid,
+    TERRAIN_BY_CODE,
+    TERRAIN_CODE,
+    TERRAIN_PALETTE,
+    TEMPERATURE_BY_BUCKET,
+    TEMPERATURE_THRESHOLDS,
+)
+
+# Temperatures covering every bucket, including values around each threshold
+# (float32, as stored by TerrainGrid)
+SAMPLE_TEMPERATURES = sorted(
+    {np.float32(t) for t in (-1.0, -0.75, -0.3, 0.0, 0.35, 0.65, 0.9, 1.0)}
+    | {np.float32(t) for t in TEMPERATURE_THRESHOLDS}
+    | {np.nextafter(np.float32(t), np.float32(-2.0)) for t in TEMPERATURE_THRESHOLDS}
+    | {np.nextafter(np.float32(t), np.float32(2.0)) for t in TEMPERATURE_THRESHOLDS}
+)
+
+
+class TestTerrainPalette(unittest.TestCase):
+    """Test that the palette agrees with MapTile.get_color."""
+
+    def test_palette_shape(self):
+        """Test one RGB entry per (terrain code, temperature bucket)."""
+        self.assertEqual(TERRAIN_PALETTE.shape, (len(TERRAIN_BY_CODE), len(TEMPERATURE_BY_BUCKET), 3))
+        self.assertEqual(TERRAIN_PALETTE.dtype, np.uint8)
+
+    def test_every_combination_matches_get_color(self):
+        """Test every terrain against temperatures in and on the edge of every bucket."""
+        for terrain in TERRAIN_BY_CODE:
+            for temperature in SAMPLE_TEMPERATURES:
+                grid = TerrainGrid(
+                    np.zeros((1, 1)),
+                    np.full((1, 1), temperature),
+                    np.full((1, 1), TERRAIN_CODE[terrain]),
+                )
+                tile = grid[0, 0]
+                self.assertEqual(tile.terrain, terrain)
+                bucket = TEMPERATURE_BY_BUCKET.index(tile.get_temperature_category())
+
+                self.assertEqual(int(grid.temperature_categories()[0, 0]), bucket)
+                self.assertEqual(tuple(grid.colors()[0, 0]), tile.get_color(),
+                                 msg=f"{terrain.name} @ {temperature}")
+
+    def test_region_image_matches_tiles(self):
+        """Test the full-region gather on generated world and local maps."""
+        generator = MapGenerator(seed=42)
+        for grid in (generator.generate_world_map(width=64, height=64),
+                     generator.generate_local_map(10, 10, local_width=32, local_height=32)):
+            image = grid.colors()
+            self.assertEqual(image.shape, grid.shape + (3,))
+            for tile in grid.flat:
+                local_x = tile.x - grid.origin_x
+                local_y = tile.y - grid.origin_y
+                self.assertEqual(tuple(image[local_y, local_x]), tile.get_color())
+
+
+if __name__ == "__main__":
+    unittest.main()
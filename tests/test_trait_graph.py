@@ -0,0 +1,129 @@
+"""
+Tests for the compiled personality trait graph.
+"""
+
+import random
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+# Setup path to import from project
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.entities.npc import DEFAULT_NPC_VALUES, PROFESSION_VALUES, get_trait_graph
+from engine.entities.trait_graph import (
+    CONTRADICTION_CHANCE, NO_TRAIT, SYNERGY_CHANCE, TraitGraph,
+)
+from engine.utils.data_registry import get_registry
+
+
+def synthetic_traits(count):
+    """Traits where t0 synergizes with t1 (no conflict) and the last one (conflicts with t0)."""
+    traits = [{"id": f"t{i}", "intensity": {"min": 10, "max": 20}} for i in range(count)]
+    last = f"t{count - 1}"
+    traits[0]["synergies"] = ["t1", last, "unknown"]
+    traits[count - 1]["conflicts"] = ["t0"]
+    return traits
+
+
+class TestCompiledGraph(unittest.TestCase):
+    """Test the compiled ids, masks and matrix."""
+
+    def setUp(self):
+        self.graph = get_trait_graph()
+        self.traits = get_registry().traits_by_id
+
+    def test_ids_and_masks(self):
+        """Test masks match the conflict and synergy lists of the data."""
+        graph = self.graph
+        self.assertEqual(graph.trait_ids, tuple(self.traits))
+        for trait_id, trait in self.traits.items():
+            i = graph.index[trait_id]
+            conflicts = {graph.trait_ids[b] for b in range(len(graph)) if graph.conflict_masks[i] >> b & 1}
+            synergies = {graph.trait_ids[b] for b in range(len(graph)) if graph.synergy_masks[i] >> b & 1}
+            self.assertEqual(conflicts, {c for c in trait.get("conflicts", []) if c in self.traits})
+            self.assertEqual(synergies, {s for s in trait.get("synergies", []) if s in self.traits})
+            self.assertEqual(graph.min_intensity[i], trait.get("intensity", {}).get("min", 0))
+
+    def test_modifier_matrix(self):
+        """Test matrix rows come from TRAIT_VALUE_MODIFIERS."""
+        row = self.graph.modifier_matrix[self.graph.index["brave"]]
+        expected = [{"aggressiveness": 10, "caution": -10}.get(name, 0) for name in self.graph.value_names]
+        np.testing.assert_array_equal(row, expected)
+        self.assertNotIn("timid", self.graph.index)
+        # Modifiers of traits missing from the data still apply on the scalar path
+        self.assertEqual(self.graph.npc_values(DEFAULT_NPC_VALUES, {"timid": 100})["caution"], 65)
+
+    def test_graph_is_cached(self):
+        """Test the graph is compiled once and rebuilt after the registry reloads."""
+        self.assertIs(get_trait_graph(), self.graph)
+        get_registry().clear()
+        rebuilt = get_trait_graph()
+        self.assertIsNot(rebuilt, self.graph)
+        self.assertEqual(rebuilt.trait_ids, self.graph.trait_ids)
+
+
+class TestScalarPath(unittest.TestCase):
+    """Test one-NPC personality and values."""
+
+    def test_personality(self):
+        """Test base traits are always present with intensities in range."""
+        graph = get_trait_graph()
+        profession_traits = get_registry().professions_by_name["warrior"]["personality_traits"]
+        rng = random.Random(4)
+        for _ in range(200):
+            personality = graph.roll_personality(profession_traits, rng)
+            for trait_id in profession_traits:
+                self.assertIn(trait_id, personality)
+            for trait_id, intensity in personality.items():
+                low, high = graph.ranges[graph.index[trait_id]]
+                self.assertTrue(low <= intensity <= high)
+        self.assertEqual(graph.roll_personality(profession_traits, random.Random(9)),
+                         graph.roll_personality(profession_traits, random.Random(9)))
+
+    def test_npc_values(self):
+        """Test values add scaled modifiers (truncated) and clamp to 0-100."""
+        graph = get_trait_graph()
+        values = graph.npc_values(PROFESSION_VALUES["warrior"], {"aggressive": 55, "loyal": 100, "brave": 99})
+        self.assertEqual(values, {"aggressiveness": 75 + 11 + 9, "honesty": 65,
+                                  "loyalty": 95, "caution": 30 - 9})
+        values = graph.npc_values(DEFAULT_NPC_VALUES, {"treacherous": 100})
+        self.assertEqual(values["loyalty"], 20)
+        clamped = graph.npc_values({"aggressiveness": 95, "honesty": 5, "loyalty": 50, "caution": 50},
+                                   {"aggressive": 100, "manipulative": 100})
+        self.assertEqual((clamped["aggressiveness"], clamped["honesty"]), (100, 0))
+
+
+class TestBatchPath(unittest.TestCase):
+    """Test batch personality and values."""
+
+    def test_multiword_masks(self):
+        """Test conflicts across mask words and the synergy/contradiction rates."""
+        graph = TraitGraph(synthetic_traits(70), {}, ("a",))
+        self.assertEqual(graph.conflict_words.shape, (70, 2))
+        personality = graph.roll_personality_batch(["t0"], np.random.default_rng(2), 40000)
+        self.assertTrue((personality[:, 0] != NO_TRAIT).all())
+        free_rate = (personality[:, 1] != NO_TRAIT).mean()
+        conflict_rate = (personality[:, 69] != NO_TRAIT).mean()
+        self.assertAlmostEqual(free_rate, SYNERGY_CHANCE, delta=0.02)
+        self.assertAlmostEqual(conflict_rate, SYNERGY_CHANCE * CONTRADICTION_CHANCE, delta=0.01)
+        present = personality[personality != NO_TRAIT]
+        self.assertTrue(((present >= 10) & (present <= 20)).all())
+
+    def test_batch_matches_scalar(self):
+        """Test batch values equal the scalar values row by row."""
+        graph = get_trait_graph()
+        profession_traits = get_registry().professions_by_name["rogue"]["personality_traits"]
+        personality = graph.roll_personality_batch(profession_traits, np.random.default_rng(5), 500)
+        values = graph.npc_values_batch(PROFESSION_VALUES["rogue"], personality)
+        for row in range(len(personality)):
+            traits = {graph.trait_ids[t]: int(personality[row, t])
+                      for t in np.flatnonzero(personality[row] != NO_TRAIT)}
+            expected = graph.npc_values(PROFESSION_VALUES["rogue"], traits)
+            self.assertEqual(values[row].tolist(), [expected[name] for name in graph.value_names])
+
+
+if __name__ == "__main__":
+    unittest.main()
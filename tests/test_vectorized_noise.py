@@ -0,0 +1,122 @@
+"""
+Tests for the vectorized NumPy noise backend used by MapGenerator.
+Compares the batched world generation against the tile-by-tile reference.
+"""
+
+import unittest
+from pathlib import Path
+
+import numpy as np
+from perlin_noise import PerlinNoise
+
+# Setup path to import from project
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.world.map_generator import MapGenerator, TERRAIN_BY_CODE
+from engine.world.noise import VectorizedPerlin
+
+
+class TestVectorizedPerlin(unittest.TestCase):
+    """Test that VectorizedPerlin reproduces PerlinNoise values."""
+
+    def test_matches_perlin_noise_pointwise(self):
+        """Test random points against the pure-Python library."""
+        rng = np.random.default_rng(3)
+        for octaves, seed in [(3, 42), (5, 3042), (10, 1042)]:
+            perlin = PerlinNoise(octaves=octaves, seed=seed)
+            vectorized = VectorizedPerlin.from_perlin(perlin)
+            xs = rng.uniform(-5, 20, size=50)
+            ys = rng.uniform(-5, 20, size=50)
+
+            batched = vectorized.sample(xs, ys)
+            expected = np.array([perlin([x, y]) for x, y in zip(xs, ys)])
+
+            np.testing.assert_allclose(batched, expected, atol=1e-12)
+
+    def test_grid_shape(self):
+        """Test that grid() returns (rows, cols) ordered output."""
+        noise = VectorizedPerlin(octaves=3, seed=7)
+        values = noise.grid(np.arange(10) / 80, np.arange(4) / 80)
+        self.assertEqual(values.shape, (4, 10))
+        self.assertAlmostEqual(values[2, 5], noise.sample(5 / 80, 2 / 80), places=12)
+
+    def test_gradient_cache_is_bounded(self):
+        """Test the gradient LRU stays under cache_size without changing values."""
+        bounded = VectorizedPerlin(octaves=3, seed=7, cache_size=100)
+        unbounded = VectorizedPerlin(octaves=3, seed=7, cache_size=10 ** 9)
+        for offset in range(0, 40, 8):
+            xs = np.arange(offset, offset + 8, 0.25)
+            np.testing.assert_array_equal(bounded.grid(xs, xs), unbounded.grid(xs, xs))
+            self.assertLessEqual(len(bounded._gradients), 100)
+        self.assertGreater(len(unbounded._gradients), 100)
+        # Evicted points are recomputed with the same seed
+        self.assertEqual(bounded.gradient(0, 0), unbounded.gradient(0, 0))
+
+
+class TestWorldMapBackends(unittest.TestCase):
+    """Test that the vectorized world map matches the reference path."""
+
+    def _assert_maps_match(self, seed, width, height):
+        generator = MapGenerator(seed=seed, world_size=128)
+        fast = generator.generate_world_map(width=width, height=height)
+        reference = generator.generate_world_map_reference(width=width, height=height)
+
+        self.assertEqual(fast.shape, reference.shape)
+        fast_heights = np.array([t.height for t in fast.flat])
+        ref_heights = np.array([t.height for t in reference.flat])
+        fast_temps = np.array([t.temperature for t in fast.flat])
+        ref_temps = np.array([t.temperature for t in reference.flat])
+
+        # TerrainGrid guarda float32
+        np.testing.assert_allclose(fast_heights, ref_heights, atol=1e-6)
+        np.testing.assert_allclose(fast_temps, ref_temps, atol=1e-6)
+
+        mismatches = sum(a.terrain != b.terrain for a, b in zip(fast.flat, reference.flat))
+        self.assertEqual(mismatches, 0)
+
+    def test_default_seed_matches_reference(self):
+        """Test seed 42 on a non-square map, including water borders."""
+        self._assert_maps_match(seed=42, width=48, height=40)
+
+    def test_other_seed_matches_reference(self):
+        """Test a second seed to cover different gradients."""
+        self._assert_maps_match(seed=98765, width=40, height=40)
+
+    def test_world_fields_are_arrays(self):
+        """Test that generate_world_fields returns full arrays."""
+        generator = MapGenerator(seed=42)
+        fields = generator.generate_world_fields(width=32, height=16)
+
+        for key in ("height", "mountain", "temperature", "terrain"):
+            self.assertEqual(fields[key].shape, (16, 32))
+        self.assertLess(int(fields["terrain"].max()), len(TERRAIN_BY_CODE))
+
+
+class TestLocalMapBackends(unittest.TestCase):
+    """Test that the vectorized local map matches the cell-by-cell loop."""
+
+    def test_local_regions_match_reference(self):
+        """Test several regions, including arena and biome variations."""
+        generator = MapGenerator(seed=42)
+        for world_x, world_y in [(0, 0), (64, 0), (128, 64), (3, 5)]:
+            fast = generator.generate_local_map(world_x, world_y)
+            reference = generator.generate_local_map_reference(world_x, world_y)
+
+            np.testing.assert_array_equal(fast.terrain_codes, reference.terrain_codes)
+            np.testing.assert_allclose(fast.heights, reference.heights, atol=1e-6)
+            np.testing.assert_allclose(fast.temperatures, reference.temperatures, atol=1e-6)
+            self.assertEqual((fast.origin_x, fast.origin_y), (reference.origin_x, reference.origin_y))
+
+    def test_local_map_leaves_global_random_untouched(self):
+        """Test that generation does not reseed the global random module."""
+        import random
+        random.seed(1234)
+        expected = random.random()
+        random.seed(1234)
+        MapGenerator(seed=42).generate_local_map(0, 0, 16, 16)
+        self.assertEqual(random.random(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark del grafo de rasgos compilado.
+
+Compara generar personalidad y valores de comportamiento recorriendo los
+diccionarios de rasgos (como hacía NPC._generate_personality antes del
+grafo) con TraitGraph, NPC a NPC y en lote. Uso:
+
+    python tests/trait_graph_benchmark.py [cantidad]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from engine.entities.npc import (
+    DEFAULT_NPC_VALUES, PROFESSION_VALUES, TRAIT_VALUE_MODIFIERS, get_trait_graph,
+)
+from engine.entities.trait_graph import CONTRADICTION_CHANCE, SYNERGY_CHANCE
+from engine.utils.data_registry import get_registry
+
+PROFESSIONS = ["warrior", "mage", "rogue", "merchant", "cleric", "bard"]
+
+
+def dict_personality(profession_traits, traits_dict, rng):
+    """Personalidad recorriendo diccionarios y listas de conflictos."""
+    selected_traits = {}
+    for trait_id in profession_traits:
+        if trait_id in traits_dict:
+            intensity_range = traits_dict[trait_id].get("intensity", {})
+            selected_traits[trait_id] = rng.randint(intensity_range.get("min", 0), intensity_range.get("max", 100))
+
+    added_synergies = set()
+    for trait_id in list(selected_traits.keys()):
+        for synergy_id in traits_dict[trait_id].get("synergies", []):
+            if (synergy_id not in selected_traits and synergy_id not in added_synergies
+                    and rng.random() < SYNERGY_CHANCE):
+                if synergy_id in traits_dict:
+                    synergy_trait = traits_dict[synergy_id]
+                    conflicts = synergy_trait.get("conflicts", [])
+                    if any(c in selected_traits for c in conflicts) and rng.random() > CONTRADICTION_CHANCE:
+                        continue
+                    intensity_range = synergy_trait.get("intensity", {})
+                    selected_traits[synergy_id] = rng.randint(
+                        intensity_range.get("min", 0), intensity_range.get("max", 100))
+                    added_synergies.add(synergy_id)
+    return selected_traits
+
+
+def dict_values(profession_name, personality):
+    """Valores de comportamiento con búsquedas en TRAIT_VALUE_MODIFIERS."""
+    values = dict(PROFESSION_VALUES.get(profession_name, DEFAULT_NPC_VALUES))
+    for trait_id, intensity in personality.items():
+        if trait_id in TRAIT_VALUE_MODIFIERS:
+            scale = intensity / 100.0
+            for value_name, modifier in TRAIT_VALUE_MODIFIERS[trait_id].items():
+                if value_name in values:
+                    values[value_name] += int(modifier * scale)
+    for key in values:
+        values[key] = max(0, min(100, values[key]))
+    return values
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) >= 2 else 50000
+
+    registry = get_registry()
+    graph = get_trait_graph()
+    traits_dict = registry.traits_by_id
+    profession_traits = [registry.professions_by_name[name].get("personality_traits", [])
+                         for name in PROFESSIONS]
+
+    rng = random.Random(1)
+    start = time.perf_counter()
+    for i in range(count):
+        k = i % len(PROFESSIONS)
+        dict_values(PROFESSIONS[k], dict_personality(profession_traits[k], traits_dict, rng))
+    dict_s = time.perf_counter() - start
+
+    rng = random.Random(1)
+    start = time.perf_counter()
+    for i in range(count):
+        k = i % len(PROFESSIONS)
+        graph.npc_values(PROFESSION_VALUES[PROFESSIONS[k]], graph.roll_personality(profession_traits[k], rng))
+    graph_s = time.perf_counter() - start
+
+    np_rng = np.random.default_rng(1)
+    start = time.perf_counter()
+    per_profession = count // len(PROFESSIONS)
+    for k, name in enumerate(PROFESSIONS):
+        personality = graph.roll_personality_batch(profession_traits[k], np_rng, per_profession)
+        graph.npc_values_batch(PROFESSION_VALUES[name], personality)
+    batch_s = time.perf_counter() - start
+
+    print("=" * 60)
+    print(f"BENCHMARK DEL GRAFO DE RASGOS - {count} personalidades")
+    print("=" * 60)
+    print(f"  Diccionarios:     {count / dict_s:12.0f} NPCs/s")
+    print(f"  TraitGraph:       {count / graph_s:12.0f} NPCs/s | x{dict_s / graph_s:.1f}")
+    print(f"  TraitGraph lote:  {count / batch_s:12.0f} NPCs/s | x{dict_s / batch_s:.0f}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()